@@ -413,6 +413,7 @@ base_extension_info = {
                   "exceptions_test.cpp",
                   "math/t2exp.cpp",
                   "math/normal_distribution.cpp",
+                  "math/exp_precision.cpp",
                   ],
     "h_files": ["base.h",
                 "base_test.h",
@@ -432,6 +433,7 @@ base_extension_info = {
                 "math/t2exp.h",
                 "math/t2exp.inl",
                 "math/normal_distribution.h",
+                "math/exp_precision.h",
                 ],
     "swig_files": ["base_module.i"],
     "module_dir": "./tick/base",
@@ -470,9 +472,9 @@ random_extension = create_extension(**random_extension_info)
 
 simulation_extension_info = {
     "cpp_files": ["pp.cpp", "poisson.cpp", "inhomogeneous_poisson.cpp",
-                  "hawkes.cpp"],
+                  "hawkes.cpp", "hawkes_multi.cpp"],
     "h_files": ["pp.h", "poisson.h", "inhomogeneous_poisson.h",
-                "hawkes.h"],
+                "hawkes.h", "hawkes_multi.h"],
     "folders": ["hawkes_baselines", "hawkes_kernels"],
     "swig_files": ["simulation_module.i"],
     "module_dir": "./tick/simulation/",
@@ -602,10 +604,12 @@ preprocessing_core = create_extension(**preprocessing_core_info)
 inference_extension_info = {
     "cpp_files": ["hawkes_conditional_law.cpp", "hawkes_em.cpp",
                   "hawkes_adm4.cpp", "hawkes_basis_kernels.cpp",
-                  "hawkes_sumgaussians.cpp"],
+                  "hawkes_sumgaussians.cpp",
+                  "hawkes_sumexpkern_intensity.cpp"],
     "h_files": ["hawkes_conditional_law.h", "hawkes_em.h",
                 "hawkes_adm4.h", "hawkes_basis_kernels.h",
-                "hawkes_sumgaussians.h"],
+                "hawkes_sumgaussians.h",
+                "hawkes_sumexpkern_intensity.h"],
     "swig_files": ["inference_module.i"],
     "module_dir": "./tick/inference/",
     "extension_name": "inference",
@@ -1,3 +1,4 @@
 # License: BSD 3 clause
 
-import tick.base
\ No newline at end of file
+import tick.base
+from tick.base import set_exp_precision, get_exp_precision
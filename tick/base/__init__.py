@@ -24,5 +24,8 @@ from .timefunc import TimeFunction
 from .base import Base
 from .decorators import actual_kwargs
 from .threadpool import ThreadPool
+from .exp_precision import set_exp_precision, get_exp_precision, \
+    exp_precision_report
 
-__all__ = ["Base", "TimeFunction", "actual_kwargs"]
+__all__ = ["Base", "TimeFunction", "actual_kwargs", "set_exp_precision",
+           "get_exp_precision", "exp_precision_report"]
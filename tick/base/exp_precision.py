@@ -0,0 +1,109 @@
+# License: BSD 3 clause
+
+import time
+
+import numpy as np
+
+from tick.base.build.base import set_fast_exp as _set_fast_exp, \
+    get_fast_exp as _get_fast_exp
+
+_exp_precisions = ["exact", "fast"]
+
+
+def set_exp_precision(precision):
+    """Sets the precision of the exponential function computed by Hawkes
+    models, learners and kernels
+
+    Parameters
+    ----------
+    precision : {'exact', 'fast'}
+        If 'fast', an approximated exponential based on lookup tables is
+        used, whatever the ``approx`` parameter of each model. Its relative
+        error is of order 1e-6. If 'exact', the approximated exponential is
+        only used by models created with ``approx=1``
+
+    Notes
+    -----
+    Models compute most of their exponentials when they are fitted, hence
+    the precision must be set before calling ``fit``.
+    """
+    if precision not in _exp_precisions:
+        raise ValueError("``precision`` must be one of %s, got %s"
+                         % (", ".join(_exp_precisions), precision))
+    _set_fast_exp(precision == "fast")
+
+
+def get_exp_precision():
+    """Returns the precision of the exponential function computed by Hawkes
+    models, learners and kernels
+
+    Returns
+    -------
+    output : {'exact', 'fast'}
+        The current precision, see `set_exp_precision`
+    """
+    return "fast" if _get_fast_exp() else "exact"
+
+
+def exp_precision_report(model, fit_args, coeffs, n_repeats=10):
+    """Reports the accuracy and the speed of a model with each precision of
+    the exponential function
+
+    Parameters
+    ----------
+    model : `Model`
+        The model to benchmark, it is fitted with each precision
+
+    fit_args : `tuple`
+        Arguments given to ``model.fit``
+
+    coeffs : `np.ndarray`
+        Coefficients at which loss and gradient are computed
+
+    n_repeats : `int`, default=10
+        Number of times loss and gradient are computed to measure their
+        speed
+
+    Returns
+    -------
+    output : `dict`
+        For each precision, the loss, the gradient and the times (in
+        seconds) taken by ``fit``, including the first computation of the
+        loss that computes the weights of the model, and by one computation
+        of loss and gradient. The relative errors of the fast loss and gradient with
+        respect to the exact ones are stored in ``loss_relative_error``
+        and ``grad_relative_error``
+    """
+    previous_precision = get_exp_precision()
+    report = {}
+    try:
+        for precision in _exp_precisions:
+            set_exp_precision(precision)
+
+            # Hawkes models compute their weights at the first call to loss,
+            # which is hence timed with fit
+            start = time.time()
+            model.fit(*fit_args)
+            model.loss(coeffs)
+            fit_time = time.time() - start
+
+            start = time.time()
+            for _ in range(n_repeats):
+                loss = model.loss(coeffs)
+                grad = model.grad(coeffs)
+            loss_and_grad_time = (time.time() - start) / n_repeats
+
+            report[precision] = {
+                "loss": loss, "grad": grad, "fit_time": fit_time,
+                "loss_and_grad_time": loss_and_grad_time
+            }
+    finally:
+        set_exp_precision(previous_precision)
+
+    exact, fast = report["exact"], report["fast"]
+    report["loss_relative_error"] = \
+        abs(fast["loss"] - exact["loss"]) / abs(exact["loss"])
+    report["grad_relative_error"] = \
+        np.linalg.norm(fast["grad"] - exact["grad"]) / \
+        np.linalg.norm(exact["grad"])
+    return report
@@ -0,0 +1,30 @@
+// License: BSD 3 clause
+
+#include "exp_precision.h"
+
+#include <cmath>
+
+std::atomic<bool> fast_exp_precision(false);
+
+void set_fast_exp(bool fast) {
+  fast_exp_precision = fast;
+}
+
+bool get_fast_exp() {
+  return fast_exp_precision;
+}
+
+void exp_batch(const double *x, double *out, ulong n) {
+  // No branch nor table lookup in this loop, so that it is vectorized
+  for (ulong i = 0; i < n; ++i) {
+    out[i] = std::exp(x[i]);
+  }
+}
+
+void exp_batch(ArrayDouble &x, ArrayDouble &out) {
+  if (x.size() != out.size()) {
+    TICK_ERROR("x (size=" << x.size() << ") and out (size=" << out.size()
+                          << ") should have the same size");
+  }
+  exp_batch(x.data(), out.data(), x.size());
+}
@@ -0,0 +1,45 @@
+#ifndef TICK_BASE_SRC_MATH_EXP_PRECISION_H_
+#define TICK_BASE_SRC_MATH_EXP_PRECISION_H_
+
+// License: BSD 3 clause
+
+#include <atomic>
+
+#include "defs.h"
+#include "array.h"
+
+//! @brief Global precision of the exponential function computed by
+//! optimized_exp. If true, the approximated exponential (t2exp) is used by
+//! all Hawkes models, learners and kernels whatever their optimization level
+extern DLL_PUBLIC std::atomic<bool> fast_exp_precision;
+
+//! @brief Sets the global precision of the exponential function
+//! \param fast : if true the faster approximated exponential is used,
+//! otherwise the exact one
+extern void set_fast_exp(bool fast);
+
+//! @brief Returns true if the faster approximated exponential is used globally
+extern bool get_fast_exp();
+
+//! @brief Tells if the approximated exponential must be used
+//! \param optimization_level : 0 corresponds to exact exponential function
+//! unless the global precision is set to fast, 1 to faster (approximated) one
+inline bool fast_exp_enabled(int optimization_level) {
+  return optimization_level > 0 ||
+      fast_exp_precision.load(std::memory_order_relaxed);
+}
+
+//! @brief Computes the exponential of n values
+//! This loop has no branch nor table lookup, hence it is vectorized when a
+//! vector math library is available (it is the case with glibc and the
+//! -O3 -ffast-math flags tick is compiled with). It is then faster than
+//! the approximated exponential while being exact, so it does not depend on
+//! the global precision.
+//! \param x : pointer to the n values exponential is computed at
+//! \param out : pointer to the n values in which the result is stored
+extern void exp_batch(const double *x, double *out, ulong n);
+
+//! @brief Array version of exp_batch
+extern void exp_batch(ArrayDouble &x, ArrayDouble &out);
+
+#endif  // TICK_BASE_SRC_MATH_EXP_PRECISION_H_
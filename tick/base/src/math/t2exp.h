@@ -22,6 +22,8 @@
 #ifndef TICK_BASE_SRC_MATH_T2EXP_H_
 #define TICK_BASE_SRC_MATH_T2EXP_H_
 
+#include "exp_precision.h"
+
 #ifdef  __cplusplus
 extern "C" {
 #endif/*__cplusplus*/
@@ -70,10 +72,9 @@ extern void t2expinl(void);
 
 inline extern double optimized_exp(double x,
                                    int optimization_level) {
-  switch (optimization_level) {
-    case 0:return exp(x);
-    default:return t2exp(x);
-  }
+  // t2exp tables only cover non positive arguments
+  if (x <= 0 && fast_exp_enabled(optimization_level)) return t2exp(x);
+  return exp(x);
 }
 
 #ifdef  __cplusplus
@@ -76,6 +76,8 @@ class TimeFunction {
 
     double get_dt() const { return dt; }
 
+    double get_t0() const { return t0; }
+
     double get_support_right() const { return support_right; }
 
     // interpolation function
@@ -12,6 +12,7 @@
 %import(module="tick.base.array.build.array") ../array/swig/array_module.i
 
 %include normal_distribution.i
+%include exp_precision.i
 %include time_func.i
 %include base_test.i
 %include exceptions_test.i
@@ -0,0 +1,11 @@
+// License: BSD 3 clause
+
+%{
+#include "math/exp_precision.h"
+%}
+
+extern void set_fast_exp(bool fast);
+
+extern bool get_fast_exp();
+
+extern void exp_batch(ArrayDouble &x, ArrayDouble &out);
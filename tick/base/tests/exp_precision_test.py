@@ -0,0 +1,105 @@
+# License: BSD 3 clause
+
+import unittest
+
+import numpy as np
+
+from tick.base import set_exp_precision, get_exp_precision, \
+    exp_precision_report
+from tick.base.build.base import exp_batch
+from tick.optim.model import ModelHawkesFixedExpKernLeastSq, \
+    ModelHawkesFixedExpKernLogLik
+from tick.simulation import HawkesKernelExp, HawkesKernelSumExp
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        self.timestamps = [np.array([.2, .3, .65, .87, 1, 10, 12, 22]),
+                           np.array([3., 40., 60.])]
+        self.coeffs = np.array([.1, .4, .3, 1., .4, .5])
+
+    def tearDown(self):
+        set_exp_precision("exact")
+
+    def test_exp_precision(self):
+        """...Test exponential precision can be set globally
+        """
+        self.assertEqual(get_exp_precision(), "exact")
+        set_exp_precision("fast")
+        self.assertEqual(get_exp_precision(), "fast")
+        set_exp_precision("exact")
+        self.assertEqual(get_exp_precision(), "exact")
+
+        msg = '^``precision`` must be one of exact, fast, got wrong$'
+        with self.assertRaisesRegex(ValueError, msg):
+            set_exp_precision("wrong")
+
+    def test_exp_precision_models(self):
+        """...Test fast exponential precision is used by models and kernels
+        whatever their approximation level
+        """
+        # Weights are computed at the first computation of the loss
+        model_exact = ModelHawkesFixedExpKernLeastSq(decays=2.)
+        exact_loss = model_exact.fit(self.timestamps).loss(self.coeffs)
+        model_approx = ModelHawkesFixedExpKernLeastSq(decays=2., approx=1)
+        approx_loss = model_approx.fit(self.timestamps).loss(self.coeffs)
+
+        set_exp_precision("fast")
+        model_fast = ModelHawkesFixedExpKernLeastSq(decays=2.)
+        fast_loss = model_fast.fit(self.timestamps).loss(self.coeffs)
+        self.assertEqual(fast_loss, approx_loss)
+        self.assertNotEqual(fast_loss, exact_loss)
+        self.assertAlmostEqual(fast_loss, exact_loss, places=4)
+
+        kernel = HawkesKernelExp(2., 3.)
+        t_values = np.linspace(0, 2, 10)
+        fast_values = kernel.get_values(t_values)
+        set_exp_precision("exact")
+        exact_values = kernel.get_values(t_values)
+        np.testing.assert_array_almost_equal(fast_values, exact_values,
+                                             decimal=4)
+        np.testing.assert_array_almost_equal(
+            exact_values, 2. * 3. * np.exp(-3. * t_values), decimal=10)
+
+    def test_exp_precision_kernels_fast_exp(self):
+        """...Test the deprecated fast exponential switches of exponential
+        kernels set the global precision
+        """
+        for kernel in [HawkesKernelExp(2., 3.),
+                       HawkesKernelSumExp([2.], [3.])]:
+            kernel._kernel.set_fast_exp(True)
+            self.assertEqual(get_exp_precision(), "fast")
+            self.assertTrue(kernel._kernel.get_fast_exp())
+            set_exp_precision("exact")
+            self.assertFalse(kernel._kernel.get_fast_exp())
+
+    def test_exp_batch(self):
+        """...Test batch exponential computation
+        """
+        x = np.hstack((np.linspace(-700, 700, 1000), 0.))
+        out = np.empty_like(x)
+        for precision in ["exact", "fast"]:
+            set_exp_precision(precision)
+            exp_batch(x, out)
+            np.testing.assert_allclose(out, np.exp(x), rtol=1e-15)
+
+    def test_exp_precision_report(self):
+        """...Test accuracy and speed report of exponential precision
+        """
+        model = ModelHawkesFixedExpKernLogLik(2.)
+        report = exp_precision_report(model, (self.timestamps,), self.coeffs,
+                                      n_repeats=2)
+        self.assertEqual(get_exp_precision(), "exact")
+        for precision in ["exact", "fast"]:
+            self.assertGreaterEqual(report[precision]["fit_time"], 0)
+            self.assertGreaterEqual(report[precision]["loss_and_grad_time"],
+                                    0)
+        self.assertLess(report["loss_relative_error"], 1e-4)
+        self.assertLess(report["grad_relative_error"], 1e-4)
+
+        model.fit(self.timestamps)
+        self.assertEqual(report["exact"]["loss"], model.loss(self.coeffs))
+
+
+if __name__ == "__main__":
+    unittest.main()
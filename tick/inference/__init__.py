@@ -14,6 +14,7 @@ from .hawkes_adm4 import HawkesADM4
 from .hawkes_basis_kernels import HawkesBasisKernels
 from .hawkes_sumgaussians import HawkesSumGaussians
 from .survival import kaplan_meier, nelson_aalen
+from .cross_validation import CrossValidation
 
 __all__ = [
     "LinearRegression",
@@ -28,5 +29,6 @@ __all__ = [
     "HawkesBasisKernels",
     "HawkesSumGaussians,"
     "kaplan_meier",
-    "nelson_aalen"
+    "nelson_aalen",
+    "CrossValidation"
 ]
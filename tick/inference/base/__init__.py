@@ -4,4 +4,5 @@
 from .learner_optim import LearnerOptim
 from .learner_glm import LearnerGLM
 from .learner_hawkes_param import LearnerHawkesParametric
+from .em_acceleration import Squarem
 from .learner_hawkes_noparam import LearnerHawkesNoParam
\ No newline at end of file
@@ -0,0 +1,106 @@
+# License: BSD 3 clause
+
+import numpy as np
+
+
+class Squarem:
+    """Squared extrapolation (SQUAREM) of fixed-point iterations, such as the
+    EM iterations of nonparametric Hawkes learners.
+
+    Each step performs two iterations of the fixed-point map, extrapolates
+    from them with step length
+
+    .. math::
+        \\alpha = \\max \\left(1, \\frac{\\|r\\|}{\\|v\\|} \\right)
+
+    where :math:`r = F(\\theta) - \\theta` and
+    :math:`v = F(F(\\theta)) - 2 F(\\theta) + \\theta`, and stabilizes the
+    extrapolated point with a third iteration of the map. The extrapolated
+    point is projected on non-negative values.
+
+    The step is safeguarded: if the residual of the extrapolated point is
+    larger than the one of the last plain iteration, or if it is not finite,
+    the extrapolation is discarded for the result of the two plain
+    iterations and the maximum step length is reset.
+
+    Parameters
+    ----------
+    step_max : `float`, default=1.
+        Initial maximum step length of the extrapolation. A step length of
+        1 gives the result of two plain iterations
+
+    step_factor : `float`, default=4.
+        Factor by which the maximum step length is increased each time it is
+        reached
+
+    Notes
+    -----
+    See R. Varadhan and C. Roland, Simple and globally convergent methods
+    for accelerating the convergence of any EM algorithm, Scandinavian
+    Journal of Statistics, 2008
+    """
+
+    def __init__(self, step_max=1., step_factor=4.):
+        self.initial_step_max = step_max
+        self.step_max = step_max
+        self.step_factor = step_factor
+
+    def step(self, fixed_point_step, params):
+        """Performs one accelerated step
+
+        Parameters
+        ----------
+        fixed_point_step : `callable`
+            Function with no argument performing one iteration of the
+            fixed-point map, updating ``params`` in place
+
+        params : `list` of `np.ndarray`
+            Parameters updated by ``fixed_point_step``. They are updated in
+            place by the accelerated step
+
+        Returns
+        -------
+        output : `int`
+            Number of iterations of the fixed-point map performed
+        """
+        theta_0 = self._flatten(params)
+        fixed_point_step()
+        theta_1 = self._flatten(params)
+        fixed_point_step()
+        theta_2 = self._flatten(params)
+
+        r = theta_1 - theta_0
+        v = theta_2 - 2 * theta_1 + theta_0
+        norm_r = np.linalg.norm(r)
+        norm_v = np.linalg.norm(v)
+        if norm_v == 0:
+            return 2
+
+        step_length = min(max(1., norm_r / norm_v), self.step_max)
+        if step_length == self.step_max:
+            self.step_max *= self.step_factor
+
+        theta_extrapolated = np.maximum(
+            theta_0 + 2 * step_length * r + step_length ** 2 * v, 0)
+        self._unflatten(theta_extrapolated, params)
+        fixed_point_step()
+        theta_stabilized = self._flatten(params)
+
+        residual = np.linalg.norm(theta_stabilized - theta_extrapolated)
+        if not np.isfinite(residual) or \
+                residual > np.linalg.norm(theta_2 - theta_1):
+            self._unflatten(theta_2, params)
+            self.step_max = self.initial_step_max
+
+        return 3
+
+    @staticmethod
+    def _flatten(params):
+        return np.hstack([np.ravel(param) for param in params])
+
+    @staticmethod
+    def _unflatten(theta, params):
+        start = 0
+        for param in params:
+            param[...] = theta[start:start + param.size].reshape(param.shape)
+            start += param.size
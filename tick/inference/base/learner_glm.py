@@ -3,6 +3,7 @@
 from warnings import warn
 
 import numpy as np
+from scipy import sparse
 from tick.base import Base
 
 from tick.optim.model.base import ModelLipschitz
@@ -91,6 +92,17 @@ class LearnerGLM(LearnerOptim):
 
     intercept : `float` or None
         The intercept, if ``fit_intercept=True``, otherwise `None`
+
+    Cs_path : `np.array`, shape=(n_Cs,)
+        The levels of penalization given to the last call to `fit_path`
+
+    weights_path : `np.array`, shape=(n_Cs, n_features)
+        The weights learned by the last call to `fit_path`, for each level
+        of penalization in ``Cs_path``
+
+    intercept_path : `np.array`, shape=(n_Cs,) or None
+        The intercepts learned by the last call to `fit_path`, if
+        ``fit_intercept=True``, otherwise `None`
     """
 
     _attrinfos = {
@@ -103,8 +115,20 @@ class LearnerGLM(LearnerOptim):
         "intercept": {
             "writable": False
         },
+        "Cs_path": {
+            "writable": False
+        },
+        "weights_path": {
+            "writable": False
+        },
+        "intercept_path": {
+            "writable": False
+        },
     }
 
+    # Penalizations for which fit_path discards features with screening rules
+    _penalties_with_screening = ['l1', 'elasticnet']
+
     def __init__(self, fit_intercept=True, penalty='l2', C=1e3,
                  solver="svrg", step=None, tol=1e-5, max_iter=100,
                  verbose=True, warm_start=False, print_every=10,
@@ -129,6 +153,9 @@ class LearnerGLM(LearnerOptim):
         self.fit_intercept = fit_intercept
         self.weights = None
         self.intercept = None
+        self.Cs_path = None
+        self.weights_path = None
+        self.intercept_path = None
 
     @property
     def fit_intercept(self):
@@ -146,7 +173,9 @@ class LearnerGLM(LearnerOptim):
         ----------
         X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
             Training vector, where n_samples in the number of samples and
-            n_features is the number of features.
+            n_features is the number of features. It can also be a list of
+            shards of consecutive rows, and it can be memory mapped, see
+            `tick.preprocessing.load_features`.
 
         y : `np.array`, shape=(n_samples,)
             Target vector relative to X.
@@ -158,11 +187,299 @@ class LearnerGLM(LearnerOptim):
         """
         solver_obj = self._solver_obj
         model_obj = self._model_obj
+
+        self._fit_model_obj(X, y)
+        self._set_model_and_prox_in_solver()
+
+        coeffs_start = None
+        if self.warm_start and self.weights is not None:
+            if self.fit_intercept and self.intercept is not None:
+                coeffs = np.hstack((self.weights, self.intercept))
+            else:
+                coeffs = self.weights
+            # ensure starting point has the right format
+            if coeffs is not None and coeffs.shape == (model_obj.n_coeffs,):
+                coeffs_start = coeffs
+            else:
+                raise ValueError('Cannot warm start, coeffs don\'t have the '
+                                 'right shape')
+
+        # Launch the solver
+        coeffs = solver_obj.solve(coeffs_start)
+        self._set_coeffs(coeffs)
+        return self
+
+    def partial_fit(self, X: object, y: np.array):
+        """
+        Update the model with a new chunk of training data, with one epoch
+        of the stochastic solver over it.
+
+        The state of the solver (current coefficients, SDCA's dual
+        variables) is kept from one call to the next, hence calling it on
+        successive chunks of a stream of samples learns the model without
+        refitting it from scratch. The
+        first call starts from zero coefficients, unless the learner has
+        already been fitted with `fit`, in which case it goes on from the
+        state reached by the solver.
+
+        Parameters
+        ----------
+        X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
+            Chunk of training vectors. The number of features must be the
+            same for all chunks.
+
+        y : `np.array`, shape=(n_samples,)
+            Target vector relative to X.
+
+        Returns
+        -------
+        self : LearnerGLM
+            The updated instance of the model
+        """
+        if self.solver not in self._solvers_stochastic:
+            raise ValueError("partial_fit can only be used with stochastic "
+                             "solvers %s, got %s"
+                             % (', '.join(self._solvers_stochastic),
+                                self.solver))
+        solver_obj = self._solver_obj
+        model_obj = self._model_obj
+
+        self._fit_model_obj(X, y)
+
+        if solver_obj.model is None:
+            self._set_model_and_prox_in_solver()
+            coeffs = solver_obj.partial_solve(np.zeros(model_obj.n_coeffs))
+        else:
+            # The solver goes on from its current state
+            solver_obj.update_model(model_obj)
+            coeffs = solver_obj.partial_solve()
+
+        self._set_coeffs(coeffs)
+        return self
+
+    def fit_path(self, X: object, y: np.array, Cs: np.array,
+                 screening: bool = True):
+        """
+        Fit the model for several levels of penalization ``C``.
+
+        The data is given once to the model, that keeps its cached
+        Lipschitz constants and features norms along the path. The levels
+        are solved by increasing ``C`` (decreasing penalization), each one
+        being warm-started from the solution of the previous one. With
+        ``'l1'`` and ``'elasticnet'`` penalties, the sequential strong rule
+        discards the features that are likely to have a zero weight, and the
+        solver works on a model fitted on the columns of the remaining ones
+        only, the weights of the discarded ones being zero. The optimality
+        conditions of the discarded features are checked afterwards, and the
+        ones that violate them are added back, hence the solutions are the
+        same as without screening.
+
+        Parameters
+        ----------
+        X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
+            Training vector, where n_samples in the number of samples and
+            n_features is the number of features.
+
+        y : `np.array`, shape=(n_samples,)
+            Target vector relative to X.
+
+        Cs : `np.array`, shape=(n_Cs,)
+            The levels of penalization, positive
+
+        screening : `bool`, default=True
+            If `True`, discard features with screening rules when the
+            penalty is ``'l1'`` or ``'elasticnet'``
+
+        Returns
+        -------
+        self : LearnerGLM
+            The instance fitted with the largest value of ``Cs``. The
+            solutions for all values of ``Cs`` are stored in ``weights_path``
+            and ``intercept_path``
+        """
+        Cs = np.array(Cs, dtype=float)
+        if Cs.ndim != 1 or len(Cs) == 0 or np.any(Cs <= 0):
+            raise ValueError("``Cs`` must be a non-empty 1d array of positive "
+                             "values")
+        if self.penalty == 'none':
+            raise ValueError("fit_path cannot be used with penalty 'none'")
+
+        solver_obj = self._solver_obj
+        model_obj = self._model_obj
         prox_obj = self._prox_obj
         fit_intercept = self.fit_intercept
+        screening = screening and self.penalty in self._penalties_with_screening
+
+        self._fit_model_obj(X, y)
+        self._set_model_and_prox_in_solver()
+
+        n_features = model_obj.n_features
+        weights_path = np.zeros((len(Cs), n_features), dtype=model_obj.dtype)
+        intercept_path = np.zeros(len(Cs), dtype=model_obj.dtype) \
+            if fit_intercept else None
+
+        coeffs = np.zeros(model_obj.n_coeffs, dtype=model_obj.dtype)
+        if screening:
+            # Gradient of the loss at the previous solution, all weights are
+            # zero as long as the l1 strength is above its sup norm
+            grad = model_obj.grad(coeffs)[:n_features]
+            l1_strength_prev = np.abs(grad).max()
+
+        for k in np.argsort(Cs):
+            self.C = Cs[k]
+            if screening:
+                l1_strength = self._l1_strength()
+                # Sequential strong rule
+                active = (coeffs[:n_features] != 0) | \
+                         (np.abs(grad) >= 2 * l1_strength - l1_strength_prev)
+                if not np.any(active):
+                    active[np.argmax(np.abs(grad))] = True
+                while True:
+                    coeffs = self._solve_on_features(active, coeffs)
+                    grad = model_obj.grad(coeffs)[:n_features]
+                    # The weights of discarded features are zero, hence they
+                    # are optimal if their gradient is below the l1 strength
+                    violations = ~active & (np.abs(grad) > l1_strength)
+                    if not np.any(violations):
+                        break
+                    active |= violations
+                l1_strength_prev = l1_strength
+            else:
+                # The solver might use a copy of the prox for another dtype
+                solver_obj.set_prox(prox_obj)
+                coeffs = solver_obj.solve(self._path_coeffs_start(coeffs))
+
+            weights_path[k] = coeffs[:n_features]
+            if fit_intercept:
+                intercept_path[k] = coeffs[-1]
+
+        self._set("Cs_path", Cs)
+        self._set("weights_path", weights_path)
+        self._set("intercept_path", intercept_path)
+        self._set_coeffs(coeffs)
+        return self
 
-        # Pass the data to the model
-        model_obj.fit(X, y)
+    def _l1_strength(self):
+        """Strength of the l1 part of the penalization
+        """
+        if self.penalty == 'elasticnet':
+            return self._prox_obj.strength * self._prox_obj.ratio
+        return self._prox_obj.strength
+
+    def _path_coeffs_start(self, coeffs):
+        """Starting point of a solver along a path of penalization levels,
+        SDCA cannot be warm started
+        """
+        if self.solver == 'sdca':
+            return None
+        return coeffs
+
+    def _solve_on_features(self, active, coeffs):
+        """Solves the problem restricted to the features given by the
+        boolean mask ``active``, starting from ``coeffs`` and returns the
+        coefficients of the whole model, with zero weights for the other
+        features
+        """
+        solver_obj = self._solver_obj
+        model_obj = self._model_obj
+        prox_obj = self._prox_obj
+        n_features = model_obj.n_features
+        columns = np.flatnonzero(active)
+        n_active = len(columns)
+
+        # The solver works on a model fitted on the columns of the active
+        # features only, hence its iterations only go through them
+        model_active = self._construct_model_obj(
+            fit_intercept=self.fit_intercept)
+        model_active.fit(self._features_columns(model_obj.features, columns),
+                         model_obj.labels)
+        coeffs_active = np.concatenate((coeffs[columns], coeffs[n_features:]))
+
+        prox_range = prox_obj.range
+        prox_obj.range = (0, n_active)
+        try:
+            solver_obj.set_model(model_active).set_prox(prox_obj)
+            coeffs_active = solver_obj.solve(
+                self._path_coeffs_start(coeffs_active))
+        finally:
+            prox_obj.range = prox_range
+            solver_obj.set_model(model_obj).set_prox(prox_obj)
+
+        coeffs = np.zeros(model_obj.n_coeffs, dtype=coeffs_active.dtype)
+        coeffs[columns] = coeffs_active[:n_active]
+        coeffs[n_features:] = coeffs_active[n_active:]
+        return coeffs
+
+    def _fit_model_obj(self, X, y):
+        """Gives the data to the model
+        """
+        # Single precision features are used as is only if the penalization
+        # and the solver support them, otherwise they are converted to double
+        # precision. Only stochastic solvers have a single precision version,
+        # BFGS, GD and AGD work on double precision iterates
+        dtype = self._features_dtype(X)
+        solver_dtypes = getattr(self._solver_obj, "_cpp_class_dtype_map", {})
+        if dtype == np.float32 and \
+                (dtype not in self._prox_obj._cpp_class_dtype_map or
+                 dtype not in solver_dtypes):
+            X = self._features_astype(X, np.float64)
+
+        self._model_obj.fit(X, y)
+
+    def _held_out_model_obj(self, X, y):
+        """Model of held-out data, whose loss scores the coefficients found
+        by the solver
+        """
+        if self._features_dtype(X) != self._model_obj.dtype:
+            X = self._features_astype(X, self._model_obj.dtype)
+        model_obj = self._construct_model_obj(
+            fit_intercept=self.fit_intercept)
+        return model_obj.fit(X, y)
+
+    @staticmethod
+    def _features_dtype(X):
+        """Dtype of the features, that must be the same for all their
+        shards if they are given as a list of shards. `None` if features
+        have no dtype
+        """
+        if isinstance(X, (list, tuple)):
+            dtypes = set(getattr(shard, "dtype", None) for shard in X)
+            if len(dtypes) > 1:
+                raise ValueError("All shards of features must have the same "
+                                 "dtype, got %s" %
+                                 ", ".join(sorted(map(str, dtypes))))
+            return dtypes.pop() if len(dtypes) == 1 else None
+        return getattr(X, "dtype", None)
+
+    @staticmethod
+    def _features_astype(X, dtype):
+        """Converts the features, or each of their shards, to dtype
+        """
+        if isinstance(X, (list, tuple)):
+            return [shard.astype(dtype) for shard in X]
+        return X.astype(dtype)
+
+    @staticmethod
+    def _features_columns(X, columns):
+        """Columns of the features, or of each of their shards. Dense
+        columns are taken in C order, as the model would copy them otherwise
+        """
+        def shard_columns(shard):
+            if sparse.issparse(shard):
+                return shard[:, columns]
+            return shard.take(columns, axis=1)
+
+        if isinstance(X, (list, tuple)):
+            return [shard_columns(shard) for shard in X]
+        return shard_columns(X)
+
+    def _set_model_and_prox_in_solver(self):
+        """Sets the default step of the solver if needed and the range of
+        the prox, and gives the model and the prox to the solver
+        """
+        solver_obj = self._solver_obj
+        model_obj = self._model_obj
+        prox_obj = self._prox_obj
 
         if self.step is None and self.solver in self._solvers_with_step:
 
@@ -180,7 +497,7 @@ class LearnerGLM(LearnerOptim):
 
         # Determine the range of the prox
         # User cannot specify a custom range if he is using learners
-        if fit_intercept:
+        if self.fit_intercept:
             # Don't penalize the intercept (intercept is the last coeff)
             prox_obj.range = (0, model_obj.n_coeffs - 1)
         else:
@@ -189,31 +506,17 @@ class LearnerGLM(LearnerOptim):
         # Now, we can pass the model and prox objects to the solver
         solver_obj.set_model(model_obj).set_prox(prox_obj)
 
-        coeffs_start = None
-        if self.warm_start and self.weights is not None:
-            if self.fit_intercept and self.intercept is not None:
-                coeffs = np.hstack((self.weights, self.intercept))
-            else:
-                coeffs = self.weights
-            # ensure starting point has the right format
-            if coeffs is not None and coeffs.shape == (model_obj.n_coeffs,):
-                coeffs_start = coeffs
-            else:
-                raise ValueError('Cannot warm start, coeffs don\'t have the '
-                                 'right shape')
-
-        # Launch the solver
-        coeffs = solver_obj.solve(coeffs_start)
-
-        # Get the learned coefficients
-        if fit_intercept:
+    def _set_coeffs(self, coeffs):
+        """Sets the learned weights and intercept from the coefficients
+        found by the solver
+        """
+        if self.fit_intercept:
             self._set("weights", coeffs[:-1])
             self._set("intercept", coeffs[-1])
         else:
             self._set("weights", coeffs)
             self._set("intercept", None)
         self._set("_fitted", True)
-        return self
 
     def get_params(self):
         """
@@ -261,4 +564,6 @@ class LearnerGLM(LearnerOptim):
         dd = Base._as_dict(self)
         dd.pop("intercept", None)
         dd.pop("weights", None)
+        dd.pop("weights_path", None)
+        dd.pop("intercept_path", None)
         return dd
@@ -3,6 +3,7 @@
 import numpy as np
 
 from tick.optim.solver.base import Solver
+from .em_acceleration import Squarem
 
 
 class LearnerHawkesNoParam(Solver):
@@ -30,6 +31,13 @@ class LearnerHawkesNoParam(Solver):
         Record history information when ``n_iter`` (iteration number) is
         a multiple of ``record_every``
 
+    acceleration : {None, 'squarem'}, default=None
+        Extrapolation scheme used to accelerate the fixed-point iterations
+        of the learners that support it. If 'squarem', each iteration
+        performs three iterations of the fixed-point map and extrapolates
+        from them (see `Squarem`). The total number of iterations of the
+        fixed-point map is recorded in history as ``n_em_steps``
+
     Notes
     -----
     This class should be not used by end-users, it is intended for
@@ -57,12 +65,23 @@ class LearnerHawkesNoParam(Solver):
 
     _cpp_obj_name = '_learner'
 
+    _accelerations = {
+        None: None,
+        "squarem": Squarem,
+    }
+
     def __init__(self, tol=1e-5, verbose=False,
                  approx=0, n_threads=1, max_iter=100,
-                 print_every=10, record_every=10):
+                 print_every=10, record_every=10, acceleration=None):
         Solver.__init__(self, tol=tol, verbose=verbose, max_iter=max_iter,
                         print_every=print_every, record_every=record_every)
 
+        if acceleration not in self._accelerations:
+            raise ValueError("``acceleration`` must be one of %s, got %s"
+                             % (", ".join(map(str, self._accelerations)),
+                                acceleration))
+        self.acceleration = acceleration
+
         self.approx = approx
         self.n_threads = n_threads
         self.verbose = verbose
@@ -119,6 +138,28 @@ class LearnerHawkesNoParam(Solver):
         except TypeError:
             self._learner.set_data(events)
 
+    def _new_accelerator(self):
+        """Accelerator of the fixed-point iterations of a new solve, `None`
+        if no acceleration is used
+        """
+        acceleration_class = self._accelerations[self.acceleration]
+        if acceleration_class is None:
+            return None
+        return acceleration_class()
+
+    @staticmethod
+    def _fixed_point_iteration(accelerator, fixed_point_step, params):
+        """Performs one iteration of the fixed-point map updating params in
+        place, accelerated by the given accelerator if it is not `None`.
+        Returns the number of evaluations of the fixed-point map it
+        performed
+        """
+        if accelerator is None:
+            fixed_point_step()
+            return 1
+        else:
+            return accelerator.step(fixed_point_step, params)
+
     def _clean_events_and_endtimes(self, events):
         if not isinstance(events[0][0], np.ndarray):
             events = [events]
@@ -10,6 +10,8 @@ from tick.optim.model.base import ModelLipschitz
 from tick.optim.prox import ProxElasticNet, ProxL1, ProxL2Sq, ProxPositive
 from tick.optim.solver import AGD, GD, SGD, SVRG, BFGS
 from tick.simulation import SimuHawkes
+from tick.inference.build.inference import HawkesSumExpKernIntensity as \
+    _HawkesSumExpKernIntensity
 
 
 class LearnerHawkesParametric(LearnerOptim):
@@ -157,13 +159,50 @@ class LearnerHawkesParametric(LearnerOptim):
         output : `LearnerHawkesParametric`
             The current instance of the Learner
         """
+        # Pass the data to the model
+        self._model_obj.fit(events)
+
+        return self._solve(start)
+
+    def partial_fit(self, events: list, end_time=None):
+        """Update the fit with a new batch of events of the same realization.
+        The first call fits the model on the given events, the following
+        calls append the events to the ones already given and restart the
+        solver from the current ``coeffs``, the weights of the model being
+        updated incrementally.
+
+        Parameters
+        ----------
+        events : `list` of `np.array`
+            The new events of each component of the Hawkes. Namely
+            `events[j]` contains a one-dimensional `numpy.array` of
+            the new events' timestamps of component j, all happening after
+            the end time of the previous batch
+
+        end_time : `float`, default=None
+            Time up to which the process has been observed. If None, it will
+            be set to the latest time of the given events
+
+        Returns
+        -------
+        output : `LearnerHawkesParametric`
+            The current instance of the Learner
+        """
+        if not self._fitted:
+            self._model_obj.fit(events, end_times=end_time)
+            return self._solve()
+
+        self._model_obj.append_events(events, end_time=end_time)
+        return self._solve(self.coeffs)
+
+    def _solve(self, start=None):
+        """Launch the solver on the model, the data being already given to
+        it
+        """
         solver_obj = self._solver_obj
         model_obj = self._model_obj
         prox_obj = self._prox_obj
 
-        # Pass the data to the model
-        model_obj.fit(events)
-
         if self.step is None and self.solver in self._solvers_with_step:
 
             if self.solver in self._solvers_with_linesearch:
@@ -206,6 +245,12 @@ class LearnerHawkesParametric(LearnerOptim):
 
         return self
 
+    def _held_out_model_obj(self, events):
+        """Model of held-out realizations, whose loss scores the coefficients
+        found by the solver
+        """
+        return self._construct_model_obj().fit(events)
+
     def _set_prox_range(self, model_obj, prox_obj):
         prox_obj.range = (0, model_obj.n_coeffs)
 
@@ -226,6 +271,191 @@ class LearnerHawkesParametric(LearnerOptim):
         """
         return SimuHawkes()
 
+    def _sum_exp_kernels(self):
+        """Estimated parameters expressed with sum exponential kernels and
+        piecewise constant baselines, used to evaluate intensities and
+        compensators
+
+        Returns
+        -------
+        decays : `np.ndarray`, shape=(n_decays, )
+            Decays shared by all kernels
+
+        baseline : `np.ndarray`, shape=(n_nodes, n_baselines)
+            Baselines of each node on each interval of a period
+
+        adjacency : `np.ndarray`
+            Adjacency coefficients of the kernels of the pairs of nodes of
+            the support, in row major order, with the coefficients of all
+            decays for each pair if ``pair_decays`` is `None`, and a single
+            coefficient otherwise
+
+        period_length : `float`
+            Period of the baselines, only used if ``n_baselines > 1``
+
+        support : `scipy.sparse.csr_matrix` or `None`
+            Pairs of nodes that have kernels, all pairs if `None`
+
+        pair_decays : `np.ndarray` or `None`
+            Index in ``decays`` of the single decay of the kernel of each
+            pair of nodes of the support. If `None`, each pair has the
+            kernels of all decays
+        """
+        raise NotImplementedError("Intensities cannot be computed with "
+                                  "the kernels of %s" %
+                                  self.__class__.__name__)
+
+    def _intensity_evaluator(self, events, n_threads):
+        """C++ object evaluating the intensities and compensators of the
+        given realizations, with the baseline and adjacency coefficients it
+        must be called with
+        """
+        if not self._fitted:
+            raise ValueError('You must fit data before computing '
+                             'intensities')
+
+        if not isinstance(events[0][0], np.ndarray):
+            events = [events]
+        events = [[np.ascontiguousarray(timestamps, dtype=float)
+                   for timestamps in realization] for realization in events]
+        end_times = np.array([max((timestamps.max()
+                                   for timestamps in realization
+                                   if len(timestamps) > 0), default=0.)
+                              for realization in events])
+
+        decays, baseline, adjacency, period_length, support, pair_decays = \
+            self._sum_exp_kernels()
+        n_baselines = baseline.shape[1]
+        evaluator = _HawkesSumExpKernIntensity(
+            np.ascontiguousarray(decays, dtype=float), n_baselines,
+            period_length if n_baselines > 1 else 0., n_threads)
+        evaluator.set_data(events, end_times)
+        if support is not None:
+            evaluator.set_support(support.indptr.astype(np.uint64),
+                                  support.indices.astype(np.uint64))
+        if pair_decays is not None:
+            evaluator.set_pair_decays(pair_decays.astype(np.uint64))
+        return evaluator, np.ascontiguousarray(baseline.ravel()), \
+            np.ascontiguousarray(adjacency.ravel())
+
+    def estimated_intensity(self, events, times, n_threads=1):
+        """Computes the intensity of each node at the given times with the
+        estimated coefficients
+
+        Parameters
+        ----------
+        events : `list` of `np.ndarray` or `list` of `list` of `np.ndarray`
+            Realization, or list of realizations, of the Hawkes process on
+            which the intensity is computed. Namely ``events[j]`` contains
+            the timestamps of component j of the realization. It does not
+            need to be the realization the learner was fitted on
+
+        times : `np.ndarray` or `list` of `np.ndarray`
+            Times at which the intensity is computed, one array per
+            realization if several realizations are given
+
+        n_threads : `int`, default=1
+            Number of threads used, the intensities of each node of each
+            realization being computed in parallel.
+
+            * if ``int <= 0``: the number of physical cores available on
+              the CPU
+            * otherwise the desired number of threads
+
+        Returns
+        -------
+        output : `np.ndarray`, shape=(n_nodes, n_times)
+            Intensity of each node at each time, only the events strictly
+            before each time being accounted for. A list of such arrays
+            is returned if several realizations are given
+
+        Notes
+        -----
+        The excitation of each kernel is updated recursively from one event
+        to the next one, hence the computation is linear in the number of
+        events and of times.
+        """
+        single_realization = not isinstance(events[0][0], np.ndarray)
+        if single_realization:
+            times = [times]
+
+        evaluator, baseline, adjacency = \
+            self._intensity_evaluator(events, n_threads)
+
+        # Times are sorted before being given to the C++ object
+        orders = [np.argsort(times_r, kind='mergesort') for times_r in times]
+        sorted_times = [np.ascontiguousarray(times_r[order], dtype=float)
+                        for times_r, order in zip(times, orders)]
+        sorted_intensities = [np.empty((self.n_nodes, len(times_r)))
+                              for times_r in sorted_times]
+        evaluator.estimated_intensity(
+            baseline, adjacency, sorted_times,
+            [list(intensities_r) for intensities_r in sorted_intensities])
+
+        intensities = []
+        for order, sorted_intensities_r in zip(orders, sorted_intensities):
+            intensities_r = np.empty_like(sorted_intensities_r)
+            intensities_r[:, order] = sorted_intensities_r
+            intensities.append(intensities_r)
+
+        if single_realization:
+            return intensities[0]
+        return intensities
+
+    def compensator(self, events, n_threads=1):
+        """Computes the compensator, namely the integral of the intensity
+        from 0, of each node at each of its events with the estimated
+        coefficients
+
+        If the model is well specified, the increments of the compensator of
+        each node between its consecutive events are independent and
+        exponentially distributed with mean 1 (time rescaling theorem),
+        which is the basis of goodness-of-fit tests.
+
+        Parameters
+        ----------
+        events : `list` of `np.ndarray` or `list` of `list` of `np.ndarray`
+            Realization, or list of realizations, of the Hawkes process on
+            which the compensator is computed. Namely ``events[j]`` contains
+            the timestamps of component j of the realization
+
+        n_threads : `int`, default=1
+            Number of threads used, the compensators of each node of each
+            realization being computed in parallel.
+
+            * if ``int <= 0``: the number of physical cores available on
+              the CPU
+            * otherwise the desired number of threads
+
+        Returns
+        -------
+        output : `list` of `np.ndarray`
+            Compensator of each node at each of its events, namely
+            ``output[j][k]`` is the compensator of node j at
+            ``events[j][k]``. A list of such lists is returned if several
+            realizations are given
+
+        Notes
+        -----
+        The integral of each kernel is updated recursively from one event to
+        the next one, hence the computation is linear in the number of
+        events.
+        """
+        single_realization = not isinstance(events[0][0], np.ndarray)
+
+        evaluator, baseline, adjacency = \
+            self._intensity_evaluator(events, n_threads)
+
+        if single_realization:
+            events = [events]
+        compensators = [[np.empty(len(timestamps)) for timestamps in
+                         realization] for realization in events]
+        evaluator.compensator(baseline, adjacency, compensators)
+
+        if single_realization:
+            return compensators[0]
+        return compensators
+
     def get_kernel_supports(self):
         """Computes kernel support. This makes our learner compliant with
         `tick.plot.plot_hawkes_kernels` API
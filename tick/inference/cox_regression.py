@@ -53,6 +53,14 @@ class CoxRegression(LearnerOptim):
         Record history information when ``n_iter`` (iteration number) is
         a multiple of ``record_every``
 
+    n_threads : `int`, default=1
+        Number of threads used to compute the loss and gradient of the
+        partial likelihood.
+
+        * if ``int <= 0``: the number of physical cores available on
+          the CPU
+        * otherwise the desired number of threads
+
     Other Parameters
     ----------------
     elastic_net_ratio : `float`, default=0.95
@@ -99,7 +107,7 @@ class CoxRegression(LearnerOptim):
                  verbose=False, warm_start=False,
                  print_every=10, record_every=10,
                  elastic_net_ratio=0.95, random_state=None, blocks_start=None,
-                 blocks_length=None):
+                 blocks_length=None, n_threads=1):
 
         self._actual_kwargs = CoxRegression.__init__.actual_kwargs
         LearnerOptim.__init__(self, penalty=penalty, C=C, solver=solver,
@@ -110,11 +118,16 @@ class CoxRegression(LearnerOptim):
                               elastic_net_ratio=elastic_net_ratio,
                               random_state=random_state,
                               blocks_start=blocks_start,
-                              blocks_length=blocks_length)
+                              blocks_length=blocks_length,
+                              extra_model_kwargs={'n_threads': n_threads})
         self.coeffs = None
 
-    def _construct_model_obj(self):
-        return ModelCoxRegPartialLik()
+    @property
+    def n_threads(self):
+        return self._model_obj.n_threads
+
+    def _construct_model_obj(self, n_threads=1):
+        return ModelCoxRegPartialLik(n_threads=n_threads)
 
     def _all_safe(self, features: np.ndarray, times: np.array,
                   censoring: np.array):
@@ -129,6 +142,14 @@ class CoxRegression(LearnerOptim):
         censoring = safe_array(censoring, np.ushort)
         return features, times, censoring
 
+    def _held_out_model_obj(self, features, times, censoring):
+        """Model of held-out data, whose loss scores the coefficients found
+        by the solver
+        """
+        features, times, censoring = self._all_safe(features, times, censoring)
+        return ModelCoxRegPartialLik(n_threads=self.n_threads).fit(
+            features, times, censoring)
+
     def fit(self, features: np.ndarray, times: np.array, censoring: np.array):
         """Fit the model according to the given training data.
 
@@ -224,8 +245,8 @@ class CoxRegression(LearnerOptim):
                 else:
                     features, times, censoring = self._all_safe(features, times,
                                                                 censoring)
-                    model = ModelCoxRegPartialLik().fit(features, times,
-                                                        censoring)
+                    model = ModelCoxRegPartialLik(n_threads=self.n_threads)\
+                        .fit(features, times, censoring)
                     return model.loss(self.coeffs)
         else:
             raise RuntimeError('You must fit the model first')
@@ -0,0 +1,276 @@
+# License: BSD 3 clause
+
+import itertools
+import multiprocessing
+from inspect import signature, Parameter
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, vstack as sparse_vstack
+
+from tick.base import Base
+from tick.inference.base import LearnerOptim, LearnerGLM, \
+    LearnerHawkesParametric
+
+
+class CrossValidation(Base):
+    """K-fold cross-validation and grid search of the hyper-parameters of a
+    learner, such as `LogisticRegression`, `CoxRegression` or
+    `HawkesExpKern`.
+
+    The data is never copied for each fold: the features of `LearnerGLM`
+    learners are given to the models as shards of row views of the whole
+    features matrix, and Hawkes learners are given the realizations that
+    belong to each fold. The folds are trained in parallel on a pool of
+    threads, the computations of the models and solvers releasing the GIL.
+    For each fold, the values of ``C`` are visited from the strongest to the
+    weakest penalization, each fit starting from the solution of the
+    previous one.
+
+    Parameters
+    ----------
+    learner : `LearnerOptim`
+        The learner to cross-validate. It is not fitted: new learners with
+        the same parameters and the values of the grid are created for each
+        fold
+
+    param_grid : `dict`
+        Values of the parameters to try, keys being the names of the
+        parameters of the learner and values the lists of values to try
+        for them. All combinations are tried
+
+    n_folds : `int`, default=5
+        Number of folds. Samples (or realizations for Hawkes learners) are
+        split in ``n_folds`` consecutive folds, each of them being used once
+        as test data while the others are used for training
+
+    n_threads : `int`, default=1
+        Number of threads used to fit the folds. If ``n_threads <= 0``, the
+        number of cpus is used
+
+    refit : `bool`, default=True
+        If `True`, the learner with the best parameters is fitted on the
+        whole data at the end and stored in ``best_learner``
+
+    Attributes
+    ----------
+    grid : `list` of `dict`
+        All the combinations of parameters tried
+
+    test_losses : `np.ndarray`, shape=(n_grid, n_folds)
+        Loss of the model on the test data of each fold, for each
+        combination of parameters of ``grid``
+
+    best_params : `dict`
+        The combination of parameters with the lowest mean test loss
+
+    best_learner : `LearnerOptim`
+        The learner with the best parameters fitted on the whole data, only
+        if ``refit`` is `True`
+
+    Notes
+    -----
+    The features of `CoxRegression` are stacked for each fold since its
+    model does not support shards of features.
+    """
+
+    _attrinfos = {
+        "grid": {
+            "writable": False
+        },
+        "test_losses": {
+            "writable": False
+        },
+        "best_params": {
+            "writable": False
+        },
+        "best_learner": {
+            "writable": False
+        },
+    }
+
+    def __init__(self, learner: LearnerOptim, param_grid: dict,
+                 n_folds: int = 5, n_threads: int = 1, refit: bool = True):
+        Base.__init__(self)
+        if not isinstance(learner, LearnerOptim):
+            raise ValueError("``learner`` must be a LearnerOptim, got %s"
+                             % learner.__class__.__name__)
+        if n_folds < 2:
+            raise ValueError("``n_folds`` must be at least 2, got %s"
+                             % str(n_folds))
+        for name, values in param_grid.items():
+            if name not in learner._actual_kwargs and \
+                    not hasattr(learner, name):
+                raise ValueError("%s has no parameter %s"
+                                 % (learner.__class__.__name__, name))
+            if len(values) == 0:
+                raise ValueError("No value given for parameter %s" % name)
+
+        if n_threads <= 0:
+            n_threads = multiprocessing.cpu_count()
+
+        self.learner = learner
+        self.param_grid = param_grid
+        self.n_folds = n_folds
+        self.n_threads = n_threads
+        self.refit = refit
+
+        self._set("grid", None)
+        self._set("test_losses", None)
+        self._set("best_params", None)
+        self._set("best_learner", None)
+
+    def fit(self, *data):
+        """Cross-validate the learner on the given data
+
+        Parameters
+        ----------
+        data :
+            The data, as given to the ``fit`` method of the learner, namely
+            ``X, y`` for `LearnerGLM` learners, ``features, times,
+            censoring`` for `CoxRegression` and ``events`` for Hawkes
+            learners, ``events`` being a list of realizations
+
+        Returns
+        -------
+        output : `CrossValidation`
+            The fitted instance
+        """
+        folds = self._split_folds(*data)
+
+        # Values of C are sorted by decreasing penalization to warm start
+        # the solver along them, other parameters need new learners
+        other_names = sorted(name for name in self.param_grid if name != 'C')
+        other_grid = [dict(zip(other_names, values)) for values in
+                      itertools.product(*[self.param_grid[name]
+                                          for name in other_names])]
+        Cs = sorted(self.param_grid.get('C', [None]))
+
+        grid = [dict(params, C=C) if C is not None else params
+                for params in other_grid for C in Cs]
+
+        jobs = list(itertools.product(range(len(other_grid)),
+                                      range(self.n_folds)))
+        with ThreadPoolExecutor(max_workers=self.n_threads) as executor:
+            futures = [executor.submit(self._fit_fold, other_grid[k], Cs,
+                                       *folds[fold])
+                       for k, fold in jobs]
+            path_losses = [future.result() for future in futures]
+
+        test_losses = np.empty((len(grid), self.n_folds))
+        for (k, fold), losses in zip(jobs, path_losses):
+            test_losses[k * len(Cs): (k + 1) * len(Cs), fold] = losses
+
+        self._set("grid", grid)
+        self._set("test_losses", test_losses)
+        best_params = grid[np.argmin(test_losses.mean(axis=1))]
+        self._set("best_params", best_params)
+
+        if self.refit:
+            best_learner = self._new_learner(best_params)
+            best_learner.fit(*data)
+            self._set("best_learner", best_learner)
+
+        return self
+
+    def _new_learner(self, params, **kwargs):
+        """Creates a learner with the parameters of the cross-validated
+        learner, updated with the given ones
+        """
+        learner_kwargs = dict(self.learner._actual_kwargs)
+        # Parameters given as positional arguments are not in actual kwargs
+        init_parameters = signature(self.learner.__class__).parameters
+        for name, parameter in init_parameters.items():
+            if parameter.default is Parameter.empty and \
+                    name not in learner_kwargs:
+                learner_kwargs[name] = getattr(self.learner, name)
+        learner_kwargs.update(kwargs)
+        learner_kwargs.update(params)
+        return self.learner.__class__(**learner_kwargs)
+
+    def _fit_fold(self, params, Cs, train_data, test_data):
+        """Fits a learner on the training data of a fold for all values of
+        C and returns the corresponding losses on the test data
+        """
+        learner = self._new_learner(params, verbose=False)
+        solver_obj = learner._solver_obj
+
+        losses = []
+        for i, C in enumerate(Cs):
+            if C is not None:
+                learner.C = C
+            if i == 0:
+                learner.fit(*train_data)
+                test_model_obj = learner._held_out_model_obj(*test_data)
+            else:
+                # The prox given to the solver might be a copy in another
+                # precision, hence it is given again with its new strength
+                solver_obj.set_prox(learner._prox_obj)
+                if learner.solver == 'sdca':
+                    solver_obj.solve()
+                else:
+                    solver_obj.solve(solver_obj.solution)
+            losses.append(test_model_obj.loss(solver_obj.solution))
+        return losses
+
+    def _split_folds(self, *data):
+        """Splits the data in training and test data of each fold
+        """
+        if isinstance(self.learner, LearnerHawkesParametric):
+            events = data[0]
+            if isinstance(events[0], np.ndarray) or \
+                    len(events) < self.n_folds:
+                raise ValueError("Hawkes learners are cross-validated on "
+                                 "realizations, got %i realizations for %i "
+                                 "folds" % (len(events), self.n_folds))
+            bounds = self._fold_bounds(len(events))
+            return [((events[:start] + events[end:],), (events[start:end],))
+                    for start, end in bounds]
+
+        features, labels = data[0], data[1:]
+        n_samples = features.shape[0]
+        if n_samples < self.n_folds:
+            raise ValueError("Got %i samples for %i folds"
+                             % (n_samples, self.n_folds))
+
+        folds = []
+        for start, end in self._fold_bounds(n_samples):
+            train_features = [shard for shard in
+                              (_row_view(features, 0, start),
+                               _row_view(features, end, n_samples))
+                              if shard.shape[0] > 0]
+            if not isinstance(self.learner, LearnerGLM):
+                if issparse(features):
+                    train_features = sparse_vstack(train_features).tocsr()
+                else:
+                    train_features = np.vstack(train_features)
+            elif len(train_features) == 1:
+                train_features = train_features[0]
+            train_labels = [np.hstack((label[:start], label[end:]))
+                            for label in labels]
+            test_labels = [label[start:end] for label in labels]
+            folds.append(
+                ((train_features,) + tuple(train_labels),
+                 (_row_view(features, start, end),) + tuple(test_labels)))
+        return folds
+
+    def _fold_bounds(self, n):
+        """Bounds of the consecutive folds of n samples
+        """
+        limits = np.linspace(0, n, self.n_folds + 1).astype(int)
+        return list(zip(limits[:-1], limits[1:]))
+
+
+def _row_view(features, start, end):
+    """Rows start to end of the features, sharing their memory
+    """
+    if issparse(features):
+        features = csr_matrix(features)
+        indptr = features.indptr[start:end + 1]
+        first, last = indptr[0], indptr[-1]
+        return csr_matrix((features.data[first:last],
+                           features.indices[first:last],
+                           indptr - first),
+                          shape=(end - start, features.shape[1]))
+    else:
+        return features[start:end]
@@ -1,6 +1,7 @@
 # License: BSD 3 clause
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from tick.inference.base import LearnerHawkesNoParam
 from tick.optim.model import ModelHawkesFixedExpKernLogLik
@@ -87,6 +88,13 @@ class HawkesADM4(LearnerHawkesNoParam):
         Record history information when ``n_iter`` (iteration number) is
         a multiple of ``record_every``
 
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, the adjacency
+        coefficient of node j on node i is fixed to zero and the EM steps
+        only go through the pairs of nodes of the support. The nuclear and
+        Lasso penalizations still apply to the whole adjacency matrix
+
     Other Parameters
     ----------------
     rho : `float`, default=0.1
@@ -100,6 +108,10 @@ class HawkesADM4(LearnerHawkesNoParam):
         * if 0: no approximation
         * if 1: a fast approximated exponential function is used
 
+        If the global precision is set to 'fast' with
+        `tick.base.set_exp_precision`, the approximated exponential function
+        is used whatever this level
+
     em_max_iter : `int`, default=30
         Maximum number of loop for inner em algorithm.
 
@@ -110,6 +122,13 @@ class HawkesADM4(LearnerHawkesNoParam):
         If None, it will be set given a heuristic which look at last
         relative difference obtained in the main loop.
 
+    acceleration : {None, 'squarem'}, default=None
+        Extrapolation scheme used to accelerate the inner EM iterations. If
+        'squarem', each iteration performs three EM iterations and
+        extrapolates from them, which usually cuts the number of
+        iterations needed to converge. The total number of inner EM
+        iterations is recorded in history as ``n_em_steps``
+
     Attributes
     ----------
     n_nodes : `int`
@@ -144,18 +163,20 @@ class HawkesADM4(LearnerHawkesNoParam):
         "_prox_l1": {"writable": False},
         "_prox_nuclear": {"writable": False},
         "_lasso_nuclear_ratio": {"writable": False},
-        "approx": {"writable": False}
+        "approx": {"writable": False},
+        "support": {"writable": False},
     }
 
     def __init__(self, decay, C=1e3, lasso_nuclear_ratio=0.5, max_iter=50,
                  tol=1e-5, n_threads=1, verbose=False, print_every=10,
                  record_every=10, rho=.1, approx=0, em_max_iter=30,
-                 em_tol=None):
+                 em_tol=None, acceleration=None, support=None):
 
         LearnerHawkesNoParam.__init__(self, verbose=verbose, max_iter=max_iter,
                                       print_every=print_every, tol=tol,
                                       n_threads=n_threads,
-                                      record_every=record_every)
+                                      record_every=record_every,
+                                      acceleration=acceleration)
         self.baseline = None
         self.adjacency = None
         self._C = 0
@@ -175,6 +196,14 @@ class HawkesADM4(LearnerHawkesNoParam):
         self.em_tol = em_tol
 
         self._learner = _HawkesADM4(decay, rho, n_threads, approx)
+        self._set("support", None)
+        if support is not None:
+            support = csr_matrix(support)
+            support.eliminate_zeros()
+            support.sort_indices()
+            self._set("support", support)
+            self._learner.set_support(support.indptr.astype(np.uint64),
+                                      support.indices.astype(np.uint64))
 
         # TODO add approx to model
         self._model = ModelHawkesFixedExpKernLogLik(self.decay,
@@ -259,6 +288,8 @@ class HawkesADM4(LearnerHawkesNoParam):
         if adjacency_start is None:
             adjacency_start = np.random.uniform(0.5, 0.9,
                                                 (self.n_nodes, self.n_nodes))
+        if self.support is not None:
+            adjacency_start = adjacency_start * (self.support.toarray() != 0)
         self._set('adjacency', adjacency_start.copy())
 
         z1 = np.zeros_like(self.adjacency)
@@ -270,19 +301,25 @@ class HawkesADM4(LearnerHawkesNoParam):
             raise ValueError("The parameter rho equals {}, while it should "
                              "be strictly positive.".format(self.rho))
 
+        def em_step():
+            self._learner.solve(self.baseline, self.adjacency, z1, z2, u1, u2)
+
         objective = self.objective(self.coeffs)
 
         max_relative_distance = 1e-1
+        n_em_steps = 0
         for i in range(self.max_iter + 1):
             prev_objective = objective
             prev_baseline = self.baseline.copy()
             prev_adjacency = self.adjacency.copy()
 
+            # The inner EM solves a new problem as z and u have changed
+            accelerator = self._new_accelerator()
             for _ in range(self.em_max_iter):
                 inner_prev_baseline = self.baseline.copy()
                 inner_prev_adjacency = self.adjacency.copy()
-                self._learner.solve(self.baseline, self.adjacency,
-                                    z1, z2, u1, u2)
+                n_em_steps += self._fixed_point_iteration(
+                    accelerator, em_step, [self.baseline, self.adjacency])
                 inner_rel_baseline = relative_distance(self.baseline,
                                                        inner_prev_baseline)
                 inner_rel_adjacency = relative_distance(self.adjacency,
@@ -321,7 +358,7 @@ class HawkesADM4(LearnerHawkesNoParam):
             self._handle_history(i, obj=objective, rel_obj=rel_obj,
                                  rel_baseline=rel_baseline,
                                  rel_adjacency=rel_adjacency,
-                                 force=force_print)
+                                 n_em_steps=n_em_steps, force=force_print)
 
             if converged:
                 break
@@ -93,6 +93,13 @@ class HawkesBasisKernels(LearnerHawkesNoParam):
         Tolerance of loop for inner inner ODE (ordinary differential equation)
         algorithm.
 
+    acceleration : {None, 'squarem'}, default=None
+        Extrapolation scheme used to accelerate the EM iterations. If
+        'squarem', each iteration performs three EM iterations and
+        extrapolates from them, which usually cuts the number of
+        iterations needed to converge. The total number of EM iterations is
+        recorded in history as ``n_em_steps``
+
     Attributes
     ----------
     n_nodes : `int`
@@ -139,12 +146,14 @@ class HawkesBasisKernels(LearnerHawkesNoParam):
 
     def __init__(self, kernel_support, n_basis=None, kernel_size=10, tol=1e-5,
                  C=1e-1, max_iter=100, verbose=False, print_every=10,
-                 record_every=10, n_threads=1, ode_max_iter=100, ode_tol=1e-5):
+                 record_every=10, n_threads=1, ode_max_iter=100, ode_tol=1e-5,
+                 acceleration=None):
 
         LearnerHawkesNoParam.__init__(self, max_iter=max_iter, verbose=verbose,
                                       tol=tol, print_every=print_every,
                                       record_every=record_every,
-                                      n_threads=n_threads)
+                                      n_threads=n_threads,
+                                      acceleration=acceleration)
 
         self.ode_max_iter = ode_max_iter
         self.ode_tol = ode_tol
@@ -242,14 +251,24 @@ class HawkesBasisKernels(LearnerHawkesNoParam):
                   self.amplitudes.reshape((self.n_nodes, self.n_nodes *
                                            self.n_basis)))
 
+        rel_ode = None
+
+        def em_step():
+            nonlocal rel_ode
+            rel_ode = self._learner.solve(self.baseline, self.basis_kernels,
+                                          self._amplitudes_2d, self.ode_max_iter,
+                                          self.ode_tol)
+
+        accelerator = self._new_accelerator()
+        n_em_steps = 0
         for i in range(self.max_iter + 1):
             prev_baseline = self.baseline.copy()
             prev_amplitudes = self.amplitudes.copy()
             prev_basis_kernels = self.basis_kernels.copy()
 
-            rel_ode = self._learner.solve(self.baseline, self.basis_kernels,
-                                          self._amplitudes_2d, self.ode_max_iter,
-                                          self.ode_tol)
+            n_em_steps += self._fixed_point_iteration(
+                accelerator, em_step,
+                [self.baseline, self.amplitudes, self.basis_kernels])
 
             rel_baseline = relative_distance(self.baseline, prev_baseline)
             rel_amplitudes = relative_distance(self.amplitudes, prev_amplitudes)
@@ -263,7 +282,7 @@ class HawkesBasisKernels(LearnerHawkesNoParam):
             self._handle_history(i, rel_baseline=rel_baseline,
                                  rel_amplitudes=rel_amplitudes,
                                  rel_basis_kernels=rel_basis_kernels,
-                                 rel_ode=rel_ode,
+                                 rel_ode=rel_ode, n_em_steps=n_em_steps,
                                  force=force_print)
 
             if converged:
@@ -87,7 +87,10 @@ class HawkesConditionalLaw(Base):
         Be aware that the complexity increase as this number squared.
 
     n_threads : `int`, default=1
-        Number of threads used for parallel computation.
+        Number of threads used for parallel computation. Conditional laws
+        are computed in parallel over the (i, j, l) triplets of all the
+        realizations given to `fit`, and the Fredholm systems of each
+        component are solved in parallel.
 
         * if `int <= 0`: the number of physical cores available on the CPU
         * otherwise the desired number of threads
@@ -155,7 +158,6 @@ class HawkesConditionalLaw(Base):
     _attrinfos = {
         '_hawkes_object': {},
         '_lags': {},
-        '_lock': {'writable': False},
         '_phi_ijl': {}, '_norm_ijl': {},
         '_ijl2index': {},
         '_index2ijl': {},
@@ -213,7 +215,6 @@ class HawkesConditionalLaw(Base):
         # Represents the conditional laws written above without conditioning by
         # the mark (so a i,j list)
         self._claw1 = None
-        self._lock = None
 
         # quad_x : `np.ndarray`, shape=(n_quad, )
         # The abscissa of the quadrature points used for the Fredholm system
@@ -259,8 +260,7 @@ class HawkesConditionalLaw(Base):
         if not isinstance(events[0][0], np.ndarray):
             events = [events]
 
-        for timestamps in events:
-            self.incremental_fit(timestamps, compute=False, T=T)
+        self._incremental_fit(events, T=T)
         self.compute()
 
         return self
@@ -472,20 +472,86 @@ class HawkesConditionalLaw(Base):
             This is useful to add multiple realizations and compute only once
             all conditional laws have been updated.
         """
+        if self.n_realizations > 0 and compute and \
+                self._has_been_computed_once():
+            warnings.warn(("compute() method was already called, "
+                           "computed kernels will be updated."))
+
+        n_added = self._incremental_fit([realization], T=T)
+
+        if compute and n_added > 0:
+            self.compute()
+
+    def _incremental_fit(self, realizations, T=None):
+        """Adds several realizations at once. The conditional laws of all
+        realizations are computed together on a thread pool, and are then
+        accumulated in the order of the realizations.
+
+        Returns the number of non empty realizations that have been added
+        """
+        realizations = list(realizations)
+
         # If first realization we perform some init
         if self.n_realizations == 0:
-            realization = self._init_basics(realization)
+            realizations[0] = self._init_basics(realizations[0])
             self._init_marked_components()
             self._init_index()
             self._init_mark_stats()
             self._init_lambdas()
             self._init_claws()
 
-        else:
-            if compute and self._has_been_computed_once():
-                warnings.warn(("compute() method was already called, "
-                               "computed kernels will be updated."))
+        prepared_realizations = []
+        for realization in realizations:
+            prepared = self._prepare_realization(realization, T)
+            if prepared is not None:
+                prepared_realizations.append(prepared)
+
+        if len(prepared_realizations) == 0:
+            return 0
+
+        for k, (realization, realization_T) in \
+                enumerate(prepared_realizations):
+            if k > 0:
+                self._symmetrize_mark_stats()
+            self._update_mark_stats(realization, realization_T)
+
+        # This is the time consuming part, that might use threads
+        realizations_claws = self._compute_claws(prepared_realizations)
 
+        for k, claws in enumerate(realizations_claws):
+            if k > 0:
+                self._symmetrize_claws()
+            self._update_claws(claws)
+            self.n_realizations += 1
+
+        # Here we compute the G^ij (not conditioned to l)
+        # It is recomputed each time
+        self._claw1 = []
+        for i in range(0, self.n_nodes):
+            self._claw1.append([])
+            for j in range(0, self.n_nodes):
+                index = self._ijl2index[i][j][0]
+                self._claw1[i].append(np.copy(self._claw[index]))
+                self._claw1[i][j] *= self._mark_probabilities[j][0]
+                for l in range(1, len(self._ijl2index[i][j])):
+                    index = self._ijl2index[i][j][l]
+                    self._claw1[i][j] += self._claw[index] * \
+                                         self._mark_probabilities[j][l]
+
+        # Deal with symmetrization
+        self._symmetrize_mark_stats()
+        for ((i1, j1), (i2, j2)) in self.symmetries2d:
+            t = (self._claw1[i1][j1] + self._claw1[i2][j2]) / 2
+            self._claw1[i1][j1] = t
+            self._claw1[i2][j2] = t
+        self._symmetrize_claws()
+
+        return len(prepared_realizations)
+
+    def _prepare_realization(self, realization, T):
+        """Checks, normalizes and delays a realization and computes its end
+        time. Returns None if the realization is empty
+        """
         # We perform some checks
         if self.n_nodes != len(realization):
             msg = 'Bad dimension for realization, should be %d instead of %d' \
@@ -521,7 +587,7 @@ class HawkesConditionalLaw(Base):
         if last_event_time < 0:
             warnings.warn(
                 "An empty realization was passed. No computation was performed.")
-            return
+            return None
 
         # We set T if needed
         if T is None:
@@ -532,6 +598,12 @@ class HawkesConditionalLaw(Base):
                              "greater or equal to %g."
                              % (T, last_event_time))
 
+        return realization, T
+
+    def _update_mark_stats(self, realization, T):
+        """Updates the mark probabilities, the mean intensities and the
+        number of events with a realization
+        """
         # We update the mark probabilities and min-max
         for i in range(0, self.n_nodes):
             if len(realization[i][0]) == 0:
@@ -569,39 +641,10 @@ class HawkesConditionalLaw(Base):
             self._n_events[0, i] += good
             self._n_events[1, i] += bad
 
-        # We might want to use threads, since this is the time consuming part
-        with_multi_processing = self.n_threads > 1
-        if with_multi_processing:
-            pool = ThreadPool(with_lock=True, max_threads=self.n_threads)
-            self._set('_lock', pool.lock)
-
-        for index, (i, j, l) in enumerate(self._index2ijl):
-            if with_multi_processing:
-                pool.add_work(self._PointProcessCondLaw, realization,
-                              index, i, j, l, T)
-            else:
-                self._PointProcessCondLaw(realization, index, i, j, l, T)
-
-        if with_multi_processing:
-            pool.start()
-
-        # Here we compute the G^ij (not conditioned to l)
-        # It is recomputed each time
-        self._claw1 = []
-        for i in range(0, self.n_nodes):
-            self._claw1.append([])
-            for j in range(0, self.n_nodes):
-                index = self._ijl2index[i][j][0]
-                self._claw1[i].append(np.copy(self._claw[index]))
-                self._claw1[i][j] *= self._mark_probabilities[j][0]
-                for l in range(1, len(self._ijl2index[i][j])):
-                    index = self._ijl2index[i][j][l]
-                    self._claw1[i][j] += self._claw[index] * \
-                                         self._mark_probabilities[j][l]
-
-        self.n_realizations += 1
-
-        # Deal with symmetrization
+    def _symmetrize_mark_stats(self):
+        """Imposes symmetries1d on the mean intensities and the marks
+        statistics
+        """
         for (i, j) in self.symmetries1d:
             t = (self.mean_intensity[i] + self.mean_intensity[j]) / 2
             self.mean_intensity[i] = t
@@ -628,10 +671,10 @@ class HawkesConditionalLaw(Base):
                 self._mark_probabilities[i][l] = t
                 self._mark_probabilities[j][l] = t
 
+    def _symmetrize_claws(self):
+        """Imposes symmetries2d on the conditional laws
+        """
         for ((i1, j1), (i2, j2)) in self.symmetries2d:
-            t = (self._claw1[i1][j1] + self._claw1[i2][j2]) / 2
-            self._claw1[i1][j1] = t
-            self._claw1[i2][j2] = t
             if self.marked_components[j1] != self.marked_components[j2]:
                 continue
             for l in range(0, len(self.marked_components[j1])):
@@ -641,13 +684,35 @@ class HawkesConditionalLaw(Base):
                 self._claw[index1] = t
                 self._claw[index2] = t
 
-        # We can remove the thread lock (lock disallows pickling)
-        self._set('_lock', None)
+    def _compute_claws(self, realizations):
+        """Computes the conditional laws of each (i, j, l) triplet of several
+        realizations given as a list of (realization, T) pairs.
 
-        if compute:
-            self.compute()
+        Each conditional law is written in its own slot, hence they can be
+        computed in parallel without any lock (the C++ computation releases
+        the GIL)
+        """
+        realizations_claws = [[None] * self._n_index for _ in realizations]
 
-    def _PointProcessCondLaw(self, realization, index, i, j, l, T):
+        with_multi_processing = self.n_threads > 1
+        if with_multi_processing:
+            pool = ThreadPool(with_lock=False, max_threads=self.n_threads)
+
+        for (realization, T), claws in zip(realizations, realizations_claws):
+            for index in range(self._n_index):
+                if with_multi_processing:
+                    pool.add_work(self._PointProcessCondLaw, realization,
+                                  index, T, claws)
+                else:
+                    self._PointProcessCondLaw(realization, index, T, claws)
+
+        if with_multi_processing:
+            pool.start()
+
+        return realizations_claws
+
+    def _PointProcessCondLaw(self, realization, index, T, claws):
+        i, j, l = self._index2ijl[index]
 
         claw_X = np.zeros(len(self._lags) - 1)
         claw_Y = np.zeros(len(self._lags) - 1)
@@ -663,22 +728,19 @@ class HawkesConditionalLaw(Base):
                             claw_X, claw_Y)
 
         self._claw_X = claw_X
+        claws[index] = claw_Y
 
-        # TODO: this lock acquire is very expensive here
-        if self.n_threads > 1:
-            self._lock.acquire()
-
-        # Update claw
-        if self.n_realizations == 0:
-            self._claw[index] = claw_Y
-        else:
-            self._claw[index] *= self.n_realizations
-            self._claw[index] += claw_Y
-            self._claw[index] /= self.n_realizations + 1
-
-        # Unlock
-        if self.n_threads > 1:
-            self._lock.release()
+    def _update_claws(self, claws):
+        """Updates the running average of the conditional laws with the ones
+        of a new realization
+        """
+        for index, claw_Y in enumerate(claws):
+            if self.n_realizations == 0:
+                self._claw[index] = claw_Y
+            else:
+                self._claw[index] *= self.n_realizations
+                self._claw[index] += claw_Y
+                self._claw[index] /= self.n_realizations + 1
 
     def _compute_lags(self):
         """Computes the lags at which the claw will be computed
@@ -700,27 +762,33 @@ class HawkesConditionalLaw(Base):
         """Computes the claw and its integrals at the difference of
         quadrature points using a linear interpolation
         """
+        # Abscissa at which claws are interpolated: the quadrature points,
+        # the claws abscissa and the (positive) differences of quadrature
+        # points. They are the same for all claws
+        xe = self._claw_X
+        xs2 = np.subtract.outer(self._quad_x, self._quad_x).ravel()
+        xs2 = np.append(xe, xs2)
+        xs2 = np.append(self._quad_x, xs2)
+        xs2 = np.unique(xs2)
+        xs2 = xs2[xs2 >= 0.]
+
+        # Each abscissa is interpolated on the first segment [xe[i-1], xe[i]]
+        # such that it is lower than xe[i], abscissa greater than xe[-1] are
+        # set to 0
+        segments = np.maximum(np.searchsorted(xe, xs2, side='right'), 1)
+        inside = segments < len(xe)
+        segments = segments[inside]
+        x_left, x_right = xe[segments - 1], xe[segments]
 
         self._int_claw = [0] * self._n_index
         # Builds a linear interpolation of the claws at the difference of
         # quadrature (only positive abscissa are kept)
         for index in range(self._n_index):
-            xe = self._claw_X
             ye = self._claw[index]
-            xs2 = np.array([(a - b) for (a, b) in
-                            itertools.product(self._quad_x, repeat=2)])
-            xs2 = np.append(xe, xs2)
-            xs2 = np.append(self._quad_x, xs2)
-            xs2 = np.array(np.lib.arraysetops.unique(xs2))
-            xs2 = np.array(np.core.fromnumeric.sort(xs2))
-            xs2 = xs2[xs2 >= 0.]
+            y_left, y_right = ye[segments - 1], ye[segments]
             ys2 = np.zeros(len(xs2))
-            j = 0
-            for i in range(1, len(xe)):
-                while j < len(xs2) and xs2[j] < xe[i]:
-                    ys2[j] = (ye[i - 1]) + ((ye[i]) - (ye[i - 1])) * (
-                        xs2[j] - xe[i - 1]) / (xe[i] - xe[i - 1])
-                    j += 1
+            ys2[inside] = y_left + (y_right - y_left) * (
+                xs2[inside] - x_left) / (x_right - x_left)
             sc = (xs2, ys2)
             self._int_claw[index] = sc
 
@@ -742,39 +810,41 @@ class HawkesConditionalLaw(Base):
                 np.diff(xc) / 2. * yc[:-1]))
             self._IG2 += [(xc, iyc_IG2)]
 
+    @staticmethod
+    def _closest_indices(x, t):
+        """Indices of the closest abscissa of x to each of the values of t
+        that are lower than x[-1]
+        """
+        index = np.minimum(np.searchsorted(x, t), len(x) - 1)
+        next_index = np.minimum(index + 1, len(x) - 1)
+        return np.where(np.abs(x[index] - t) < np.abs(x[next_index] - t),
+                        index, next_index)
+
     @staticmethod
     def _lin0(sig, t):
         """Find closest value of a signal, zero value border
+
+        t might be a float or a `np.ndarray`
         """
         x, y = sig
-        if t >= x[-1]:
-            return 0
-        index = np.searchsorted(x, t)
-        if index == len(y) - 1:
-            return y[index]
-        elif np.abs(x[index] - t) < np.abs(x[index + 1] - t):
-            return y[index]
-        else:
-            return y[index + 1]
+        closest = HawkesConditionalLaw._closest_indices(x, t)
+        return np.where(t >= x[-1], 0., y[closest])
 
     @staticmethod
     def _linc(sig, t):
         """Find closest value of a signal, continuous border
+
+        t might be a float or a `np.ndarray`
         """
         x, y = sig
-        if t >= x[-1]:
-            return y[-1]
-        index = np.searchsorted(x, t)
-        if np.abs(x[index] - t) < np.abs(x[index + 1] - t):
-            return y[index]
-        else:
-            return y[index + 1]
+        closest = HawkesConditionalLaw._closest_indices(x, t)
+        return np.where(t >= x[-1], y[-1], y[closest])
 
     def _G(self, i, j, l, t):
-        """Returns the value of a claw at a point
+        """Returns the value of a claw at a point (or an array of points)
         Used to fill V and M with 'gauss' method
         """
-        if t < 0:
+        if np.any(t < 0):
             warnings.warn("G(): should not be called for t < 0")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._lin0(self._int_claw[index], t)
@@ -782,7 +852,7 @@ class HawkesConditionalLaw(Base):
     def _DIG(self, i, j, l, t1, t2):
         """Returns the integral of a claw between t1 and t2
         """
-        if t1 >= t2:
+        if np.any(t1 >= t2):
             warnings.warn("t2>t1 wrong in DIG")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._linc(self._IG[index], t2) - \
@@ -791,7 +861,7 @@ class HawkesConditionalLaw(Base):
     def _DIG2(self, i, j, l, t1, t2):
         """Returns the integral of x times a claw between t1 and t2
         """
-        if t1 >= t2:
+        if np.any(t1 >= t2):
             warnings.warn("t2>t1 wrong in DIG2")
         index = self._ijl2index[i][j][l]
         return HawkesConditionalLaw._linc(self._IG2[index], t2) - \
@@ -844,189 +914,199 @@ class HawkesConditionalLaw(Base):
         self._compute_ints_claw()
 
         # For each i we write and solve the system V =  M PHI
-        index_first = 0
+        # The indices corresponding to i are the contiguous ones from
+        # (i, 0, 0) to (i, n_nodes - 1, last mark)
+        index_bounds = [(self._ijl2index[i][0][0], self._ijl2index[i][-1][-1])
+                        for i in range(self.n_nodes)]
+
+        # The systems are independent and might be solved in parallel
+        solutions = [None] * self.n_nodes
+        if self.n_threads > 1:
+            pool = ThreadPool(with_lock=False, max_threads=self.n_threads)
+            for i, (index_first, index_last) in enumerate(index_bounds):
+                pool.add_work(self._solve_system, i, index_first, index_last,
+                              solutions)
+            pool.start()
+        else:
+            for i, (index_first, index_last) in enumerate(index_bounds):
+                self._solve_system(i, index_first, index_last, solutions)
+
         self._phi_ijl = []
         self._norm_ijl = []
         self.kernels = []
         self.kernels_norms = np.mat(np.zeros((self.n_nodes, self.n_nodes)))
 
-        for i in range(0, self.n_nodes):
-
-            # We must compute the last valid index which corresponds to i
-            index_last = index_first
-            for index_last in range(index_first, self._n_index):
-                (i1, j1, l1) = self._index2ijl[index_last]
-                if i1 != i:
-                    index_last -= 1
-                    break
-
-            # Number of indices corresponding to i
-            n_index = index_last - index_first + 1
-
-            # Compute V and M
-            V = self._compute_V(i, n_index, self.n_quad, index_first,
-                                index_last)
-            M = self._compute_M(n_index, self.n_quad, index_first, index_last,
-                                self.quad_method)
-            # Then we solve it
-            res = solve(M, V)
-
-            self._estimate_kernels_and_norms(i, index_first, index_last, res,
-                                             self.n_quad, self.quad_method)
-
-            index_first = index_last + 1
+        for i, (index_first, index_last) in enumerate(index_bounds):
+            self._estimate_kernels_and_norms(i, index_first, index_last,
+                                             solutions[i], self.n_quad,
+                                             self.quad_method)
 
         self._estimate_baseline()
         self._estimate_mark_functions()
 
+    def _solve_system(self, i, index_first, index_last, solutions):
+        # Number of indices corresponding to i
+        n_index = index_last - index_first + 1
+
+        # Compute V and M
+        V = self._compute_V(i, n_index, self.n_quad, index_first, index_last)
+        M = self._compute_M(n_index, self.n_quad, index_first, index_last,
+                            self.quad_method)
+        # Then we solve it
+        solutions[i] = solve(M, V)
+
     def _compute_V(self, i, n_index, n_quad, index_first, index_last):
         V = np.zeros((n_index * n_quad, 1))
         for index in range(index_first, index_last + 1):
             (x, j, l) = self._index2ijl[index]
-            for n in range(0, n_quad):
-                index_i_quad = (index - index_first) * n_quad + n
-                V[index_i_quad] = self._G(i, j, l, self._quad_x[n])
+            row = (index - index_first) * n_quad
+            V[row:row + n_quad, 0] = self._G(i, j, l, self._quad_x)
         return V
 
     def _compute_M(self, n_index, n_quad, index_first, index_last, method):
         M = np.mat(np.zeros((n_index * n_quad, n_index * n_quad)))
         for index in range(index_first, index_last + 1):
             (x, j, l) = self._index2ijl[index]
+            row = (index - index_first) * n_quad
             for index1 in range(index_first, index_last + 1):
                 (i1, j1, l1) = self._index2ijl[index1]
                 fact = self.mean_intensity[j1] / self.mean_intensity[j]
-                for n in range(0, n_quad):
-                    for n1 in range(0, n_quad):
-                        if method == 'gauss' or method == 'gauss-':
-                            self._fill_M_for_gauss(M, method, n_quad,
-                                                   index_first, index, index1,
-                                                   j, l, j1, l1, fact,
-                                                   n, n1)
-
-                        elif method == 'log' or method == 'lin':
-                            self._fill_M_for_log_lin(M, method, n_quad,
-                                                     index_first, index, index1,
-                                                     j, l, j1, l1, fact,
-                                                     n, n1)
-        return M
-
-    def _fill_M_for_gauss(self, M, method, n_quad,
-                          index_first, index, index1,
-                          j, l, j1, l1, fact, n, n1):
-
-        def x_value(n_lower, n_greater, j_lower, j_greater, l_greater):
-            return self._mark_probabilities[j1][l1] * self._quad_w[n1] * \
-                   self._G(j_lower, j_greater, l_greater,
-                           self._quad_x[n_greater] - self._quad_x[n_lower])
-
-        if n > n1:
-            x = x_value(n1, n, j1, j, l)
-
-        elif n < n1:
-            x = fact * x_value(n, n1, j, j1, l1)
-
-        else:
-            if method == 'gauss-':
-                x = 0
-            else:
-                x1 = x_value(n1, n, j1, j, l)
-                x2 = fact * x_value(n, n1, j, j1, l1)
-                x = (x1 + x2) / 2
-
-        if method == 'gauss-':
-            row = (index - index_first) * n_quad + n
-            col = (index1 - index_first) * n_quad + n
-            M[row, col] -= x
-
-        if l == l1 and j == j1 and n == n1:
-            x += 1
-
-        row = (index - index_first) * n_quad + n
-        col = (index1 - index_first) * n_quad + n1
-        M[row, col] += x
-
-    def _fill_M_for_log_lin(self, M, method, n_quad,
-                            index_first, index, index1,
-                            j, l, j1, l1, fact, n, n1):
-
-        mark_probability = self._mark_probabilities[j1][l1]
-
-        ratio_dig = lambda n_q: (
-            (self._quad_x[n] - self._quad_x[n_q]) / self._quad_w[n_q]
-        )
-
-        ratio_dig2 = lambda n_q: 1. / self._quad_w[n_q]
-
-        dig_arg_greater = lambda n_q: (
-            j1, j, l,
-            self._quad_x[n] - self._quad_x[n_q] - self._quad_w[n_q],
-            self._quad_x[n] - self._quad_x[n_q])
-
-        dig_arg_lower = lambda n_q: (
-            j, j1, l1,
-            self._quad_x[n_q] - self._quad_x[n],
-            self._quad_x[n_q] - self._quad_x[n] + self._quad_w[n_q])
-
-        x = 0
-        if n > n1:
-            x += mark_probability * self._DIG(*dig_arg_greater(n1))
-
-            if n1 < n_quad - 1:
-                x -= ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1))
-
-                x += ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1))
-
-            if n1 > 0:
-                x += ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1 - 1))
+                col = (index1 - index_first) * n_quad
 
-                x -= ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1 - 1))
+                if method == 'gauss' or method == 'gauss-':
+                    block = self._M_block_for_gauss(method, n_quad,
+                                                    j, l, j1, l1, fact)
 
-        elif n < n1:
+                elif method == 'log' or method == 'lin':
+                    block = self._M_block_for_log_lin(n_quad,
+                                                      j, l, j1, l1, fact)
 
-            x += fact * mark_probability * self._DIG(*dig_arg_lower(n1))
+                if l == l1 and j == j1:
+                    block += np.eye(n_quad)
 
-            if n1 < n_quad - 1:
-                x -= fact * ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1))
-
-                x -= fact * ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1))
+                M[row:row + n_quad, col:col + n_quad] += block
+        return M
 
-            if n1 > 0:
-                x += fact * ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1 - 1))
+    def _M_block_for_gauss(self, method, n_quad, j, l, j1, l1, fact):
+        """Block of M coupling index (i, j, l) with index (i, j1, l1), rows
+        are indexed by n and columns by n1
+        """
+        n_greater = np.tri(n_quad, k=-1, dtype=bool)
+        n_lower = n_greater.T
 
-                x += fact * ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1 - 1))
+        # Quadrature points are sorted, hence x[n] - x[n1] for n > n1 and
+        # x[n1] - x[n] for n < n1
+        differences = np.abs(np.subtract.outer(self._quad_x, self._quad_x))
+        weights = self._mark_probabilities[j1][l1] * self._quad_w
 
-        elif n == n1:
-            x += fact * self._mark_probabilities[j1][l1] * \
-                 self._DIG(*dig_arg_lower(n1))
+        x_greater = weights * self._G(j1, j, l, differences)
+        x_lower = fact * (weights * self._G(j, j1, l1, differences))
 
-            if n1 < n_quad - 1:
-                x -= fact * ratio_dig(n1) * mark_probability * \
-                     self._DIG(*dig_arg_lower(n1))
+        if method == 'gauss-':
+            x_diagonal = 0
+        else:
+            x_diagonal = (x_greater + x_lower) / 2
 
-                x -= fact * ratio_dig2(n1) * mark_probability * \
-                     self._DIG2(*dig_arg_lower(n1))
+        block = np.where(n_greater, x_greater,
+                         np.where(n_lower, x_lower, x_diagonal))
 
-            if n1 > 0:
-                x += ratio_dig(n1 - 1) * mark_probability * \
-                     self._DIG(*dig_arg_greater(n1 - 1))
+        if method == 'gauss-':
+            block[np.diag_indices(n_quad)] -= block.sum(axis=1)
 
-                x -= ratio_dig2(n1 - 1) * mark_probability * \
-                     self._DIG2(*dig_arg_greater(n1 - 1))
+        return block
 
-        if l == l1 and j == j1 and n == n1:
-            x += 1
+    def _M_block_for_log_lin(self, n_quad, j, l, j1, l1, fact):
+        """Block of M coupling index (i, j, l) with index (i, j1, l1), rows
+        are indexed by n and columns by n_q (n1 or n1 - 1)
+        """
+        mark_probability = self._mark_probabilities[j1][l1]
 
-        row = (index - index_first) * n_quad + n
-        col = (index1 - index_first) * n_quad + n1
-        M[row, col] += x
+        quad_x_n = self._quad_x[:, np.newaxis]
+        quad_x_q = self._quad_x[np.newaxis, :]
+        quad_w_q = self._quad_w[np.newaxis, :]
+
+        ratio_dig = (quad_x_n - quad_x_q) / quad_w_q
+        ratio_dig2 = 1. / quad_w_q
+
+        dig_arg_greater = (j1, j, l,
+                           quad_x_n - quad_x_q - quad_w_q,
+                           quad_x_n - quad_x_q)
+
+        dig_arg_lower = (j, j1, l1,
+                         quad_x_q - quad_x_n,
+                         quad_x_q - quad_x_n + quad_w_q)
+
+        dig_greater = self._DIG(*dig_arg_greater)
+        dig2_greater = self._DIG2(*dig_arg_greater)
+        dig_lower = self._DIG(*dig_arg_lower)
+        dig2_lower = self._DIG2(*dig_arg_lower)
+
+        def previous(values):
+            # Values taken at column n1 - 1, terms with n1 = 0 are masked
+            shifted = np.zeros_like(values)
+            shifted[:, 1:] = values[:, :-1]
+            return shifted
+
+        not_last = np.arange(n_quad) < n_quad - 1
+        not_first = np.arange(n_quad) > 0
+
+        # Terms with n > n1
+        x_greater = mark_probability * dig_greater
+        x_greater = np.where(
+            not_last,
+            x_greater - ratio_dig * mark_probability * dig_greater,
+            x_greater)
+        x_greater = np.where(
+            not_last,
+            x_greater + ratio_dig2 * mark_probability * dig2_greater,
+            x_greater)
+        x_greater = np.where(
+            not_first,
+            x_greater + previous(ratio_dig * mark_probability * dig_greater),
+            x_greater)
+        x_greater = np.where(
+            not_first,
+            x_greater - previous(ratio_dig2 * mark_probability * dig2_greater),
+            x_greater)
+
+        # Terms with n <= n1 share their first part
+        x_lower_n1 = fact * mark_probability * dig_lower
+        x_lower_n1 = np.where(
+            not_last,
+            x_lower_n1 - fact * ratio_dig * mark_probability * dig_lower,
+            x_lower_n1)
+        x_lower_n1 = np.where(
+            not_last,
+            x_lower_n1 - fact * ratio_dig2 * mark_probability * dig2_lower,
+            x_lower_n1)
+
+        # Terms with n < n1
+        x_lower = np.where(
+            not_first,
+            x_lower_n1 +
+            previous(fact * ratio_dig * mark_probability * dig_lower),
+            x_lower_n1)
+        x_lower = np.where(
+            not_first,
+            x_lower + previous(fact * ratio_dig2 * mark_probability *
+                               dig2_lower),
+            x_lower)
+
+        # Terms with n == n1
+        x_diagonal = np.where(
+            not_first,
+            x_lower_n1 + previous(ratio_dig * mark_probability * dig_greater),
+            x_lower_n1)
+        x_diagonal = np.where(
+            not_first,
+            x_diagonal -
+            previous(ratio_dig2 * mark_probability * dig2_greater),
+            x_diagonal)
+
+        n_greater = np.tri(n_quad, k=-1, dtype=bool)
+        n_lower = n_greater.T
+        return np.where(n_greater, x_greater,
+                        np.where(n_lower, x_lower, x_diagonal))
 
     def _estimate_kernels_and_norms(self, i, index_first, index_last,
                                     res, n_quad, method):
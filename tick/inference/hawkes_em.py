@@ -58,11 +58,20 @@ class HawkesEM(LearnerHawkesNoParam):
         a multiple of ``record_every``
 
     n_threads : `int`, default=1
-        Number of threads used for parallel computation.
+        Number of threads used for parallel computation. The events of all
+        realizations are split in as many blocks of consecutive events, so
+        that a single realization also benefits from all threads.
 
         * if `int <= 0`: the number of physical cores available on the CPU
         * otherwise the desired number of threads
 
+    acceleration : {None, 'squarem'}, default=None
+        Extrapolation scheme used to accelerate the EM iterations. If
+        'squarem', each iteration performs three EM iterations and
+        extrapolates from them, which usually cuts the number of
+        iterations needed to converge. The total number of EM iterations is
+        recorded in history as ``n_em_steps``
+
     Attributes
     ----------
     n_nodes : `int`
@@ -92,12 +101,12 @@ class HawkesEM(LearnerHawkesNoParam):
     def __init__(self, kernel_support=None, kernel_size=10,
                  kernel_discretization=None, tol=1e-5, max_iter=100,
                  print_every=10, record_every=10,
-                 verbose=False, n_threads=1):
+                 verbose=False, n_threads=1, acceleration=None):
 
         LearnerHawkesNoParam.__init__(
             self, n_threads=n_threads, verbose=verbose, tol=tol,
             max_iter=max_iter, print_every=print_every,
-            record_every=record_every)
+            record_every=record_every, acceleration=acceleration)
 
         if kernel_discretization is not None:
             self._learner = _HawkesEM(kernel_discretization, n_threads)
@@ -179,11 +188,17 @@ class HawkesEM(LearnerHawkesNoParam):
         _kernel_uvm_2d = self.kernel.reshape((self.n_nodes,
                                               self.n_nodes * self.kernel_size))
 
+        def em_step():
+            self._learner.solve(self.baseline, _kernel_uvm_2d)
+
+        accelerator = self._new_accelerator()
+        n_em_steps = 0
         for i in range(self.max_iter + 1):
             prev_baseline = self.baseline.copy()
             prev_kernel = self.kernel.copy()
 
-            self._learner.solve(self.baseline, _kernel_uvm_2d)
+            n_em_steps += self._fixed_point_iteration(
+                accelerator, em_step, [self.baseline, self.kernel])
 
             rel_baseline = relative_distance(self.baseline, prev_baseline)
             rel_kernel = relative_distance(self.kernel, prev_kernel)
@@ -191,7 +206,8 @@ class HawkesEM(LearnerHawkesNoParam):
             converged = max(rel_baseline, rel_kernel) <= self.tol
             force_print = (i == self.max_iter) or converged
             self._handle_history(i, rel_baseline=rel_baseline,
-                                 rel_kernel=rel_kernel, force=force_print)
+                                 rel_kernel=rel_kernel, n_em_steps=n_em_steps,
+                                 force=force_print)
 
             if converged:
                 break
@@ -1,6 +1,7 @@
 # License: BSD 3 clause
 
 import numpy as np
+from scipy.sparse import csr_matrix
 
 from tick.base import actual_kwargs
 from tick.inference.base import LearnerHawkesParametric
@@ -104,6 +105,21 @@ class HawkesExpKern(LearnerHawkesParametric):
         seed will be used (based on timestamp and other physical metrics).
         Used in 'sgd', and 'svrg' solvers
 
+    window : `float`, default=np.inf
+        Length of the sliding window of the least-squares model when the
+        learner is updated with `partial_fit`: only the events of the last
+        ``window`` time units are accounted for in the loss. Only available
+        with 'least-squares' goodness of fit
+
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, the adjacency
+        coefficient of node j on node i is fixed to zero. Only the
+        coefficients of the pairs in the support are learned, which makes
+        the cost of fitting scale with the number of nonzero entries of
+        ``support`` instead of ``n_nodes ** 2``. Not available with
+        'nuclear' penalty
+
     Attributes
     ----------
     n_nodes : `int`
@@ -117,12 +133,15 @@ class HawkesExpKern(LearnerHawkesParametric):
 
     coeffs : `np.array`, shape=(n_nodes * n_nodes + n_nodes, )
         Raw coefficients of the model. Row stack of `self.baseline` and
-        `self.adjacency`
+        `self.adjacency`. If a ``support`` is given, only the adjacency
+        coefficients of the pairs in the support are kept, in row major order
     """
 
     _attrinfos = {
         "gofit": {"writable": False},
         "decays": {"writable": False},
+        "window": {"writable": False},
+        "support": {"writable": False},
     }
 
     _penalties = {
@@ -137,13 +156,22 @@ class HawkesExpKern(LearnerHawkesParametric):
     def __init__(self, decays, gofit="least-squares", penalty="l2", C=1e3,
                  solver="agd", step=None, tol=1e-5, max_iter=100,
                  verbose=False, print_every=10, record_every=10,
-                 elastic_net_ratio=0.95, random_state=None):
+                 elastic_net_ratio=0.95, random_state=None,
+                 window=np.inf, support=None):
 
         self._actual_kwargs = \
             HawkesExpKern.__init__.actual_kwargs
 
         self._set_gofit(gofit)
+        if gofit == "likelihood" and window != np.inf:
+            raise ValueError("A window can only be used with 'least-squares' "
+                             "goodness of fit")
+        if support is not None and penalty == "nuclear":
+            raise ValueError("A support cannot be used with 'nuclear' "
+                             "penalty")
         self.decays = decays
+        self.window = window
+        self.support = support
 
         LearnerHawkesParametric.__init__(self, penalty=penalty, C=C,
                                          solver=solver, step=step, tol=tol,
@@ -159,7 +187,9 @@ class HawkesExpKern(LearnerHawkesParametric):
 
     def _construct_model_obj(self):
         if self.gofit == "least-squares":
-            model = ModelHawkesFixedExpKernLeastSq(self.decays)
+            model = ModelHawkesFixedExpKernLeastSq(self.decays,
+                                                   window=self.window,
+                                                   support=self.support)
         elif self.gofit == "likelihood":
             # decays must be constant
             if isinstance(self.decays, np.ndarray):
@@ -170,7 +200,8 @@ class HawkesExpKern(LearnerHawkesParametric):
                                           "you must provide a constant decay "
                                           "for all kernels")
 
-            model = ModelHawkesFixedExpKernLogLik(self.decays)
+            model = ModelHawkesFixedExpKernLogLik(self.decays,
+                                                  support=self.support)
         return model
 
     def _set_gofit(self, val):
@@ -191,10 +222,34 @@ class HawkesExpKern(LearnerHawkesParametric):
         if not self._fitted:
             raise ValueError('You must fit data before getting estimated '
                              'adjacency')
+        elif self.support is not None:
+            support = self._model_obj.support
+            return csr_matrix((self.coeffs[self.n_nodes:], support.indices,
+                               support.indptr),
+                              shape=(self.n_nodes, self.n_nodes)).toarray()
         else:
             return self.coeffs[self.n_nodes:].reshape((self.n_nodes,
                                                        self.n_nodes))
 
+    def _sum_exp_kernels(self):
+        baseline = self.baseline.reshape((self.n_nodes, 1))
+        support = self._model_obj.support
+        adjacency = self.coeffs[self.n_nodes:]
+        if isinstance(self.decays, np.ndarray):
+            # Each pair of nodes has a single kernel, with its own decay
+            if support is not None:
+                rows = np.repeat(np.arange(self.n_nodes),
+                                 np.diff(support.indptr))
+                pair_decays = self.decays[rows, support.indices]
+            else:
+                pair_decays = self.decays.ravel()
+            decays, decay_indices = np.unique(pair_decays,
+                                              return_inverse=True)
+        else:
+            decays = np.array([self.decays], dtype=float)
+            decay_indices = None
+        return decays, baseline, adjacency, 0., support, decay_indices
+
     def _corresponding_simu(self):
         return SimuHawkesExpKernels(adjacency=self.adjacency,
                                     decays=self.decays,
@@ -108,6 +108,17 @@ class HawkesSumExpKern(LearnerHawkesParametric):
         seed will be used (based on timestamp and other physical metrics).
         Used in 'sgd', and 'svrg' solvers
 
+    window : `float`, default=np.inf
+        Length of the sliding window of the model when the learner is
+        updated with `partial_fit`: only the events of the last ``window``
+        time units are accounted for in the loss
+
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, the adjacency
+        coefficients of node j on node i are fixed to zero for all decays.
+        Only the coefficients of the pairs in the support are learned
+
     Attributes
     ----------
     n_nodes : `int`
@@ -121,7 +132,16 @@ class HawkesSumExpKern(LearnerHawkesParametric):
 
     coeffs : `np.array`, shape=(n_nodes + n_nodes * n_nodes * n_decays, )
         Raw coefficients of the model. Row stack of `self.baseline` and
-        `self.adjacency`
+        `self.adjacency`. If a ``support`` is given, only the adjacency
+        coefficients of the pairs in the support are kept, in row major order
+
+    Notes
+    -----
+    The weights of the least squares loss are computed exactly with
+    recursive sums of exponentials, in linear time with respect to the
+    number of events (and of baseline intervals), see
+    `ModelHawkesFixedSumExpKernLeastSq`. No binned or FFT approximation is
+    available.
     """
 
     _attrinfos = {
@@ -129,6 +149,8 @@ class HawkesSumExpKern(LearnerHawkesParametric):
         "decays": {"writable": False},
         "n_baselines": {"writable": False},
         "period_length": {"writable": False},
+        "window": {"writable": False},
+        "support": {"writable": False},
     }
 
     _penalties = {
@@ -142,7 +164,8 @@ class HawkesSumExpKern(LearnerHawkesParametric):
     def __init__(self, decays, penalty="l2", C=1e3, n_baselines=1,
                  period_length=None, solver="agd", step=None, tol=1e-5,
                  max_iter=100, verbose=False, print_every=10, record_every=10,
-                 elastic_net_ratio=0.95, random_state=None):
+                 elastic_net_ratio=0.95, random_state=None,
+                 window=np.inf, support=None):
 
         self._actual_kwargs = \
             HawkesSumExpKern.__init__.actual_kwargs
@@ -150,6 +173,8 @@ class HawkesSumExpKern(LearnerHawkesParametric):
         self.decays = decays
         self.n_baselines = n_baselines
         self.period_length = period_length
+        self.window = window
+        self.support = support
 
         LearnerHawkesParametric.__init__(self, penalty=penalty, C=C,
                                          solver=solver, step=step, tol=tol,
@@ -162,7 +187,8 @@ class HawkesSumExpKern(LearnerHawkesParametric):
     def _construct_model_obj(self):
         model = ModelHawkesFixedSumExpKernLeastSq(
             self.decays, n_baselines=self.n_baselines,
-            period_length=self.period_length)
+            period_length=self.period_length, window=self.window,
+            support=self.support)
         return model
 
     @property
@@ -187,10 +213,27 @@ class HawkesSumExpKern(LearnerHawkesParametric):
         if not self._fitted:
             raise ValueError('You must fit data before getting estimated '
                              'adjacency')
+        elif self.support is not None:
+            support = self._model_obj.support
+            adjacency = np.zeros((self.n_nodes, self.n_nodes, self.n_decays))
+            rows, cols = support.nonzero()
+            adjacency[rows, cols] = \
+                self.coeffs[self.n_nodes * self._model_obj.n_baselines:]\
+                .reshape((support.nnz, self.n_decays))
+            return adjacency
         else:
             return self.coeffs[self.n_nodes * self._model_obj.n_baselines:]\
                 .reshape((self.n_nodes, self.n_nodes, self.n_decays))
 
+    def _sum_exp_kernels(self):
+        baseline = self.baseline.reshape((self.n_nodes,
+                                          self._model_obj.n_baselines))
+        period_length = self._model_obj.period_length
+        adjacency = self.coeffs[self.n_nodes * self._model_obj.n_baselines:]
+        return self.decays, baseline, adjacency, \
+            0. if period_length is None else period_length, \
+            self._model_obj.support, None
+
     def _corresponding_simu(self):
         return SimuHawkesSumExpKernels(
             adjacency=self.adjacency, decays=self.decays,
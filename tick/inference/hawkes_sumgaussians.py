@@ -103,6 +103,10 @@ class HawkesSumGaussians(LearnerHawkesNoParam):
         * if 0: no approximation
         * if 1: a fast approximated exponential function is used
 
+        If the global precision is set to 'fast' with
+        `tick.base.set_exp_precision`, the approximated exponential function
+        is used whatever this level
+
     em_max_iter : `int`, default=30
         Maximum number of loop for inner em algorithm.
 
@@ -157,7 +157,9 @@ class LogisticRegression(LearnerGLM):
         ----------
         X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
             Training vector, where n_samples in the number of samples and
-            n_features is the number of features.
+            n_features is the number of features. It can also be a list of
+            shards of consecutive rows, and it can be memory mapped, see
+            `tick.preprocessing.load_features`.
 
         y : `np.array`, shape=(n_samples,)
             Target vector relative to X.
@@ -167,7 +169,99 @@ class LogisticRegression(LearnerGLM):
         self : LearnerGLM
             The fitted instance of the model
         """
-        self.classes = np.unique(y)
+        self._set_classes(np.unique(y))
+
+        # If classes are not in the canonical shape we must transform them
+        y = self._encode_labels_vector(y)
+
+        LearnerGLM.fit(self, X, y)
+
+    def fit_path(self, X: object, y: np.array, Cs: np.array,
+                 screening: bool = True):
+        """Fit the model for several levels of penalization ``C``, with warm
+        starts and screening of features, see `LearnerGLM.fit_path`.
+
+        Parameters
+        ----------
+        X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
+            Training vector, where n_samples in the number of samples and
+            n_features is the number of features.
+
+        y : `np.array`, shape=(n_samples,)
+            Target vector relative to X.
+
+        Cs : `np.array`, shape=(n_Cs,)
+            The levels of penalization, positive
+
+        screening : `bool`, default=True
+            If `True`, discard features with screening rules when the
+            penalty is ``'l1'`` or ``'elasticnet'``
+
+        Returns
+        -------
+        self : LogisticRegression
+            The instance fitted with the largest value of ``Cs``
+        """
+        self._set_classes(np.unique(y))
+
+        # If classes are not in the canonical shape we must transform them
+        y = self._encode_labels_vector(y)
+
+        return LearnerGLM.fit_path(self, X, y, Cs, screening=screening)
+
+    def partial_fit(self, X: object, y: np.array, classes: np.array = None):
+        """Update the model with a new chunk of training data, with one
+        epoch of the stochastic solver over it. The state of the solver is
+        kept from one call to the next, see `LearnerGLM.partial_fit`.
+
+        Parameters
+        ----------
+        X : `np.ndarray` or `scipy.sparse.csr_matrix`,, shape=(n_samples, n_features)
+            Chunk of training vectors. The number of features must be the
+            same for all chunks.
+
+        y : `np.array`, shape=(n_samples,)
+            Target vector relative to X.
+
+        classes : `np.array`, shape=(2,), default=None
+            The two classes of the labels. It is needed at the first call
+            if the first chunk does not contain both classes, and ignored
+            afterwards.
+
+        Returns
+        -------
+        self : LogisticRegression
+            The updated instance of the model
+        """
+        if self.classes is None:
+            if classes is None:
+                classes = y
+            self._set_classes(np.unique(classes))
+        elif not np.all(np.in1d(y, self.classes)):
+            raise ValueError('Labels must be in the classes %s given at the '
+                             'first call of partial_fit' % self.classes)
+
+        # If classes are not in the canonical shape we must transform them
+        y = self._encode_labels_vector(y)
+
+        return LearnerGLM.partial_fit(self, X, y)
+
+    def _held_out_model_obj(self, X, y):
+        """Model of held-out data, whose labels are encoded with the
+        classes of the training data
+        """
+        y = self._encode_labels_vector(y)
+        return LearnerGLM._held_out_model_obj(self, X, y)
+
+    def _set_classes(self, classes):
+        """Sets the two classes of the labels
+
+        Parameters
+        ----------
+        classes : `np.array`, shape=(2,)
+            Sorted unique values of the labels
+        """
+        self.classes = classes
         if len(self.classes) != 2:
             raise ValueError('You wan only fit binary problems with '
                              'LogisticRegression')
@@ -180,11 +274,6 @@ class LogisticRegression(LearnerGLM):
             self.classes[0] = 0.
             self.classes[1] = 1.
 
-        # If classes are not in the canonical shape we must transform them
-        y = self._encode_labels_vector(y)
-
-        LearnerGLM.fit(self, X, y)
-
     def decision_function(self, X):
         """
         Predict scores for given samples
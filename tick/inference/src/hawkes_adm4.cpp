@@ -12,6 +12,8 @@ HawkesADM4::HawkesADM4(const double decay, const double rho,
 }
 
 void HawkesADM4::compute_weights() {
+  check_support();
+
   // Allocate weights
   next_mu = ArrayDouble2d(n_realizations, n_nodes);
   next_C = ArrayDouble2d(n_realizations * n_nodes, n_nodes);
@@ -141,7 +143,9 @@ void HawkesADM4::estimate_ru(const ulong r_u,
     // norm will be equal to mu_u + \sum_v \sum_(t_j < t_i) a_uv g(t_i - t_j)
     double norm = mu_u;
 
-    for (ulong node_v = 0; node_v < n_nodes; node_v++) {
+    // Only the nodes of the support may excite node u
+    for (ulong p = 0; p < get_n_sources(node_u); p++) {
+      const ulong node_v = get_source(node_u, p);
       const double sum_unnormalized_p_ij = adjacency_u[node_v] * g_ru_i[node_v];
       unnormalized_next_C_ru[node_v] += sum_unnormalized_p_ij;
       norm += sum_unnormalized_p_ij;
@@ -171,7 +175,16 @@ void HawkesADM4::update_u(const ulong u, ArrayDouble &mu, ArrayDouble2d &adjacen
 void HawkesADM4::update_adjacency_u(const ulong u, ArrayDouble &adjacency_u,
                                     ArrayDouble &z1_u, ArrayDouble &z2_u,
                                     ArrayDouble &u1_u, ArrayDouble &u2_u) {
+  // Position of the next node of the support exciting u
+  ulong p = 0;
   for (ulong v = 0; v < n_nodes; v++) {
+    // Adjacency coefficients out of the support are fixed to zero
+    if (p == get_n_sources(u) || get_source(u, p) != v) {
+      adjacency_u[v] = 0;
+      continue;
+    }
+    p++;
+
     const double B = kernel_integral[v] + rho * (-z1_u[v] + u1_u[v] - z2_u[v] + u2_u[v]);
 
     double C = 0;
@@ -41,6 +41,7 @@ class HawkesADM4 : public ModelHawkesList {
   void compute_weights();
 
   //! @brief Perform one iteration of the algorithm
+  //! If a support is set, adjacency coefficients of the pairs of nodes out of it are set to zero
   void solve(ArrayDouble &mu, ArrayDouble2d &adjacency, ArrayDouble2d &z1, ArrayDouble2d &z2,
              ArrayDouble2d &u1, ArrayDouble2d &u2);
 
@@ -3,6 +3,8 @@
 
 #include "hawkes_em.h"
 
+#include <algorithm>
+
 HawkesEM::HawkesEM(const double kernel_support, const ulong kernel_size,
                    const int max_n_threads)
     : ModelHawkesList(max_n_threads, 0),
@@ -17,14 +19,29 @@ HawkesEM::HawkesEM(const SArrayDoublePtr kernel_discretization, const int max_n_
 }
 
 void HawkesEM::allocate_weights() {
-  next_mu = ArrayDouble2d(n_realizations, n_nodes);
-  next_kernels = ArrayDouble2d(n_realizations * n_nodes, n_nodes * kernel_size);
-  unnormalized_kernels = ArrayDouble2d(n_realizations * n_nodes, n_nodes * kernel_size);
+  const ulong n_blocks = get_n_threads();
+  next_mu = ArrayDouble2d(n_blocks, n_nodes);
+  next_kernels = ArrayDouble2d(n_blocks, n_nodes * n_nodes * kernel_size);
+  unnormalized_kernels = ArrayDouble2d(n_blocks, n_nodes * kernel_size);
+
+  events_starts = ArrayULong(n_realizations * n_nodes + 1);
+  events_starts[0] = 0;
+  for (ulong r = 0; r < n_realizations; r++) {
+    for (ulong node_u = 0; node_u < n_nodes; ++node_u) {
+      const ulong r_u = r * n_nodes + node_u;
+      events_starts[r_u + 1] = events_starts[r_u] + timestamps_list[r][node_u]->size();
+    }
+  }
   weights_computed = true;
 }
 
+unsigned int HawkesEM::get_n_threads() const {
+  const ulong n_total_jumps = std::max(get_n_total_jumps(), ulong(1));
+  return static_cast<unsigned int>(std::min(static_cast<ulong>(max_n_threads), n_total_jumps));
+}
+
 void HawkesEM::solve(ArrayDouble &mu, ArrayDouble2d &kernels) {
-  if (!weights_computed) allocate_weights();
+  if (!weights_computed || next_mu.n_rows() != get_n_threads()) allocate_weights();
 
   if (mu.size() != n_nodes) {
     TICK_ERROR("baseline / mu argument must be an array of size " << n_nodes);
@@ -35,34 +52,65 @@ void HawkesEM::solve(ArrayDouble &mu, ArrayDouble2d &kernels) {
   }
 
   // Map
-  // Fill next_mu and next_kernels
-  next_mu.init_to_zero();
-  next_kernels.init_to_zero();
-  parallel_run(get_n_threads(), n_nodes * n_realizations,
-               &HawkesEM::solve_u_r, this, mu, kernels);
+  // Each thread fills the rows of next_mu and next_kernels of its block of events
+  const ulong n_blocks = next_mu.n_rows();
+  parallel_run(get_n_threads(), n_blocks, &HawkesEM::solve_block, this, mu, kernels);
 
   // Reduce
-  // Fill mu and kernels with next_mu and next_kernels
-  mu.init_to_zero();
-  kernels.init_to_zero();
-  for (ulong r = 0; r < n_realizations; r++) {
-    for (ulong node_u = 0; node_u < n_nodes; ++node_u) {
-      mu[node_u] += next_mu(r, node_u);
+  // Sum the rows of the blocks pairwise in parallel, the total ending in the first row
+  for (ulong stride = 1; stride < n_blocks; stride *= 2) {
+    const ulong n_pairs = (n_blocks + 2 * stride - 1) / (2 * stride);
+    parallel_run(get_n_threads(), n_pairs, &HawkesEM::reduce_blocks, this, stride);
+  }
 
-      ArrayDouble2d next_kernel_u_r(n_nodes, kernel_size,
-                                    view_row(next_kernels, r * n_nodes + node_u).data());
-      ArrayDouble2d kernel_u(n_nodes, kernel_size, view_row(kernels, node_u).data());
-      kernel_u.mult_incr(next_kernel_u_r, 1.);
+  // Fill mu and kernels with the sum of next_mu and next_kernels
+  mu.mult_fill(view_row(next_mu, 0), 1.);
+  ArrayDouble next_kernels_sum = view_row(next_kernels, 0);
+  for (ulong node_u = 0; node_u < n_nodes; ++node_u) {
+    ArrayDouble kernel_u = view_row(kernels, node_u);
+    for (ulong k = 0; k < n_nodes * kernel_size; ++k) {
+      kernel_u[k] = next_kernels_sum[node_u * n_nodes * kernel_size + k];
     }
   }
 }
 
-void HawkesEM::solve_u_r(const ulong r_u, const ArrayDouble &mu,
-                         ArrayDouble2d &kernels) {
-  // Obtain realization and node index from r_u
-  const ulong r = static_cast<const ulong>(r_u / n_nodes);
-  const ulong node_u = r_u % n_nodes;
+void HawkesEM::solve_block(const ulong block, const ArrayDouble &mu, ArrayDouble2d &kernels) {
+  ArrayDouble next_mu_block = view_row(next_mu, block);
+  ArrayDouble next_kernels_block = view_row(next_kernels, block);
+  next_mu_block.init_to_zero();
+  next_kernels_block.init_to_zero();
+
+  // Events are split in blocks of consecutive events of the same size
+  const ulong n_blocks = next_mu.n_rows();
+  const ulong n_events = events_starts.last();
+  const ulong block_start = n_events * block / n_blocks;
+  const ulong block_end = n_events * (block + 1) / n_blocks;
+
+  // The block might span several nodes and realizations
+  for (ulong r_u = 0; r_u < n_realizations * n_nodes; ++r_u) {
+    const ulong i_start = std::max(block_start, events_starts[r_u]);
+    const ulong i_end = std::min(block_end, events_starts[r_u + 1]);
+    if (i_start >= i_end) continue;
+
+    solve_u_r(r_u / n_nodes, r_u % n_nodes, i_start - events_starts[r_u],
+              i_end - events_starts[r_u], block, mu, kernels);
+  }
+}
 
+void HawkesEM::reduce_blocks(const ulong pair, const ulong stride) {
+  const ulong block = 2 * stride * pair;
+  const ulong other_block = block + stride;
+  if (other_block >= next_mu.n_rows()) return;
+
+  ArrayDouble next_mu_block = view_row(next_mu, block);
+  next_mu_block.mult_incr(view_row(next_mu, other_block), 1.);
+  ArrayDouble next_kernels_block = view_row(next_kernels, block);
+  next_kernels_block.mult_incr(view_row(next_kernels, other_block), 1.);
+}
+
+void HawkesEM::solve_u_r(const ulong r, const ulong node_u, const ulong i_start,
+                         const ulong i_end, const ulong block, const ArrayDouble &mu,
+                         ArrayDouble2d &kernels) {
   // Fetch corresponding data
   SArrayDoublePtrList1D &realization = timestamps_list[r];
   ArrayDouble2d kernel_u(n_nodes, kernel_size, view_row(kernels, node_u).data());
@@ -70,23 +118,28 @@ void HawkesEM::solve_u_r(const ulong r_u, const ArrayDouble &mu,
 
   // initialize next data
   ArrayDouble2d next_kernel_ru(n_nodes, kernel_size,
-                               view_row(next_kernels, r * n_nodes + node_u).data());
+                               view_row(next_kernels, block).data()
+                                   + node_u * n_nodes * kernel_size);
   ArrayDouble2d unnormalized_kernel_ru(n_nodes, kernel_size,
-                                       view_row(unnormalized_kernels,
-                                                r * n_nodes + node_u).data());
-  double &next_mu_ru = next_mu(r, node_u);
+                                       view_row(unnormalized_kernels, block).data());
+  double &next_mu_ru = next_mu(block, node_u);
 
   ArrayDouble timestamps_u = view(*realization[node_u]);
 
   // This array will allow us to find quicker the events in each component that
   // have occurred just before the events we will look at
+  // It starts after the events that occurred before the last event of the range
   ArrayULong last_indices(n_nodes);
+  const double t_last = timestamps_u[i_end - 1];
   for (ulong v = 0; v < n_nodes; v++) {
-    last_indices[v] = realization[v]->size();
+    ArrayDouble timestamps_v = view(*realization[v]);
+    last_indices[v] = std::upper_bound(timestamps_v.data(),
+                                       timestamps_v.data() + timestamps_v.size(),
+                                       t_last) - timestamps_v.data();
   }
 
   // We loop in reverse order to benefit from last_indices
-  for (ulong i = timestamps_u.size() - 1; i != static_cast<ulong>(-1); i--) {
+  for (ulong i = i_end - 1; i != i_start - 1; i--) {
     // this array will store temporary values
     unnormalized_kernel_ru.init_to_zero();
 
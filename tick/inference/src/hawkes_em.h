@@ -28,11 +28,16 @@ class HawkesEM : public ModelHawkesList {
   //! @brief explicit discretization of the kernel
   SArrayDoublePtr kernel_discretization;
 
-  //! @brief buffer variables
+  //! @brief buffer variables, one row per block of events each filled by a single thread
   ArrayDouble2d next_mu;
   ArrayDouble2d next_kernels;
   ArrayDouble2d unnormalized_kernels;
 
+  //! @brief Index of the first event of each node of each realization when all events are
+  //! numbered realization by realization and node by node (the last value is the total number
+  //! of events)
+  ArrayULong events_starts;
+
  public :
   HawkesEM(const double kernel_support, const ulong kernel_size,
            const int max_n_threads = 1);
@@ -45,10 +50,24 @@ class HawkesEM : public ModelHawkesList {
   //! @brief The main method to perform one iteration
   void solve(ArrayDouble &mu, ArrayDouble2d &kernels);
 
+  //! @brief Number of threads used, which may exceed the number of nodes times the number of
+  //! realizations as realizations are split in blocks of events
+  unsigned int get_n_threads() const override;
+
  private:
   //! @brief A method called in parallel by the method 'solve'
-  //! @param r_u : r * n_realizations + u, tells which realization and which node
-  void solve_u_r(const ulong r_u, const ArrayDouble &mu, ArrayDouble2d &kernel);
+  //! Accumulates in the buffers of the block the contributions of its events
+  //! @param block : index of the block of consecutive events (as numbered in events_starts)
+  void solve_block(const ulong block, const ArrayDouble &mu, ArrayDouble2d &kernels);
+
+  //! @brief Accumulates in the buffers of the block the contributions of the events i_start to
+  //! i_end (excluded) of node u of realization r
+  void solve_u_r(const ulong r, const ulong node_u, const ulong i_start, const ulong i_end,
+                 const ulong block, const ArrayDouble &mu, ArrayDouble2d &kernels);
+
+  //! @brief A method called in parallel by the method 'solve' to sum the buffers of the blocks
+  //! Adds the buffers of block 2 * stride * pair + stride to the ones of block 2 * stride * pair
+  void reduce_blocks(const ulong pair, const ulong stride);
 
   //! @brief Discretization parameter of the kernel
   //! If kernel_discretization is a nullptr then it is equal to kernel_support / kernel_size
@@ -0,0 +1,282 @@
+// License: BSD 3 clause
+
+#include <algorithm>
+#include <numeric>
+
+#include "hawkes_sumexpkern_intensity.h"
+
+HawkesSumExpKernIntensity::HawkesSumExpKernIntensity(const ArrayDouble &decays,
+                                                     const ulong n_baselines,
+                                                     const double period_length,
+                                                     const int max_n_threads)
+    : ModelHawkesList(max_n_threads, 0),
+      decays(decays), n_baselines(n_baselines), period_length(period_length) {
+  if (n_baselines == 0) TICK_ERROR("n_baselines must be positive");
+  if (n_baselines > 1 && period_length <= 0) {
+    TICK_ERROR("period_length must be positive with several baselines, received "
+                   << period_length);
+  }
+}
+
+void HawkesSumExpKernIntensity::compute_weights() {
+  sorted_events = ArrayDoubleList1D(n_realizations);
+  sorted_nodes = ArrayULongList1D(n_realizations);
+  decay_factors = ArrayDouble2dList1D(n_realizations);
+
+  parallel_run(get_n_threads(), n_realizations,
+               &HawkesSumExpKernIntensity::compute_weights_r, this);
+
+  weights_computed = true;
+}
+
+void HawkesSumExpKernIntensity::compute_weights_r(const ulong r) {
+  const ulong n_events = (*n_jumps_per_realization)[r];
+  const ulong n_decays = decays.size();
+
+  ArrayDouble events(n_events);
+  ArrayULong nodes(n_events);
+  ulong e = 0;
+  for (ulong j = 0; j < n_nodes; ++j) {
+    const ArrayDouble &timestamps_j = *timestamps_list[r][j];
+    for (ulong k = 0; k < timestamps_j.size(); ++k, ++e) {
+      events[e] = timestamps_j[k];
+      nodes[e] = j;
+    }
+  }
+
+  std::vector<ulong> order(n_events);
+  std::iota(order.begin(), order.end(), 0);
+  std::stable_sort(order.begin(), order.end(),
+                   [&events](const ulong a, const ulong b) { return events[a] < events[b]; });
+
+  sorted_events[r] = ArrayDouble(n_events);
+  sorted_nodes[r] = ArrayULong(n_events);
+  decay_factors[r] = ArrayDouble2d(n_events, n_decays);
+  double previous_t = 0;
+  for (e = 0; e < n_events; ++e) {
+    const double t_e = events[order[e]];
+    sorted_events[r][e] = t_e;
+    sorted_nodes[r][e] = nodes[order[e]];
+    for (ulong u = 0; u < n_decays; ++u) {
+      decay_factors[r](e, u) = cexp(-decays[u] * (t_e - previous_t));
+    }
+    previous_t = t_e;
+  }
+}
+
+void HawkesSumExpKernIntensity::set_pair_decays(const ArrayULong &pair_decays) {
+  for (ulong q = 0; q < pair_decays.size(); ++q) {
+    if (pair_decays[q] >= decays.size()) {
+      TICK_ERROR("pair_decays must be smaller than the number of decays (" << decays.size()
+                     << "), got " << pair_decays[q]);
+    }
+  }
+  this->pair_decays = pair_decays;
+}
+
+void HawkesSumExpKernIntensity::check_coeffs(const ArrayDouble &baseline,
+                                             const ArrayDouble &adjacency) {
+  check_support();
+  if (baseline.size() != n_nodes * n_baselines) {
+    TICK_ERROR("baseline must have " << n_nodes * n_baselines << " values but has "
+                                     << baseline.size());
+  }
+  if (pair_decays.size() > 0 && pair_decays.size() != get_n_support_pairs()) {
+    TICK_ERROR("pair_decays must have " << get_n_support_pairs() << " values but has "
+                                        << pair_decays.size());
+  }
+  const ulong n_coeffs = get_n_support_pairs() * (pair_decays.size() > 0 ? 1 : decays.size());
+  if (adjacency.size() != n_coeffs) {
+    TICK_ERROR("adjacency must have " << n_coeffs << " values but has " << adjacency.size());
+  }
+  if (!weights_computed) compute_weights();
+}
+
+void HawkesSumExpKernIntensity::get_kernels_i(const ulong i, ArrayULong &source_positions,
+                                              std::vector<ulong> &decays_i) const {
+  const ulong n_sources = get_n_sources(i);
+  source_positions = ArrayULong(n_nodes);
+  source_positions.fill(n_sources);
+  for (ulong p = 0; p < n_sources; ++p) {
+    source_positions[get_source(i, p)] = p;
+  }
+
+  decays_i.clear();
+  if (pair_decays.size() > 0) {
+    const ulong start = get_support_start(i);
+    for (ulong p = 0; p < n_sources; ++p) {
+      decays_i.push_back(pair_decays[start + p]);
+    }
+    std::sort(decays_i.begin(), decays_i.end());
+    decays_i.erase(std::unique(decays_i.begin(), decays_i.end()), decays_i.end());
+  } else if (n_sources > 0) {
+    decays_i.resize(decays.size());
+    std::iota(decays_i.begin(), decays_i.end(), 0);
+  }
+}
+
+void HawkesSumExpKernIntensity::estimated_intensity(const ArrayDouble &baseline,
+                                                    const ArrayDouble &adjacency,
+                                                    const ArrayDoubleList1D &times,
+                                                    ArrayDoubleList2D &out) {
+  check_coeffs(baseline, adjacency);
+  if (times.size() != n_realizations || out.size() != n_realizations) {
+    TICK_ERROR("times and out must have one entry per realization (" << n_realizations << ")");
+  }
+  for (ulong r = 0; r < n_realizations; ++r) {
+    if (out[r].size() != n_nodes) {
+      TICK_ERROR("out[" << r << "] must have one array per node (" << n_nodes << ")");
+    }
+    for (ulong i = 0; i < n_nodes; ++i) {
+      if (out[r][i].size() != times[r].size()) {
+        TICK_ERROR("out[" << r << "][" << i << "] must have the size of times[" << r << "]");
+      }
+    }
+    for (ulong q = 1; q < times[r].size(); ++q) {
+      if (times[r][q] < times[r][q - 1]) TICK_ERROR("times[" << r << "] must be sorted");
+    }
+  }
+
+  parallel_run(get_n_threads(), n_realizations * n_nodes,
+               &HawkesSumExpKernIntensity::estimated_intensity_i_r, this,
+               baseline, adjacency, times, out);
+}
+
+void HawkesSumExpKernIntensity::estimated_intensity_i_r(const ulong i_r,
+                                                        const ArrayDouble &baseline,
+                                                        const ArrayDouble &adjacency,
+                                                        const ArrayDoubleList1D &times,
+                                                        ArrayDoubleList2D &out) {
+  const ulong r = static_cast<const ulong>(i_r / n_nodes);
+  const ulong i = i_r % n_nodes;
+  const ulong n_sources = get_n_sources(i);
+
+  const ArrayDouble &events_r = sorted_events[r];
+  const ArrayULong &nodes_r = sorted_nodes[r];
+  const ArrayDouble2d &decay_factors_r = decay_factors[r];
+  const ArrayDouble &times_r = times[r];
+  ArrayDouble &out_r_i = out[r][i];
+
+  ArrayULong source_positions;
+  std::vector<ulong> decays_i;
+  get_kernels_i(i, source_positions, decays_i);
+
+  // excitation[u] = sum_j alpha^{iju} sum_{t^j_k <= last_t} exp(-decays[u] (last_t - t^j_k))
+  ArrayDouble excitation(decays.size());
+  excitation.init_to_zero();
+  double last_t = 0;
+
+  ulong e = 0;
+  for (ulong q = 0; q < times_r.size(); ++q) {
+    const double t_q = times_r[q];
+    while (e < events_r.size() && events_r[e] < t_q) {
+      for (const ulong u : decays_i) {
+        excitation[u] *= decay_factors_r(e, u);
+      }
+      const ulong p = source_positions[nodes_r[e]];
+      if (p < n_sources) add_pair_coeffs(i, p, adjacency, excitation);
+      last_t = events_r[e];
+      ++e;
+    }
+
+    double intensity = n_baselines == 1 ? baseline[i]
+                                        : baseline[i * n_baselines + get_baseline_interval(t_q)];
+    for (const ulong u : decays_i) {
+      if (excitation[u] != 0) {
+        intensity += decays[u] * excitation[u] * cexp(-decays[u] * (t_q - last_t));
+      }
+    }
+    out_r_i[q] = intensity;
+  }
+}
+
+void HawkesSumExpKernIntensity::compensator(const ArrayDouble &baseline,
+                                            const ArrayDouble &adjacency,
+                                            ArrayDoubleList2D &out) {
+  check_coeffs(baseline, adjacency);
+  if (out.size() != n_realizations) {
+    TICK_ERROR("out must have one entry per realization (" << n_realizations << ")");
+  }
+  for (ulong r = 0; r < n_realizations; ++r) {
+    if (out[r].size() != n_nodes) {
+      TICK_ERROR("out[" << r << "] must have one array per node (" << n_nodes << ")");
+    }
+    for (ulong i = 0; i < n_nodes; ++i) {
+      if (out[r][i].size() != timestamps_list[r][i]->size()) {
+        TICK_ERROR("out[" << r << "][" << i << "] must have one value per event of node " << i);
+      }
+    }
+  }
+
+  parallel_run(get_n_threads(), n_realizations * n_nodes,
+               &HawkesSumExpKernIntensity::compensator_i_r, this, baseline, adjacency, out);
+}
+
+void HawkesSumExpKernIntensity::compensator_i_r(const ulong i_r,
+                                                const ArrayDouble &baseline,
+                                                const ArrayDouble &adjacency,
+                                                ArrayDoubleList2D &out) {
+  const ulong r = static_cast<const ulong>(i_r / n_nodes);
+  const ulong i = i_r % n_nodes;
+  const ulong n_sources = get_n_sources(i);
+
+  const ArrayDouble &events_r = sorted_events[r];
+  const ArrayULong &nodes_r = sorted_nodes[r];
+  const ArrayDouble2d &decay_factors_r = decay_factors[r];
+  ArrayDouble &out_r_i = out[r][i];
+
+  ArrayULong source_positions;
+  std::vector<ulong> decays_i;
+  get_kernels_i(i, source_positions, decays_i);
+
+  // Integral of the baseline over the first p intervals of a period, so that the integral of
+  // the baseline from 0 to any time is obtained in constant time
+  const ArrayDouble mu_i = view(baseline, i * n_baselines, (i + 1) * n_baselines);
+  const double interval_length = n_baselines == 1 ? 0 : period_length / n_baselines;
+  ArrayDouble cumulated_mu_i(n_baselines + 1);
+  cumulated_mu_i[0] = 0;
+  for (ulong p = 0; p < n_baselines; ++p) {
+    cumulated_mu_i[p + 1] = cumulated_mu_i[p] + mu_i[p] * interval_length;
+  }
+
+  ArrayDouble excitation(decays.size());
+  excitation.init_to_zero();
+  double integrated_excitation = 0;
+
+  ulong k = 0;
+  for (ulong e = 0; e < events_r.size(); ++e) {
+    const double t_e = events_r[e];
+    const ulong j = nodes_r[e];
+    for (const ulong u : decays_i) {
+      // The integral of decays[u] * excitation[u] * exp(-decays[u] s) between the previous
+      // event and t_e
+      integrated_excitation += excitation[u] * (1 - decay_factors_r(e, u));
+      excitation[u] *= decay_factors_r(e, u);
+    }
+    const ulong p = source_positions[j];
+    if (p < n_sources) add_pair_coeffs(i, p, adjacency, excitation);
+
+    if (j == i) {
+      double integrated_baseline;
+      if (n_baselines == 1) {
+        integrated_baseline = mu_i[0] * t_e;
+      } else {
+        const double n_full_periods = std::floor(t_e / period_length);
+        const ulong p = get_baseline_interval(t_e);
+        const double time_in_interval =
+            t_e - n_full_periods * period_length - p * interval_length;
+        integrated_baseline = n_full_periods * cumulated_mu_i[n_baselines]
+            + cumulated_mu_i[p] + mu_i[p] * time_in_interval;
+      }
+      out_r_i[k] = integrated_baseline + integrated_excitation;
+      ++k;
+    }
+  }
+}
+
+ulong HawkesSumExpKernIntensity::get_baseline_interval(const double t) const {
+  const double first_period_t = t - std::floor(t / period_length) * period_length;
+  if (first_period_t == period_length) return n_baselines - 1;
+  return std::min(static_cast<ulong>(std::floor(first_period_t / period_length * n_baselines)),
+                  n_baselines - 1);
+}
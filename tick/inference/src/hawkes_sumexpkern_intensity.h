@@ -0,0 +1,137 @@
+#ifndef TICK_INFERENCE_SRC_HAWKES_SUMEXPKERN_INTENSITY_H_
+#define TICK_INFERENCE_SRC_HAWKES_SUMEXPKERN_INTENSITY_H_
+
+// License: BSD 3 clause
+
+#include "base.h"
+#include "base/hawkes_list.h"
+
+#include <vector>
+
+/**
+ * \class HawkesSumExpKernIntensity
+ * \brief Evaluates the intensity and the compensator of Hawkes processes with sum exponential
+ * kernels and piecewise constant periodic baselines on a list of realizations
+ *
+ * The kernel of node j on node i is \f$ \sum_u \alpha^{iju} \beta^u e^{-\beta^u t} \f$. The
+ * excitation of each node is updated recursively from one event to the next one, hence the
+ * evaluation is linear in the number of events (times the number of nodes and decays) instead
+ * of quadratic.
+ *
+ * Only the pairs of nodes of the support have kernels (see ModelHawkes::set_support), and
+ * each of them can be given a single decay with set_pair_decays, as exponential kernels with
+ * different decays. The adjacency coefficients then only contain the coefficients of these
+ * kernels.
+ */
+class HawkesSumExpKernIntensity : public ModelHawkesList {
+  //! @brief Decays shared by all kernels
+  ArrayDouble decays;
+
+  //! @brief If not empty, the pair of nodes number q of the support has a single kernel, of
+  //! decay decays[pair_decays[q]]
+  ArrayULong pair_decays;
+
+  //! @brief Number of baselines per period, the baseline of each node being constant on
+  //! intervals of size period_length / n_baselines
+  ulong n_baselines;
+
+  //! @brief Period of the baselines, only used if n_baselines > 1
+  double period_length;
+
+  //! @brief Events of each realization (all nodes merged) sorted by time, with their node
+  ArrayDoubleList1D sorted_events;
+  ArrayULongList1D sorted_nodes;
+
+  //! @brief For each realization, decay_factors[r](e, u) = exp(-decays[u] * (t_e - t_{e-1}))
+  //! where t_e is the e-th event of sorted_events[r] (and t_{-1} = 0)
+  ArrayDouble2dList1D decay_factors;
+
+ public:
+  /**
+   * @brief Constructor
+   * \param decays : decays shared by all kernels
+   * \param n_baselines : number of baselines per period
+   * \param period_length : period of the baselines, only used if n_baselines > 1
+   * \param max_n_threads : number of cores to be used for multithreading. If negative,
+   * the number of physical cores will be used
+   */
+  HawkesSumExpKernIntensity(const ArrayDouble &decays, const ulong n_baselines = 1,
+                            const double period_length = 0., const int max_n_threads = 1);
+
+  //! @brief Sorts the events of each realization and computes the decay factors between them
+  void compute_weights();
+
+  /**
+   * @brief Computes the intensity of each node of each realization at the given times, only
+   * the events strictly before each time being accounted for
+   * \param baseline : baselines of size n_nodes * n_baselines, the n_baselines values of node i
+   * being stored from index i * n_baselines
+   * \param adjacency : adjacency coefficients of size n_pairs * n_decays, where n_pairs is the
+   * number of pairs of nodes of the support (n_nodes * n_nodes without support), alpha^{iju}
+   * being stored at index q * n_decays + u if (i, j) is the q-th pair of the support in CSR
+   * order. If pair decays are set, there is one coefficient per pair, stored at index q
+   * \param times : sorted times at which the intensities of each realization are computed
+   * \param out : out[r][i] is filled with the intensity of node i of realization r at times[r]
+   */
+  void estimated_intensity(const ArrayDouble &baseline, const ArrayDouble &adjacency,
+                           const ArrayDoubleList1D &times, ArrayDoubleList2D &out);
+
+  /**
+   * @brief Computes the compensator (integrated intensity) of each node of each realization at
+   * each of its events
+   * \param baseline : baselines, see estimated_intensity
+   * \param adjacency : adjacency coefficients, see estimated_intensity
+   * \param out : out[r][i] is filled with the compensator of node i of realization r at each
+   * event of this node
+   */
+  void compensator(const ArrayDouble &baseline, const ArrayDouble &adjacency,
+                   ArrayDoubleList2D &out);
+
+  /**
+   * @brief Gives a single decay to the kernel of each pair of nodes of the support
+   * \param pair_decays : index in decays of the decay of each pair of nodes of the support,
+   * in CSR order. If empty, each pair has the kernels of all decays
+   */
+  void set_pair_decays(const ArrayULong &pair_decays);
+
+  ulong get_n_decays() const { return decays.size(); }
+  ulong get_n_baselines() const { return n_baselines; }
+  double get_period_length() const { return period_length; }
+
+ private:
+  void compute_weights_r(const ulong r);
+
+  void estimated_intensity_i_r(const ulong i_r, const ArrayDouble &baseline,
+                               const ArrayDouble &adjacency, const ArrayDoubleList1D &times,
+                               ArrayDoubleList2D &out);
+
+  void compensator_i_r(const ulong i_r, const ArrayDouble &baseline,
+                       const ArrayDouble &adjacency, ArrayDoubleList2D &out);
+
+  //! @brief Position of each node among the nodes exciting node i (see get_source_position)
+  //! and decays used by the kernels of node i
+  void get_kernels_i(const ulong i, ArrayULong &source_positions,
+                     std::vector<ulong> &decays_i) const;
+
+  //! @brief Adds to excitation the coefficients of the kernels of the p-th pair of node i
+  inline void add_pair_coeffs(const ulong i, const ulong p, const ArrayDouble &adjacency,
+                              ArrayDouble &excitation) const {
+    const ulong q = get_support_start(i) + p;
+    if (pair_decays.size() > 0) {
+      excitation[pair_decays[q]] += adjacency[q];
+    } else {
+      const ulong n_decays = decays.size();
+      for (ulong u = 0; u < n_decays; ++u) {
+        excitation[u] += adjacency[q * n_decays + u];
+      }
+    }
+  }
+
+  //! @brief Checks the sizes of the coefficients and computes weights if needed
+  void check_coeffs(const ArrayDouble &baseline, const ArrayDouble &adjacency);
+
+  //! @brief Index of the baseline interval time t belongs to
+  ulong get_baseline_interval(const double t) const;
+};
+
+#endif  // TICK_INFERENCE_SRC_HAWKES_SUMEXPKERN_INTENSITY_H_
@@ -0,0 +1,33 @@
+// License: BSD 3 clause
+
+
+%include std_shared_ptr.i
+%shared_ptr(HawkesSumExpKernIntensity);
+
+%{
+#include "hawkes_sumexpkern_intensity.h"
+%}
+
+class HawkesSumExpKernIntensity : public ModelHawkesList {
+
+ public:
+
+  HawkesSumExpKernIntensity(const ArrayDouble &decays, const ulong n_baselines = 1,
+                            const double period_length = 0., const int max_n_threads = 1);
+
+  void compute_weights();
+
+  void estimated_intensity(const ArrayDouble &baseline, const ArrayDouble &adjacency,
+                           const ArrayDoubleList1D &times, ArrayDoubleList2D &out);
+
+  void compensator(const ArrayDouble &baseline, const ArrayDouble &adjacency,
+                   ArrayDoubleList2D &out);
+
+  void set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices);
+
+  void set_pair_decays(const ArrayULong &pair_decays);
+
+  ulong get_n_decays() const;
+  ulong get_n_baselines() const;
+  double get_period_length() const;
+};
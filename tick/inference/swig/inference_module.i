@@ -21,4 +21,5 @@
 %include hawkes_em.i
 %include hawkes_adm4.i
 %include hawkes_basis_kernels.i
-%include hawkes_sumgaussians.i
\ No newline at end of file
+%include hawkes_sumgaussians.i
+%include hawkes_sumexpkern_intensity.i
\ No newline at end of file
@@ -0,0 +1,144 @@
+# License: BSD 3 clause
+
+import unittest
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from tick.inference import CrossValidation, LogisticRegression, \
+    CoxRegression, HawkesExpKern
+from tick.optim.model import ModelLogReg
+from tick.simulation import SimuLogReg, SimuCoxReg, SimuHawkesExpKernels, \
+    weights_sparse_gauss
+
+
+class Test(unittest.TestCase):
+    @staticmethod
+    def get_logreg_data(n_features=10, n_samples=500):
+        np.random.seed(12)
+        weights0 = weights_sparse_gauss(n_features, nnz=4)
+        features, y = SimuLogReg(weights0, 0.1, n_samples=n_samples,
+                                 verbose=False).simulate()
+        return features, y
+
+    def test_cross_validation_logreg(self):
+        """...Test CrossValidation on LogisticRegression gives the losses
+        of learners fitted independently on each fold, whatever the number
+        of threads and the storage of the features
+        """
+        X, y = Test.get_logreg_data()
+        Cs = [1e3, 1e-1, 1e1]
+        learner = LogisticRegression(penalty='l1', solver='svrg',
+                                     random_state=12, tol=1e-10,
+                                     max_iter=500, verbose=False)
+        param_grid = {'C': Cs, 'fit_intercept': [True, False]}
+
+        cv = CrossValidation(learner, param_grid, n_folds=4).fit(X, y)
+        self.assertEqual(cv.test_losses.shape, (6, 4))
+        self.assertEqual(cv.grid[0], {'C': 1e-1, 'fit_intercept': True})
+        self.assertEqual(cv.grid[5], {'C': 1e3, 'fit_intercept': False})
+
+        # Fold 1 is tested on samples 125 to 250
+        for k, params in enumerate(cv.grid):
+            fold_learner = LogisticRegression(penalty='l1', solver='svrg',
+                                              random_state=12, tol=1e-10,
+                                              max_iter=500, verbose=False,
+                                              **params)
+            fold_learner.fit(np.vstack((X[:125], X[250:])),
+                             np.hstack((y[:125], y[250:])))
+            model = ModelLogReg(fit_intercept=params['fit_intercept'])
+            model.fit(X[125:250], y[125:250])
+            coeffs = fold_learner.weights
+            if params['fit_intercept']:
+                coeffs = np.hstack((coeffs, fold_learner.intercept))
+            self.assertAlmostEqual(cv.test_losses[k, 1], model.loss(coeffs),
+                                   places=4)
+
+        best = np.argmin(cv.test_losses.mean(axis=1))
+        self.assertEqual(cv.best_params, cv.grid[best])
+        self.assertEqual(cv.best_learner.C, cv.best_params['C'])
+        self.assertIsNotNone(cv.best_learner.weights)
+
+        for n_threads, features in [(4, X), (-1, X), (4, csr_matrix(X))]:
+            cv_threads = CrossValidation(learner, param_grid, n_folds=4,
+                                         n_threads=n_threads, refit=False)
+            cv_threads.fit(features, y)
+            np.testing.assert_almost_equal(cv_threads.test_losses,
+                                           cv.test_losses, decimal=5)
+            self.assertIsNone(cv_threads.best_learner)
+
+    def test_cross_validation_logreg_sdca(self):
+        """...Test CrossValidation goes along the values of C with SDCA
+        """
+        X, y = Test.get_logreg_data()
+        learner = LogisticRegression(solver='sdca', random_state=12,
+                                     verbose=False)
+        cv = CrossValidation(learner, {'C': [1e1, 1e2, 1e3]}, n_folds=3,
+                             n_threads=2).fit(X, y)
+        self.assertEqual(cv.test_losses.shape, (3, 3))
+        self.assertTrue(np.all(np.isfinite(cv.test_losses)))
+
+    def test_cross_validation_coxreg(self):
+        """...Test CrossValidation on CoxRegression
+        """
+        np.random.seed(12)
+        coeffs0 = weights_sparse_gauss(5, nnz=3)
+        features, times, censoring = SimuCoxReg(coeffs0, n_samples=300,
+                                                verbose=False).simulate()
+        learner = CoxRegression(solver='agd', verbose=False)
+        cv = CrossValidation(learner, {'C': [1e-1, 1e1, 1e3]}, n_folds=3,
+                             n_threads=3)
+        cv.fit(features, times, censoring)
+        self.assertEqual(cv.test_losses.shape, (3, 3))
+        self.assertTrue(np.all(np.isfinite(cv.test_losses)))
+        self.assertEqual(cv.best_learner.coeffs.shape, (5,))
+
+        # The training features of each fold stay sparse
+        cv_sparse = CrossValidation(learner, {'C': [1e-1, 1e1, 1e3]},
+                                    n_folds=3, n_threads=3, refit=False)
+        cv_sparse.fit(csr_matrix(features), times, censoring)
+        np.testing.assert_almost_equal(cv_sparse.test_losses,
+                                       cv.test_losses, decimal=5)
+
+    def test_cross_validation_hawkes(self):
+        """...Test CrossValidation on HawkesExpKern splits the
+        realizations in folds
+        """
+        n_nodes = 2
+        realizations = []
+        for seed in range(4):
+            simu = SimuHawkesExpKernels(0.3 * np.ones((n_nodes, n_nodes)), 2.,
+                                        baseline=np.ones(n_nodes),
+                                        end_time=100, seed=seed,
+                                        verbose=False)
+            simu.simulate()
+            realizations.append(simu.timestamps)
+
+        learner = HawkesExpKern(2., verbose=False)
+        cv = CrossValidation(learner, {'C': [1e1, 1e3],
+                                       'penalty': ['l1', 'l2']}, n_folds=2,
+                             n_threads=2)
+        cv.fit(realizations)
+        self.assertEqual(cv.test_losses.shape, (4, 2))
+        self.assertEqual(cv.best_learner.decays, 2.)
+        self.assertEqual(cv.best_learner.coeffs.shape, (n_nodes * 3,))
+
+        msg = '^Hawkes learners are cross-validated on realizations'
+        with self.assertRaisesRegex(ValueError, msg):
+            cv.fit(realizations[0])
+
+    def test_cross_validation_errors(self):
+        """...Test CrossValidation errors
+        """
+        learner = LogisticRegression()
+        msg = '^LogisticRegression has no parameter wrong_name$'
+        with self.assertRaisesRegex(ValueError, msg):
+            CrossValidation(learner, {'wrong_name': [1]})
+
+        msg = '^``n_folds`` must be at least 2, got 1$'
+        with self.assertRaisesRegex(ValueError, msg):
+            CrossValidation(learner, {'C': [1]}, n_folds=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
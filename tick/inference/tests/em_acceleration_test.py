@@ -0,0 +1,64 @@
+# License: BSD 3 clause
+
+import unittest
+
+import numpy as np
+
+from tick.inference.base import Squarem
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(23982)
+        # A slowly contracting affine map with a non-negative fixed point
+        self.matrix = np.array([[0.9, 0.05], [0.02, 0.95]])
+        self.intercept = np.array([1., 2.])
+        self.fixed_point = np.linalg.solve(np.eye(2) - self.matrix,
+                                           self.intercept)
+
+    def _n_iterations_to_converge(self, accelerator, tol=1e-8):
+        x = np.zeros(2)
+        params = [x]
+
+        def fixed_point_step():
+            x[:] = self.matrix.dot(x) + self.intercept
+
+        n_iterations = 0
+        while np.linalg.norm(x - self.fixed_point) > tol:
+            if accelerator is None:
+                fixed_point_step()
+                n_iterations += 1
+            else:
+                n_iterations += accelerator.step(fixed_point_step, params)
+        return n_iterations
+
+    def test_squarem_convergence(self):
+        """...Test that Squarem converges to the fixed point with much fewer
+        iterations of the fixed-point map
+        """
+        n_plain = self._n_iterations_to_converge(None)
+        n_squarem = self._n_iterations_to_converge(Squarem())
+        self.assertLess(10 * n_squarem, n_plain)
+
+    def test_squarem_safeguard(self):
+        """...Test that Squarem falls back on two plain iterations when the
+        extrapolation increases the residual
+        """
+        x = np.zeros(1)
+        y = np.ones((1, 1))
+
+        # Contracting towards 2 but diverging from 1.8, where the
+        # extrapolation of the first iterations lands
+        def fixed_point_step():
+            x[:] = x / 2 + 1 if x[0] < 1.8 else 10 * x
+            y[:] = y / 2
+
+        squarem = Squarem(step_max=1e3)
+        self.assertEqual(squarem.step(fixed_point_step, [x, y]), 3)
+        np.testing.assert_array_equal(x, [1.5])
+        np.testing.assert_array_equal(y, [[0.25]])
+        self.assertEqual(squarem.step_max, 1e3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -46,6 +46,27 @@ class Test(unittest.TestCase):
         np.testing.assert_array_almost_equal(learner.adjacency, adjacency,
                                              decimal=6)
 
+    def test_hawkes_adm4_support(self):
+        """...Test HawkesADM4 keeps the adjacency to zero outside of the
+        support
+        """
+        events = [np.array([1, 1.2, 3.4, 5.8, 10.3, 11, 13.4]),
+                  np.array([2, 5, 8.3, 9.10, 15, 18, 20, 33]),
+                  np.array([2, 3.2, 11.4, 12.8, 45])]
+        support = np.array([[1, 0, 1],
+                            [0, 1, 0],
+                            [1, 1, 0]])
+
+        learner = HawkesADM4(0.7, C=10, max_iter=10, em_max_iter=3,
+                             support=support)
+        learner.fit(events)
+        self.assertEqual(learner.adjacency.shape, (3, 3))
+        np.testing.assert_array_equal(learner.adjacency[support == 0], 0)
+
+        adjacency_start = np.zeros((3, 3)) + .2
+        learner.fit(events, adjacency_start=adjacency_start)
+        np.testing.assert_array_equal(learner.adjacency[support == 0], 0)
+
     def test_hawkes_adm4_set_data(self):
         """...Test set_data method of Hawkes ADM4
         """
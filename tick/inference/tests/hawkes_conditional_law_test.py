@@ -109,6 +109,28 @@ class Test(InferenceTest):
         with self.assertWarnsRegex(UserWarning, msg):
             new_model.incremental_fit(self.timestamps, compute=True)
 
+    def test_hawkes_conditional_law_n_threads(self):
+        """...Test HawkesConditionalLaw estimates on several realizations
+        are the same whatever the number of threads and with incremental fits
+        """
+        other_timestamps = [np.cumsum(random(randint(20, 25))) * 10
+                            for _ in range(self.dim)]
+        for quad_method in ['gauss', 'gauss-', 'lin', 'log']:
+            model = HawkesConditionalLaw(n_quad=5, quad_method=quad_method)
+            model.incremental_fit(self.timestamps, compute=False)
+            model.incremental_fit(other_timestamps)
+
+            model_threads = HawkesConditionalLaw(n_quad=5, n_threads=3,
+                                                 quad_method=quad_method)
+            model_threads.fit([self.timestamps, other_timestamps])
+
+            self.assertEqual(model_threads.n_realizations, 2)
+            np.testing.assert_array_almost_equal(model_threads.kernels_norms,
+                                                 model.kernels_norms)
+            np.testing.assert_array_almost_equal(model_threads.kernels,
+                                                 model.kernels)
+            np.testing.assert_array_almost_equal(model_threads.baseline,
+                                                 model.baseline)
 
 
 if __name__ == "__main__":
@@ -71,6 +71,63 @@ class Test(unittest.TestCase):
         np.testing.assert_array_equal(em.get_kernel_supports(),
                                       np.ones((self.n_nodes, self.n_nodes)) * 3)
 
+    def test_hawkes_em_fit_n_threads(self):
+        """...Test HawkesEM gives the same estimation whatever the number of
+        threads, even with more threads than nodes and realizations
+        """
+        baseline = np.zeros(self.n_nodes) + .2
+        kernel = np.zeros((self.n_nodes, self.n_nodes, 3)) + .4
+
+        for events in [self.events, self.events[0]]:
+            em = HawkesEM(kernel_support=3, kernel_size=3, n_threads=1,
+                          max_iter=10, verbose=False)
+            em.fit(events, baseline_start=baseline, kernel_start=kernel)
+
+            for n_threads in [2, 5, 20]:
+                em_threads = HawkesEM(kernel_support=3, kernel_size=3,
+                                      n_threads=n_threads, max_iter=10,
+                                      verbose=False)
+                em_threads.fit(events, baseline_start=baseline,
+                               kernel_start=kernel)
+                np.testing.assert_array_almost_equal(em_threads.baseline,
+                                                     em.baseline)
+                np.testing.assert_array_almost_equal(em_threads.kernel,
+                                                     em.kernel)
+
+    def test_hawkes_em_acceleration(self):
+        """...Test HawkesEM accelerated with SQUAREM converges to the same
+        estimation in fewer EM iterations
+        """
+        baseline = np.zeros(self.n_nodes) + .2
+        kernel = np.zeros((self.n_nodes, self.n_nodes, 3)) + .4
+
+        learners = {}
+        for acceleration in [None, 'squarem']:
+            em = HawkesEM(kernel_support=3, kernel_size=3, max_iter=3000,
+                          tol=1e-10, acceleration=acceleration)
+            em.fit(self.events, baseline_start=baseline, kernel_start=kernel)
+            learners[acceleration] = em
+
+        np.testing.assert_array_almost_equal(learners['squarem'].baseline,
+                                             learners[None].baseline,
+                                             decimal=4)
+        np.testing.assert_array_almost_equal(learners['squarem'].kernel,
+                                             learners[None].kernel,
+                                             decimal=4)
+        # Each SQUAREM iteration runs up to three EM iterations
+        n_em_steps = {acceleration: em.history.last_values['n_em_steps']
+                      for acceleration, em in learners.items()}
+        self.assertEqual(n_em_steps[None],
+                         learners[None].history.last_values['n_iter'] + 1)
+        self.assertLessEqual(
+            n_em_steps['squarem'],
+            3 * (learners['squarem'].history.last_values['n_iter'] + 1))
+        self.assertLess(n_em_steps['squarem'], n_em_steps[None])
+
+        msg = "^``acceleration`` must be one of None, squarem, got anderson$"
+        with self.assertRaisesRegex(ValueError, msg):
+            HawkesEM(kernel_support=3, acceleration='anderson')
+
     def test_hawkes_em_kernel_support(self):
         """...Test that Hawkes em kernel support parameter is correctly
         synchronized
@@ -136,6 +136,71 @@ class Test(InferenceTest):
         learner.fit(self.events, start=random_coeffs)
         np.testing.assert_array_equal(learner.coeffs, random_coeffs)
 
+    def test_HawkesExpKern_partial_fit(self):
+        """...Test HawkesExpKern fitted on batches of events reaches the
+        solution of the fit on all events
+        """
+        cut = 4.
+        batches = [[e[e < cut] for e in self.events],
+                   [e[e >= cut] for e in self.events]]
+
+        learner = HawkesExpKern(self.decays, penalty='l2', C=1e1,
+                                solver='bfgs', max_iter=1000, tol=1e-10)
+        learner.fit(self.events)
+
+        learner_batches = HawkesExpKern(self.decays, penalty='l2', C=1e1,
+                                        solver='bfgs', max_iter=1000,
+                                        tol=1e-10)
+        learner_batches.partial_fit(batches[0], end_time=cut)
+        learner_batches.partial_fit(batches[1])
+        np.testing.assert_array_almost_equal(learner_batches.coeffs,
+                                             learner.coeffs, decimal=4)
+
+        learner_window = HawkesExpKern(self.decays, window=2.)
+        self.assertEqual(learner_window._model_obj.window, 2.)
+
+        msg = "^A window can only be used with 'least-squares' goodness of fit"
+        with self.assertRaisesRegex(ValueError, msg):
+            HawkesExpKern(self.decays, gofit='likelihood', window=2.)
+
+    def test_HawkesExpKern_support(self):
+        """...Test HawkesExpKern only learns the adjacency coefficients of
+        the pairs of nodes in the support
+        """
+        n_nodes = len(self.events)
+        support = np.array([[1, 0, 0],
+                            [1, 1, 0],
+                            [0, 0, 1]])
+        for gofit in ['least-squares', 'likelihood']:
+            learner_kwargs = {'gofit': gofit, 'penalty': 'l1', 'C': 1e1,
+                              'step': 1e-2, 'max_iter': 50}
+
+            learner = HawkesExpKern(self.decays, **learner_kwargs)
+            learner.fit(self.events, start=0.3)
+            learner_full_support = HawkesExpKern(
+                self.decays, support=np.ones((n_nodes, n_nodes)),
+                **learner_kwargs)
+            learner_full_support.fit(self.events, start=0.3)
+            np.testing.assert_array_almost_equal(learner_full_support.coeffs,
+                                                 learner.coeffs)
+
+            learner_support = HawkesExpKern(self.decays, support=support,
+                                            **learner_kwargs)
+            learner_support.fit(self.events, start=0.3)
+            self.assertEqual(learner_support.coeffs.shape, (n_nodes + 4,))
+            self.assertEqual(learner_support.adjacency.shape,
+                             (n_nodes, n_nodes))
+            np.testing.assert_array_equal(
+                learner_support.adjacency[support == 0], 0)
+            np.testing.assert_array_equal(
+                learner_support.adjacency[support != 0],
+                learner_support.coeffs[n_nodes:])
+
+        msg = "^A support cannot be used with 'nuclear' penalty"
+        with self.assertRaisesRegex(ValueError, msg):
+            HawkesExpKern(self.decays, gofit='likelihood', penalty='nuclear',
+                          support=support)
+
     @staticmethod
     def specific_solver_kwargs(solver):
         """...A simple method to as systematically some kwargs to our tests
@@ -429,6 +494,63 @@ class Test(InferenceTest):
         np.testing.assert_array_equal(corresponding_simu.adjacency,
                                       learner.adjacency)
 
+    def test_HawkesExpKern_intensity_compensator(self):
+        """...Test intensity and compensator computed by HawkesExpKern
+        """
+        n_nodes = len(self.events)
+        events_list = [self.events,
+                       [np.cumsum(np.random.rand(5 + i)) for i in range(3)]]
+        times = np.random.rand(20) * 10
+
+        decays_matrix = np.random.choice([1., 3.], size=(n_nodes, n_nodes))
+        support = np.eye(n_nodes)
+        support[0, -1] = 1
+        for decays, support in [(self.decays, None), (decays_matrix, None),
+                                (decays_matrix, support)]:
+            learner = HawkesExpKern(decays, max_iter=10, support=support)
+            learner.fit(self.events)
+            decays = decays * np.ones((n_nodes, n_nodes))
+
+            for events in events_list:
+                intensity = learner.baseline.reshape(n_nodes, 1) * \
+                    np.ones((n_nodes, len(times)))
+                compensator = [learner.baseline[i] * events[i]
+                               for i in range(n_nodes)]
+                for i in range(n_nodes):
+                    for j in range(n_nodes):
+                        alpha, beta = learner.adjacency[i, j], decays[i, j]
+                        dt = times[np.newaxis, :] - events[j][:, np.newaxis]
+                        intensity[i] += (alpha * beta * np.exp(-beta * dt) *
+                                         (dt > 0)).sum(axis=0)
+                        dt = events[i][np.newaxis, :] - \
+                            events[j][:, np.newaxis]
+                        compensator[i] += (alpha * (1 - np.exp(-beta * dt)) *
+                                           (dt > 0)).sum(axis=0)
+
+                np.testing.assert_array_almost_equal(
+                    learner.estimated_intensity(events, times), intensity)
+                for i in range(n_nodes):
+                    np.testing.assert_array_almost_equal(
+                        learner.compensator(events)[i], compensator[i])
+
+            # Several realizations are computed in parallel
+            intensities = learner.estimated_intensity(
+                events_list, [times, times[:5]], n_threads=2)
+            self.assertEqual(len(intensities), 2)
+            np.testing.assert_array_almost_equal(
+                intensities[0], learner.estimated_intensity(self.events, times))
+            np.testing.assert_array_almost_equal(
+                intensities[1],
+                learner.estimated_intensity(events_list[1], times[:5]))
+            compensators = learner.compensator(events_list, n_threads=2)
+            for i in range(n_nodes):
+                np.testing.assert_array_almost_equal(
+                    compensators[1][i], learner.compensator(events_list[1])[i])
+
+        learner = HawkesExpKern(self.decays)
+        with self.assertRaisesRegex(ValueError, "You must fit data"):
+            learner.compensator(self.events)
+
 
 if __name__ == "__main__":
     unittest.main()
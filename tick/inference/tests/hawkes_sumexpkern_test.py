@@ -132,6 +132,38 @@ class Test(InferenceTest):
         """
         return dict()
 
+    def test_HawkesSumExpKern_support(self):
+        """...Test HawkesSumExpKern only learns the adjacency coefficients of
+        the pairs of nodes in the support
+        """
+        n_nodes = len(self.events)
+        support = np.array([[1, 0, 0],
+                            [1, 1, 0],
+                            [0, 0, 1]])
+        learner_kwargs = {'penalty': 'l1', 'C': 1e1, 'max_iter': 50}
+
+        learner = HawkesSumExpKern(self.decays, **learner_kwargs)
+        learner.fit(self.events, start=0.3)
+        learner_full_support = HawkesSumExpKern(
+            self.decays, support=np.ones((n_nodes, n_nodes)),
+            **learner_kwargs)
+        learner_full_support.fit(self.events, start=0.3)
+        np.testing.assert_array_almost_equal(learner_full_support.coeffs,
+                                             learner.coeffs)
+
+        learner_support = HawkesSumExpKern(self.decays, support=support,
+                                           **learner_kwargs)
+        learner_support.fit(self.events, start=0.3)
+        self.assertEqual(learner_support.coeffs.shape,
+                         (n_nodes + 4 * self.n_decays,))
+        self.assertEqual(learner_support.adjacency.shape,
+                         (n_nodes, n_nodes, self.n_decays))
+        np.testing.assert_array_equal(learner_support.adjacency[support == 0],
+                                      0)
+        np.testing.assert_array_equal(
+            learner_support.adjacency[support != 0].ravel(),
+            learner_support.coeffs[n_nodes:])
+
     def test_HawkesSumExpKern_settings(self):
         """...Test HawkesSumExpKern basic settings
         """
@@ -424,6 +456,55 @@ class Test(InferenceTest):
         np.testing.assert_array_equal(corresponding_simu.adjacency,
                                       learner.adjacency)
 
+    def test_HawkesSumExpKern_intensity_compensator(self):
+        """...Test intensity and compensator computed by HawkesSumExpKern
+        with periodic baselines
+        """
+        n_nodes = len(self.events)
+        learner = HawkesSumExpKern(self.decays, n_baselines=3,
+                                   period_length=2., max_iter=10)
+        learner.fit(self.events)
+
+        end_time = max(timestamps[-1] for timestamps in self.events)
+        times = np.linspace(0, end_time, 100000)
+        intensity = np.array([learner.get_baseline_values(i, times)
+                              for i in range(n_nodes)])
+        for i in range(n_nodes):
+            for j in range(n_nodes):
+                for t_j in self.events[j]:
+                    intensity[i, times > t_j] += learner.get_kernel_values(
+                        i, j, times[times > t_j] - t_j)
+
+        estimated_intensity = learner.estimated_intensity(self.events, times)
+        np.testing.assert_array_almost_equal(estimated_intensity, intensity)
+
+        compensator = learner.compensator(self.events, n_threads=2)
+        for i in range(n_nodes):
+            integrated_intensity = np.hstack((0, np.cumsum(
+                (intensity[i, 1:] + intensity[i, :-1]) / 2 * np.diff(times))))
+            np.testing.assert_array_almost_equal(
+                compensator[i],
+                np.interp(self.events[i], times, integrated_intensity),
+                decimal=2)
+
+        # Only the kernels of the pairs of nodes in the support are used
+        support = np.eye(n_nodes)
+        support[0, -1] = 1
+        learner_support = HawkesSumExpKern(self.decays, n_baselines=3,
+                                           period_length=2., max_iter=10,
+                                           support=support)
+        learner_support.fit(self.events)
+        learner._set("coeffs", np.hstack((learner_support.baseline.ravel(),
+                                          learner_support.adjacency.ravel())))
+        times = times[::100]
+        np.testing.assert_array_almost_equal(
+            learner_support.estimated_intensity(self.events, times),
+            learner.estimated_intensity(self.events, times))
+        for i in range(n_nodes):
+            np.testing.assert_array_almost_equal(
+                learner_support.compensator(self.events)[i],
+                learner.compensator(self.events)[i])
+
 
 if __name__ == "__main__":
     unittest.main()
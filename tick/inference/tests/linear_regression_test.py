@@ -100,6 +100,36 @@ class Test(InferenceTest):
             self.assertLess(learner._solver_obj.objective(coeffs_2),
                             learner._solver_obj.objective(coeffs_1))
 
+    def test_LinearRegression_partial_fit(self):
+        """...Test LinearRegression learns on a stream of chunks with
+        partial_fit
+        """
+        n_features = 20
+        X, y, weights0, intercept0 = Test.get_train_data(n_features=n_features)
+
+        learner = LinearRegression(solver='svrg', random_state=12)
+        for _ in range(5):
+            for i in range(0, len(y), 500):
+                learner.partial_fit(X[i:i + 500], y[i:i + 500])
+        err = norm(learner.weights - weights0) / n_features ** 0.5
+        self.assertLess(err, 1e-1)
+        self.assertLess(abs(learner.intercept - intercept0), 1e-1)
+
+        # partial_fit goes on from the state reached by fit
+        learner = LinearRegression(solver='svrg', random_state=12, max_iter=2,
+                                   tol=0)
+        learner.fit(X, y)
+        coeffs_1 = np.hstack((learner.weights, learner.intercept))
+        learner.partial_fit(X, y)
+        coeffs_2 = np.hstack((learner.weights, learner.intercept))
+        self.assertLess(learner._solver_obj.objective(coeffs_2),
+                        learner._solver_obj.objective(coeffs_1))
+
+        msg = '^partial_fit can only be used with stochastic solvers sgd, ' \
+              'svrg, sdca, got gd$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LinearRegression(solver='gd').partial_fit(X, y)
+
     @staticmethod
     def specific_solver_kwargs(solver):
         """...A simple method to as systematically some kwargs to our tests
@@ -137,6 +137,152 @@ class Test(InferenceTest):
                 self.assertLess(learner._solver_obj.objective(coeffs_2),
                                 learner._solver_obj.objective(coeffs_1))
 
+    def test_LogisticRegression_partial_fit(self):
+        """...Test LogisticRegression learns on a stream of chunks with
+        partial_fit while keeping the state of the solver
+        """
+        sto_seed = 179312
+        features, y = Test.get_train_data()
+        chunk_size = 300
+        chunks = [(features[i:i + chunk_size], y[i:i + chunk_size])
+                  for i in range(0, len(y), chunk_size)]
+
+        for solver in ['sgd', 'svrg', 'sdca']:
+            solver_kwargs = {'solver': solver, 'C': 100, 'verbose': False,
+                             'random_state': sto_seed}
+            if solver == 'sdca':
+                solver_kwargs['sdca_ridge_strength'] = 2e-2
+            if solver == 'sgd':
+                solver_kwargs['step'] = 1.
+
+            learner = LogisticRegression(**solver_kwargs)
+            cpp_solver = None
+            for n_chunk, (X_chunk, y_chunk) in enumerate(chunks):
+                learner.partial_fit(X_chunk, y_chunk)
+                if cpp_solver is None:
+                    cpp_solver = learner._solver_obj._solver
+                # The C++ solver is never rebuilt
+                self.assertIs(learner._solver_obj._solver, cpp_solver)
+                if solver == 'sdca':
+                    self.assertEqual(cpp_solver.get_n_past_samples(),
+                                     n_chunk * chunk_size)
+
+            probas = learner.predict_proba(features)[:, 1]
+            auc = roc_auc_score(y, probas)
+            self.assertGreater(auc, 0.7, "solver %s reached too low AUC with "
+                                         "partial_fit" % solver)
+
+        # Classes can be given at the first call
+        learner = LogisticRegression(random_state=sto_seed)
+        y_zero_one = (y + 1) / 2
+        learner.partial_fit(features[:10], np.ones(10), classes=[0, 1])
+        np.testing.assert_array_equal(learner.classes, [0., 1.])
+        learner.partial_fit(features[10:100], y_zero_one[10:100])
+
+        msg = '^Labels must be in the classes .* given at the first call ' \
+              'of partial_fit$'
+        with self.assertRaisesRegex(ValueError, msg):
+            learner.partial_fit(features[:10], 2 * np.ones(10))
+
+        msg = '^partial_fit can only be used with stochastic solvers sgd, ' \
+              'svrg, sdca, got agd$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LogisticRegression(solver='agd').partial_fit(features, y)
+
+    def test_LogisticRegression_fit_float32(self):
+        """...Test LogisticRegression on float32 features works in single
+        precision with stochastic solvers, and converts them to double
+        precision for the other ones
+        """
+        features, y = Test.get_train_data(n_samples=200)
+        features_float32 = features.astype(np.float32)
+
+        for solver in ['bfgs', 'gd', 'agd']:
+            learner = LogisticRegression(solver=solver, max_iter=20,
+                                         verbose=False)
+            learner.fit(features, y)
+            learner_float32 = LogisticRegression(solver=solver, max_iter=20,
+                                                 verbose=False)
+            learner_float32.fit(features_float32, y)
+            self.assertEqual(learner_float32._model_obj.dtype, np.float64)
+            np.testing.assert_array_almost_equal(learner_float32.weights,
+                                                 learner.weights, decimal=5)
+
+        learner = LogisticRegression(solver='svrg', random_state=12,
+                                     verbose=False)
+        learner.fit(features_float32, y)
+        self.assertEqual(learner._model_obj.dtype, np.float32)
+        self.assertEqual(learner.weights.dtype, np.float32)
+
+    def test_LogisticRegression_fit_path(self):
+        """...Test LogisticRegression fit_path gives the same solutions with
+        and without screening, as fit does for each C
+        """
+        features, y = Test.get_train_data(n_samples=1000)
+        n_features = features.shape[1]
+        Cs = [1e2, 1., 1e-1, 10.]
+
+        for penalty in ['l1', 'elasticnet']:
+            solver_kwargs = {'penalty': penalty, 'solver': 'svrg',
+                             'random_state': 12, 'tol': 1e-10,
+                             'max_iter': 500, 'verbose': False}
+            paths = []
+            for screening in [True, False]:
+                learner = LogisticRegression(**solver_kwargs)
+                learner.fit_path(features, y, Cs, screening=screening)
+                np.testing.assert_array_equal(learner.Cs_path, Cs)
+                self.assertEqual(learner.weights_path.shape,
+                                 (len(Cs), n_features))
+                self.assertEqual(learner.intercept_path.shape, (len(Cs),))
+                # The learner is fitted with the largest C
+                self.assertAlmostEqual(learner.C, 1e2)
+                np.testing.assert_array_equal(learner.weights,
+                                              learner.weights_path[0])
+                paths.append(learner.weights_path)
+
+            np.testing.assert_almost_equal(paths[0], paths[1], decimal=4)
+
+            for C, weights in zip(Cs, paths[0]):
+                learner = LogisticRegression(C=C, **solver_kwargs)
+                learner.fit(features, y)
+                np.testing.assert_almost_equal(weights, learner.weights,
+                                               decimal=4)
+
+        # The strongest penalization discards all the features
+        learner = LogisticRegression(penalty='l1', solver='svrg',
+                                     random_state=12, verbose=False)
+        learner.fit_path(features, y, [1e-3, 1e-2])
+        np.testing.assert_array_equal(learner.weights_path[0],
+                                      np.zeros(n_features))
+
+        # The path has the floating point type of the features
+        learner = LogisticRegression(penalty='l1', solver='svrg',
+                                     random_state=12, verbose=False)
+        learner.fit_path(features.astype(np.float32), y, Cs)
+        self.assertEqual(learner.weights_path.dtype, np.float32)
+        self.assertEqual(learner.intercept_path.dtype, np.float32)
+
+        # It is also the case for features given as shards
+        shards = [features[:100].astype(np.float32),
+                  features[100:].astype(np.float32)]
+        learner = LogisticRegression(penalty='l1', solver='svrg',
+                                     random_state=12, verbose=False)
+        learner.fit_path(shards, y, Cs)
+        self.assertEqual(learner.weights_path.dtype, np.float32)
+
+        msg = '^All shards of features must have the same dtype, got ' \
+              'float32, float64$'
+        with self.assertRaisesRegex(ValueError, msg):
+            learner.fit_path([shards[0], features[100:]], y, Cs)
+
+        msg = '^fit_path cannot be used with penalty \'none\'$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LogisticRegression(penalty='none').fit_path(features, y, Cs)
+
+        msg = '^``Cs`` must be a non-empty 1d array of positive values$'
+        with self.assertRaisesRegex(ValueError, msg):
+            LogisticRegression().fit_path(features, y, [1., -1.])
+
     @staticmethod
     def specific_solver_kwargs(solver):
         """...A simple method to as systematically some kwargs to our tests
@@ -35,6 +35,10 @@ class Model(ABC, Base):
     n_passes_over_data : `int` (read-only)
         Number of effective passes through the data
 
+    dtype : `numpy.dtype` (read-only)
+        Floating point type of the data and of the coefficients used by the
+        model, either ``float64`` or ``float32``
+
     Notes
     -----
     This class should be not used by end-users, it is intended for
@@ -60,6 +64,9 @@ class Model(ABC, Base):
         },
         "_model": {
             "writable": False
+        },
+        "dtype": {
+            "writable": False
         }
     }
 
@@ -70,6 +77,7 @@ class Model(ABC, Base):
         Base.__init__(self)
         self._fitted = False
         self._model = None
+        self.dtype = np.dtype("float64")
         setattr(self, N_CALLS_LOSS, 0)
         setattr(self, PASS_OVER_DATA, 0)
 
@@ -129,10 +137,23 @@ class Model(ABC, Base):
         self._inc_attr(N_CALLS_LOSS)
         self._inc_attr(PASS_OVER_DATA,
                        step=self.pass_per_operation[LOSS])
-        return self._loss(coeffs)
+        return self._loss(self._cast_coeffs(coeffs))
 
     @abstractmethod
     def _loss(self, coeffs: np.ndarray) -> float:
         """Must be overloaded in child class
         """
         pass
+
+    def _cast_coeffs(self, coeffs: np.ndarray) -> np.ndarray:
+        """Converts ``coeffs`` to the dtype of the model, if needed, so
+        that it can be given to the C++ model
+        """
+        if coeffs.dtype != self.dtype:
+            coeffs = coeffs.astype(self.dtype)
+        return coeffs
+
+    def _as_dict(self):
+        dd = Base._as_dict(self)
+        dd["dtype"] = self.dtype.name
+        return dd
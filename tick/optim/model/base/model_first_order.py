@@ -95,7 +95,8 @@ class ModelFirstOrder(Model):
         if out is not None:
             grad = out
         else:
-            grad = np.empty(self.n_coeffs)
+            grad = np.empty(self.n_coeffs, dtype=self.dtype)
+        coeffs = self._cast_coeffs(coeffs)
         self._inc_attr(N_CALLS_GRAD)
         self._inc_attr(PASS_OVER_DATA,
                        step=self.pass_per_operation[GRAD])
@@ -153,7 +154,8 @@ class ModelFirstOrder(Model):
         if out is not None:
             grad = out
         else:
-            grad = np.empty(self.n_coeffs)
+            grad = np.empty(self.n_coeffs, dtype=self.dtype)
+        coeffs = self._cast_coeffs(coeffs)
 
         self._inc_attr(N_CALLS_LOSS_AND_GRAD)
         self._inc_attr(N_CALLS_LOSS)
@@ -1,6 +1,8 @@
 # License: BSD 3 clause
 
 
+import numpy as np
+
 from . import ModelLabelsFeatures
 
 __author__ = 'Stephane Gaiffas'
@@ -54,3 +56,18 @@ class ModelGeneralizedLinear(ModelLabelsFeatures):
             return self.n_features + 1
         else:
             return self.n_features
+
+    def get_features_norm_sq(self) -> np.ndarray:
+        """Returns the squared norms of the rows of the features. They are
+        computed with ``n_threads`` threads at the first call after ``fit``
+
+        Returns
+        -------
+        output : `np.ndarray`, shape=(n_samples,)
+            The squared norms of the rows of the features
+        """
+        if self._fitted:
+            return self._model.get_features_norm_sq()
+        else:
+            raise ValueError("call ``fit`` before calling "
+                             "``get_features_norm_sq``")
@@ -93,6 +93,27 @@ class ModelHawkes(ModelFirstOrder):
 
         self._model.set_data(events, end_times)
 
+    def _set_support(self, support):
+        """Set the pairs of nodes that may excite each other. The adjacency
+        coefficients of the other pairs are fixed to zero and removed from
+        the coefficients of the model
+
+        Parameters
+        ----------
+        support : `np.ndarray` or `scipy.sparse.csr_matrix`
+            Matrix of shape (n_nodes, n_nodes), node j may excite node i if
+            ``support[i, j]`` is not zero
+        """
+        support = csr_matrix(support)
+        if support.shape[0] != support.shape[1]:
+            raise ValueError("support must be a square matrix, got shape %s"
+                             % str(support.shape))
+        support.eliminate_zeros()
+        support.sort_indices()
+        self._set("support", support)
+        self._model.set_support(support.indptr.astype(np.uint64),
+                                support.indices.astype(np.uint64))
+
     def incremental_fit(self, events, end_time=None):
         """Incrementally fit model with data by adding one Hawkes realization.
 
@@ -121,6 +142,44 @@ class ModelHawkes(ModelFirstOrder):
         self._set(N_CALLS_LOSS, 0)
         self._set(PASS_OVER_DATA, 0)
 
+    def append_events(self, events, end_time=None):
+        """Append events at the end of the last realization the model was
+        fitted with. Weights are updated incrementally: only the new events
+        are visited, the contributions of the previous ones being extended
+        to the new end time.
+
+        Parameters
+        ----------
+        events : `list` of `np.ndarray`
+            The new events of each component. Namely `events[j]` contains a
+            one-dimensional `np.ndarray` of the new events' timestamps of
+            component j, all happening after the current end time of the
+            last realization
+
+        end_time : `float`, default=None
+            New end time of the last realization.
+            If None, it will be set to the latest time of the new events,
+            it must be given if there is no new event.
+
+        Notes
+        -----
+        Appended events are not added to ``data``
+        """
+        if not self._fitted:
+            raise ValueError("call ``fit`` before using ``append_events``")
+
+        if end_time is None:
+            if all(len(e) == 0 for e in events):
+                raise ValueError("``end_time`` must be given when no events "
+                                 "are appended")
+            end_time = max(max(e) for e in events if len(e) > 0)
+
+        self._model.append_events(events, end_time)
+
+        self._set("_end_times", None)
+        self._set(N_CALLS_LOSS, 0)
+        self._set(PASS_OVER_DATA, 0)
+
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
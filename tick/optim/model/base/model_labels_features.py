@@ -1,6 +1,9 @@
 # License: BSD 3 clause
 
 import numpy as np
+from numpy.linalg import svd
+from scipy import sparse
+from scipy.sparse.linalg import LinearOperator, eigsh
 
 from . import Model
 from ....preprocessing.utils import safe_array
@@ -13,8 +16,9 @@ class ModelLabelsFeatures(Model):
 
     Attributes
     ----------
-    features : `numpy.ndarray`, shape=(n_samples, n_features) (read-only)
-        The features matrix
+    features : `numpy.ndarray` or `list`, shape=(n_samples, n_features) (read-only)
+        The features matrix, or the list of its shards if it is split in
+        blocks of consecutive rows
 
     labels : `numpy.ndarray`, shape=(n_samples,)  (read-only)
         The labels vector
@@ -46,6 +50,11 @@ class ModelLabelsFeatures(Model):
         }
     }
 
+    # Maps the floating point types of the features supported natively by
+    # the model to its C++ class. Features of any other type are converted
+    # to float64
+    _cpp_class_dtype_map = {}
+
     # fit_intercept should be in a model_generalized_linear, not here
     def __init__(self):
         Model.__init__(self)
@@ -59,8 +68,13 @@ class ModelLabelsFeatures(Model):
 
         Parameters
         ----------
-        features : `numpy.ndarray`, shape=(n_samples, n_features)
-            The features matrix
+        features : `numpy.ndarray` or `list`, shape=(n_samples, n_features)
+            The features matrix. It can also be given as a list of shards,
+            namely matrices containing consecutive blocks of rows of the
+            features matrix, that are never concatenated. Features (or
+            shards) can be memory mapped, see
+            `tick.preprocessing.load_features`. They are not copied as long
+            as their dtype is supported by the model
 
         labels : `numpy.ndarray`, shape=(n_samples,)
             The labels vector
@@ -74,19 +88,73 @@ class ModelLabelsFeatures(Model):
         return Model.fit(self, features, labels)
 
     def _set_data(self, features, labels):
-        n_samples, n_features = features.shape
+        if isinstance(features, (list, tuple)):
+            n_samples, n_features = self._check_feature_shards(features)
+            first_features = features[0]
+        else:
+            n_samples, n_features = features.shape
+            first_features = features
         if n_samples != labels.shape[0]:
             raise ValueError(("Features has %i samples while labels "
                               "have %i" % (n_samples, labels.shape[0])))
 
-        features = safe_array(features)
-        labels = safe_array(labels)
+        dtype = np.dtype(getattr(first_features, "dtype", np.float64))
+        if dtype not in self._cpp_class_dtype_map:
+            dtype = np.dtype(np.float64)
+
+        if isinstance(features, (list, tuple)):
+            features = [safe_array(shard, dtype=dtype) for shard in features]
+        else:
+            features = safe_array(features, dtype=dtype)
+        labels = safe_array(labels, dtype=dtype)
 
+        self._set("dtype", dtype)
         self._set("features", features)
         self._set("labels", labels)
         self._set("n_features", n_features)
         self._set("n_samples", n_samples)
 
+    @staticmethod
+    def _check_feature_shards(feature_shards):
+        """Checks that the shards of a features matrix can be stacked
+        vertically and returns the shape of the features matrix
+        """
+        if len(feature_shards) == 0:
+            raise ValueError("features must contain at least one shard")
+        n_features = feature_shards[0].shape[1]
+        is_sparse = sparse.issparse(feature_shards[0])
+        for k, shard in enumerate(feature_shards):
+            if shard.shape[1] != n_features:
+                raise ValueError("Shard %i of features has %i columns while "
+                                 "shard 0 has %i" % (k, shard.shape[1],
+                                                     n_features))
+            if sparse.issparse(shard) != is_sparse:
+                raise ValueError("Shards of features must be either all "
+                                 "sparse or all dense")
+        n_samples = sum(shard.shape[0] for shard in feature_shards)
+        return n_samples, n_features
+
+    def _get_features_norm_sq(self):
+        """Squared largest singular value of the features matrix. When
+        features are given as shards, it is the largest eigenvalue of
+        X^T X, computed with products against each shard, hence without
+        stacking them
+        """
+        if not isinstance(self.features, list):
+            return svd(self.features, full_matrices=False,
+                       compute_uv=False)[0] ** 2
+
+        shards = self.features
+
+        def gram_dot(v):
+            return sum(shard.T.dot(shard.dot(v)) for shard in shards)
+
+        if self.n_features == 1:
+            return float(gram_dot(np.ones(1))[0])
+        gram = LinearOperator((self.n_features, self.n_features),
+                              matvec=gram_dot, dtype=np.float64)
+        return eigsh(gram, k=1, return_eigenvectors=False)[0]
+
     @property
     def _epoch_size(self):
         # This gives the typical size of an epoch when using a
@@ -39,6 +39,10 @@ class ModelHawkesFixedBeta(ModelSecondOrder, ModelSelfConcordant):
         * if 0: no approximation
         * if 1: a fast approximated exponential function is used
 
+        If the global precision is set to 'fast' with
+        `tick.base.set_exp_precision`, the approximated exponential function
+        is used whatever this level
+
     n_threads : `int`, default=-1 (read-only)
         Number of threads used for parallel computation.
 
@@ -56,6 +56,10 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
         * if 0: no approximation
         * if 1: a fast approximated exponential function is used
 
+        If the global precision is set to 'fast' with
+        `tick.base.set_exp_precision`, the approximated exponential function
+        is used whatever this level
+
     n_threads : `int`, default=1
         Number of threads used for parallel computation.
 
@@ -63,6 +67,23 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
           the CPU
         * otherwise the desired number of threads
 
+    window : `float`, default=np.inf
+        Length of the sliding window used when events are appended with
+        `append_events`. Once the last realization ends after ``window``,
+        only its events of the last ``window`` time units (up to the
+        granularity of the appended batches) are accounted for in the loss,
+        the intensity still depending on the previous events. Weights are
+        computed again over all events if the model is fitted again or its
+        decays are changed
+
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, node j has no
+        influence on node i and :math:`\\alpha^{ij}` is fixed to zero. The
+        model then only has coefficients for the pairs in the support and
+        its weights, loss and gradient only involve, for each node, the pairs
+        of nodes exciting it. If `None`, all nodes may excite each other
+
     Attributes
     ----------
     n_nodes : `int` (read-only)
@@ -71,6 +92,15 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
     data : `list` of `numpy.array` (read-only)
         The events given to the model through `fit` method.
         Note that data given through `incremental_fit` is not stored
+
+    Notes
+    -----
+    The coefficients of the model are the baselines :math:`\\mu` followed
+    by the adjacency matrix :math:`A` in row major order. When a ``support``
+    is given, only the adjacency coefficients of the pairs in the support are
+    kept, in row major order too, hence there are
+    ``n_nodes + support.nnz`` coefficients. The hessian is not available in
+    this case.
     """
     # In Hawkes case, getting value and grad at the same time need only
     # one pas over the data
@@ -82,11 +112,18 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
         "decays": {
             "writable": True,
             "cpp_setter": "set_decays"
-        }
+        },
+        "window": {
+            "writable": True,
+            "cpp_setter": "set_window"
+        },
+        "support": {
+            "writable": False
+        },
     }
 
     def __init__(self, decays: np.ndarray, approx: int = 0,
-                 n_threads: int = 1):
+                 n_threads: int = 1, window: float = np.inf, support=None):
         ModelHawkes.__init__(self, approx=approx, n_threads=n_threads)
         self.decays = decays
 
@@ -100,6 +137,10 @@ class ModelHawkesFixedExpKernLeastSq(ModelHawkes):
         self._model = _ModelHawkesFixedExpKernLeastSq(decays.copy(),
                                                       self.n_threads,
                                                       self.approx)
+        self.window = window
+        self._set("support", None)
+        if support is not None:
+            self._set_support(support)
 
     def _set_data(self, events: list):
         """Set the corresponding realization(s) of the process.
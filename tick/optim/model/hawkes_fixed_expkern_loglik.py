@@ -59,6 +59,25 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
           the CPU
         * otherwise the desired number of threads
 
+    weights_tol : `float`, default=0
+        Tolerance below which the precomputed weights, namely the values of
+        the exponential kernels summed over past events of each node, are
+        dropped. If positive, only the weights above it are stored, in sparse
+        arrays, which bounds the memory used by the model when nodes are
+        rarely active at the same time. Dropping weights slightly
+        underestimates the intensities, weights of the order of
+        ``1e-10 * decay`` usually give the same loss up to numerical
+        precision. If zero, all weights are stored in dense arrays
+
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, node j has no
+        influence on node i and :math:`\\alpha^{ij}` is fixed to zero. The
+        model then only has coefficients for the pairs in the support and
+        the cost of its weights, loss and gradient scales with the number of
+        nonzero entries of ``support`` instead of :math:`D^2`. If `None`,
+        all nodes may excite each other
+
     Attributes
     ----------
     n_nodes : `int` (read-only)
@@ -67,6 +86,18 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
     data : `list` of `numpy.array` (read-only)
         The events given to the model through `fit` method.
         Note that data given through `incremental_fit` is not stored
+
+    n_stored_weights : `int` (read-only)
+        Number of precomputed weights stored in memory
+
+    Notes
+    -----
+    The coefficients of the model are the baselines :math:`\\mu` followed
+    by the adjacency matrix :math:`A` in row major order. When a ``support``
+    is given, only the adjacency coefficients of the pairs in the support are
+    kept, in row major order too, hence there are
+    ``n_nodes + support.nnz`` coefficients. The hessian is not available in
+    this case.
     """
     # In Hawkes case, getting value and grad at the same time need only
     # one pas over the data
@@ -78,14 +109,25 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
         "decay": {
             "cpp_setter": "set_decay"
         },
+        "weights_tol": {
+            "cpp_setter": "set_weights_tol"
+        },
+        "support": {
+            "writable": False
+        },
     }
 
-    def __init__(self, decay: float, n_threads: int = 1):
+    def __init__(self, decay: float, n_threads: int = 1,
+                 weights_tol: float = 0., support=None):
         ModelHawkes.__init__(self, n_threads=1, approx=0)
         ModelSecondOrder.__init__(self)
         ModelSelfConcordant.__init__(self)
         self.decay = decay
         self._model = _ModelHawkesFixedExpKernLogLik(decay, n_threads)
+        self.weights_tol = weights_tol
+        self._set("support", None)
+        if support is not None:
+            self._set_support(support)
 
     def fit(self, events, end_times=None):
         """Set the corresponding realization(s) of the process.
@@ -124,6 +166,10 @@ class ModelHawkesFixedExpKernLogLik(ModelHawkes,
     def decays(self):
         return self.decay
 
+    @property
+    def n_stored_weights(self):
+        return self._model.get_n_stored_weights()
+
     @property
     def _epoch_size(self):
         # This gives the typical size of an epoch when using a
@@ -67,6 +67,10 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
         * if 0: no approximation
         * if 1: a fast approximated exponential function is used
 
+        If the global precision is set to 'fast' with
+        `tick.base.set_exp_precision`, the approximated exponential function
+        is used whatever this level
+
     n_threads : `int`, default=-1 (read-only)
         Number of threads used for parallel computation.
 
@@ -74,6 +78,24 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
           the CPU
         * otherwise the desired number of threads
 
+    window : `float`, default=np.inf
+        Length of the sliding window used when events are appended with
+        `append_events`. Once the last realization ends after ``window``,
+        only its events of the last ``window`` time units (up to the
+        granularity of the appended batches) are accounted for in the loss,
+        the intensity still depending on the previous events. Weights are
+        computed again over all events if the model is fitted again or its
+        decays are changed
+
+    support : `np.ndarray` or `scipy.sparse.csr_matrix`, default=None
+        Matrix of shape (n_nodes, n_nodes) of the pairs of nodes that may
+        excite each other: if ``support[i, j]`` is zero, node j has no
+        influence on node i and :math:`\\alpha^{u}_{ij}` is fixed to zero for
+        all decays. The model then only has coefficients for the pairs in
+        the support and the cost of its loss and gradient scales with the
+        squared number of nodes exciting each node. If `None`, all nodes may
+        excite each other
+
     Attributes
     ----------
     n_nodes : `int` (read-only)
@@ -85,6 +107,21 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
     data : `list` of `numpy.array` (read-only)
         The events given to the model through `fit` method.
         Note that data given through `incremental_fit` is not stored
+
+    Notes
+    -----
+    The coefficients of the model are the baselines followed by the
+    adjacency tensor of shape (n_nodes, n_nodes, n_decays) in row major
+    order. When a ``support`` is given, only the adjacency coefficients of
+    the pairs in the support are kept, in row major order too, hence there
+    are ``n_nodes * n_baselines + support.nnz * n_decays`` coefficients.
+
+    The weights of the loss are computed exactly, with recursive sums of
+    exponentials over the events, including the weights of the periodic
+    baselines whose cost is linear in the number of events plus the number
+    of baseline intervals. There is no binned or FFT approximation of the
+    weights, and least squares models for arbitrary kernels are not
+    available.
     """
     # In Hawkes case, getting value and grad at the same time need only
     # one pas over the data
@@ -97,6 +134,10 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
             "writable": True,
             "cpp_setter": "set_decays"
         },
+        "window": {
+            "writable": True,
+            "cpp_setter": "set_window"
+        },
         "n_baselines": {
             "writable": True,
             "cpp_setter": "set_n_baselines"
@@ -104,10 +145,14 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
         "_period_length": {
             "writable": False,
         },
+        "support": {
+            "writable": False
+        },
     }
 
     def __init__(self, decays: np.ndarray, n_baselines=1, period_length=None,
-                 approx: int = 0, n_threads: int = 1):
+                 approx: int = 0, n_threads: int = 1,
+                 window: float = np.inf, support=None):
         ModelHawkes.__init__(self, approx=approx, n_threads=n_threads)
         self._end_times = None
 
@@ -131,6 +176,10 @@ class ModelHawkesFixedSumExpKernLeastSq(ModelHawkes):
             self.decays, self.n_baselines, self.cast_period_length(),
             self.n_threads, self.approx
         )
+        self.window = window
+        self._set("support", None)
+        if support is not None:
+            self._set_support(support)
 
     @property
     def n_decays(self):
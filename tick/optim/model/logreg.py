@@ -1,9 +1,10 @@
 # License: BSD 3 clause
 
 import numpy as np
-from numpy.linalg import svd
-from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelLipschitz
+from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelLipschitz, \
+    LOSS_AND_GRAD
 from .build.model import ModelLogReg as _ModelLogReg
+from .build.model import ModelLogRegFloat as _ModelLogRegFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -45,6 +46,15 @@ class ModelLogReg(ModelFirstOrder,
         * otherwise the desired number of threads
     """
 
+    pass_per_operation = \
+        {k: v for d in [ModelFirstOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _ModelLogReg,
+        np.dtype(np.float32): _ModelLogRegFloat
+    }
+
     def __init__(self, fit_intercept: bool = True, n_threads: int = 1):
         ModelFirstOrder.__init__(self)
         ModelGeneralizedLinear.__init__(self, fit_intercept)
@@ -59,7 +69,9 @@ class ModelLogReg(ModelFirstOrder,
         Parameters
         ----------
         features : `numpy.ndarray`, shape=(n_samples, n_features)
-            The features matrix
+            The features matrix. If its dtype is ``float32``, it is used
+            without any copy and computations are done in single
+            precision
 
         labels : `numpy.ndarray`, shape=(n_samples,)
             The labels vector
@@ -72,10 +84,11 @@ class ModelLogReg(ModelFirstOrder,
         ModelFirstOrder.fit(self, features, labels)
         ModelGeneralizedLinear.fit(self, features, labels)
         ModelLipschitz.fit(self, features, labels)
-        self._set("_model", _ModelLogReg(self.features,
-                                         self.labels,
-                                         self.fit_intercept,
-                                         self.n_threads))
+        model_class = self._cpp_class_dtype_map[self.dtype]
+        self._set("_model", model_class(self.features,
+                                        self.labels,
+                                        self.fit_intercept,
+                                        self.n_threads))
         return self
 
     def _grad(self, coeffs: np.ndarray, out: np.ndarray) -> None:
@@ -84,6 +97,9 @@ class ModelLogReg(ModelFirstOrder,
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     @staticmethod
     def sigmoid(coeffs: np.ndarray,
                 out: np.ndarray = None) -> np.ndarray:
@@ -110,8 +126,7 @@ class ModelLogReg(ModelFirstOrder,
 
     def _get_lip_best(self):
         # TODO: Use sklearn.decomposition.TruncatedSVD instead?
-        s = svd(self.features, full_matrices=False,
-                compute_uv=False)[0] ** 2
+        s = self._get_features_norm_sq()
         if self.fit_intercept:
             return (s + 1) / (4 * self.n_samples)
         else:
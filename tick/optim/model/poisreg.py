@@ -2,12 +2,13 @@
 
 
 from .build.model import ModelPoisReg as _ModelPoisReg
+from .build.model import ModelPoisRegFloat as _ModelPoisRegFloat
 from .build.model import LinkType_identity as identity
 from .build.model import LinkType_exponential as exponential
 
 import numpy as np
 from .base import ModelGeneralizedLinear, ModelFirstOrder, ModelSecondOrder, \
-    ModelSelfConcordant
+    ModelSelfConcordant, LOSS_AND_GRAD
 
 
 __author__ = 'Stephane Gaiffas'
@@ -72,6 +73,10 @@ class ModelPoisReg(ModelGeneralizedLinear,
     ``link="exponential"``
     """
 
+    pass_per_operation = \
+        {k: v for d in [ModelSecondOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     _attrinfos = {
         "_link_type": {
             "writable": False
@@ -81,6 +86,11 @@ class ModelPoisReg(ModelGeneralizedLinear,
         }
     }
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _ModelPoisReg,
+        np.dtype(np.float32): _ModelPoisRegFloat
+    }
+
     def __init__(self, fit_intercept: bool = True,
                  link: str = "exponential", n_threads: int = 1):
         """
@@ -99,7 +109,9 @@ class ModelPoisReg(ModelGeneralizedLinear,
         Parameters
         ----------
         features : `numpy.ndarray`, shape=(n_samples, n_features)
-            The features matrix
+            The features matrix. If its dtype is ``float32``, it is used
+            without any copy and computations are done in single
+            precision
 
         labels : `numpy.ndarray`, shape=(n_samples,)
             The labels vector
@@ -111,11 +123,12 @@ class ModelPoisReg(ModelGeneralizedLinear,
         """
         ModelFirstOrder.fit(self, features, labels)
         ModelGeneralizedLinear.fit(self, features, labels)
-        self._set("_model", _ModelPoisReg(features,
-                                          labels,
-                                          self._link_type,
-                                          self.fit_intercept,
-                                          self.n_threads))
+        model_class = self._cpp_class_dtype_map[self.dtype]
+        self._set("_model", model_class(self.features,
+                                        self.labels,
+                                        self._link_type,
+                                        self.fit_intercept,
+                                        self.n_threads))
         return self
 
     def _grad(self, coeffs: np.ndarray, out: np.ndarray) -> None:
@@ -124,6 +137,9 @@ class ModelPoisReg(ModelGeneralizedLinear,
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     @property
     def link(self):
         return self._link
@@ -1,7 +1,7 @@
 # License: BSD 3 clause
 
 import numpy as np
-from .base import ModelFirstOrder, ModelLipschitz
+from .base import ModelFirstOrder, ModelLipschitz, LOSS_AND_GRAD
 from .build.model import ModelSCCS as _ModelSCCS
 from tick.preprocessing.utils import check_longitudinal_features_consistency, \
     check_censoring_consistency
@@ -21,6 +21,14 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
         values of the features over the `n_lags` time intervals. `n_lags`
         must be between 0 and `n_intervals` - 1
 
+    n_threads : `int`, default=1
+        Number of threads used to compute loss and gradient, patients being
+        split between threads.
+
+        * if ``int <= 0``: the number of physical cores available on
+          the CPU
+        * otherwise the desired number of threads
+
     Attributes
     ----------
     features : `list` of `numpy.ndarray` or `list` of `scipy.sparse.csr_matrix`,
@@ -49,8 +57,20 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
 
     n_coeffs : `int` (read-only)
         Total number of coefficients of the model
+
+    Notes
+    -----
+    The inner products of the features of all patients with the last
+    coefficients the loss or gradient was computed at are kept, such that
+    computing the loss and the gradient at the same coefficients needs a
+    single pass over the features. They take ``n_samples * n_intervals``
+    doubles in memory.
     """
 
+    pass_per_operation = \
+        {k: v for d in [ModelFirstOrder.pass_per_operation,
+                        {LOSS_AND_GRAD: 1}] for k, v in d.items()}
+
     _attrinfos = {
         "labels": {
             "writable": False
@@ -72,10 +92,13 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
         },
         "n_intervals": {
             "writable": False
+        },
+        "n_threads": {
+            "writable": False
         }
     }
 
-    def __init__(self, n_intervals: int, n_lags: int):
+    def __init__(self, n_intervals: int, n_lags: int, n_threads: int = 1):
         if n_lags >= n_intervals:
             raise ValueError("n_lags should be < n_intervals")
 
@@ -88,6 +111,7 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
         self.censoring = None
         self.n_features = None
         self.n_samples = None
+        self.n_threads = n_threads
 
     def fit(self, features, labels, censoring=None):
         """Set the data into the model object.
@@ -116,7 +140,8 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
                   _ModelSCCS(features=self.features,
                              labels=self.labels,
                              censoring=self.censoring,
-                             n_lags=self.n_lags))
+                             n_lags=self.n_lags,
+                             n_threads=self.n_threads))
 
         return self
 
@@ -172,6 +197,9 @@ class ModelSCCS(ModelFirstOrder, ModelLipschitz):
     def _loss(self, coeffs: np.ndarray) -> float:
         return self._model.loss(coeffs)
 
+    def _loss_and_grad(self, coeffs: np.ndarray, out: np.ndarray) -> float:
+        return self._model.loss_and_grad(coeffs, out)
+
     def _get_n_coeffs(self):
         return self._model.get_n_coeffs()
 
@@ -25,6 +25,38 @@ void ModelHawkesList::set_data(const SArrayDoublePtrList2D &timestamps_list,
   weights_computed = false;
 }
 
+void ModelHawkesList::append_events(const SArrayDoublePtrList1D &timestamps,
+                                    double end_time) {
+  if (n_realizations == 0) {
+    TICK_ERROR("Events can only be appended to a model that has been given a realization");
+  }
+  const ulong last_r = n_realizations - 1;
+  const SArrayDoublePtrList1D last_timestamps = append_weights(timestamps, end_time);
+
+  // These arrays might be shared with Python, hence they are copied before being modified
+  end_times = VArrayDouble::new_ptr(*end_times);
+  (*end_times)[last_r] = end_time;
+
+  ulong n_new_jumps = 0;
+  n_jumps_per_node = SArrayULong::new_ptr(*n_jumps_per_node);
+  for (ulong i = 0; i < n_nodes; ++i) {
+    n_new_jumps += timestamps[i]->size();
+    (*n_jumps_per_node)[i] += timestamps[i]->size();
+  }
+  n_jumps_per_realization = VArrayULong::new_ptr(*n_jumps_per_realization);
+  (*n_jumps_per_realization)[last_r] += n_new_jumps;
+
+  // Timestamps are only kept if the model was not fitted incrementally
+  if (timestamps_list.size() == n_realizations) timestamps_list[last_r] = last_timestamps;
+
+  weights_computed = true;
+}
+
+SArrayDoublePtrList1D ModelHawkesList::append_weights(const SArrayDoublePtrList1D &timestamps,
+                                                      double end_time) {
+  TICK_ERROR("Events cannot be appended to this model");
+}
+
 unsigned int ModelHawkesList::get_n_threads() const {
   return std::min(this->max_n_threads, static_cast<unsigned int>(n_nodes * n_realizations));
 }
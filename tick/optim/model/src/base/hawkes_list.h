@@ -45,6 +45,26 @@ class ModelHawkesList : public ModelHawkes {
   }
 
   virtual unsigned int get_n_threads() const;
+
+  /**
+   * @brief Appends events at the end of the last realization
+   * Weights are updated incrementally from the ones of the current realization instead of
+   * being computed again from scratch.
+   * \param timestamps : new events of each node, all happening after the end time of the last
+   * realization
+   * \param end_time : new ending time of the last realization
+   */
+  virtual void append_events(const SArrayDoublePtrList1D &timestamps, double end_time);
+
+ protected:
+  /**
+   * @brief Updates the weights with events appended to the last realization
+   * \param timestamps : new events of each node
+   * \param end_time : new ending time of the last realization
+   * \return all the timestamps of the last realization, appended events included
+   */
+  virtual SArrayDoublePtrList1D append_weights(const SArrayDoublePtrList1D &timestamps,
+                                               double end_time);
 };
 
 #endif  // TICK_OPTIM_MODEL_SRC_BASE_HAWKES_LIST_H_
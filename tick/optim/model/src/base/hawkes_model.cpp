@@ -3,6 +3,8 @@
 
 #include "hawkes_model.h"
 
+#include <algorithm>
+
 ModelHawkes::ModelHawkes(const int max_n_threads,
                          const unsigned int optimization_level) :
     optimization_level(optimization_level),
@@ -22,3 +24,42 @@ void ModelHawkes::set_n_threads(const int max_n_threads) {
   this->max_n_threads = max_n_threads >= 1 ? static_cast<unsigned int>(max_n_threads)
                                            : std::thread::hardware_concurrency();
 }
+
+void ModelHawkes::set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices) {
+  support_indptr = indptr;
+  support_indices = indices;
+  weights_computed = false;
+}
+
+ulong ModelHawkes::get_source_position(const ulong i, const ulong j) const {
+  if (support_indptr == nullptr) return j;
+  const ulong *first = support_indices->data() + (*support_indptr)[i];
+  const ulong *last = support_indices->data() + (*support_indptr)[i + 1];
+  const ulong *found = std::lower_bound(first, last, j);
+  if (found == last || *found != j) return get_n_sources(i);
+  return static_cast<ulong>(found - first);
+}
+
+void ModelHawkes::check_support() const {
+  if (!has_support()) return;
+
+  if (support_indptr->size() != n_nodes + 1) {
+    TICK_ERROR("support indptr must have " << n_nodes + 1 << " values but has "
+                                           << support_indptr->size());
+  }
+  if ((*support_indptr)[0] != 0 || (*support_indptr)[n_nodes] != support_indices->size()) {
+    TICK_ERROR("support indptr must start at 0 and end at the number of support indices");
+  }
+  for (ulong i = 0; i < n_nodes; ++i) {
+    const ulong start = (*support_indptr)[i];
+    const ulong end = (*support_indptr)[i + 1];
+    if (end < start) TICK_ERROR("support indptr must be non decreasing");
+    for (ulong p = start; p < end; ++p) {
+      const ulong j = (*support_indices)[p];
+      if (j >= n_nodes || (p > start && j <= (*support_indices)[p - 1])) {
+        TICK_ERROR("support indices of each node must be sorted, unique and lower than "
+                       << n_nodes);
+      }
+    }
+  }
+}
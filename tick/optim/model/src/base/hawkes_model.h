@@ -29,6 +29,12 @@ class ModelHawkes : public Model {
   //! @brief Number of jumps per dimension
   SArrayULongPtr n_jumps_per_node;
 
+  //! @brief Nodes that may excite each node, in CSR format: node i is excited by the nodes
+  //! support_indices[support_indptr[i]:support_indptr[i + 1]]. If null, all nodes excite each
+  //! other
+  SArrayULongPtr support_indptr;
+  SArrayULongPtr support_indices;
+
  public:
   //! @brief Constructor
   //! \param max_n_threads : maximum number of threads to be used for multithreading
@@ -46,10 +52,57 @@ class ModelHawkes : public Model {
 
   SArrayULongPtr get_n_jumps_per_node() const { return n_jumps_per_node; }
 
+  /**
+   * @brief Set the nodes that may excite each node, adjacency coefficients of the other pairs of
+   * nodes being zero. The adjacency coefficients of the model are then the ones of the pairs of
+   * nodes in the support, in CSR order.
+   * \param indptr : node i is excited by the nodes indices[indptr[i]:indptr[i + 1]]
+   * \param indices : sorted indices of the nodes exciting each node
+   * \note Weights will need to be recomputed
+   */
+  void set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices);
+
+  //! @brief Returns true if a support was set
+  bool has_support() const {
+    return support_indptr != nullptr;
+  }
+
  protected:
   //! @brief set n_nodes
   void set_n_nodes(const ulong n_nodes);
 
+  //! @brief Number of nodes that may excite node i
+  inline ulong get_n_sources(const ulong i) const {
+    if (support_indptr == nullptr) return n_nodes;
+    return (*support_indptr)[i + 1] - (*support_indptr)[i];
+  }
+
+  //! @brief p-th node that may excite node i
+  inline ulong get_source(const ulong i, const ulong p) const {
+    if (support_indptr == nullptr) return p;
+    return (*support_indices)[(*support_indptr)[i] + p];
+  }
+
+  //! @brief Index of the first pair of nodes (i, j) among all pairs of the support, in CSR
+  //! order. The pairs of node i end at get_support_start(i + 1)
+  inline ulong get_support_start(const ulong i) const {
+    if (support_indptr == nullptr) return i * n_nodes;
+    return (*support_indptr)[i];
+  }
+
+  //! @brief Number of pairs of nodes in the support
+  ulong get_n_support_pairs() const {
+    if (support_indptr == nullptr) return n_nodes * n_nodes;
+    return support_indices->size();
+  }
+
+  //! @brief Position p such that get_source(i, p) == j, or get_n_sources(i) if node j does not
+  //! excite node i
+  ulong get_source_position(const ulong i, const ulong j) const;
+
+  //! @brief Checks that the support is consistent with the number of nodes
+  void check_support() const;
+
   //! @brief Custom exponential function taking into account optimization
   //! level
   //! \param x : The value exponential is computed at
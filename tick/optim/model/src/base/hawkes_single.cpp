@@ -6,6 +6,8 @@
 
 #include "hawkes_single.h"
 
+#include <algorithm>
+
 ModelHawkesSingle::ModelHawkesSingle(const int max_n_threads,
                                      const unsigned int optimization_level) :
     ModelHawkes(max_n_threads, optimization_level), n_total_jumps(0) {}
@@ -36,6 +38,57 @@ void ModelHawkesSingle::set_data(const SArrayDoublePtrList1D &timestamps,
   this->timestamps = timestamps;
 }
 
+void ModelHawkesSingle::check_appended_events(const SArrayDoublePtrList1D &timestamps_chunk,
+                                              const double new_end_time) const {
+  if (timestamps_chunk.size() != n_nodes) {
+    TICK_ERROR("Appended events should have " << n_nodes << " nodes but have "
+                                              << timestamps_chunk.size() << ".");
+  }
+  if (new_end_time < end_time) {
+    TICK_ERROR("Provided end_time (" << new_end_time << ") is smaller than current end_time ("
+                                     << end_time << ")");
+  }
+  for (ulong i = 0; i < n_nodes; ++i) {
+    const ArrayDouble &chunk_i = *timestamps_chunk[i];
+    if (chunk_i.size() == 0) continue;
+    if (chunk_i[0] < end_time) {
+      TICK_ERROR("Appended events of component " << i << " start at " << chunk_i[0]
+                                                 << ", before current end_time (" << end_time
+                                                 << ")");
+    }
+    if (chunk_i[chunk_i.size() - 1] > new_end_time) {
+      TICK_ERROR("Provided end_time (" << new_end_time << ") is smaller than last time of "
+                                       << "component " << i << " ("
+                                       << chunk_i[chunk_i.size() - 1] << ")");
+    }
+  }
+}
+
+ArrayULong ModelHawkesSingle::append_timestamps(const SArrayDoublePtrList1D &timestamps_chunk,
+                                                const double new_end_time) {
+  check_appended_events(timestamps_chunk, new_end_time);
+
+  ArrayULong previous_n_jumps_per_node = *n_jumps_per_node;
+  auto new_n_jumps_per_node = SArrayULong::new_ptr(n_nodes);
+  for (ulong i = 0; i < n_nodes; ++i) {
+    const ArrayDouble &timestamps_i = *timestamps[i];
+    const ArrayDouble &chunk_i = *timestamps_chunk[i];
+    auto new_timestamps_i = SArrayDouble::new_ptr(timestamps_i.size() + chunk_i.size());
+    std::copy(timestamps_i.data(), timestamps_i.data() + timestamps_i.size(),
+              new_timestamps_i->data());
+    std::copy(chunk_i.data(), chunk_i.data() + chunk_i.size(),
+              new_timestamps_i->data() + timestamps_i.size());
+
+    timestamps[i] = new_timestamps_i;
+    (*new_n_jumps_per_node)[i] = new_timestamps_i->size();
+  }
+  n_jumps_per_node = new_n_jumps_per_node;
+  n_total_jumps = n_jumps_per_node->sum();
+  end_time = new_end_time;
+
+  return previous_n_jumps_per_node;
+}
+
 unsigned int ModelHawkesSingle::get_n_threads() const {
   return std::min(this->max_n_threads, static_cast<unsigned int>(n_nodes));
 }
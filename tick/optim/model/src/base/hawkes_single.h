@@ -32,6 +32,25 @@ class ModelHawkesSingle : public ModelHawkes {
 
   unsigned int get_n_threads() const;
 
+ protected:
+  /**
+   * @brief Checks that events can be appended at the end of the realization
+   * \param timestamps_chunk : new events of each node, all happening after end_time
+   * \param new_end_time : new ending time of the realization
+   */
+  void check_appended_events(const SArrayDoublePtrList1D &timestamps_chunk,
+                             const double new_end_time) const;
+
+  /**
+   * @brief Appends events at the end of the realization
+   * \param timestamps_chunk : new events of each node, all happening after end_time
+   * \param new_end_time : new ending time of the realization
+   * \return number of jumps of each node before the events were appended
+   * \note Timestamps are copied in new arrays as they might be shared with Python
+   */
+  ArrayULong append_timestamps(const SArrayDoublePtrList1D &timestamps_chunk,
+                               const double new_end_time);
+
   friend class ModelHawkesList;
 };
 
@@ -13,7 +13,9 @@
 
 ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr features,
                                              const SArrayDoublePtr times_,
-                                             const SArrayUShortPtr censoring_) {
+                                             const SArrayUShortPtr censoring_,
+                                             const int n_threads)
+    : n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()) {
     n_samples = features->n_rows();
     n_features = features->n_cols();
     n_failures = 0;
@@ -26,8 +28,7 @@ ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr feature
 
     // Will contain inner products for loss and gradient computations
     inner_prods = ArrayDouble(n_samples);
-    // Used for gradient computations
-    s1 = ArrayDouble(n_features);
+    weights = ArrayDouble(n_samples);
 
     // Get the indices that sort the times by decreasing order in idx
     idx = ArrayULong(n_samples);
@@ -61,95 +62,90 @@ ModelCoxRegPartialLik::ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr feature
             i_failure++;
         }
     }
+    risk_set_sums = ArrayDouble(n_failures);
 }
 
 
 double ModelCoxRegPartialLik::loss(const ArrayDouble &coeffs) {
-    const ulong n_failures_minus_one = n_failures - 1;
-    // Compute all the inner products and maintain the maximal one
-    double max_inner_prod = -DBL_MAX;
-    for (ulong i = 0; i < n_samples; ++i) {
-        const double inner_prod = get_feature(i).dot(coeffs);
-        inner_prods[i] = inner_prod;
-        if (inner_prod > max_inner_prod) {
-            max_inner_prod = inner_prod;
-        }
-    }
-    double log_lik = 0;
-    double s = DBL_MIN;
-    const ulong idx0 = get_idx_failure(0);
-    for (ulong i = 0; i <= idx0; ++i) {
-        const double diff = inner_prods[i] - max_inner_prod;
-        s += exp(diff);
-    }
-    for (ulong k = 0; k < n_failures; ++k) {
-        const ulong idx = get_idx_failure(k);
-        log_lik += log(s) - inner_prods[idx] + max_inner_prod;
-        if (k != n_failures_minus_one) {
-            const ulong idx_next = get_idx_failure(k + 1) + 1;
-            for (ulong i = idx + 1; i < idx_next; ++i) {
-                const double diff = inner_prods[i] - max_inner_prod;
-                if (diff > DBL_MIN_EXP) {
-                    s += exp(diff);
-                }
-            }
-        }
-    }
-    return log_lik / n_failures;
+    const double max_inner_prod = compute_inner_prods(coeffs);
+    return compute_risk_set_sums(max_inner_prod) / n_failures;
 }
 
 void ModelCoxRegPartialLik::grad(const ArrayDouble &coeffs, ArrayDouble &out) {
-    const ulong n_failures_minus_one = n_failures - 1;
-    // grad must be filled with 0
-    out.init_to_zero();
-    s1.init_to_zero();
-    inner_prods.init_to_zero();
+    loss_and_grad(coeffs, out);
+}
 
-    // Initialize s to a very small positive number (to avoid division by
-    // 0 in weird cases)
-    double s2 = DBL_MIN;
-
-    // Compute first all inner products and keep the maximum
-    // (to avoid overflow)
-    double max_inner_prod = -DBL_MAX;
-    for (ulong i = 0; i < n_samples; ++i) {
-        const double inner_prod = get_feature(i).dot(coeffs);
-        inner_prods[i] = inner_prod;
-        if (inner_prod > max_inner_prod) {
-            max_inner_prod = inner_prod;
+double ModelCoxRegPartialLik::loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+    const double max_inner_prod = compute_inner_prods(coeffs);
+    const double log_lik = compute_risk_set_sums(max_inner_prod);
+
+    // The gradient is the sum over failures k of s1_k / s2_k - x_k, where s1_k and s2_k are
+    // the sums over the risk set of k of exp(inner_prod_i) x_i and exp(inner_prod_i). Each row
+    // x_i is then weighted by exp(inner_prod_i) times the sum of 1 / s2_k over the failures
+    // whose risk set contains i, namely the failures k such that i <= idx_k
+    double inverse_sums = 0;
+    ulong k = n_failures;
+    for (ulong i = n_samples; i-- > 0;) {
+        if (get_censoring(i) != 0) {
+            inverse_sums += 1 / risk_set_sums[--k];
+            weights[i] = weights[i] * inverse_sums - 1;
+        } else {
+            weights[i] *= inverse_sums;
         }
     }
 
-    const ulong idx0 = get_idx_failure(0);
-    for (ulong i = 0; i <= idx0; ++i) {
-        const double diff = inner_prods[i] - max_inner_prod;
-        const double exp_diff = exp(diff);
-        if (diff > DBL_MIN_EXP) {
-            const BaseArrayDouble x_i = get_feature(i);
-            s1.mult_incr(x_i, exp_diff);
-            s2 += exp_diff;
-        }
-    }
+    out.init_to_zero();
+    parallel_map_array<ArrayDouble>(n_threads,
+                                    n_samples,
+                                    [](ArrayDouble &r, const ArrayDouble &s) {
+                                      r.mult_incr(s, 1.0);
+                                    },
+                                    &ModelCoxRegPartialLik::inc_grad_i,
+                                    this,
+                                    out);
+    out /= n_failures;
+
+    return log_lik / n_failures;
+}
+
+void ModelCoxRegPartialLik::compute_inner_prod_i(const ulong i, const ArrayDouble &coeffs) {
+    inner_prods[i] = get_feature(i).dot(coeffs);
+}
+
+double ModelCoxRegPartialLik::compute_inner_prods(const ArrayDouble &coeffs) {
+    parallel_run(n_threads, n_samples, &ModelCoxRegPartialLik::compute_inner_prod_i,
+                 this, coeffs);
+    // Keep the maximum to avoid overflows
+    return n_samples > 0 ? inner_prods.max() : -DBL_MAX;
+}
 
+double ModelCoxRegPartialLik::compute_risk_set_sums(const double max_inner_prod) {
+    // Times are sorted by decreasing order, hence the risk set of the kth failure contains the
+    // samples up to idx_failures[k] and the sums over risk sets are cumulative sums
+    // Initialize s to a very small positive number (to avoid division by
+    // 0 in weird cases)
+    double s = DBL_MIN;
+    double log_lik = 0;
+    ulong i = 0;
     for (ulong k = 0; k < n_failures; ++k) {
         const ulong idx = get_idx_failure(k);
-        const BaseArrayDouble x_idx = get_feature(idx);
-
-        out.mult_add_mult_incr(s1, 1 / s2, x_idx, -1);
-        if (k != n_failures_minus_one) {
-            const ulong idx_next = get_idx_failure(k+1) + 1;
-            for (ulong i = idx + 1; i < idx_next; ++i) {
-                const BaseArrayDouble x_i = get_feature(i);
-                double diff = inner_prods[i] - max_inner_prod;
-                if (diff > DBL_MIN_EXP) {
-                    const double exp_diff = exp(diff);
-                    s1.mult_incr(x_i, exp_diff);
-                    s2 += exp_diff;
-                }
-            }
+        for (; i <= idx; ++i) {
+            const double diff = inner_prods[i] - max_inner_prod;
+            weights[i] = diff > DBL_MIN_EXP ? exp(diff) : 0;
+            s += weights[i];
         }
+        risk_set_sums[k] = s;
+        log_lik += log(s) - inner_prods[idx] + max_inner_prod;
+    }
+    // Samples after the last failure are in no risk set
+    for (; i < n_samples; ++i) {
+        weights[i] = 0;
     }
-    for (ulong j = 0; j < n_features; ++j) {
-        out[j] /= n_failures;
+    return log_lik;
+}
+
+void ModelCoxRegPartialLik::inc_grad_i(const ulong i, ArrayDouble &out) {
+    if (weights[i] != 0) {
+        out.mult_incr(get_feature(i), weights[i]);
     }
 }
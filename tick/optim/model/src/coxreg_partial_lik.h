@@ -13,12 +13,30 @@
 class ModelCoxRegPartialLik : public Model {
  private:
     ArrayDouble inner_prods;
-    ArrayDouble s1;
     ArrayULong idx;
 
+    //! Exponentials of the inner products (shifted by their maximum), replaced by the factors
+    //! of the rows of the features in the gradient
+    ArrayDouble weights;
+
+    //! Sums of the exponentials of the inner products over the risk set of each failure
+    ArrayDouble risk_set_sums;
+
+    void compute_inner_prod_i(const ulong i, const ArrayDouble &coeffs);
+
+    //! Computes all inner products in parallel and returns their maximum
+    double compute_inner_prods(const ArrayDouble &coeffs);
+
+    //! Computes the sums over the risk sets from the inner products and returns the loss
+    double compute_risk_set_sums(const double max_inner_prod);
+
+    void inc_grad_i(const ulong i, ArrayDouble &out);
+
  protected:
     ulong n_samples, n_features, n_failures;
 
+    unsigned int n_threads;
+
     SBaseArrayDouble2dPtr features;
     ArrayDouble times;
     ArrayUShort censoring;
@@ -43,7 +61,8 @@ class ModelCoxRegPartialLik : public Model {
  public:
     ModelCoxRegPartialLik(const SBaseArrayDouble2dPtr features,
                           const SArrayDoublePtr times,
-                          const SArrayUShortPtr censoring);
+                          const SArrayUShortPtr censoring,
+                          const int n_threads = 1);
 
     const char *get_class_name() const override {
         return "ModelCoxRegPartialLik";
@@ -64,7 +83,26 @@ class ModelCoxRegPartialLik : public Model {
     */
     double loss(const ArrayDouble &coeffs) override;
 
+    /**
+     * \brief Computation of the gradient of minus the partial Cox log-likelihood at point
+     * coeffs.
+     *
+     * \note
+     * The sums over the risk sets of the features weighted by the exponentials of the inner
+     * products are never computed. Instead, each row of the features is added once to the
+     * gradient, weighted by the cumulative sum of the inverse risk set sums of the failures it
+     * is at risk for. Hence only the non-zero features of each row are visited.
+     *
+     * \param coeffs : The vector at which the gradient is computed
+     * \param out : The vector in which the gradient is stored
+    */
     void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
+
+    /**
+     * \brief Computes the loss and the gradient with a single computation of the inner products
+     * \return The loss
+     */
+    double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
 };
 
 
@@ -2,6 +2,7 @@
 
 
 #include "hawkes_fixed_expkern_leastsq.h"
+#include "hawkes_utils.h"
 
 // Constructor
 ModelHawkesFixedExpKernLeastSq::ModelHawkesFixedExpKernLeastSq(
@@ -30,31 +31,29 @@ double ModelHawkesFixedExpKernLeastSq::loss(const ArrayDouble &coeffs) {
 double ModelHawkesFixedExpKernLeastSq::loss_i(const ulong i, const ArrayDouble &coeffs) {
   if (!weights_computed) TICK_ERROR("Please compute weights before calling loss_i");
 
-  const ArrayDouble E_i = view_row(E, i);
-  const ArrayDouble Dg_i = view_row(Dg, i);
-  const ArrayDouble Dg2_i = view_row(Dg2, i);
-  const ArrayDouble C_i = view_row(C, i);
-  const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ulong n_sources = get_n_sources(i);
+  const ulong start_i = get_support_start(i);
+  const double *E_i = E.data() + E_starts[i];
+  const double mu_i = coeffs[i];
+  const double *alpha_i = coeffs.data() + get_alpha_start(i);
 
   double value = 0;
-  value += mu[i] * mu[i] * end_time;
+  value += mu_i * mu_i * end_time;
 
   double temp1 = 0;
   double temp2 = 0;
   double temp3 = 0;
   double temp4 = 0;
-  for (ulong j = 0; j < n_nodes; j++) {
-    temp1 += alpha[i * n_nodes + j] * Dg_i[j];
-    temp2 += alpha[i * n_nodes + j] * alpha[i * n_nodes + j] * Dg2_i[j];
-    temp3 += alpha[i * n_nodes + j] * C_i[j];
-    for (ulong j1 = 0; j1 < n_nodes; j1++) {
-      temp4 += alpha[i * n_nodes + j] * alpha[i * n_nodes + j1] *
-          E_i[j * n_nodes + j1];
+  for (ulong p = 0; p < n_sources; p++) {
+    temp1 += alpha_i[p] * Dg[start_i + p];
+    temp2 += alpha_i[p] * alpha_i[p] * Dg2[start_i + p];
+    temp3 += alpha_i[p] * C[start_i + p];
+    for (ulong p1 = 0; p1 < n_sources; p1++) {
+      temp4 += alpha_i[p] * alpha_i[p1] * E_i[p * n_sources + p1];
     }
   }
-  value += 2 * mu[i] * temp1 + temp2 - 2 * temp3 + 2 * temp4 -
-      2 * mu[i] * (*n_jumps_per_node)[i];
+  value += 2 * mu_i * temp1 + temp2 - 2 * temp3 + 2 * temp4 -
+      2 * mu_i * (*n_jumps_per_node)[i];
   return value;
 }
 
@@ -78,34 +77,32 @@ void ModelHawkesFixedExpKernLeastSq::grad_i(const ulong i, const ArrayDouble &co
                                             ArrayDouble &out) {
   if (!weights_computed) TICK_ERROR("Please compute weights before calling grad_i");
 
-  const ArrayDouble E_i = view_row(E, i);
-  const ArrayDouble Dg_i = view_row(Dg, i);
-  const ArrayDouble Dg2_i = view_row(Dg2, i);
-  const ArrayDouble C_i = view_row(C, i);
-
-  const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
-  ArrayDouble grad_mu = view(out, 0, n_nodes);
-  ArrayDouble grad_alpha = view(out, n_nodes, n_nodes + n_nodes * n_nodes);
-
-  grad_mu[i] = 2 * mu[i] * end_time - 2 * (*n_jumps_per_node)[i];
-
-  for (ulong j = 0; j < n_nodes; j++) {
-    grad_mu[i] += 2 * alpha[i * n_nodes + j] * Dg_i[j];
-    grad_alpha[i * n_nodes + j] =
-        2 * mu[i] * Dg_i[j] + 2 * alpha[i * n_nodes + j] * Dg2_i[j] +
-            4 * alpha[i * n_nodes + j] * E_i[j * n_nodes + j] - 2 * C_i[j];
-
-    for (ulong j1 = 0; j1 < n_nodes; j1++) {
-      if (j1 != j)
-        grad_alpha[i * n_nodes + j] += 2 * alpha[i * n_nodes + j1] *
-            (E_i[j * n_nodes + j1] +
-                E_i[j1 * n_nodes + j]);
+  const ulong n_sources = get_n_sources(i);
+  const ulong start_i = get_support_start(i);
+  const double *E_i = E.data() + E_starts[i];
+  const double mu_i = coeffs[i];
+  const double *alpha_i = coeffs.data() + get_alpha_start(i);
+  double *grad_alpha_i = out.data() + get_alpha_start(i);
+
+  out[i] = 2 * mu_i * end_time - 2 * (*n_jumps_per_node)[i];
+
+  for (ulong p = 0; p < n_sources; p++) {
+    out[i] += 2 * alpha_i[p] * Dg[start_i + p];
+    grad_alpha_i[p] =
+        2 * mu_i * Dg[start_i + p] + 2 * alpha_i[p] * Dg2[start_i + p] +
+            4 * alpha_i[p] * E_i[p * n_sources + p] - 2 * C[start_i + p];
+
+    for (ulong p1 = 0; p1 < n_sources; p1++) {
+      if (p1 != p)
+        grad_alpha_i[p] += 2 * alpha_i[p1] *
+            (E_i[p * n_sources + p1] +
+                E_i[p1 * n_sources + p]);
     }
   }
 }
 
 void ModelHawkesFixedExpKernLeastSq::hessian(ArrayDouble &out) {
+  if (has_support()) TICK_ERROR("hessian is not available when a support is set");
   if (!weights_computed) compute_weights();
 
   // This allows to run in a multithreaded environment the computation of each component
@@ -121,15 +118,15 @@ void ModelHawkesFixedExpKernLeastSq::hessian_i(const ulong i, ArrayDouble &out)
   // fill mu in mu diag
   out[start_mu_line] = 2 * end_time;
   // fill alpha line
-  const ArrayDouble Dg_i = view_row(Dg, i);
+  const ArrayDouble Dg_i = view(Dg, i * n_nodes, (i + 1) * n_nodes);
   for (ulong j = 0; j < n_nodes; ++j) {
     out[start_mu_line + j + 1] += 2 * Dg_i[j];
   }
 
   // fill alpha lines
-  const ArrayDouble E_k = view_row(E, i);
-  const ArrayDouble Dg2_k = view_row(Dg2, i);
-  const ArrayDouble Dg_k = view_row(Dg, i);
+  const ArrayDouble E_k = view(E, E_starts[i], E_starts[i + 1]);
+  const ArrayDouble Dg2_k = view(Dg2, i * n_nodes, (i + 1) * n_nodes);
+  const ArrayDouble Dg_k = view(Dg, i * n_nodes, (i + 1) * n_nodes);
 
   const ulong block_start = (i + 1) * n_nodes * (n_nodes + 1);
   for (ulong l = 0; l < n_nodes; ++l) {
@@ -156,16 +153,72 @@ void ModelHawkesFixedExpKernLeastSq::allocate_weights() {
   if (n_nodes == 0) {
     TICK_ERROR("Please provide valid timestamps before allocating weights")
   }
+  check_support();
+  compute_E_starts();
+  compute_support_targets();
 
   // Allocation
-  Dg = ArrayDouble2d(n_nodes, n_nodes);
+  const ulong n_support_pairs = get_n_support_pairs();
+  Dg = ArrayDouble(n_support_pairs);
   Dg.init_to_zero();
-  Dg2 = ArrayDouble2d(n_nodes, n_nodes);
+  Dg2 = ArrayDouble(n_support_pairs);
   Dg2.init_to_zero();
-  C = ArrayDouble2d(n_nodes, n_nodes);
+  C = ArrayDouble(n_support_pairs);
   C.init_to_zero();
-  E = ArrayDouble2d(n_nodes, n_nodes * n_nodes);
+  E = ArrayDouble(E_starts[n_nodes]);
   E.init_to_zero();
+  H_sum = ArrayDouble(E_starts[n_nodes]);
+  H_sum.init_to_zero();
+  H_last = ArrayDouble(E_starts[n_nodes]);
+  H_last.init_to_zero();
+  H_last_C = ArrayDouble(n_support_pairs);
+  H_last_C.init_to_zero();
+}
+
+void ModelHawkesFixedExpKernLeastSq::compute_E_starts() {
+  E_starts = ArrayULong(n_nodes + 1);
+  E_starts[0] = 0;
+  for (ulong i = 0; i < n_nodes; i++) {
+    E_starts[i + 1] = E_starts[i] + get_n_sources(i) * get_n_sources(i);
+  }
+}
+
+void ModelHawkesFixedExpKernLeastSq::compute_support_targets() {
+  targets_starts = ArrayULong(n_nodes + 1);
+  targets_starts.init_to_zero();
+  for (ulong t = 0; t < n_nodes; t++) {
+    for (ulong p = 0; p < get_n_sources(t); p++) targets_starts[get_source(t, p) + 1]++;
+  }
+  for (ulong i = 0; i < n_nodes; i++) targets_starts[i + 1] += targets_starts[i];
+
+  // Nodes t are visited in increasing order, so that the targets of each node are sorted
+  support_targets = ArrayULong(get_n_support_pairs());
+  target_positions = ArrayULong(get_n_support_pairs());
+  ArrayULong next_target(n_nodes);
+  std::copy(targets_starts.data(), targets_starts.data() + n_nodes, next_target.data());
+  for (ulong t = 0; t < n_nodes; t++) {
+    for (ulong p = 0; p < get_n_sources(t); p++) {
+      const ulong q = next_target[get_source(t, p)]++;
+      support_targets[q] = t;
+      target_positions[q] = p;
+    }
+  }
+}
+
+void ModelHawkesFixedExpKernLeastSq::get_weights_targets(
+    const ulong i, std::vector<WeightsTarget> &weights_targets) const {
+  weights_targets.clear();
+  for (ulong q = targets_starts[i]; q < targets_starts[i + 1]; q++) {
+    const ulong t = support_targets[q];
+    const ulong n_sources_t = get_n_sources(t);
+    const ulong E_start = E_starts[t] + target_positions[q] * n_sources_t;
+    for (ulong p_j = 0; p_j < n_sources_t; p_j++) {
+      weights_targets.push_back({get_source(t, p_j), t, E_start + p_j});
+    }
+  }
+  // Targets t are visited in increasing order, the stable sort keeps them sorted for each j
+  std::stable_sort(weights_targets.begin(), weights_targets.end(),
+                   [](const WeightsTarget &a, const WeightsTarget &b) { return a.j < b.j; });
 }
 
 // Full initialization of the arrays H, Dg, Dg2 and C
@@ -176,65 +229,168 @@ void ModelHawkesFixedExpKernLeastSq::compute_weights() {
   weights_computed = true;
 }
 
+void ModelHawkesFixedExpKernLeastSq::append_events(const SArrayDoublePtrList1D &timestamps_chunk,
+                                                   const double new_end_time) {
+  // Weights that are not computed yet will be computed from scratch
+  if (!weights_computed) {
+    append_timestamps(timestamps_chunk, new_end_time);
+    return;
+  }
+
+  const double previous_end_time = end_time;
+  const ArrayULong previous_n_jumps_per_node = append_timestamps(timestamps_chunk, new_end_time);
+  parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedExpKernLeastSq::append_weights_i,
+               this, previous_n_jumps_per_node, previous_end_time);
+}
+
 // Contribution of the ith component to the initialization
 // Computation of the arrays H, Dg, Dg2 and C
 void ModelHawkesFixedExpKernLeastSq::compute_weights_i(const ulong i) {
+  ArrayULong n_accounted_jumps(n_nodes);
+  n_accounted_jumps.init_to_zero();
+  accumulate_weights_i(i, n_accounted_jumps);
+}
+
+void ModelHawkesFixedExpKernLeastSq::accumulate_weights_i(const ulong i,
+                                                          const ArrayULong &n_accounted_jumps) {
   const SArrayDoublePtr timestamps_i = timestamps[i];
-  ArrayDouble2d H(n_nodes, n_nodes);
-  H.init_to_zero();
-  ArrayDouble Dg_i = view_row(Dg, i);
-  ArrayDouble Dg2_i = view_row(Dg2, i);
-  ArrayDouble C_i = view_row(C, i);
+  const ulong n_sources_i = get_n_sources(i);
+  const ulong start_i = get_support_start(i);
+
+  std::vector<WeightsTarget> weights_targets;
+  get_weights_targets(i, weights_targets);
+
+  // Kernels H(j1, j) of the nodes j1 whose weights involve the pair (i, j), the last one being
+  // H(i, j) if it is only needed by C
+  std::vector<ulong> targets, E_indices;
 
   const ulong N_i_size = timestamps_i->size();
-  for (ulong j = 0; j < n_nodes; j++) {
+  const ulong first_k = n_accounted_jumps[i];
+  // Only the nodes j exciting i or involved in the weights of the nodes excited by i are
+  // visited, w being the first weights target of node j and p its position among the sources of
+  // node i
+  ulong w = 0;
+  ulong p = 0;
+  while (w < weights_targets.size() || p < n_sources_i) {
+    ulong j = n_nodes;
+    if (w < weights_targets.size()) j = weights_targets[w].j;
+    if (p < n_sources_i) j = std::min(j, get_source(i, p));
     const SArrayDoublePtr realization_j = timestamps[j];
     const ulong N_j_size = realization_j->size();
     const double betaij = (*decays)(i, j);
+    const bool j_excites_i = p < n_sources_i && get_source(i, p) == j;
+
+    targets.clear();
+    E_indices.clear();
+    for (; w < weights_targets.size() && weights_targets[w].j == j; w++) {
+      targets.push_back(weights_targets[w].t);
+      E_indices.push_back(weights_targets[w].E_index);
+    }
+    const ulong n_targets = targets.size();
+    // Index in H of the kernel H(i, j) needed by C
+    ulong C_kernel = n_targets;
+    for (ulong q = 0; q < n_targets; q++) {
+      if (targets[q] == i) C_kernel = q;
+    }
+    if (j_excites_i && C_kernel == n_targets) targets.push_back(i);
+    const ulong n_kernels = targets.size();
+    ArrayDouble H(n_kernels);
+
+    if (j_excites_i) {
+      // The exponentials of all new jumps of j are computed in a vectorized pass
+      const ulong first_ij = n_accounted_jumps[j];
+      const ulong n_new_jumps_j = N_j_size > first_ij ? N_j_size - first_ij : 0;
+      ArrayDouble exp_j(n_new_jumps_j);
+      ArrayDouble exp2_j(n_new_jumps_j);
+      for (ulong ij = first_ij; ij < N_j_size; ij++) {
+        exp_j[ij - first_ij] = -betaij * (end_time - (*realization_j)[ij]);
+        exp2_j[ij - first_ij] = -2 * betaij * (end_time - (*realization_j)[ij]);
+      }
+      exp_batch(exp_j, exp_j);
+      exp_batch(exp2_j, exp2_j);
+      for (ulong k = 0; k < n_new_jumps_j; k++) {
+        Dg[start_i + p] += (1 - exp_j[k]);
+        Dg2[start_i + p] += betaij * (1 - exp2_j[k]) / 2;
+      }
+    }
+
+    // The kernels are resumed from their values at the last accounted jump of i
     ulong ij = 0;
-    for (ulong k = 0; k < N_i_size; k++) {
+    H.init_to_zero();
+    if (first_k > 0) {
+      ij = first_jump_after(*realization_j, (*timestamps_i)[first_k - 1]);
+      for (ulong q = 0; q < n_targets; q++) H[q] = H_last[E_indices[q]];
+      if (n_kernels > n_targets) H[n_targets] = H_last_C[start_i + p];
+    }
+
+    for (ulong k = first_k; k < N_i_size; k++) {
       if (k > 0) {
-        for (ulong j1 = 0; j1 < n_nodes; j1++) {
-          double beta_j1_j = (*decays)(j1, j);
-          H(j1, j) *= cexp(
+        for (ulong q = 0; q < n_kernels; q++) {
+          double beta_j1_j = (*decays)(targets[q], j);
+          H[q] *= cexp(
               -beta_j1_j * ((*timestamps_i)[k] - (*timestamps_i)[k - 1]));
         }
       }
       while ((ij < N_j_size) && ((*realization_j)[ij] < (*timestamps_i)[k])) {
-        for (ulong j1 = 0; j1 < n_nodes; j1++) {
-          double beta_j1_j = (*decays)(j1, j);
-          H(j1, j) += beta_j1_j * cexp(
+        for (ulong q = 0; q < n_kernels; q++) {
+          double beta_j1_j = (*decays)(targets[q], j);
+          H[q] += beta_j1_j * cexp(
               -beta_j1_j * ((*timestamps_i)[k] - (*realization_j)[ij]));
         }
-        Dg_i[j] += (1 - cexp(-betaij * (end_time - (*realization_j)[ij])));
-        Dg2_i[j] += betaij * (1 - cexp(-2 * betaij * (end_time - (*realization_j)[ij]))) / 2;
         ij++;
       }
 
-      C_i[j] += H(i, j);
+      if (j_excites_i) C[start_i + p] += H[C_kernel];
 
       // Here we compute E(j1,i,j)
-      const ulong index = i * n_nodes + j;
-      for (ulong j1 = 0; j1 < n_nodes; j1++) {
-        double beta_j1_i = (*decays)(j1, i);
-        double beta_j1_j = (*decays)(j1, j);
-        ArrayDouble E_j1 = view_row(E, j1);
+      for (ulong q = 0; q < n_targets; q++) {
+        double beta_j1_i = (*decays)(targets[q], i);
+        double beta_j1_j = (*decays)(targets[q], j);
         double r = beta_j1_i / (beta_j1_i + beta_j1_j);
-        E_j1[index] += r * (1 - cexp(-(end_time - (*timestamps_i)[k]) * (beta_j1_i + beta_j1_j)))
-            * H(j1, j);
+        E[E_indices[q]] += r * (1 - cexp(-(end_time - (*timestamps_i)[k]) * (beta_j1_i + beta_j1_j)))
+            * H[q];
+        H_sum[E_indices[q]] += H[q];
       }
     }
 
-    if (ij < N_j_size) {
-      while (ij < N_j_size) {
-        Dg2_i[j] += betaij * (1 - cexp(-2 * betaij * (end_time - (*realization_j)[ij]))) / 2;
-        Dg_i[j] += (1 - cexp(-betaij * (end_time - (*realization_j)[ij])));
-        ij++;
-      }
+    if (N_i_size > first_k) {
+      for (ulong q = 0; q < n_targets; q++) H_last[E_indices[q]] = H[q];
+      if (j_excites_i) H_last_C[start_i + p] = H[C_kernel];
     }
+    if (j_excites_i) p++;
   }
 }
 
+void ModelHawkesFixedExpKernLeastSq::append_weights_i(const ulong i,
+                                                      const ArrayULong &previous_n_jumps_per_node,
+                                                      const double previous_end_time) {
+  const double delta = end_time - previous_end_time;
+  const ulong start_i = get_support_start(i);
+
+  // Integrals up to the previous end time are extended up to the new one
+  for (ulong p = 0; p < get_n_sources(i); p++) {
+    const ulong j = get_source(i, p);
+    const double betaij = (*decays)(i, j);
+    const double n_jumps_j = previous_n_jumps_per_node[j];
+    Dg[start_i + p] += (n_jumps_j - Dg[start_i + p]) * (1 - cexp(-betaij * delta));
+    Dg2[start_i + p] += (betaij * n_jumps_j / 2 - Dg2[start_i + p])
+        * (1 - cexp(-2 * betaij * delta));
+  }
+
+  std::vector<WeightsTarget> weights_targets;
+  get_weights_targets(i, weights_targets);
+  for (const WeightsTarget &target : weights_targets) {
+    double beta_j1_i = (*decays)(target.t, i);
+    double beta_j1_j = (*decays)(target.t, target.j);
+    double r = beta_j1_i / (beta_j1_i + beta_j1_j);
+    const ulong index = target.E_index;
+    E[index] += (r * H_sum[index] - E[index])
+        * (1 - cexp(-delta * (beta_j1_i + beta_j1_j)));
+  }
+
+  accumulate_weights_i(i, previous_n_jumps_per_node);
+}
+
 ulong ModelHawkesFixedExpKernLeastSq::get_n_coeffs() const {
-  return n_nodes + n_nodes * n_nodes;
+  return n_nodes + get_n_support_pairs();
 }
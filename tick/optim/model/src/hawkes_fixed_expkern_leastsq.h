@@ -20,8 +20,64 @@ class ModelHawkesFixedExpKernLeastSq : public ModelHawkesSingle {
    */
   void compute_weights_i(const ulong i);
 
+  /**
+   * @brief Adds the contributions of the jumps that have not been accounted for yet to the
+   * intermediate values of dimension i
+   * \param i : selected dimension
+   * \param n_accounted_jumps : number of jumps of each node already accounted for
+   */
+  void accumulate_weights_i(const ulong i, const ArrayULong &n_accounted_jumps);
+
+  /**
+   * @brief Updates the intermediate values of dimension i once events have been appended
+   * \param i : selected dimension
+   * \param previous_n_jumps_per_node : number of jumps of each node before events were appended
+   * \param previous_end_time : end time before events were appended
+   */
+  void append_weights_i(const ulong i, const ArrayULong &previous_n_jumps_per_node,
+                        const double previous_end_time);
+
+  //! @brief Weight E of a node t excited by nodes i and j, given by get_weights_targets
+  struct WeightsTarget {
+    //! @brief Node whose jumps the kernels are computed from
+    ulong j;
+    //! @brief Node excited by both i and j
+    ulong t;
+    //! @brief Index in E of the weight of the triplet (t, i, j)
+    ulong E_index;
+  };
+
+  /**
+   * @brief Finds the weights E that involve the jumps of node i, by going through the nodes t
+   * excited by i and their sources j, hence in O(sum of squared degrees of the nodes t)
+   * \param i : node whose jumps are summed over
+   * \param weights_targets : filled with the weights of the nodes excited by i, sorted by node j
+   * and then by node t
+   */
+  void get_weights_targets(const ulong i, std::vector<WeightsTarget> &weights_targets) const;
+
+  //! @brief Computes the nodes excited by each node, the transposed support
+  void compute_support_targets();
+
+  //! @brief Computes the index in E of the first weight of each node
+  void compute_E_starts();
+
   //! @brief Some arrays used for intermediate computings. They are initialized in init()
-  ArrayDouble2d E, Dg, Dg2, C;
+  //! Dg, Dg2 and C store one weight per pair of nodes of the support (i, j), at index
+  //! get_support_start(i) + p where j = get_source(i, p). E stores the weights of node i for
+  //! the pairs of its sources (j, j1) at index E_starts[i] + p * get_n_sources(i) + p1
+  ArrayDouble E, Dg, Dg2, C;
+  ArrayULong E_starts;
+
+  //! @brief Nodes excited by each node, in CSR format: node i excites the nodes
+  //! support_targets[targets_starts[i]:targets_starts[i + 1]], sorted, node i being the
+  //! source of position target_positions[q] of node support_targets[q]
+  ArrayULong targets_starts, support_targets, target_positions;
+
+  //! @brief Sum over the jumps of i and value at its last jump of the kernels H(j1, j), stored
+  //! like E. H_last_C is the value of the kernel H(i, j) involved in C, stored like C. They are
+  //! only needed to append events to the realization.
+  ArrayDouble H_sum, H_last, H_last_C;
 
   //! @brief The 2d array of decays (remember that the decays are fixed!)
   SArrayDouble2dPtr decays;
@@ -45,6 +101,15 @@ class ModelHawkesFixedExpKernLeastSq : public ModelHawkesSingle {
    */
   void compute_weights();
 
+  /**
+   * @brief Appends events at the end of the realization and updates the weights incrementally
+   * The contributions of the previous events are extended to the new end time in closed form,
+   * only the new events are visited.
+   * \param timestamps_chunk : new events of each node, all happening after end_time
+   * \param new_end_time : new ending time of the realization
+   */
+  void append_events(const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time);
+
   /**
    * @brief Compute loss
    * \param coeffs : Point in which loss is computed
@@ -79,7 +144,8 @@ class ModelHawkesFixedExpKernLeastSq : public ModelHawkesSingle {
    * @brief Compute hessian
    * \param coeffs : Point in which hessian is computed
    * \param out : Array in which the value of the hessian is stored
-   * \note : We only fill data, python code takes care of creating index and indexptr
+   * \note : We only fill data, python code takes care of creating index and indexptr. The
+   * hessian is not available when a support is set
    */
   void hessian(ArrayDouble &out);
 
@@ -108,6 +174,12 @@ class ModelHawkesFixedExpKernLeastSq : public ModelHawkesSingle {
    */
   void hessian_i(const ulong i, ArrayDouble &out);
 
+  //! @brief Index in coeffs of the first adjacency coefficient of node i, the adjacency
+  //! coefficients of node i ending at get_alpha_start(i + 1)
+  inline ulong get_alpha_start(const ulong i) const {
+    return n_nodes + get_support_start(i);
+  }
+
   friend class ModelHawkesFixedExpKernLeastSqList;
 };
 
@@ -2,15 +2,20 @@
 
 
 #include "hawkes_fixed_expkern_loglik.h"
+#include "hawkes_utils.h"
+
+#include <algorithm>
 
 ModelHawkesFixedExpKernLogLik::ModelHawkesFixedExpKernLogLik(
     const double decay, const int max_n_threads) :
     ModelHawkesSingle(max_n_threads, 0),
-    decay(decay) {}
+    decay(decay), weights_tol(0.) {}
 
 void ModelHawkesFixedExpKernLogLik::compute_weights() {
   allocate_weights();
-  parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedExpKernLogLik::compute_weights_dim_i, this);
+  const ulong first_row = 0;
+  parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedExpKernLogLik::compute_weights_dim_i,
+               this, first_row);
   weights_computed = true;
 }
 
@@ -18,52 +23,155 @@ void ModelHawkesFixedExpKernLogLik::allocate_weights() {
   if (n_nodes == 0) {
     TICK_ERROR("Please provide valid timestamps before allocating weights")
   }
-  g = ArrayDouble2dList1D(n_nodes);
-  G = ArrayDouble2dList1D(n_nodes);
+  check_support();
+  g = SBaseArrayDouble2dPtrList1D(n_nodes);
+  G = SBaseArrayDouble2dPtrList1D(n_nodes);
   sum_G = ArrayDoubleList1D(n_nodes);
 
   for (ulong i = 0; i < n_nodes; i++) {
-    g[i] = ArrayDouble2d((*n_jumps_per_node)[i], n_nodes);
-    g[i].init_to_zero();
-    G[i] = ArrayDouble2d((*n_jumps_per_node)[i] + 1, n_nodes);
-    G[i].init_to_zero();
-    sum_G[i] = ArrayDouble(n_nodes);
+    const ulong n_sources = get_n_sources(i);
+    // Sparse weights are allocated once their number is known
+    if (weights_tol <= 0) {
+      g[i] = SArrayDouble2d::new_ptr((*n_jumps_per_node)[i], n_sources);
+      g[i]->init_to_zero();
+      G[i] = SArrayDouble2d::new_ptr((*n_jumps_per_node)[i] + 1, n_sources);
+      G[i]->init_to_zero();
+    }
+    sum_G[i] = ArrayDouble(n_sources);
   }
 }
 
-void ModelHawkesFixedExpKernLogLik::compute_weights_dim_i(const ulong i) {
+void ModelHawkesFixedExpKernLogLik::compute_weights_dim_i(const ulong i, const ulong first_row) {
+  if (weights_tol > 0) {
+    compute_sparse_weights_dim_i(i, first_row);
+    return;
+  }
+
   const ArrayDouble t_i = view(*timestamps[i]);
-  ArrayDouble2d g_i = view(g[i]);
-  ArrayDouble2d G_i = view(G[i]);
+  ArrayDouble2d g_i = view(static_cast<ArrayDouble2d &>(*g[i]));
+  ArrayDouble2d G_i = view(static_cast<ArrayDouble2d &>(*G[i]));
   ArrayDouble sum_G_i = view(sum_G[i]);
 
   const ulong n_jumps_i = (*n_jumps_per_node)[i];
+  const ulong n_sources = get_n_sources(i);
 
-  for (ulong j = 0; j < n_nodes; j++) {
+  // Column p of the weights corresponds to the p-th node exciting i
+  for (ulong p = 0; p < n_sources; p++) {
+    const ulong j = get_source(i, p);
     const ArrayDouble t_j = view(*timestamps[j]);
-    ulong ij = 0;
-    for (ulong k = 0; k < n_jumps_i + 1; k++) {
+    ulong ij = first_row > 0 ? first_jump_after(t_j, t_i[first_row - 1]) : 0;
+    for (ulong k = first_row; k < n_jumps_i + 1; k++) {
       const double t_i_k = k < n_jumps_i ? t_i[k] : end_time;
       if (k > 0) {
-        const double ebt = std::exp(-decay * (t_i_k - t_i[k - 1]));
+        const double ebt = cexp(-decay * (t_i_k - t_i[k - 1]));
 
-        if (k < n_jumps_i) g_i[k * n_nodes + j] = g_i[(k - 1) * n_nodes + j] * ebt;
-        G_i[k * n_nodes + j] = g_i[(k - 1) * n_nodes + j] * (1 - ebt) / decay;
+        if (k < n_jumps_i) g_i[k * n_sources + p] = g_i[(k - 1) * n_sources + p] * ebt;
+        G_i[k * n_sources + p] = g_i[(k - 1) * n_sources + p] * (1 - ebt) / decay;
       } else {
-        g_i[k * n_nodes + j] = 0;
-        G_i[k * n_nodes + j] = 0;
-        sum_G[i][j] = 0.;
+        if (n_jumps_i > 0) g_i[k * n_sources + p] = 0;
+        G_i[k * n_sources + p] = 0;
+        sum_G[i][p] = 0.;
       }
 
       while ((ij < (*n_jumps_per_node)[j]) && (t_j[ij] < t_i_k)) {
-        const double ebt = std::exp(-decay * (t_i_k - t_j[ij]));
-        if (k < n_jumps_i) g_i[k * n_nodes + j] += decay * ebt;
-        G_i[k * n_nodes + j] += 1 - ebt;
+        const double ebt = cexp(-decay * (t_i_k - t_j[ij]));
+        if (k < n_jumps_i) g_i[k * n_sources + p] += decay * ebt;
+        G_i[k * n_sources + p] += 1 - ebt;
         ij++;
       }
-      sum_G_i[j] += G_i[k * n_nodes + j];
+      sum_G_i[p] += G_i[k * n_sources + p];
+    }
+  }
+}
+
+void ModelHawkesFixedExpKernLogLik::compute_sparse_weights_dim_i(const ulong i,
+                                                                 const ulong first_row) {
+  const ArrayDouble t_i = view(*timestamps[i]);
+  ArrayDouble sum_G_i = view(sum_G[i]);
+  if (first_row == 0) sum_G_i.init_to_zero();
+
+  const ulong n_jumps_i = (*n_jumps_per_node)[i];
+  const ulong n_sources = get_n_sources(i);
+
+  // Same recurrence as in the dense case but row by row, the exact values of the current row of
+  // g being kept for all nodes exciting i while only those above weights_tol are stored
+  ArrayDouble g_i_k(n_sources);
+  g_i_k.init_to_zero();
+  ArrayULong ij(n_sources);
+  for (ulong p = 0; p < n_sources; p++) {
+    const ArrayDouble t_j = view(*timestamps[get_source(i, p)]);
+    ij[p] = first_row > 0 ? first_jump_after(t_j, t_i[first_row - 1]) : 0;
+  }
+
+  std::vector<double> g_data, G_data;
+  std::vector<INDICE_TYPE> g_indices, G_indices;
+  std::vector<INDICE_TYPE> g_row_indices(1, 0), G_row_indices(1, 0);
+
+  // Rows before first_row are kept, the recurrence starts from the last of them
+  if (first_row > 0) {
+    g_i_k.mult_incr(view_row(*g[i], first_row - 1), 1.);
+
+    const BaseArrayDouble2d &previous_g_i = *g[i];
+    const ulong n_previous_g = previous_g_i.row_indices()[first_row];
+    g_data.assign(previous_g_i.data(), previous_g_i.data() + n_previous_g);
+    g_indices.assign(previous_g_i.indices(), previous_g_i.indices() + n_previous_g);
+    g_row_indices.assign(previous_g_i.row_indices(),
+                         previous_g_i.row_indices() + first_row + 1);
+
+    const BaseArrayDouble2d &previous_G_i = *G[i];
+    const ulong n_previous_G = previous_G_i.row_indices()[first_row];
+    G_data.assign(previous_G_i.data(), previous_G_i.data() + n_previous_G);
+    G_indices.assign(previous_G_i.indices(), previous_G_i.indices() + n_previous_G);
+    G_row_indices.assign(previous_G_i.row_indices(),
+                         previous_G_i.row_indices() + first_row + 1);
+  }
+
+  for (ulong k = first_row; k < n_jumps_i + 1; k++) {
+    const double t_i_k = k < n_jumps_i ? t_i[k] : end_time;
+    const double ebt = k > 0 ? cexp(-decay * (t_i_k - t_i[k - 1])) : 0;
+
+    for (ulong p = 0; p < n_sources; p++) {
+      const ulong j = get_source(i, p);
+      const ArrayDouble t_j = view(*timestamps[j]);
+
+      double G_i_k_j = g_i_k[p] * (1 - ebt) / decay;
+      g_i_k[p] *= ebt;
+      while ((ij[p] < (*n_jumps_per_node)[j]) && (t_j[ij[p]] < t_i_k)) {
+        const double ebt_j = cexp(-decay * (t_i_k - t_j[ij[p]]));
+        g_i_k[p] += decay * ebt_j;
+        G_i_k_j += 1 - ebt_j;
+        ij[p]++;
+      }
+      sum_G_i[p] += G_i_k_j;
+
+      if (k < n_jumps_i && g_i_k[p] > weights_tol) {
+        g_data.push_back(g_i_k[p]);
+        g_indices.push_back(p);
+      }
+      if (G_i_k_j > weights_tol) {
+        G_data.push_back(G_i_k_j);
+        G_indices.push_back(p);
+      }
     }
+    if (k < n_jumps_i) g_row_indices.push_back(g_data.size());
+    G_row_indices.push_back(G_data.size());
   }
+
+  g[i] = weights_to_sparse_array(n_jumps_i, n_sources, g_data, g_indices, g_row_indices);
+  G[i] = weights_to_sparse_array(n_jumps_i + 1, n_sources, G_data, G_indices, G_row_indices);
+}
+
+void ModelHawkesFixedExpKernLogLik::append_events(const SArrayDoublePtrList1D &timestamps_chunk,
+                                                  const double new_end_time) {
+  // Weights that are not computed yet will be computed from scratch
+  if (!weights_computed) {
+    append_timestamps(timestamps_chunk, new_end_time);
+    return;
+  }
+
+  const ArrayULong previous_n_jumps_per_node = append_timestamps(timestamps_chunk, new_end_time);
+  parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedExpKernLogLik::append_weights_dim_i,
+               this, previous_n_jumps_per_node);
 }
 
 double ModelHawkesFixedExpKernLogLik::loss(const ArrayDouble &coeffs) {
@@ -112,6 +220,23 @@ void ModelHawkesFixedExpKernLogLik::grad_i(const ulong sampled_i,
   grad_i_k(i, k, coeffs, out);
 }
 
+void ModelHawkesFixedExpKernLogLik::grad_batch(const ArrayULong &indices,
+                                               const ArrayDouble &coeffs,
+                                               ArrayDouble &out) {
+  if (!weights_computed) compute_weights();
+
+  out.fill(0);
+
+  // grad_i_k adds the gradient of a sample to out, no need for an intermediate array
+  ulong i;
+  ulong k;
+  for (ulong l = 0; l < indices.size(); ++l) {
+    sampled_i_to_index(indices[l], &i, &k);
+    grad_i_k(i, k, coeffs, out);
+  }
+  out /= indices.size();
+}
+
 double ModelHawkesFixedExpKernLogLik::loss_and_grad(const ArrayDouble &coeffs,
                                                     ArrayDouble &out) {
   if (!weights_computed) compute_weights();
@@ -141,6 +266,7 @@ double ModelHawkesFixedExpKernLogLik::hessian_norm(const ArrayDouble &coeffs,
 
 
 void ModelHawkesFixedExpKernLogLik::hessian(const ArrayDouble &coeffs, ArrayDouble &out) {
+  if (has_support()) TICK_ERROR("hessian is not available when a support is set");
   if (!weights_computed) compute_weights();
 
   // This allows to run in a multithreaded environment the computation of each component
@@ -151,10 +277,76 @@ void ModelHawkesFixedExpKernLogLik::hessian(const ArrayDouble &coeffs, ArrayDoub
 
 
 
+void ModelHawkesFixedExpKernLogLik::set_weights_tol(double weights_tol) {
+  if (weights_tol < 0) {
+    TICK_ERROR("weights_tol must be non negative, received " << weights_tol);
+  }
+  this->weights_tol = weights_tol;
+  weights_computed = false;
+}
+
+ulong ModelHawkesFixedExpKernLogLik::get_n_stored_weights() const {
+  ulong n_stored_weights = 0;
+  for (ulong i = 0; i < g.size(); ++i) {
+    if (g[i] != nullptr) n_stored_weights += g[i]->size_data();
+    if (G[i] != nullptr) n_stored_weights += G[i]->size_data();
+  }
+  return n_stored_weights;
+}
+
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 //                                    PRIVATE METHODS
 ////////////////////////////////////////////////////////////////////////////////////////////////////
 
+void ModelHawkesFixedExpKernLogLik::append_weights_dim_i(
+    const ulong i, const ArrayULong &previous_n_jumps_per_node) {
+  const ulong first_row = previous_n_jumps_per_node[i];
+  const ulong n_jumps_i = (*n_jumps_per_node)[i];
+
+  // The last row of G was integrated up to the previous end time, it is computed again
+  sum_G[i].mult_incr(view_row(*G[i], first_row), -1.);
+
+  // Sparse weights are copied in new arrays while being computed
+  if (weights_tol <= 0) {
+    const ulong n_sources = get_n_sources(i);
+    auto g_i = SArrayDouble2d::new_ptr(n_jumps_i, n_sources);
+    std::copy(g[i]->data(), g[i]->data() + first_row * n_sources, g_i->data());
+    g[i] = g_i;
+
+    auto G_i = SArrayDouble2d::new_ptr(n_jumps_i + 1, n_sources);
+    std::copy(G[i]->data(), G[i]->data() + first_row * n_sources, G_i->data());
+    G[i] = G_i;
+  }
+
+  compute_weights_dim_i(i, first_row);
+}
+
+SBaseArrayDouble2dPtr ModelHawkesFixedExpKernLogLik::weights_to_sparse_array(
+    const ulong n_rows, const ulong n_cols, const std::vector<double> &data,
+    const std::vector<INDICE_TYPE> &indices, const std::vector<INDICE_TYPE> &row_indices) {
+  if (data.size() != static_cast<INDICE_TYPE>(data.size())) {
+    TICK_ERROR("Too many weights above weights_tol (" << data.size() << "), "
+               "weights_tol should be increased");
+  }
+  // SSparseArrayDouble2d::new_ptr does not allocate row indices of arrays without non zero
+  // values, that we need to take row views
+  double *weights_data;
+  TICK_PYTHON_MALLOC(weights_data, double, std::max<ulong>(data.size(), 1));
+  INDICE_TYPE *weights_indices;
+  TICK_PYTHON_MALLOC(weights_indices, INDICE_TYPE, std::max<ulong>(indices.size(), 1));
+  INDICE_TYPE *weights_row_indices;
+  TICK_PYTHON_MALLOC(weights_row_indices, INDICE_TYPE, row_indices.size());
+
+  std::copy(data.begin(), data.end(), weights_data);
+  std::copy(indices.begin(), indices.end(), weights_indices);
+  std::copy(row_indices.begin(), row_indices.end(), weights_row_indices);
+
+  auto weights = std::make_shared<SSparseArrayDouble2d>(n_rows, n_cols);
+  weights->set_data_indices_rowindices(weights_data, weights_indices, weights_row_indices,
+                                       n_rows, n_cols);
+  return weights;
+}
+
 void ModelHawkesFixedExpKernLogLik::sampled_i_to_index(const ulong sampled_i,
                                                        ulong *i,
                                                        ulong *k) {
@@ -172,18 +364,15 @@ void ModelHawkesFixedExpKernLogLik::sampled_i_to_index(const ulong sampled_i,
 double ModelHawkesFixedExpKernLogLik::loss_dim_i(const ulong i,
                                                  const ArrayDouble &coeffs) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
 
   double loss = 0;
   loss += end_time * mu[i];
 
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; ++k) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const BaseArrayDouble g_i_k = view_row(*g[i], k);
 
-    double s = mu[i];
-    for (ulong j = 0; j < n_nodes; j++) {
-      s += alpha[j + i * n_nodes] * g_i_k[j];
-    }
+    const double s = mu[i] + g_i_k.dot(alpha_i);
     if (s <= 0) {
       TICK_ERROR("The sum of the influence on someone cannot be negative. "
                      "Maybe did you forget to add a positive constraint to "
@@ -192,9 +381,7 @@ double ModelHawkesFixedExpKernLogLik::loss_dim_i(const ulong i,
     loss -= log(s);
   }
 
-  for (ulong j = 0; j < n_nodes; j++) {
-    loss += alpha[j + i * n_nodes] * sum_G[i][j];
-  }
+  loss += alpha_i.dot(sum_G[i]);
   return loss;
 }
 
@@ -202,11 +389,11 @@ double ModelHawkesFixedExpKernLogLik::loss_i_k(const ulong i,
                                                const ulong k,
                                                const ArrayDouble &coeffs) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
   double loss = 0;
 
-  const ArrayDouble g_i_k = view_row(g[i], k);
-  const ArrayDouble G_i_k = view_row(G[i], k);
+  const BaseArrayDouble g_i_k = view_row(*g[i], k);
+  const BaseArrayDouble G_i_k = view_row(*G[i], k);
 
   // Both are correct, just a question of point of view
   const double t_i_k = k == (*n_jumps_per_node)[i] - 1 ? end_time : (*timestamps[i])[k];
@@ -214,10 +401,7 @@ double ModelHawkesFixedExpKernLogLik::loss_i_k(const ulong i,
   loss += (t_i_k - t_i_k_minus_one) * mu[i];
   //  loss += end_time * mu[i] / (*n_jumps_per_node)[i];
 
-  double s = mu[i];
-  for (ulong j = 0; j < n_nodes; j++) {
-    s += alpha[j + i * n_nodes] * g_i_k[j];
-  }
+  const double s = mu[i] + g_i_k.dot(alpha_i);
 
   if (s <= 0) {
     TICK_ERROR("The sum of the influence on someone cannot be negative. Maybe did "
@@ -226,11 +410,8 @@ double ModelHawkesFixedExpKernLogLik::loss_i_k(const ulong i,
   }
   loss -= log(s);
 
-  for (ulong j = 0; j < n_nodes; j++) {
-    double G_i_k_j = G_i_k[j];
-    if (k == (*n_jumps_per_node)[i] - 1) G_i_k_j += G[i](k + 1, j);
-    loss += alpha[j + i * n_nodes] * G_i_k_j;
-  }
+  loss += G_i_k.dot(alpha_i);
+  if (k == (*n_jumps_per_node)[i] - 1) loss += view_row(*G[i], k + 1).dot(alpha_i);
   return loss;
 }
 
@@ -238,41 +419,33 @@ void ModelHawkesFixedExpKernLogLik::grad_dim_i(const ulong i,
                                                const ArrayDouble &coeffs,
                                                ArrayDouble &out) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
   ArrayDouble grad_mu = view(out, 0, n_nodes);
-  ArrayDouble grad_alpha = view(out, n_nodes, n_nodes + n_nodes * n_nodes);
+  ArrayDouble grad_alpha_i = view_alpha(i, out);
 
   grad_mu[i] += end_time;
 
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; ++k) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
-    double s = mu[i];
-
-    for (ulong j = 0; j < n_nodes; j++) {
-      s += alpha[j + i * n_nodes] * g_i_k[j];
-    }
+    const BaseArrayDouble g_i_k = view_row(*g[i], k);
+    const double s = mu[i] + g_i_k.dot(alpha_i);
 
     grad_mu[i] -= 1. / s;
-    for (ulong j = 0; j < n_nodes; j++) {
-      grad_alpha[j + i * n_nodes] -= g_i_k[j] / s;
-    }
+    grad_alpha_i.mult_incr(g_i_k, -1. / s);
   }
 
-  for (ulong j = 0; j < n_nodes; j++) {
-    grad_alpha[j + i * n_nodes] += sum_G[i][j];
-  }
+  grad_alpha_i.mult_incr(sum_G[i], 1.);
 }
 
 void ModelHawkesFixedExpKernLogLik::grad_i_k(const ulong i, const ulong k,
                                              const ArrayDouble &coeffs,
                                              ArrayDouble &out) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
   ArrayDouble grad_mu = view(out, 0, n_nodes);
-  ArrayDouble grad_alpha = view(out, n_nodes, n_nodes + n_nodes * n_nodes);
+  ArrayDouble grad_alpha_i = view_alpha(i, out);
 
-  const ArrayDouble g_i_k = view_row(g[i], k);
-  const ArrayDouble G_i_k = view_row(G[i], k);
+  const BaseArrayDouble g_i_k = view_row(*g[i], k);
+  const BaseArrayDouble G_i_k = view_row(*G[i], k);
 
   // Both are correct, just a question of point of view
   const double t_i_k = k == (*n_jumps_per_node)[i] - 1 ? end_time : (*timestamps[i])[k];
@@ -280,41 +453,32 @@ void ModelHawkesFixedExpKernLogLik::grad_i_k(const ulong i, const ulong k,
   grad_mu[i] += t_i_k - t_i_k_minus_one;
   //  grad_mu[i] += end_time / (*n_jumps_per_node)[i];
 
-  double s = mu[i];
-
-  for (ulong j = 0; j < n_nodes; j++) {
-    s += alpha[j + i * n_nodes] * g_i_k[j];
-  }
+  const double s = mu[i] + g_i_k.dot(alpha_i);
 
   grad_mu[i] -= 1. / s;
 
-  for (ulong j = 0; j < n_nodes; j++) {
-    double G_i_k_j = G_i_k[j];
-    if (k == (*n_jumps_per_node)[i] - 1) G_i_k_j += G[i](k + 1, j);
-    grad_alpha[j + i * n_nodes] += G_i_k_j - g_i_k[j] / s;
-  }
+  grad_alpha_i.mult_incr(G_i_k, 1.);
+  if (k == (*n_jumps_per_node)[i] - 1) grad_alpha_i.mult_incr(view_row(*G[i], k + 1), 1.);
+  grad_alpha_i.mult_incr(g_i_k, -1. / s);
 }
 
 double ModelHawkesFixedExpKernLogLik::loss_and_grad_dim_i(const ulong i,
                                                           const ArrayDouble &coeffs,
                                                           ArrayDouble &out) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
 
   ArrayDouble grad_mu = view(out, 0, n_nodes);
-  ArrayDouble grad_alpha = view(out, n_nodes, n_nodes + n_nodes * n_nodes);
+  ArrayDouble grad_alpha_i = view_alpha(i, out);
 
   double loss = 0;
 
   grad_mu[i] += end_time;
   loss += end_time * mu[i];
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; k++) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const BaseArrayDouble g_i_k = view_row(*g[i], k);
 
-    double s = mu[i];
-    for (ulong j = 0; j < n_nodes; j++) {
-      s += alpha[j + i * n_nodes] * g_i_k[j];
-    }
+    const double s = mu[i] + g_i_k.dot(alpha_i);
 
     if (s <= 0) {
       TICK_ERROR("The sum of the influence on someone cannot be negative. Maybe did "
@@ -323,16 +487,11 @@ double ModelHawkesFixedExpKernLogLik::loss_and_grad_dim_i(const ulong i,
     }
     loss -= log(s);
     grad_mu[i] -= 1. / s;
-
-    for (ulong j = 0; j < n_nodes; j++) {
-      grad_alpha[j + i * n_nodes] -= g_i_k[j] / s;
-    }
+    grad_alpha_i.mult_incr(g_i_k, -1. / s);
   }
 
-  for (ulong j = 0; j < n_nodes; j++) {
-    grad_alpha[j + i * n_nodes] += sum_G[i][j];
-    loss += alpha[j + i * n_nodes] * sum_G[i][j];
-  }
+  grad_alpha_i.mult_incr(sum_G[i], 1.);
+  loss += alpha_i.dot(sum_G[i]);
 
   return loss;
 }
@@ -341,21 +500,17 @@ double ModelHawkesFixedExpKernLogLik::hessian_norm_dim_i(const ulong i,
                                                          const ArrayDouble &coeffs,
                                                          const ArrayDouble &vector) {
   const ArrayDouble mu = view(coeffs, 0, n_nodes);
-  const ArrayDouble alpha = view(coeffs, n_nodes, n_nodes + n_nodes * n_nodes);
+  const ArrayDouble alpha_i = view_alpha(i, coeffs);
   ArrayDouble d_mu = view(vector, 0, n_nodes);
-  ArrayDouble d_alpha = view(vector, n_nodes, n_nodes + n_nodes * n_nodes);
+  ArrayDouble d_alpha_i = view_alpha(i, vector);
 
   double hess_norm = 0;
 
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; k++) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const BaseArrayDouble g_i_k = view_row(*g[i], k);
 
-    double S = d_mu[i];
-    double s = mu[i];
-    for (ulong j = 0; j < n_nodes; j++) {
-      S += d_alpha[j + i * n_nodes] * g_i_k[j];
-      s += alpha[j + i * n_nodes] * g_i_k[j];
-    }
+    const double S = d_mu[i] + g_i_k.dot(d_alpha_i);
+    const double s = mu[i] + g_i_k.dot(alpha_i);
     double tmp = S / s;
     hess_norm += tmp * tmp;
   }
@@ -375,31 +530,36 @@ void ModelHawkesFixedExpKernLogLik::hessian_i(const ulong i,
   const ulong block_start = (i + 1) * n_nodes * (n_nodes + 1);
 
   for (ulong k = 0; k < (*n_jumps_per_node)[i]; ++k) {
-    const ArrayDouble g_i_k = view_row(g[i], k);
+    const BaseArrayDouble g_i_k = view_row(*g[i], k);
 
     double s = mu_i;
     s += alpha_i.dot(g_i_k);
     const double s_2 = s * s;
 
+    // Only the non zero weights contribute, p and q index the stored weights of the row
+    const ulong n_weights = g_i_k.size_data();
+    const bool is_sparse = g_i_k.is_sparse();
+
     // fill mu mu
     out[start_mu_line] += 1. / s_2;
-    // fill mu alpha
-    for (ulong j = 0; j < n_nodes; ++j) {
-      out[start_mu_line + j + 1] += g_i_k[j] / s_2;
-    }
+    for (ulong p = 0; p < n_weights; ++p) {
+      const ulong l = is_sparse ? g_i_k.indices()[p] : p;
+      const double g_i_k_l = g_i_k.data()[p];
+      // fill mu alpha
+      out[start_mu_line + l + 1] += g_i_k_l / s_2;
 
-    for (ulong l = 0; l < n_nodes; ++l) {
       const ulong start_alpha_line = block_start + l * (n_nodes + 1);
       // fill alpha mu
-      out[start_alpha_line] += g_i_k[l] / s_2;
+      out[start_alpha_line] += g_i_k_l / s_2;
       // fill alpha square
-      for (ulong m = 0; m < n_nodes; ++m) {
-        out[start_alpha_line + m + 1] += g_i_k[l] * g_i_k[m] / s_2;
+      for (ulong q = 0; q < n_weights; ++q) {
+        const ulong m = is_sparse ? g_i_k.indices()[q] : q;
+        out[start_alpha_line + m + 1] += g_i_k_l * g_i_k.data()[q] / s_2;
       }
     }
   }
 }
 
 ulong ModelHawkesFixedExpKernLogLik::get_n_coeffs() const {
-  return n_nodes + n_nodes * n_nodes;
+  return n_nodes + get_n_support_pairs();
 }
@@ -24,15 +24,34 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
   //! @brief Value of decay for this model
   double decay;
 
+  //! @brief Weights below this value are not stored, if positive g and G are stored as sparse
+  //! arrays
+  double weights_tol;
+
   //! @brief Some arrays used for intermediate computings. They are initialized in init()
-  ArrayDouble2dList1D g;
-  ArrayDouble2dList1D G;
+  //! g[i] and G[i] are dense or sparse depending on weights_tol. If a support is set, weights are
+  //! only computed for its pairs of nodes and g[i], G[i] and sum_G[i] have one column per node
+  //! exciting i
+  SBaseArrayDouble2dPtrList1D g;
+  SBaseArrayDouble2dPtrList1D G;
   ArrayDoubleList1D sum_G;
 
+  //! @brief Index in coeffs of the first adjacency coefficient of node i, the adjacency
+  //! coefficients of node i ending at get_alpha_start(i + 1)
+  inline ulong get_alpha_start(const ulong i) const {
+    return n_nodes + get_support_start(i);
+  }
+
+  //! @brief View on the adjacency coefficients of node i in an array of size n_coeffs
+  inline ArrayDouble view_alpha(const ulong i, const ArrayDouble &array) const {
+    if (get_n_sources(i) == 0) return ArrayDouble();
+    return view(array, get_alpha_start(i), get_alpha_start(i + 1));
+  }
+
  public:
   //! @brief Default constructor
   //! @note This constructor is only used to create vectors of ModelHawkesFixedExpKernLeastSq
-  ModelHawkesFixedExpKernLogLik() : ModelHawkesSingle() {}
+  ModelHawkesFixedExpKernLogLik() : ModelHawkesSingle(), weights_tol(0.) {}
 
   /**
    * @brief Constructor
@@ -48,6 +67,14 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
    */
   void compute_weights();
 
+  /**
+   * @brief Appends events at the end of the realization and updates the weights incrementally
+   * Only the rows of g and G of the new events, and the last row of G, are computed.
+   * \param timestamps_chunk : new events of each node, all happening after end_time
+   * \param new_end_time : new ending time of the realization
+   */
+  void append_events(const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time);
+
   /**
    * @brief Compute loss and gradient
    * \param coeffs : Point in which loss and gradient are computed
@@ -90,6 +117,15 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
    */
   void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) override;
 
+  /**
+   * @brief Compute the average of the gradients of a batch of samples
+   * \param indices : selected samples (between 0 and rand_max)
+   * \param coeffs : Point in which gradient is computed
+   * \param out : Array in which the value of the gradient is stored
+   */
+  void grad_batch(const ArrayULong &indices, const ArrayDouble &coeffs,
+                  ArrayDouble &out) override;
+
   /**
    * @brief Compute the hessian norm \f$ \sqrt{ d^T \nabla^2 f(x) d} \f$
    * \param coeffs : Point in which the hessian is computed (\f$ x \f$)
@@ -110,8 +146,30 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
   /**
    * @brief Precomputations of intermediate values for component i
    * \param i : selected component
+   * \param first_row : first row of g and G to compute, previous rows being already computed
    */
-  void compute_weights_dim_i(const ulong i);
+  void compute_weights_dim_i(const ulong i, const ulong first_row = 0);
+
+  /**
+   * @brief Precomputations of intermediate values for component i, stored in sparse arrays
+   * that only keep the weights greater than weights_tol
+   * \param i : selected component
+   * \param first_row : first row of g and G to compute, previous rows being already computed
+   */
+  void compute_sparse_weights_dim_i(const ulong i, const ulong first_row);
+
+  /**
+   * @brief Updates the weights of component i once events have been appended
+   * \param i : selected component
+   * \param previous_n_jumps_per_node : number of jumps of each node before events were appended
+   */
+  void append_weights_dim_i(const ulong i, const ArrayULong &previous_n_jumps_per_node);
+
+  //! @brief Builds a sparse array owning its allocation from weights computed row by row
+  static SBaseArrayDouble2dPtr weights_to_sparse_array(const ulong n_rows, const ulong n_cols,
+                                                       const std::vector<double> &data,
+                                                       const std::vector<INDICE_TYPE> &indices,
+                                                       const std::vector<INDICE_TYPE> &row_indices);
 
   /**
    * @brief Convert sample i (between 0 and rand_max) to a tuple component, timestamp index
@@ -209,6 +267,21 @@ class ModelHawkesFixedExpKernLogLik : public ModelHawkesSingle {
     weights_computed = false;
   }
 
+  //! @brief Returns the tolerance below which weights are not stored
+  double get_weights_tol() const {
+    return weights_tol;
+  }
+
+  /**
+   * @brief Set the tolerance below which weights are not stored
+   * \param weights_tol : new tolerance, if positive the weights are stored in sparse arrays
+   * \note Weights will need to be recomputed
+   */
+  void set_weights_tol(double weights_tol);
+
+  //! @brief Returns the number of weights stored in memory
+  ulong get_n_stored_weights() const;
+
   friend ModelHawkesFixedExpKernLogLikList;
 };
 
@@ -2,6 +2,7 @@
 
 
 #include "hawkes_fixed_sumexpkern_leastsq.h"
+#include "hawkes_utils.h"
 
 ModelHawkesFixedSumExpKernLeastSq::ModelHawkesFixedSumExpKernLeastSq(
     const ArrayDouble &decays,
@@ -36,9 +37,8 @@ double ModelHawkesFixedSumExpKernLeastSq::loss_i(const ulong i,
   if (!weights_computed) TICK_ERROR("Please compute weights before calling hessian_i");
 
   ArrayDouble mu_i = view(coeffs, i * n_baselines, (i + 1) * n_baselines);
-  ulong start_alpha_i = n_nodes * n_baselines + i * n_nodes * n_decays;
-  ulong end_alpha_i = n_nodes * n_baselines + (i + 1) * n_nodes * n_decays;
-  ArrayDouble alpha_i = view(coeffs, start_alpha_i, end_alpha_i);
+  const ulong n_sources = get_n_sources(i);
+  const double *alpha_i = coeffs.data() + get_alpha_start(i);
 
   double C_sum = 0;
   double Dg_sum = 0;
@@ -46,13 +46,14 @@ double ModelHawkesFixedSumExpKernLeastSq::loss_i(const ulong i,
   double E_sum = 0;
 
   ArrayDouble2d &C_i = C[i];
-  for (ulong j = 0; j < n_nodes; ++j) {
+  for (ulong q = 0; q < n_sources; ++q) {
+    const ulong j = get_source(i, q);
     ArrayDouble2d &Dg_j = Dg[j];
     ArrayDouble2d &Dgg_j = Dgg[j];
     ArrayDouble2d &E_j = E[j];
 
     for (ulong u = 0; u < n_decays; ++u) {
-      double alpha_i_j_u = alpha_i[j * n_decays + u];
+      double alpha_i_j_u = alpha_i[q * n_decays + u];
       C_sum += alpha_i_j_u * C_i(j, u);
 
       for (ulong p = 0; p < n_baselines; ++p) {
@@ -60,11 +61,12 @@ double ModelHawkesFixedSumExpKernLeastSq::loss_i(const ulong i,
       }
 
       for (ulong u1 = 0; u1 < n_decays; ++u1) {
-        double alpha_i_j_u1 = alpha_i[j * n_decays + u1];
+        double alpha_i_j_u1 = alpha_i[q * n_decays + u1];
         Dgg_sum += alpha_i_j_u * alpha_i_j_u1 * Dgg_j(u, u1);
 
-        for (ulong j1 = 0; j1 < n_nodes; ++j1) {
-          double alpha_i_j1_u1 = alpha_i[j1 * n_decays + u1];
+        for (ulong q1 = 0; q1 < n_sources; ++q1) {
+          const ulong j1 = get_source(i, q1);
+          double alpha_i_j1_u1 = alpha_i[q1 * n_decays + u1];
           E_sum += alpha_i_j_u * alpha_i_j1_u1 * E_j(j1, u * n_decays + u1);
         }
       }
@@ -112,13 +114,12 @@ void ModelHawkesFixedSumExpKernLeastSq::grad_i(const ulong i,
   if (!weights_computed) TICK_ERROR("Please compute weights before calling hessian_i");
 
   ArrayDouble mu_i = view(coeffs, i * n_baselines, (i + 1) * n_baselines);
-  ulong start_alpha_i = n_nodes * n_baselines + i * n_nodes * n_decays;
-  ulong end_alpha_i = n_nodes * n_baselines + (i + 1) * n_nodes * n_decays;
-  ArrayDouble alpha_i = view(coeffs, start_alpha_i, end_alpha_i);
+  const ulong n_sources = get_n_sources(i);
+  const double *alpha_i = coeffs.data() + get_alpha_start(i);
 
   ArrayDouble grad_mu_i = view(out, i * n_baselines, (i + 1) * n_baselines);
-  ArrayDouble grad_alpha_i = view(out, start_alpha_i, end_alpha_i);
-  grad_alpha_i.init_to_zero();
+  double *grad_alpha_i = out.data() + get_alpha_start(i);
+  for (ulong k = 0; k < n_sources * n_decays; ++k) grad_alpha_i[k] = 0;
 
   ArrayDouble &K_i = K[i];
   for (ulong p = 0; p < n_baselines; ++p) {
@@ -126,14 +127,15 @@ void ModelHawkesFixedSumExpKernLeastSq::grad_i(const ulong i,
   }
 
   ArrayDouble2d &C_i = C[i];
-  for (ulong j = 0; j < n_nodes; ++j) {
+  for (ulong q = 0; q < n_sources; ++q) {
+    const ulong j = get_source(i, q);
     ArrayDouble2d &Dg_j = Dg[j];
     ArrayDouble2d &Dgg_j = Dgg[j];
     ArrayDouble2d &E_j = E[j];
 
     for (ulong u = 0; u < n_decays; ++u) {
-      double alpha_i_j_u = alpha_i[j * n_decays + u];
-      double &grad_alpha_i_j_u = grad_alpha_i[j * n_decays + u];
+      double alpha_i_j_u = alpha_i[q * n_decays + u];
+      double &grad_alpha_i_j_u = grad_alpha_i[q * n_decays + u];
 
       grad_alpha_i_j_u -= 2 * C_i(j, u);
 
@@ -143,13 +145,14 @@ void ModelHawkesFixedSumExpKernLeastSq::grad_i(const ulong i,
       }
 
       for (ulong u1 = 0; u1 < n_decays; ++u1) {
-        double alpha_i_j_u1 = alpha_i[j * n_decays + u1];
+        double alpha_i_j_u1 = alpha_i[q * n_decays + u1];
 
         grad_alpha_i_j_u += 2 * alpha_i_j_u1 * Dgg_j(u , u1);
 
-        for (ulong j1 = 0; j1 < n_nodes; ++j1) {
-          double alpha_i_j1_u1 = alpha_i[j1 * n_decays + u1];
-          double &grad_alpha_i_j1_u1 = grad_alpha_i[j1 * n_decays + u1];
+        for (ulong q1 = 0; q1 < n_sources; ++q1) {
+          const ulong j1 = get_source(i, q1);
+          double alpha_i_j1_u1 = alpha_i[q1 * n_decays + u1];
+          double &grad_alpha_i_j1_u1 = grad_alpha_i[q1 * n_decays + u1];
           double E_j_j1_u_u1 = E_j(j1, u * n_decays + u1);
 
           grad_alpha_i_j_u += 2 * alpha_i_j1_u1 * E_j_j1_u_u1;
@@ -168,9 +171,30 @@ double ModelHawkesFixedSumExpKernLeastSq::loss_and_grad(const ArrayDouble &coeff
   return loss(coeffs);
 }
 
+void ModelHawkesFixedSumExpKernLeastSq::append_events(
+    const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time) {
+  // Weights that are not computed yet will be computed from scratch
+  if (!weights_computed) {
+    append_timestamps(timestamps_chunk, new_end_time);
+    return;
+  }
+
+  const double previous_end_time = end_time;
+  const ArrayULong previous_n_jumps_per_node = append_timestamps(timestamps_chunk, new_end_time);
+  parallel_run(get_n_threads(), n_nodes, &ModelHawkesFixedSumExpKernLeastSq::append_weights_i,
+               this, previous_n_jumps_per_node, previous_end_time);
+}
+
 // Contribution of the ith component to the initialization
 // Computation of the arrays H, Dg, Dg2 and C
 void ModelHawkesFixedSumExpKernLeastSq::compute_weights_i(const ulong i) {
+  ArrayULong n_accounted_jumps(n_nodes);
+  n_accounted_jumps.init_to_zero();
+  accumulate_weights_i(i, n_accounted_jumps);
+}
+
+void ModelHawkesFixedSumExpKernLeastSq::accumulate_weights_i(
+    const ulong i, const ArrayULong &n_accounted_jumps) {
   for (ulong p = 0; p < n_baselines; ++p) {
     // dispatch interval length computation among threads
     if (p % n_nodes == i)
@@ -185,14 +209,23 @@ void ModelHawkesFixedSumExpKernLeastSq::compute_weights_i(const ulong i) {
   ArrayULong l = ArrayULong(n_nodes);
   l.init_to_zero();
 
+  // The kernels are resumed from their values at the last accounted jump of i
+  const ulong first_k = n_accounted_jumps[i];
+  if (first_k > 0) {
+    H = H_last[i];
+    for (ulong j = 0; j < n_nodes; ++j) {
+      l[j] = first_jump_after(*timestamps[j], timestamps_i[first_k - 1]);
+    }
+  }
+  ArrayDouble decayed_jumps_i = view_row(decayed_jumps, i);
+
   ArrayDouble2d &C_i = C[i];
-  ArrayDouble2d &Dg_i = Dg[i];
   ArrayDouble2d &Dgg_i = Dgg[i];
   ArrayDouble2d &E_i = E[i];
   ArrayDouble &K_i = K[i];
 
   ulong N_i = timestamps_i.size();
-  for (ulong k = 0; k < N_i; ++k) {
+  for (ulong k = first_k; k < N_i; ++k) {
     double t_k_i = timestamps_i[k];
 
     const ulong p_interval = get_baseline_interval(t_k_i);
@@ -239,32 +272,127 @@ void ModelHawkesFixedSumExpKernLeastSq::compute_weights_i(const ulong i) {
 
     for (ulong u = 0; u < n_decays; ++u) {
       double decay_u = decays[u];
-      ArrayDouble Dg_i_u = view_row(Dg_i, u);
-      for (ulong p = 0; p < n_baselines; ++p) {
-        ulong n_passed_periods = static_cast<ulong>(std::floor(t_k_i / period_length));
-        double lower = n_passed_periods * period_length + (p * period_length) / n_baselines;
-        while (lower < end_time) {
-          const double shift_lower = std::max(t_k_i, lower);
-          const double upper = std::min(lower + period_length / n_baselines, end_time);
-          if (shift_lower < upper)
-            Dg_i_u[p] += cexp(-decay_u * (shift_lower - t_k_i)) - cexp(-decay_u * (upper - t_k_i));
-          lower += period_length;
-        }
-      }
       for (ulong u1 = 0; u1 < n_decays; ++u1) {
         double decay_u1 = decays[u1];
 
         double ratio = decay_u * decay_u1 / (decay_u + decay_u1);
         Dgg_i(u, u1) += ratio * (1 - cexp(-(decay_u + decay_u1) * (end_time - t_k_i)));
       }
+      decayed_jumps_i[u] += cexp(-decay_u * (end_time - t_k_i));
+    }
+  }
+
+  accumulate_Dg_i(i, first_k);
+
+  if (N_i > first_k) H_last[i] = H;
+}
+
+void ModelHawkesFixedSumExpKernLeastSq::accumulate_Dg_i(const ulong i, const ulong first_k) {
+  const ArrayDouble &timestamps_i = *timestamps[i];
+  const ulong N_i = timestamps_i.size();
+  if (N_i <= first_k) return;
+
+  ArrayDouble2d &Dg_i = Dg[i];
+  const ulong n_decays = decays.size();
+
+  // Intervals of the periods before the first jump have no contribution
+  const ulong first_period = static_cast<ulong>(std::floor(timestamps_i[first_k] / period_length));
+
+  for (ulong u = 0; u < n_decays; ++u) {
+    const double decay_u = decays[u];
+    ArrayDouble Dg_i_u = view_row(Dg_i, u);
+
+    for (ulong p = 0; p < n_baselines; ++p) {
+      // Sum of exp(-decay_u * (time - t_k_i)) over the jumps t_k_i <= time
+      double decayed_sum = 0;
+      double time = timestamps_i[first_k];
+      ulong k = first_k;
+
+      double lower = first_period * period_length + (p * period_length) / n_baselines;
+      while (lower < end_time) {
+        const double upper = std::min(lower + period_length / n_baselines, end_time);
+
+        // Jumps before the interval contribute exp(-decay_u * (lower - t_k_i))
+        // - exp(-decay_u * (upper - t_k_i))
+        while (k < N_i && timestamps_i[k] <= lower) {
+          decayed_sum = decayed_sum * cexp(-decay_u * (timestamps_i[k] - time)) + 1;
+          time = timestamps_i[k];
+          ++k;
+        }
+        decayed_sum *= cexp(-decay_u * (lower - time));
+        time = lower;
+        Dg_i_u[p] += decayed_sum * (1 - cexp(-decay_u * (upper - lower)));
+
+        // Jumps inside the interval contribute 1 - exp(-decay_u * (upper - t_k_i))
+        while (k < N_i && timestamps_i[k] < upper) {
+          Dg_i_u[p] += 1 - cexp(-decay_u * (upper - timestamps_i[k]));
+          decayed_sum = decayed_sum * cexp(-decay_u * (timestamps_i[k] - time)) + 1;
+          time = timestamps_i[k];
+          ++k;
+        }
+
+        lower += period_length;
+      }
+    }
+  }
+}
+
+void ModelHawkesFixedSumExpKernLeastSq::append_weights_i(
+    const ulong i, const ArrayULong &previous_n_jumps_per_node, const double previous_end_time) {
+  const double delta = end_time - previous_end_time;
+  const double n_jumps_i = previous_n_jumps_per_node[i];
+
+  ArrayDouble2d &C_i = C[i];
+  ArrayDouble2d &Dg_i = Dg[i];
+  ArrayDouble2d &Dgg_i = Dgg[i];
+  ArrayDouble2d &E_i = E[i];
+  ArrayDouble decayed_jumps_i = view_row(decayed_jumps, i);
+
+  // Integrals up to the previous end time are extended up to the new one
+  for (ulong j = 0; j < n_nodes; ++j) {
+    for (ulong u = 0; u < n_decays; ++u) {
+      for (ulong u1 = 0; u1 < n_decays; ++u1) {
+        const double decay_sum = decays[u] + decays[u1];
+        const double ratio = decays[u1] / decay_sum;
+        E_i(j, u1 * n_decays + u) += (ratio * C_i(j, u) - E_i(j, u1 * n_decays + u))
+            * (1 - cexp(-decay_sum * delta));
+      }
     }
   }
+
+  for (ulong u = 0; u < n_decays; ++u) {
+    const double decay_u = decays[u];
+    ArrayDouble Dg_i_u = view_row(Dg_i, u);
+    for (ulong p = 0; p < n_baselines; ++p) {
+      ulong n_passed_periods = static_cast<ulong>(std::floor(previous_end_time / period_length));
+      double lower = n_passed_periods * period_length + (p * period_length) / n_baselines;
+      while (lower < end_time) {
+        const double shift_lower = std::max(previous_end_time, lower);
+        const double upper = std::min(lower + period_length / n_baselines, end_time);
+        if (shift_lower < upper)
+          Dg_i_u[p] += decayed_jumps_i[u] * (cexp(-decay_u * (shift_lower - previous_end_time))
+              - cexp(-decay_u * (upper - previous_end_time)));
+        lower += period_length;
+      }
+    }
+
+    for (ulong u1 = 0; u1 < n_decays; ++u1) {
+      const double decay_u1 = decays[u1];
+      const double ratio = decay_u * decay_u1 / (decay_u + decay_u1);
+      Dgg_i(u, u1) += (ratio * n_jumps_i - Dgg_i(u, u1))
+          * (1 - cexp(-(decay_u + decay_u1) * delta));
+    }
+    decayed_jumps_i[u] *= cexp(-decay_u * delta);
+  }
+
+  accumulate_weights_i(i, previous_n_jumps_per_node);
 }
 
 void ModelHawkesFixedSumExpKernLeastSq::allocate_weights() {
   if (n_nodes == 0) {
     TICK_ERROR("Please provide valid timestamps before allocating weights")
   }
+  check_support();
 
   L = ArrayDouble(n_baselines);
   L.init_to_zero();
@@ -286,6 +414,14 @@ void ModelHawkesFixedSumExpKernLeastSq::allocate_weights() {
     K[i] = ArrayDouble(n_baselines);
     K[i].init_to_zero();
   }
+
+  H_last = ArrayDouble2dList1D(n_nodes);
+  for (ulong i = 0; i < n_nodes; ++i) {
+    H_last[i] = ArrayDouble2d(n_nodes, n_decays);
+    H_last[i].init_to_zero();
+  }
+  decayed_jumps = ArrayDouble2d(n_nodes, n_decays);
+  decayed_jumps.init_to_zero();
 }
 
 // Full initialization of the arrays H, Dg, Dg2 and C
@@ -301,7 +437,7 @@ void ModelHawkesFixedSumExpKernLeastSq::compute_weights() {
 }
 
 ulong ModelHawkesFixedSumExpKernLeastSq::get_n_coeffs() const {
-  return n_nodes * n_baselines + n_nodes * n_nodes * n_decays;
+  return n_nodes * n_baselines + get_n_support_pairs() * n_decays;
 }
 
 ulong ModelHawkesFixedSumExpKernLeastSq::get_baseline_interval(const double t) {
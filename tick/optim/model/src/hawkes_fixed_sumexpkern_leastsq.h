@@ -20,6 +20,11 @@ class ModelHawkesFixedSumExpKernLeastSq : public ModelHawkesSingle {
   ArrayDoubleList1D K;
   ArrayDouble2dList1D Dg;
 
+  //! @brief Values of the kernels H at the last jump of each component, and sum of the decayed
+  //! jumps of each component at end_time. They are only needed to append events.
+  ArrayDouble2dList1D H_last;
+  ArrayDouble2d decayed_jumps;
+
   ulong n_baselines;
   double period_length;
 
@@ -54,6 +59,15 @@ class ModelHawkesFixedSumExpKernLeastSq : public ModelHawkesSingle {
    */
   void compute_weights();
 
+  /**
+   * @brief Appends events at the end of the realization and updates the weights incrementally
+   * The contributions of the previous events are extended to the new end time in closed form,
+   * only the new events are visited.
+   * \param timestamps_chunk : new events of each node, all happening after end_time
+   * \param new_end_time : new ending time of the realization
+   */
+  void append_events(const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time);
+
   /**
    * @brief Compute loss
    * \param coeffs : Point in which loss is computed
@@ -110,6 +124,39 @@ class ModelHawkesFixedSumExpKernLeastSq : public ModelHawkesSingle {
    */
   void compute_weights_i(const ulong i);
 
+  /**
+   * @brief Adds the contributions of the jumps of component i that have not been accounted for
+   * yet to its intermediate values
+   * \param i : selected component
+   * \param n_accounted_jumps : number of jumps of each node already accounted for
+   */
+  void accumulate_weights_i(const ulong i, const ArrayULong &n_accounted_jumps);
+
+  /**
+   * @brief Adds the contributions of the jumps of component i from first_k to Dg[i]
+   * \param i : selected component
+   * \param first_k : index of the first jump of i not accounted for yet
+   * \note The intervals of each baseline are visited in chronological order along with the
+   * jumps, with a running sum of their exponentially decayed contributions. Hence the cost is
+   * linear in the number of jumps plus the number of intervals, instead of their product.
+   */
+  void accumulate_Dg_i(const ulong i, const ulong first_k);
+
+  /**
+   * @brief Updates the intermediate values of component i once events have been appended
+   * \param i : selected component
+   * \param previous_n_jumps_per_node : number of jumps of each node before events were appended
+   * \param previous_end_time : end time before events were appended
+   */
+  void append_weights_i(const ulong i, const ArrayULong &previous_n_jumps_per_node,
+                        const double previous_end_time);
+
+  //! @brief Index in coeffs of the first adjacency coefficient of node i. They are stored per
+  //! node exciting i, then per decay
+  inline ulong get_alpha_start(const ulong i) const {
+    return n_nodes * n_baselines + get_support_start(i) * n_decays;
+  }
+
   ulong get_baseline_interval(const double t);
   double get_baseline_interval_length(const ulong interval_p);
 
@@ -3,6 +3,8 @@
 
 #include "hawkes_utils.h"
 
+#include <algorithm>
+
 
 TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &timestamps_list) {
   // Check the number of realizations
@@ -66,3 +68,8 @@ TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &ti
 
   return timestamps_list_descriptor;
 }
+
+ulong first_jump_after(const ArrayDouble &timestamps, const double t) {
+  return std::lower_bound(timestamps.data(), timestamps.data() + timestamps.size(), t)
+      - timestamps.data();
+}
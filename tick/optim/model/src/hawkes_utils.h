@@ -18,4 +18,7 @@ TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &ti
 TimestampListDescriptor describe_timestamps_list(const SArrayDoublePtrList2D &timestamps_list,
                                                  const VArrayDoublePtr end_times);
 
+//! @brief Index of the first jump of the sorted timestamps happening at t or after
+ulong first_jump_after(const ArrayDouble &timestamps, const double t);
+
 #endif  // TICK_OPTIM_MODEL_SRC_HAWKES_UTILS_H_
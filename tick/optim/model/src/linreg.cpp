@@ -6,26 +6,38 @@
 
 #include "linreg.h"
 
-ModelLinReg::ModelLinReg(const SBaseArrayDouble2dPtr features,
-                         const SArrayDoublePtr labels,
-                         const bool fit_intercept,
-                         const int n_threads)
+template <class T>
+TModelLinReg<T>::TModelLinReg(const std::shared_ptr<BaseArray2d<T> > features,
+                              const std::shared_ptr<SArray<T> > labels,
+                              const bool fit_intercept,
+                              const int n_threads)
 
-    : ModelGeneralizedLinear(features,
-                             labels,
-                             fit_intercept,
-                             n_threads),
-      ModelLipschitz() {}
+    : TModelGeneralizedLinear<T>(features,
+                                 labels,
+                                 fit_intercept,
+                                 n_threads),
+      TModelLipschitz<T>() {}
 
-const char *ModelLinReg::get_class_name() const {
+template <class T>
+TModelLinReg<T>::TModelLinReg(
+    const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+    const std::shared_ptr<SArray<T> > labels,
+    const bool fit_intercept,
+    const int n_threads)
+    : TModelGeneralizedLinear<T>(feature_shards, labels, fit_intercept, n_threads),
+      TModelLipschitz<T>() {}
+
+template <class T>
+const char *TModelLinReg<T>::get_class_name() const {
   return "ModelLinReg";
 }
 
-double ModelLinReg::sdca_dual_min_i(const ulong i,
-                                    const ArrayDouble &dual_vector,
-                                    const ArrayDouble &primal_vector,
-                                    const ArrayDouble &previous_delta_dual,
-                                    const double l_l2sq) {
+template <class T>
+double TModelLinReg<T>::sdca_dual_min_i(const ulong i,
+                                        const Array<T> &dual_vector,
+                                        const Array<T> &primal_vector,
+                                        const Array<T> &previous_delta_dual,
+                                        const double l_l2sq) {
   compute_features_norm_sq();
   double normalized_features_norm = features_norm_sq[i] / (l_l2sq * n_samples);
   if (use_intercept()) {
@@ -38,21 +50,22 @@ double ModelLinReg::sdca_dual_min_i(const ulong i,
   return delta_dual;
 }
 
-double ModelLinReg::loss_i(const ulong i,
-                           const ArrayDouble &coeffs) {
-  // Compute x_i^T \beta + b
-  const double z = get_inner_prod(i, coeffs);
-  const double d = get_label(i) - z;
+template <class T>
+double TModelLinReg<T>::loss_i_from_inner_prod(const ulong i,
+                                               const double inner_prod) {
+  // inner_prod is x_i^T \beta + b
+  const double d = get_label(i) - inner_prod;
   return d * d / 2;
 }
 
-double ModelLinReg::grad_i_factor(const ulong i,
-                                  const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
-  return z - get_label(i);
+template <class T>
+double TModelLinReg<T>::grad_i_factor_from_inner_prod(const ulong i,
+                                                      const double inner_prod) {
+  return inner_prod - get_label(i);
 }
 
-void ModelLinReg::compute_lip_consts() {
+template <class T>
+void TModelLinReg<T>::compute_lip_consts() {
   if (ready_lip_consts) {
     return;
   } else {
@@ -67,3 +80,6 @@ void ModelLinReg::compute_lip_consts() {
     }
   }
 }
+
+template class TModelLinReg<double>;
+template class TModelLinReg<float>;
@@ -12,34 +12,55 @@
 
 #include <cereal/types/base_class.hpp>
 
-class ModelLinReg : public ModelGeneralizedLinear, public ModelLipschitz {
+template <class T>
+class TModelLinReg : public TModelGeneralizedLinear<T>, public TModelLipschitz<T> {
+ protected:
+  using TModelGeneralizedLinear<T>::n_samples;
+  using TModelGeneralizedLinear<T>::fit_intercept;
+  using TModelGeneralizedLinear<T>::features_norm_sq;
+  using TModelGeneralizedLinear<T>::compute_features_norm_sq;
+  using TModelGeneralizedLinear<T>::get_inner_prod;
+  using TModelGeneralizedLinear<T>::get_label;
+  using TModelGeneralizedLinear<T>::use_intercept;
+  using TModelLipschitz<T>::ready_lip_consts;
+  using TModelLipschitz<T>::lip_consts;
+
  public:
-  ModelLinReg(const SBaseArrayDouble2dPtr features,
-              const SArrayDoublePtr labels,
-              const bool fit_intercept,
-              const int n_threads = 1);
+  TModelLinReg(const std::shared_ptr<BaseArray2d<T> > features,
+               const std::shared_ptr<SArray<T> > labels,
+               const bool fit_intercept,
+               const int n_threads = 1);
+
+  TModelLinReg(const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+               const std::shared_ptr<SArray<T> > labels,
+               const bool fit_intercept,
+               const int n_threads = 1);
 
   const char *get_class_name() const override;
 
   double sdca_dual_min_i(const ulong i,
-                         const ArrayDouble &dual_vector,
-                         const ArrayDouble &primal_vector,
-                         const ArrayDouble &previous_delta_dual,
+                         const Array<T> &dual_vector,
+                         const Array<T> &primal_vector,
+                         const Array<T> &previous_delta_dual,
                          const double l_l2sq) override;
 
-  double loss_i(const ulong i, const ArrayDouble &coeffs) override;
+  double loss_i_from_inner_prod(const ulong i, const double inner_prod) override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod) override;
 
   void compute_lip_consts() override;
 
   template<class Archive>
   void serialize(Archive & ar) {
-    ar(cereal::make_nvp("ModelGeneralizedLinear", cereal::base_class<ModelGeneralizedLinear>(this)));
-    ar(cereal::make_nvp("ModelLipschitz", cereal::base_class<ModelLipschitz>(this)));
+    ar(cereal::make_nvp("ModelGeneralizedLinear",
+                        cereal::base_class<TModelGeneralizedLinear<T> >(this)));
+    ar(cereal::make_nvp("ModelLipschitz", cereal::base_class<TModelLipschitz<T> >(this)));
   }
 };
 
+typedef TModelLinReg<double> ModelLinReg;
+typedef TModelLinReg<float> ModelLinRegFloat;
+
 CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelLinReg, cereal::specialization::member_serialize)
 
 #endif  // TICK_OPTIM_MODEL_SRC_LINREG_H_
@@ -16,16 +16,16 @@ const char *ModelLinRegWithIntercepts::get_class_name() const {
   return "ModelLinRegWithIntercepts";
 }
 
-double ModelLinRegWithIntercepts::loss_i(const ulong i, const ArrayDouble &coeffs) {
-  // Compute x_i^T \beta + b_i
-  const double z = get_inner_prod(i, coeffs);
-  const double d = get_label(i) - z;
+double ModelLinRegWithIntercepts::loss_i_from_inner_prod(const ulong i,
+                                                         const double inner_prod) {
+  // inner_prod is x_i^T \beta + b_i
+  const double d = get_label(i) - inner_prod;
   return d * d / 2;
 }
 
-double ModelLinRegWithIntercepts::grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
-  return z - get_label(i);
+double ModelLinRegWithIntercepts::grad_i_factor_from_inner_prod(const ulong i,
+                                                                const double inner_prod) {
+  return inner_prod - get_label(i);
 }
 
 void ModelLinRegWithIntercepts::compute_lip_consts() {
@@ -13,12 +13,29 @@
 
 // TODO: labels should be a ArrayInt
 
-class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
+template <class T>
+class TModelLogReg : public TModelGeneralizedLinear<T>, public TModelLipschitz<T> {
+ protected:
+  using TModelGeneralizedLinear<T>::n_samples;
+  using TModelGeneralizedLinear<T>::fit_intercept;
+  using TModelGeneralizedLinear<T>::features_norm_sq;
+  using TModelGeneralizedLinear<T>::compute_features_norm_sq;
+  using TModelGeneralizedLinear<T>::get_inner_prod;
+  using TModelGeneralizedLinear<T>::get_label;
+  using TModelGeneralizedLinear<T>::use_intercept;
+  using TModelLipschitz<T>::ready_lip_consts;
+  using TModelLipschitz<T>::lip_consts;
+
  public:
-  ModelLogReg(const SBaseArrayDouble2dPtr features,
-              const SArrayDoublePtr labels,
-              const bool fit_intercept,
-              const int n_threads = 1);
+  TModelLogReg(const std::shared_ptr<BaseArray2d<T> > features,
+               const std::shared_ptr<SArray<T> > labels,
+               const bool fit_intercept,
+               const int n_threads = 1);
+
+  TModelLogReg(const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+               const std::shared_ptr<SArray<T> > labels,
+               const bool fit_intercept,
+               const int n_threads = 1);
 
   const char *get_class_name() const override;
 
@@ -40,21 +57,24 @@ class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
     }
   }
 
-  static void sigmoid(const ArrayDouble &x, ArrayDouble &out);
+  static void sigmoid(const Array<T> &x, Array<T> &out);
 
-  static void logistic(const ArrayDouble &x, ArrayDouble &out);
+  static void logistic(const Array<T> &x, Array<T> &out);
 
-  double loss_i(const ulong i, const ArrayDouble &coeffs) override;
+  double loss_i_from_inner_prod(const ulong i, const double inner_prod) override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod) override;
 
   double sdca_dual_min_i(const ulong i,
-                         const ArrayDouble &dual_vector,
-                         const ArrayDouble &primal_vector,
-                         const ArrayDouble &previous_delta_dual,
+                         const Array<T> &dual_vector,
+                         const Array<T> &primal_vector,
+                         const Array<T> &previous_delta_dual,
                          const double l_l2sq) override;
 
   void compute_lip_consts() override;
 };
 
+typedef TModelLogReg<double> ModelLogReg;
+typedef TModelLogReg<float> ModelLogRegFloat;
+
 #endif  // TICK_OPTIM_MODEL_SRC_LOGREG_H_
@@ -16,36 +16,69 @@
 // TODO: Model "data" : ModeLabelsFeatures, Model,Model pour les Hawkes
 
 /**
- * @class Model
- * @brief The main Model class from which all models inherit.
+ * @class TModel
+ * @brief The main Model class from which all models inherit. It is templated on the
+ * floating point type of the data and of the coefficients (double or float).
  * @note This class has all methods ever used by any model, hence solvers which are using a
  * pointer on a model should be able to call all methods they need. This is certainly not the
  * best possible design but it is sufficient at the moment.
  */
-class Model {
+template <class T>
+class TModel {
  public:
-  Model() {}
+  TModel() {}
 
   virtual const char *get_class_name() const {
     return "Model";
   }
 
-  virtual double loss_i(const ulong i, const ArrayDouble &coeffs) {
+  virtual double loss_i(const ulong i, const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) {
+  virtual void grad_i(const ulong i, const Array<T> &coeffs, Array<T> &out) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual void grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+  virtual void grad(const Array<T> &coeffs, Array<T> &out) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual double loss(const ArrayDouble &coeffs) {
+  virtual double loss(const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
+  /**
+   * @brief Average of the losses of the samples given by indices
+   * @note The default implementation calls loss_i for each sample. Models should override it
+   * when they can compute it faster for a batch of samples
+   */
+  virtual double loss_batch(const ArrayULong &indices, const Array<T> &coeffs) {
+    double loss = 0;
+    for (ulong k = 0; k < indices.size(); ++k) {
+      loss += loss_i(indices[k], coeffs);
+    }
+    return loss / indices.size();
+  }
+
+  /**
+   * @brief Average of the gradients of the samples given by indices, stored in out
+   * @note The default implementation calls grad_i for each sample. Models should override it
+   * when they can compute it faster for a batch of samples. Generalized linear models use
+   * blocked batch kernels, the Hawkes least-squares models keep this default since the
+   * gradient of one of their nodes is already computed from precomputed weights
+   */
+  virtual void grad_batch(const ArrayULong &indices, const Array<T> &coeffs,
+                          Array<T> &out) {
+    Array<T> grad_k(out.size());
+    out.init_to_zero();
+    for (ulong k = 0; k < indices.size(); ++k) {
+      grad_i(indices[k], coeffs, grad_k);
+      out.mult_incr(grad_k, 1.);
+    }
+    out /= indices.size();
+  }
+
   virtual ulong get_epoch_size() const {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
@@ -65,14 +98,14 @@ class Model {
   }
 
   virtual double sdca_dual_min_i(ulong i,
-                                 const ArrayDouble &dual_vector,
-                                 const ArrayDouble &primal_vector,
-                                 const ArrayDouble &previous_delta_dual,
+                                 const Array<T> &dual_vector,
+                                 const Array<T> &primal_vector,
+                                 const Array<T> &previous_delta_dual,
                                  double l_l2sq) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
-  virtual BaseArrayDouble get_features(const ulong i) const {
+  virtual BaseArray<T> get_features(const ulong i) const {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
@@ -80,11 +113,21 @@ class Model {
     return false;
   }
 
+  /**
+   * @brief Get the index of the first sample of each shard in which the samples are stored,
+   * followed by the number of samples
+   * @note Stochastic solvers use it to sample shards one after the other. An empty array means
+   * that the samples are not split in shards
+   */
+  virtual ArrayULong get_shard_starts() const {
+    return ArrayULong();
+  }
+
   virtual bool use_intercept() const {
     return false;
   }
 
-  virtual double grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
+  virtual double grad_i_factor(const ulong i, const Array<T> &coeffs) {
     TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
   }
 
@@ -109,7 +152,11 @@ class Model {
   }
 };
 
+typedef TModel<double> Model;
+typedef TModel<float> ModelFloat;
+
 typedef std::shared_ptr<Model> ModelPtr;
+typedef std::shared_ptr<ModelFloat> ModelFloatPtr;
 
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_H_
 
@@ -6,44 +6,97 @@
 
 #include "model_generalized_linear.h"
 
-ModelGeneralizedLinear::ModelGeneralizedLinear(const SBaseArrayDouble2dPtr features,
-                                               const SArrayDoublePtr labels,
-                                               const bool fit_intercept,
-                                               const int n_threads)
-    : ModelLabelsFeatures(features, labels),
+template <class T>
+TModelGeneralizedLinear<T>::TModelGeneralizedLinear(
+    const std::shared_ptr<BaseArray2d<T> > features,
+    const std::shared_ptr<SArray<T> > labels,
+    const bool fit_intercept,
+    const int n_threads)
+    : TModelLabelsFeatures<T>(features, labels),
       n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()),
       fit_intercept(fit_intercept),
       ready_features_norm_sq(false) {}
 
-void ModelGeneralizedLinear::compute_features_norm_sq() {
+template <class T>
+TModelGeneralizedLinear<T>::TModelGeneralizedLinear(
+    const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+    const std::shared_ptr<SArray<T> > labels,
+    const bool fit_intercept,
+    const int n_threads)
+    : TModelLabelsFeatures<T>(feature_shards, labels),
+      n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()),
+      fit_intercept(fit_intercept),
+      ready_features_norm_sq(false) {}
+
+template <class T>
+void TModelGeneralizedLinear<T>::compute_features_norm_sq() {
   if (!ready_features_norm_sq) {
     features_norm_sq = ArrayDouble(n_samples);
-    // TODO: How to do it in parallel ? (I'm not sure of how to do it)
-    for (ulong i = 0; i < n_samples; ++i) {
-      features_norm_sq[i] = view_row(*features, i).norm_sq();
+    for (ulong shard = 0; shard < feature_shards.size(); ++shard) {
+      BaseArray2d<T> &shard_features = *feature_shards[shard];
+      ArrayDouble shard_norms_sq = view(features_norm_sq, shard_starts[shard],
+                                        shard_starts[shard] + shard_features.n_rows());
+      parallel_run(n_threads, shard_features.n_rows(),
+                   &TModelGeneralizedLinear<T>::compute_shard_norm_sq_i, this, shard_features,
+                   shard_norms_sq);
     }
     ready_features_norm_sq = true;
   }
 }
 
-const char *ModelGeneralizedLinear::get_class_name() const {
+template <class T>
+void TModelGeneralizedLinear<T>::compute_shard_norm_sq_i(const ulong i, BaseArray2d<T> &shard,
+                                                         ArrayDouble &norms_sq) {
+  norms_sq[i] = view_row(shard, i).norm_sq();
+}
+
+template <class T>
+SArrayDoublePtr TModelGeneralizedLinear<T>::get_features_norm_sq() {
+  compute_features_norm_sq();
+  ArrayDouble features_norm_sq_copy = features_norm_sq;
+  return features_norm_sq_copy.as_sarray_ptr();
+}
+
+template <class T>
+const char *TModelGeneralizedLinear<T>::get_class_name() const {
   return "ModelGeneralizedLinear";
 }
 
-double ModelGeneralizedLinear::grad_i_factor(const ulong i,
-                                             const ArrayDouble &coeffs) {
+template <class T>
+double TModelGeneralizedLinear<T>::loss_i(const ulong i, const Array<T> &coeffs) {
+  return loss_i_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::grad_i_factor(const ulong i,
+                                                 const Array<T> &coeffs) {
+  return grad_i_factor_from_inner_prod(i, get_inner_prod(i, coeffs));
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::loss_i_from_inner_prod(const ulong i,
+                                                          const double inner_prod) {
+  std::stringstream ss;
+  ss << get_class_name() << " does not implement " << __func__;
+  throw std::runtime_error(ss.str());
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::grad_i_factor_from_inner_prod(const ulong i,
+                                                                 const double inner_prod) {
   std::stringstream ss;
   ss << get_class_name() << " does not implement " << __func__;
   throw std::runtime_error(ss.str());
 }
 
-void ModelGeneralizedLinear::compute_grad_i(const ulong i, const ArrayDouble &coeffs,
-                                            ArrayDouble &out, const bool fill) {
-  const BaseArrayDouble x_i = get_features(i);
-  const double alpha_i = grad_i_factor(i, coeffs);
+template <class T>
+void TModelGeneralizedLinear<T>::compute_grad_i(const ulong i, const Array<T> &coeffs,
+                                                Array<T> &out, const bool fill) {
+  const BaseArray<T> x_i = get_features(i);
+  const T alpha_i = grad_i_factor(i, coeffs);
 
   if (fit_intercept) {
-    ArrayDouble out_no_interc = view(out, 0, n_features);
+    Array<T> out_no_interc = view(out, 0, n_features);
 
     if (fill) {
       out_no_interc.mult_fill(x_i, alpha_i);
@@ -62,47 +115,279 @@ void ModelGeneralizedLinear::compute_grad_i(const ulong i, const ArrayDouble &co
   }
 }
 
-void ModelGeneralizedLinear::grad_i(const ulong i, const ArrayDouble &coeffs,
-                                    ArrayDouble &out) {
+template <class T>
+void TModelGeneralizedLinear<T>::grad_i(const ulong i, const Array<T> &coeffs,
+                                        Array<T> &out) {
   compute_grad_i(i, coeffs, out, true);
 }
 
-void ModelGeneralizedLinear::inc_grad_i(const ulong i, ArrayDouble &out,
-                                        const ArrayDouble &coeffs) {
+template <class T>
+void TModelGeneralizedLinear<T>::inc_grad_i(const ulong i, Array<T> &out,
+                                            const Array<T> &coeffs) {
   compute_grad_i(i, coeffs, out, false);
 }
 
-void ModelGeneralizedLinear::grad(const ArrayDouble &coeffs,
-                                  ArrayDouble &out) {
+template <class T>
+void TModelGeneralizedLinear<T>::inc_grad_i_with_factor(const ulong i, const T grad_i_factor,
+                                                        Array<T> &out) {
+  const BaseArray<T> x_i = get_features(i);
+  if (fit_intercept) {
+    Array<T> out_no_interc = view(out, 0, n_features);
+    out_no_interc.mult_incr(x_i, grad_i_factor);
+    out[n_features] += grad_i_factor;
+  } else {
+    out.mult_incr(x_i, grad_i_factor);
+  }
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::grad(const Array<T> &coeffs,
+                                      Array<T> &out) {
+  std::shared_ptr<const InnerProds> inner_prods = get_last_inner_prods(coeffs);
+  if (inner_prods == nullptr) {
+    // Computing the loss along costs no additional pass over the features
+    loss_and_grad(coeffs, out);
+    return;
+  }
+
   out.fill(0.0);
 
-  parallel_map_array<ArrayDouble>(n_threads,
-                                  n_samples,
-                                  [](ArrayDouble &r, const ArrayDouble &s) { r.mult_incr(s, 1.0); },
-                                  &ModelGeneralizedLinear::inc_grad_i,
-                                  this,
-                                  out,
-                                  coeffs);
+  parallel_map_array<Array<T> >(n_threads,
+                                n_samples,
+                                [](Array<T> &r, const Array<T> &s) { r.mult_incr(s, 1.0); },
+                                &TModelGeneralizedLinear<T>::inc_grad_i_with_inner_prods,
+                                this,
+                                out,
+                                inner_prods->values);
 
   double one_over_n_samples = 1.0 / n_samples;
 
   out *= one_over_n_samples;
 }
 
-double ModelGeneralizedLinear::loss(const ArrayDouble &coeffs) {
-  return parallel_map_additive_reduce(n_threads, n_samples, &ModelGeneralizedLinear::loss_i,
-                                      this, coeffs)
+template <class T>
+double TModelGeneralizedLinear<T>::loss(const Array<T> &coeffs) {
+  std::shared_ptr<const InnerProds> inner_prods = get_last_inner_prods(coeffs);
+  if (inner_prods == nullptr) {
+    ArrayDouble values(n_samples);
+    parallel_run(n_threads, n_samples, &TModelGeneralizedLinear<T>::compute_inner_prod_i,
+                 this, coeffs, values);
+    set_last_inner_prods(coeffs, values);
+    inner_prods = get_last_inner_prods(coeffs);
+  }
+  return parallel_map_additive_reduce(n_threads, n_samples,
+                                      &TModelGeneralizedLinear<T>::loss_i_with_inner_prods,
+                                      this, inner_prods->values)
       / n_samples;
 }
 
-double ModelGeneralizedLinear::get_inner_prod(const ulong i, const ArrayDouble &coeffs) const {
-  const BaseArrayDouble x_i = get_features(i);
+template <class T>
+double TModelGeneralizedLinear<T>::loss_and_grad(const Array<T> &coeffs, Array<T> &out) {
+  if (get_last_inner_prods(coeffs) != nullptr) {
+    // The gradient only needs a pass over the features if inner products are known
+    grad(coeffs, out);
+    return loss(coeffs);
+  }
+
+  const ulong n_blocks = std::max<ulong>(1, std::min<ulong>(n_threads, n_samples));
+  std::vector<Array<T> > block_grads(n_blocks, Array<T>(out.size()));
+  ArrayDouble block_losses(n_blocks);
+  ArrayDouble inner_prods(n_samples);
+  parallel_run(n_threads, n_blocks, &TModelGeneralizedLinear<T>::loss_and_grad_block,
+               this, coeffs, block_grads, block_losses, inner_prods);
+
+  out.init_to_zero();
+  for (const Array<T> &block_grad : block_grads) {
+    out.mult_incr(block_grad, 1.);
+  }
+  out /= n_samples;
+
+  set_last_inner_prods(coeffs, inner_prods);
+  return block_losses.sum() / n_samples;
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::loss_and_grad_block(const ulong block,
+                                                     const Array<T> &coeffs,
+                                                     std::vector<Array<T> > &block_grads,
+                                                     ArrayDouble &block_losses,
+                                                     ArrayDouble &inner_prods) {
+  ulong start{}, end{};
+  std::tie(start, end) = tick::get_thread_indices(block, block_grads.size(), n_samples);
+
+  Array<T> &block_grad = block_grads[block];
+  block_grad.init_to_zero();
+  double block_loss = 0;
+  for (ulong i = start; i < end; ++i) {
+    const double inner_prod = get_inner_prod(i, coeffs);
+    inner_prods[i] = inner_prod;
+    block_loss += loss_i_from_inner_prod(i, inner_prod);
+    inc_grad_i_with_factor(i, grad_i_factor_from_inner_prod(i, inner_prod), block_grad);
+  }
+  block_losses[block] = block_loss;
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::compute_inner_prod_i(const ulong i, const Array<T> &coeffs,
+                                                      ArrayDouble &inner_prods) {
+  inner_prods[i] = get_inner_prod(i, coeffs);
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::loss_i_with_inner_prods(const ulong i,
+                                                           const ArrayDouble &inner_prods) {
+  return loss_i_from_inner_prod(i, inner_prods[i]);
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::inc_grad_i_with_inner_prods(const ulong i, Array<T> &out,
+                                                             const ArrayDouble &inner_prods) {
+  inc_grad_i_with_factor(i, grad_i_factor_from_inner_prod(i, inner_prods[i]), out);
+}
+
+template <class T>
+std::shared_ptr<const typename TModelGeneralizedLinear<T>::InnerProds>
+TModelGeneralizedLinear<T>::get_last_inner_prods(const Array<T> &coeffs) const {
+  // Loaded atomically since the model might be used by several threads
+  std::shared_ptr<const InnerProds> inner_prods = std::atomic_load(&last_inner_prods);
+  if (inner_prods != nullptr && inner_prods->coeffs.size() == coeffs.size()
+      && std::equal(coeffs.data(), coeffs.data() + coeffs.size(), inner_prods->coeffs.data())) {
+    return inner_prods;
+  }
+  return nullptr;
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::set_last_inner_prods(const Array<T> &coeffs,
+                                                      ArrayDouble &inner_prods) {
+  std::shared_ptr<InnerProds> new_inner_prods = std::make_shared<InnerProds>();
+  new_inner_prods->coeffs = coeffs;
+  new_inner_prods->values = std::move(inner_prods);
+  std::atomic_store(&last_inner_prods, std::shared_ptr<const InnerProds>(new_inner_prods));
+}
+
+//! Number of features processed at once by the batch kernels, the coefficients and the gradient
+//! of a block staying in cache while going through the rows of the batch
+static const ulong batch_block_size = 512;
+
+template <class T>
+T TModelGeneralizedLinear<T>::get_intercept_i(const ulong i, const Array<T> &coeffs) const {
+  // The last coefficient of coeffs is the intercept
+  return fit_intercept ? coeffs[n_features] : T{0};
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::inc_intercept_grad_i(const ulong i, const T grad_i_factor,
+                                                      Array<T> &out) {
+  if (fit_intercept) out[n_features] += grad_i_factor;
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::compute_batch_inner_prods(const ArrayULong &indices,
+                                                           const Array<T> &coeffs,
+                                                           ArrayDouble &inner_prods) {
+  const ulong batch_size = indices.size();
+  const Array<T> w = view(coeffs, 0, n_features);
+  inner_prods = ArrayDouble(batch_size);
+
+  // Sparse rows are computed at once, dense rows are kept for the blocked pass
+  std::vector<const T *> dense_rows;
+  std::vector<ulong> dense_positions;
+  for (ulong k = 0; k < batch_size; ++k) {
+    const BaseArray<T> x_k = get_features(indices[k]);
+    inner_prods[k] = get_intercept_i(indices[k], coeffs);
+    if (x_k.is_sparse()) {
+      inner_prods[k] += x_k.dot(w);
+    } else {
+      dense_rows.push_back(x_k.data());
+      dense_positions.push_back(k);
+    }
+  }
+
+  const T *w_data = w.data();
+  for (ulong start = 0; start < n_features; start += batch_block_size) {
+    const ulong end = std::min(start + batch_block_size, n_features);
+    for (ulong r = 0; r < dense_rows.size(); ++r) {
+      const T *x_r = dense_rows[r];
+      double block_prod = 0;
+      for (ulong j = start; j < end; ++j) block_prod += x_r[j] * w_data[j];
+      inner_prods[dense_positions[r]] += block_prod;
+    }
+  }
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::inc_grad_batch_with_factors(const ArrayULong &indices,
+                                                             const ArrayDouble &factors,
+                                                             Array<T> &out) {
+  const ulong batch_size = indices.size();
+  Array<T> out_no_interc = view(out, 0, n_features);
+
+  std::vector<const T *> dense_rows;
+  std::vector<T> dense_factors;
+  for (ulong k = 0; k < batch_size; ++k) {
+    const BaseArray<T> x_k = get_features(indices[k]);
+    const T factor = factors[k];
+    inc_intercept_grad_i(indices[k], factor, out);
+    if (x_k.is_sparse()) {
+      out_no_interc.mult_incr(x_k, factor);
+    } else {
+      dense_rows.push_back(x_k.data());
+      dense_factors.push_back(factor);
+    }
+  }
+
+  T *out_data = out_no_interc.data();
+  for (ulong start = 0; start < n_features; start += batch_block_size) {
+    const ulong end = std::min(start + batch_block_size, n_features);
+    for (ulong r = 0; r < dense_rows.size(); ++r) {
+      const T *x_r = dense_rows[r];
+      const T factor = dense_factors[r];
+      for (ulong j = start; j < end; ++j) out_data[j] += factor * x_r[j];
+    }
+  }
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::loss_batch(const ArrayULong &indices,
+                                              const Array<T> &coeffs) {
+  ArrayDouble inner_prods;
+  compute_batch_inner_prods(indices, coeffs, inner_prods);
+  double loss = 0;
+  for (ulong k = 0; k < indices.size(); ++k) {
+    loss += loss_i_from_inner_prod(indices[k], inner_prods[k]);
+  }
+  return loss / indices.size();
+}
+
+template <class T>
+void TModelGeneralizedLinear<T>::grad_batch(const ArrayULong &indices,
+                                            const Array<T> &coeffs,
+                                            Array<T> &out) {
+  const ulong batch_size = indices.size();
+  ArrayDouble factors;
+  compute_batch_inner_prods(indices, coeffs, factors);
+  // The gradient of a sample is its features vector scaled by its gradient factor, the factors
+  // are averaged over the batch before the single update of out
+  for (ulong k = 0; k < batch_size; ++k) {
+    factors[k] = grad_i_factor_from_inner_prod(indices[k], factors[k]) / batch_size;
+  }
+  out.init_to_zero();
+  inc_grad_batch_with_factors(indices, factors, out);
+}
+
+template <class T>
+double TModelGeneralizedLinear<T>::get_inner_prod(const ulong i, const Array<T> &coeffs) const {
+  const BaseArray<T> x_i = get_features(i);
   if (fit_intercept) {
     // The last coefficient of coeffs is the intercept
     const ulong size = coeffs.size();
-    const ArrayDouble w = view(coeffs, 0, size - 1);
+    const Array<T> w = view(coeffs, 0, size - 1);
     return x_i.dot(w) + coeffs[size - 1];
   } else {
     return x_i.dot(coeffs);
   }
 }
+
+template class TModelGeneralizedLinear<double>;
+template class TModelGeneralizedLinear<float>;
@@ -8,8 +8,16 @@
 
 #include "model_labels_features.h"
 
-class ModelGeneralizedLinear : public ModelLabelsFeatures {
+template <class T>
+class TModelGeneralizedLinear : public TModelLabelsFeatures<T> {
  protected:
+  using TModelLabelsFeatures<T>::n_samples;
+  using TModelLabelsFeatures<T>::n_features;
+  using TModelLabelsFeatures<T>::features;
+  using TModelLabelsFeatures<T>::feature_shards;
+  using TModelLabelsFeatures<T>::shard_starts;
+  using TModelLabelsFeatures<T>::get_features;
+
   ArrayDouble features_norm_sq;
 
   unsigned int n_threads;
@@ -24,24 +32,97 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
    * @param fill : If `true` out will be filled by the gradient value, otherwise out will be
    * inceremented by the gradient value.
    */
-  virtual void compute_grad_i(const ulong i, const ArrayDouble &coeffs,
-                              ArrayDouble &out, const bool fill);
+  virtual void compute_grad_i(const ulong i, const Array<T> &coeffs,
+                              Array<T> &out, const bool fill);
+
+  /**
+   * Increments out with the gradient of the ith observation, given its gradient factor
+   */
+  virtual void inc_grad_i_with_factor(const ulong i, const T grad_i_factor, Array<T> &out);
+
+  //! Part of the inner product of the ith observation that does not depend on its features,
+  //! namely the intercept
+  virtual T get_intercept_i(const ulong i, const Array<T> &coeffs) const;
+
+  //! Increments out with the gradient of the part of the ith inner product that does not depend
+  //! on its features, given its gradient factor
+  virtual void inc_intercept_grad_i(const ulong i, const T grad_i_factor, Array<T> &out);
+
+  //! Inner products of all observations with the coefficients they were computed at
+  struct InnerProds {
+    Array<T> coeffs;
+    ArrayDouble values;
+  };
+
+  //! Inner products computed by the last call to loss or loss_and_grad. They are reused when
+  //! the loss or gradient is computed again at the same coefficients, as in the line searches
+  //! of first order solvers
+  std::shared_ptr<const InnerProds> last_inner_prods;
+
+  //! Gets the last inner products if they were computed at coeffs, nullptr otherwise
+  std::shared_ptr<const InnerProds> get_last_inner_prods(const Array<T> &coeffs) const;
+
+  void set_last_inner_prods(const Array<T> &coeffs, ArrayDouble &inner_prods);
 
     bool ready_features_norm_sq;
 
     void compute_features_norm_sq();
 
+ private:
+  void compute_shard_norm_sq_i(const ulong i, BaseArray2d<T> &shard, ArrayDouble &norms_sq);
+
+  void compute_inner_prod_i(const ulong i, const Array<T> &coeffs, ArrayDouble &inner_prods);
+
+  double loss_i_with_inner_prods(const ulong i, const ArrayDouble &inner_prods);
+
+  void inc_grad_i_with_inner_prods(const ulong i, Array<T> &out, const ArrayDouble &inner_prods);
+
+  //! Computes the inner products of the observations of a batch with the coefficients. Dense
+  //! rows are visited block of features by block of features, such that the coefficients of a
+  //! block stay in cache for all the rows of the batch
+  void compute_batch_inner_prods(const ArrayULong &indices, const Array<T> &coeffs,
+                                 ArrayDouble &inner_prods);
+
+  //! Increments out with the sum of the features of the observations of a batch scaled by their
+  //! factors, in a single pass blocked like compute_batch_inner_prods
+  void inc_grad_batch_with_factors(const ArrayULong &indices, const ArrayDouble &factors,
+                                   Array<T> &out);
+
+  //! Accumulates the losses and gradients of the observations of a block (one per thread) in a
+  //! single pass over their features, storing their inner products
+  void loss_and_grad_block(const ulong block, const Array<T> &coeffs,
+                           std::vector<Array<T> > &block_grads, ArrayDouble &block_losses,
+                           ArrayDouble &inner_prods);
+
  public:
-  ModelGeneralizedLinear(const SBaseArrayDouble2dPtr features,
-                         const SArrayDoublePtr labels,
-                         const bool fit_intercept,
-                         const int n_threads = 1);
+  TModelGeneralizedLinear(const std::shared_ptr<BaseArray2d<T> > features,
+                          const std::shared_ptr<SArray<T> > labels,
+                          const bool fit_intercept,
+                          const int n_threads = 1);
+
+  TModelGeneralizedLinear(const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+                          const std::shared_ptr<SArray<T> > labels,
+                          const bool fit_intercept,
+                          const int n_threads = 1);
 
   const char *get_class_name() const override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  double loss_i(const ulong i, const Array<T> &coeffs) override;
+
+  double grad_i_factor(const ulong i, const Array<T> &coeffs) override;
 
-  void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) override;
+  /**
+   * @brief Loss of the ith observation, given its inner product with the coefficients
+   */
+  virtual double loss_i_from_inner_prod(const ulong i, const double inner_prod);
+
+  /**
+   * @brief Gradient factor of the ith observation, given its inner product with the
+   * coefficients
+   */
+  virtual double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod);
+
+  void grad_i(const ulong i, const Array<T> &coeffs, Array<T> &out) override;
 
   /**
    * To be used by grad(ArrayDouble&, ArrayDouble&) to calculate grad by incrementally
@@ -49,11 +130,31 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
    * out and coeffs are not in the same order as in grad_i as this is necessary for
    * parallel_map_array
    */
-  virtual void inc_grad_i(const ulong i, ArrayDouble &out, const ArrayDouble &coeffs);
+  virtual void inc_grad_i(const ulong i, Array<T> &out, const Array<T> &coeffs);
 
-  void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
+  void grad(const Array<T> &coeffs, Array<T> &out) override;
 
-  double loss(const ArrayDouble &coeffs) override;
+  double loss(const Array<T> &coeffs) override;
+
+  /**
+   * @brief Computes the loss and the gradient in a single pass over the features, stored in out
+   * @return The loss
+   */
+  virtual double loss_and_grad(const Array<T> &coeffs, Array<T> &out);
+
+  /**
+   * @brief Average of the losses of the samples given by indices, computed from their inner
+   * products with the blocked batch kernel
+   */
+  double loss_batch(const ArrayULong &indices, const Array<T> &coeffs) override;
+
+  /**
+   * @brief Average of the gradients of the samples given by indices, stored in out. The inner
+   * products of the batch are computed first, then the gradient is updated in a single fused
+   * pass over the features of the batch
+   */
+  void grad_batch(const ArrayULong &indices, const Array<T> &coeffs,
+                  Array<T> &out) override;
 
   bool use_intercept() const override {
     return fit_intercept;
@@ -64,10 +165,10 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
   }
 
   ulong get_n_coeffs() const override {
-    return get_n_features() + static_cast<int>(fit_intercept);
+    return this->get_n_features() + static_cast<int>(fit_intercept);
   }
 
-  virtual double get_inner_prod(const ulong i, const ArrayDouble &coeffs) const;
+  virtual double get_inner_prod(const ulong i, const Array<T> &coeffs) const;
 
   virtual void set_fit_intercept(const bool fit_intercept) {
     this->fit_intercept = fit_intercept;
@@ -77,15 +178,25 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
     return fit_intercept;
   }
 
+  /**
+   * @brief Get the squared norms of the rows of the features
+   * @note They are computed with n_threads threads at the first call and kept by the model
+   */
+  SArrayDoublePtr get_features_norm_sq();
+
   template<class Archive>
   void serialize(Archive & ar) {
-    ar(cereal::make_nvp("ModelLabelsFeatures", cereal::base_class<ModelLabelsFeatures>(this)));
+    ar(cereal::make_nvp("ModelLabelsFeatures",
+                        cereal::base_class<TModelLabelsFeatures<T> >(this)));
     ar(CEREAL_NVP(features_norm_sq));
     ar(CEREAL_NVP(fit_intercept));
     ar(CEREAL_NVP(ready_features_norm_sq));
   }
 };
 
+typedef TModelGeneralizedLinear<double> ModelGeneralizedLinear;
+typedef TModelGeneralizedLinear<float> ModelGeneralizedLinearFloat;
+
 CEREAL_SPECIALIZE_FOR_ALL_ARCHIVES(ModelGeneralizedLinear, cereal::specialization::member_serialize)
 
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_GENERALIZED_LINEAR_H_
@@ -41,24 +41,22 @@ void ModelGeneralizedLinearWithIntercepts::compute_grad_i(const ulong i, const A
   }
 }
 
-void ModelGeneralizedLinearWithIntercepts::grad(const ArrayDouble &coeffs,
-                                                ArrayDouble &out) {
-  out.fill(0.0);
-  parallel_map_array<ArrayDouble>(n_threads,
-                                  n_samples,
-                                  [](ArrayDouble &r, const ArrayDouble &s) { r.mult_incr(s, 1.0); },
-                                  &ModelGeneralizedLinearWithIntercepts::inc_grad_i,
-                                  this,
-                                  out,
-                                  coeffs);
+void ModelGeneralizedLinearWithIntercepts::inc_grad_i_with_factor(const ulong i,
+                                                                  const double grad_i_factor,
+                                                                  ArrayDouble &out) {
+  const BaseArrayDouble x_i = get_features(i);
+  ArrayDouble out_no_interc = view(out, 0, n_features);
+  out_no_interc.mult_incr(x_i, grad_i_factor);
+  out[n_features + i] += grad_i_factor;
+}
 
-  const double one_over_n_samples = 1.0 / n_samples;
-  out *= one_over_n_samples;
+double ModelGeneralizedLinearWithIntercepts::get_intercept_i(const ulong i,
+                                                             const ArrayDouble &coeffs) const {
+  return coeffs[n_features + i];
 }
 
-double ModelGeneralizedLinearWithIntercepts::loss(const ArrayDouble &coeffs) {
-  return parallel_map_additive_reduce(n_threads, n_samples,
-                                      &ModelGeneralizedLinearWithIntercepts::loss_i,
-                                      this, coeffs)
-      / n_samples;
+void ModelGeneralizedLinearWithIntercepts::inc_intercept_grad_i(const ulong i,
+                                                                const double grad_i_factor,
+                                                                ArrayDouble &out) {
+  out[n_features + i] += grad_i_factor;
 }
@@ -22,6 +22,14 @@ class ModelGeneralizedLinearWithIntercepts : public ModelGeneralizedLinear {
   void compute_grad_i(const ulong i, const ArrayDouble &coeffs,
                       ArrayDouble &out, const bool fill) override;
 
+  void inc_grad_i_with_factor(const ulong i, const double grad_i_factor,
+                              ArrayDouble &out) override;
+
+  double get_intercept_i(const ulong i, const ArrayDouble &coeffs) const override;
+
+  void inc_intercept_grad_i(const ulong i, const double grad_i_factor,
+                            ArrayDouble &out) override;
+
  public:
   ModelGeneralizedLinearWithIntercepts(const SBaseArrayDouble2dPtr features,
                                        const SArrayDoublePtr labels,
@@ -29,10 +37,6 @@ class ModelGeneralizedLinearWithIntercepts : public ModelGeneralizedLinear {
 
   const char *get_class_name() const override;
 
-  void grad(const ArrayDouble &coeffs, ArrayDouble &out) override;
-
-  double loss(const ArrayDouble &coeffs) override;
-
   double get_inner_prod(const ulong i, const ArrayDouble &coeffs) const override;
 
   ulong get_n_coeffs() const override {
@@ -6,8 +6,9 @@
 
 #include "model_labels_features.h"
 
-ModelLabelsFeatures::ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
-                                         SArrayDoublePtr labels)
+template <class T>
+TModelLabelsFeatures<T>::TModelLabelsFeatures(std::shared_ptr<BaseArray2d<T> > features,
+                                              std::shared_ptr<SArray<T> > labels)
     : n_samples(labels.get() ? labels->size() : 0),
       n_features(features.get() ? features->n_cols() : 0),
       labels(labels),
@@ -18,4 +19,51 @@ ModelLabelsFeatures::ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
     ss << " while the features matrix has " << features->n_rows() << " rows.";
     throw std::invalid_argument(ss.str());
   }
+  feature_shards = {features};
+  init_shard_starts();
 }
+
+template <class T>
+TModelLabelsFeatures<T>::TModelLabelsFeatures(
+    const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+    std::shared_ptr<SArray<T> > labels)
+    : n_samples(labels.get() ? labels->size() : 0),
+      labels(labels),
+      feature_shards(feature_shards) {
+  if (feature_shards.empty()) {
+    throw std::invalid_argument("In ModelLabelsFeatures, features must have at least one shard");
+  }
+  features = feature_shards[0];
+  n_features = features->n_cols();
+  for (ulong k = 1; k < feature_shards.size(); ++k) {
+    if (feature_shards[k]->n_cols() != n_features
+        || feature_shards[k]->is_sparse() != features->is_sparse()) {
+      std::stringstream ss;
+      ss << "In ModelLabelsFeatures, shard " << k << " has " << feature_shards[k]->n_cols();
+      ss << " columns (sparse=" << feature_shards[k]->is_sparse() << ") while shard 0 has ";
+      ss << n_features << " columns (sparse=" << features->is_sparse() << ").";
+      throw std::invalid_argument(ss.str());
+    }
+  }
+  init_shard_starts();
+  const ulong n_rows = shard_starts[feature_shards.size()];
+  if (labels.get() && labels->size() != n_rows) {
+    std::stringstream ss;
+    ss << "In ModelLabelsFeatures, number of labels is " << labels->size();
+    ss << " while the features shards have " << n_rows << " rows.";
+    throw std::invalid_argument(ss.str());
+  }
+}
+
+template <class T>
+void TModelLabelsFeatures<T>::init_shard_starts() {
+  shard_starts = ArrayULong(feature_shards.size() + 1);
+  shard_starts[0] = 0;
+  for (ulong k = 0; k < feature_shards.size(); ++k) {
+    const ulong n_rows = feature_shards[k].get() ? feature_shards[k]->n_rows() : 0;
+    shard_starts[k + 1] = shard_starts[k] + n_rows;
+  }
+}
+
+template class TModelLabelsFeatures<double>;
+template class TModelLabelsFeatures<float>;
@@ -9,21 +9,44 @@
 
 #include "model.h"
 
+#include <algorithm>
 #include <iostream>
+#include <vector>
 
-class ModelLabelsFeatures : public virtual Model {
+template <class T>
+class TModelLabelsFeatures : public virtual TModel<T> {
  protected:
   ulong n_samples, n_features;
 
   //! Labels vector
-  SArrayDoublePtr labels;
+  std::shared_ptr<SArray<T> > labels;
 
-  //! Features matrix (either sparse or not)
-  SBaseArrayDouble2dPtr features;
+  //! Features matrix (either sparse or not). If features are split in shards, this is the
+  //! first shard
+  std::shared_ptr<BaseArray2d<T> > features;
+
+  //! Blocks of consecutive rows of the features matrix, stored separately (they might be
+  //! memory mapped from different files). It only contains features if they are not split
+  std::vector<std::shared_ptr<BaseArray2d<T> > > feature_shards;
+
+  //! Index of the first row of each shard, followed by n_samples
+  ArrayULong shard_starts;
+
+  //! Sets shard_starts from the number of rows of the shards and checks they are consistent
+  void init_shard_starts();
+
+  //! Index of the shard containing the i-th sample
+  inline ulong get_shard(ulong i) const {
+    const ulong *starts = shard_starts.data();
+    return std::upper_bound(starts, starts + shard_starts.size(), i) - starts - 1;
+  }
 
  public:
-  ModelLabelsFeatures(SBaseArrayDouble2dPtr features,
-                      SArrayDoublePtr labels);
+  TModelLabelsFeatures(std::shared_ptr<BaseArray2d<T> > features,
+                       std::shared_ptr<SArray<T> > labels);
+
+  TModelLabelsFeatures(const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+                       std::shared_ptr<SArray<T> > labels);
 
   const char *get_class_name() const override {
     return "ModelLabelsFeatures";
@@ -38,8 +61,20 @@ class ModelLabelsFeatures : public virtual Model {
   }
 
   // TODO: add consts
-  BaseArrayDouble get_features(ulong i) const override {
-    return view_row(*features, i);
+  BaseArray<T> get_features(ulong i) const override {
+    if (feature_shards.size() == 1) {
+      return view_row(*features, i);
+    }
+    const ulong shard = get_shard(i);
+    return view_row(*feature_shards[shard], i - shard_starts[shard]);
+  }
+
+  ulong get_n_shards() const {
+    return feature_shards.size();
+  }
+
+  ArrayULong get_shard_starts() const override {
+    return shard_starts;
   }
 
   virtual double get_label(ulong i) const {
@@ -58,21 +93,30 @@ class ModelLabelsFeatures : public virtual Model {
   void load(Archive & ar) {
     ar(CEREAL_NVP(n_samples) );
 
-    ArrayDouble temp_labels;
-    ArrayDouble2d temp_features;
+    Array<T> temp_labels;
+    Array2d<T> temp_features;
     ar(cereal::make_nvp("labels", temp_labels));
     ar(cereal::make_nvp("features", temp_features));
 
     labels = temp_labels.as_sarray_ptr();
     features = temp_features.as_sarray2d_ptr();
+    feature_shards = {features};
+    init_shard_starts();
   }
 
   template<class Archive>
   void save(Archive & ar) const {
+    if (feature_shards.size() > 1) {
+      TICK_ERROR(get_class_name() << " cannot be serialized when its features are split in "
+                                  << feature_shards.size() << " shards");
+    }
     ar(CEREAL_NVP(n_samples));
     ar(cereal::make_nvp("labels", *labels));
     ar(cereal::make_nvp("features", *features));
   }
 };
 
+typedef TModelLabelsFeatures<double> ModelLabelsFeatures;
+typedef TModelLabelsFeatures<float> ModelLabelsFeaturesFloat;
+
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_LABELS_FEATURES_H_
@@ -6,7 +6,8 @@
 
 #include "model_lipschitz.h"
 
-ModelLipschitz::ModelLipschitz() : Model() {
+template <class T>
+TModelLipschitz<T>::TModelLipschitz() : TModel<T>() {
   ready_lip_consts = false;
   ready_lip_max = false;
   ready_lip_mean = false;
@@ -14,25 +15,30 @@ ModelLipschitz::ModelLipschitz() : Model() {
   lip_max = 0;
 }
 
-double ModelLipschitz::get_lip_max() {
+template <class T>
+double TModelLipschitz<T>::get_lip_max() {
   if (ready_lip_max) {
     return lip_max;
   } else {
-    compute_lip_consts();
+    this->compute_lip_consts();
     lip_max = lip_consts.max();
     ready_lip_max = true;
     return lip_max;
   }
 }
 
-double ModelLipschitz::get_lip_mean() {
+template <class T>
+double TModelLipschitz<T>::get_lip_mean() {
   if (ready_lip_mean) {
     return lip_mean;
   } else {
-    compute_lip_consts();
+    this->compute_lip_consts();
     // TODO: no mean method in array.h, really ?!?
     lip_mean = lip_consts.sum() / lip_consts.size();
     ready_lip_mean = true;
     return lip_mean;
   }
 }
+
+template class TModelLipschitz<double>;
+template class TModelLipschitz<float>;
@@ -10,10 +10,11 @@
 #include "model.h"
 
 /**
- * \class ModelLipschitz
+ * \class TModelLipschitz
  * \brief An interface for a Model with the ability to compute Lipschitz constants
  */
-class ModelLipschitz : public virtual Model {
+template <class T>
+class TModelLipschitz : public virtual TModel<T> {
  protected:
   //! True if all lipschitz constants are already computed
   bool ready_lip_consts;
@@ -31,7 +32,7 @@ class ModelLipschitz : public virtual Model {
   double lip_mean, lip_max;
 
  public:
-  ModelLipschitz();
+  TModelLipschitz();
 
   const char *get_class_name() const override {
     return "ModelLipchitz";
@@ -60,4 +61,7 @@ class ModelLipschitz : public virtual Model {
   }
 };
 
+typedef TModelLipschitz<double> ModelLipschitz;
+typedef TModelLipschitz<float> ModelLipschitzFloat;
+
 #endif  // TICK_OPTIM_MODEL_SRC_MODEL_LIPSCHITZ_H_
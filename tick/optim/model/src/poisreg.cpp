@@ -6,25 +6,37 @@
 
 #include "poisreg.h"
 
-ModelPoisReg::ModelPoisReg(const SBaseArrayDouble2dPtr features,
-                           const SArrayDoublePtr labels,
-                           const LinkType link_type,
-                           const bool fit_intercept,
-                           const int n_threads)
-    : ModelGeneralizedLinear(features,
-                             labels,
-                             fit_intercept,
-                             n_threads),
+template <class T>
+TModelPoisReg<T>::TModelPoisReg(const std::shared_ptr<BaseArray2d<T> > features,
+                                const std::shared_ptr<SArray<T> > labels,
+                                const LinkType link_type,
+                                const bool fit_intercept,
+                                const int n_threads)
+    : TModelGeneralizedLinear<T>(features,
+                                 labels,
+                                 fit_intercept,
+                                 n_threads),
+      link_type(link_type) {}
+
+template <class T>
+TModelPoisReg<T>::TModelPoisReg(
+    const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+    const std::shared_ptr<SArray<T> > labels,
+    const LinkType link_type,
+    const bool fit_intercept,
+    const int n_threads)
+    : TModelGeneralizedLinear<T>(feature_shards, labels, fit_intercept, n_threads),
       link_type(link_type) {}
 
 // TODO: Add all the methods for first order computation
 
 
-double ModelPoisReg::sdca_dual_min_i(const ulong i,
-                                     const ArrayDouble &dual_vector,
-                                     const ArrayDouble &primal_vector,
-                                     const ArrayDouble &previous_delta_dual,
-                                     const double l_l2sq) {
+template <class T>
+double TModelPoisReg<T>::sdca_dual_min_i(const ulong i,
+                                         const Array<T> &dual_vector,
+                                         const Array<T> &primal_vector,
+                                         const Array<T> &previous_delta_dual,
+                                         const double l_l2sq) {
   if (link_type == LinkType::identity) {
     throw std::invalid_argument("SDCA not implemented for identity link");
   }
@@ -77,8 +89,8 @@ double ModelPoisReg::sdca_dual_min_i(const ulong i,
   return delta_dual;
 }
 
-double ModelPoisReg::loss_i(const ulong i, const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
+template <class T>
+double TModelPoisReg<T>::loss_i_from_inner_prod(const ulong i, const double z) {
   switch (link_type) {
     case LinkType::exponential: {
       double y_i = get_label(i);
@@ -92,8 +104,8 @@ double ModelPoisReg::loss_i(const ulong i, const ArrayDouble &coeffs) {
   }
 }
 
-double ModelPoisReg::grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
-  const double z = get_inner_prod(i, coeffs);
+template <class T>
+double TModelPoisReg<T>::grad_i_factor_from_inner_prod(const ulong i, const double z) {
   switch (link_type) {
     case LinkType::exponential: {
       return exp(z) - get_label(i);
@@ -104,3 +116,6 @@ double ModelPoisReg::grad_i_factor(const ulong i, const ArrayDouble &coeffs) {
     default:throw std::runtime_error("Undefined link type");
   }
 }
+
+template class TModelPoisReg<double>;
+template class TModelPoisReg<float>;
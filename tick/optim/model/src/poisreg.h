@@ -17,34 +17,51 @@ enum class LinkType {
   exponential
 };
 
-class ModelPoisReg : public ModelGeneralizedLinear {
+template <class T>
+class TModelPoisReg : public TModelGeneralizedLinear<T> {
  private:
+  using TModelGeneralizedLinear<T>::n_samples;
+  using TModelGeneralizedLinear<T>::features_norm_sq;
+  using TModelGeneralizedLinear<T>::compute_features_norm_sq;
+  using TModelGeneralizedLinear<T>::get_inner_prod;
+  using TModelGeneralizedLinear<T>::get_label;
+  using TModelGeneralizedLinear<T>::use_intercept;
+
   LinkType link_type;
 
  public:
-  ModelPoisReg(const SBaseArrayDouble2dPtr features,
-               const SArrayDoublePtr labels,
-               const LinkType link_type,
-               const bool fit_intercept,
-               const int n_threads = 1);
+  TModelPoisReg(const std::shared_ptr<BaseArray2d<T> > features,
+                const std::shared_ptr<SArray<T> > labels,
+                const LinkType link_type,
+                const bool fit_intercept,
+                const int n_threads = 1);
+
+  TModelPoisReg(const std::vector<std::shared_ptr<BaseArray2d<T> > > &feature_shards,
+                const std::shared_ptr<SArray<T> > labels,
+                const LinkType link_type,
+                const bool fit_intercept,
+                const int n_threads = 1);
 
   const char *get_class_name() const override {
     return "ModelPoisReg";
   }
 
   double sdca_dual_min_i(const ulong i,
-                         const ArrayDouble &dual_vector,
-                         const ArrayDouble &primal_vector,
-                         const ArrayDouble &previous_delta_dual,
+                         const Array<T> &dual_vector,
+                         const Array<T> &primal_vector,
+                         const Array<T> &previous_delta_dual,
                          const double l_l2sq) override;
 
-  double loss_i(const ulong i, const ArrayDouble &coeffs) override;
+  double loss_i_from_inner_prod(const ulong i, const double inner_prod) override;
 
-  double grad_i_factor(const ulong i, const ArrayDouble &coeffs) override;
+  double grad_i_factor_from_inner_prod(const ulong i, const double inner_prod) override;
 
   virtual void set_link_type(const LinkType link_type) {
     this->link_type = link_type;
   }
 };
 
+typedef TModelPoisReg<double> ModelPoisReg;
+typedef TModelPoisReg<float> ModelPoisRegFloat;
+
 #endif  // TICK_OPTIM_MODEL_SRC_POISREG_H_
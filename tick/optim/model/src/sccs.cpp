@@ -13,7 +13,8 @@
 ModelSCCS::ModelSCCS(const SBaseArrayDouble2dPtrList1D &features,
                      const SArrayIntPtrList1D &labels,
                      const SBaseArrayULongPtr censoring,
-                     ulong n_lags)
+                     ulong n_lags,
+                     const int n_threads)
     : n_intervals(features[0]->n_rows()),
       n_lags(n_lags),
       n_samples(features.size()),
@@ -22,7 +23,8 @@ ModelSCCS::ModelSCCS(const SBaseArrayDouble2dPtrList1D &features,
       n_features(n_lags > 0 ? n_lagged_features / (n_lags + 1) : n_lagged_features),
       labels(labels),
       features(features),
-      censoring(censoring) {
+      censoring(censoring),
+      n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()) {
   if (n_lags >= n_intervals)
     TICK_ERROR("ModelSCCS requires n_lags < n_intervals");
 
@@ -45,80 +47,176 @@ ModelSCCS::ModelSCCS(const SBaseArrayDouble2dPtrList1D &features,
 }
 
 double ModelSCCS::loss(const ArrayDouble &coeffs) {
-  double loss = 0;
-  for (ulong i = 0; i < n_samples; ++i)
-    loss += loss_i(i, coeffs);
-
-  return loss / n_samples;
+  std::shared_ptr<const InnerProds> inner_prods = get_last_inner_prods(coeffs);
+  if (inner_prods == nullptr) {
+    ArrayDouble values(n_samples * n_intervals);
+    parallel_run(n_threads, n_samples, &ModelSCCS::compute_inner_prods_i, this, coeffs, values);
+    set_last_inner_prods(coeffs, values);
+    inner_prods = get_last_inner_prods(coeffs);
+  }
+  return parallel_map_additive_reduce(n_threads, n_samples, &ModelSCCS::loss_i_with_inner_prods,
+                                      this, inner_prods->values)
+      / n_samples;
 }
 
 double ModelSCCS::loss_i(const ulong i, const ArrayDouble &coeffs) {
-  double loss = 0;
-  ArrayDouble inner_prod(n_intervals), softmax(n_intervals);
-  ulong max_interval = get_max_interval(i);
-
-  for (ulong t = 0; t < max_interval; t++)
-    inner_prod[t] = get_inner_prod(i, t, coeffs);
-  for (ulong t = max_interval; t < n_intervals; t++)
-    inner_prod[t] = 0;
-
-  softMax(inner_prod, softmax);
-
-  for (ulong t = 0; t < max_interval; t++)
-    loss -= get_longitudinal_label(i, t) * log(softmax[t]);
-
-  return loss;
+  ArrayDouble inner_prods(n_intervals);
+  compute_inner_prods(i, coeffs, inner_prods);
+  return loss_i_from_inner_prods(i, inner_prods);
 }
 
 void ModelSCCS::grad(const ArrayDouble &coeffs, ArrayDouble &out) {
-  out.init_to_zero();
-  ArrayDouble buffer(out.size());  // is init to 0 in grad_i
-
-  for (ulong i = 0; i < n_samples; ++i) {
-    grad_i(i, coeffs, buffer);
-    out.mult_incr(buffer, 1);
+  std::shared_ptr<const InnerProds> inner_prods = get_last_inner_prods(coeffs);
+  if (inner_prods == nullptr) {
+    // Computing the loss along costs no additional pass over the features
+    loss_and_grad(coeffs, out);
+    return;
   }
 
-  for (ulong j = 0; j < out.size(); ++j) {
-    out[j] /= n_samples;
-  }
+  out.init_to_zero();
+  parallel_map_array<ArrayDouble>(n_threads,
+                                  n_samples,
+                                  [](ArrayDouble &r, const ArrayDouble &s) { r.mult_incr(s, 1.0); },
+                                  &ModelSCCS::inc_grad_i_with_inner_prods,
+                                  this,
+                                  out,
+                                  inner_prods->values);
+  out /= n_samples;
 }
 
 void ModelSCCS::grad_i(const ulong i,
                        const ArrayDouble &coeffs,
                        ArrayDouble &out) {
   out.init_to_zero();
-  ArrayDouble inner_prod(n_intervals);
-  ArrayDouble buffer(n_lagged_features);
-  buffer.init_to_zero();
-  ulong max_interval = get_max_interval(i);
+  ArrayDouble inner_prods(n_intervals);
+  compute_inner_prods(i, coeffs, inner_prods);
+  inc_grad_i_from_inner_prods(i, inner_prods, out);
+}
+
+double ModelSCCS::loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out) {
+  if (get_last_inner_prods(coeffs) != nullptr) {
+    // The gradient only needs a pass over the features if inner products are known
+    grad(coeffs, out);
+    return loss(coeffs);
+  }
+
+  const ulong n_blocks = std::max<ulong>(1, std::min<ulong>(n_threads, n_samples));
+  std::vector<ArrayDouble> block_grads(n_blocks, ArrayDouble(out.size()));
+  ArrayDouble block_losses(n_blocks);
+  ArrayDouble inner_prods(n_samples * n_intervals);
+  parallel_run(n_threads, n_blocks, &ModelSCCS::loss_and_grad_block,
+               this, coeffs, block_grads, block_losses, inner_prods);
+
+  out.init_to_zero();
+  for (const ArrayDouble &block_grad : block_grads) {
+    out.mult_incr(block_grad, 1.);
+  }
+  out /= n_samples;
+
+  set_last_inner_prods(coeffs, inner_prods);
+  return block_losses.sum() / n_samples;
+}
 
+void ModelSCCS::loss_and_grad_block(const ulong block,
+                                    const ArrayDouble &coeffs,
+                                    std::vector<ArrayDouble> &block_grads,
+                                    ArrayDouble &block_losses,
+                                    ArrayDouble &inner_prods) {
+  ulong start{}, end{};
+  std::tie(start, end) = tick::get_thread_indices(block, block_grads.size(), n_samples);
+
+  ArrayDouble &block_grad = block_grads[block];
+  block_grad.init_to_zero();
+  double block_loss = 0;
+  for (ulong i = start; i < end; ++i) {
+    ArrayDouble inner_prods_i = view(inner_prods, i * n_intervals, (i + 1) * n_intervals);
+    compute_inner_prods(i, coeffs, inner_prods_i);
+    block_loss += loss_i_from_inner_prods(i, inner_prods_i);
+    inc_grad_i_from_inner_prods(i, inner_prods_i, block_grad);
+  }
+  block_losses[block] = block_loss;
+}
+
+void ModelSCCS::compute_inner_prods(const ulong i,
+                                    const ArrayDouble &coeffs,
+                                    ArrayDouble &inner_prods) const {
+  const ulong max_interval = get_max_interval(i);
   for (ulong t = 0; t < max_interval; t++)
-    inner_prod[t] = get_inner_prod(i, t, coeffs);
+    inner_prods[t] = get_inner_prod(i, t, coeffs);
+  for (ulong t = max_interval; t < n_intervals; t++)
+    inner_prods[t] = 0;
+}
 
-  if (max_interval < n_intervals)
-    view(inner_prod, max_interval, n_intervals).fill(0);  // TODO
+double ModelSCCS::loss_i_from_inner_prods(const ulong i, ArrayDouble &inner_prods) const {
+  const ulong max_interval = get_max_interval(i);
+  // log of the softmax of the inner products is inner_prods[t] - log_sum_exp
+  const double log_sum_exp = logSumExp(inner_prods);
 
-  double x_max = inner_prod.max();
-  double sum_exp = sumExpMinusMax(inner_prod, x_max);
+  double loss = 0;
+  for (ulong t = 0; t < max_interval; t++)
+    loss -= get_longitudinal_label(i, t) * (inner_prods[t] - log_sum_exp);
+
+  return loss;
+}
+
+void ModelSCCS::inc_grad_i_from_inner_prods(const ulong i,
+                                            ArrayDouble &inner_prods,
+                                            ArrayDouble &out) const {
+  const ulong max_interval = get_max_interval(i);
+
+  double sum_labels = 0;
+  for (ulong t = 0; t < max_interval; t++)
+    sum_labels += get_longitudinal_label(i, t);
+  if (sum_labels == 0) return;
 
-  double multiplier = 0;  // need a double instead of long double for mult_incr
+  const double x_max = inner_prods.max();
+  const double sum_exp = sumExpMinusMax(inner_prods, x_max);
+
+  // The gradient is sum_t label_t * (sum_s softmax_s * x_s - x_t), hence each row x_s is
+  // weighted by sum_labels * softmax_s - label_s
   for (ulong t = 0; t < max_interval; t++) {
-    multiplier =
-        exp(inner_prod[t] - x_max) / sum_exp;  // overflow-proof
-    buffer.mult_incr(get_longitudinal_features(i, t), multiplier);
+    const double softmax = exp(inner_prods[t] - x_max) / sum_exp;  // overflow-proof
+    const double factor = sum_labels * softmax - get_longitudinal_label(i, t);
+    if (factor != 0)
+      out.mult_incr(get_longitudinal_features(i, t), factor);
   }
+}
 
-  double label = 0;
-  for (ulong t = 0; t < max_interval; t++) {
-    label = get_longitudinal_label(i, t);
-    if (label != 0) {
-      out.mult_add_mult_incr(get_longitudinal_features(i, t),
-                             -label,
-                             buffer,
-                             label);
-    }
+void ModelSCCS::compute_inner_prods_i(const ulong i,
+                                      const ArrayDouble &coeffs,
+                                      ArrayDouble &inner_prods) {
+  ArrayDouble inner_prods_i = view(inner_prods, i * n_intervals, (i + 1) * n_intervals);
+  compute_inner_prods(i, coeffs, inner_prods_i);
+}
+
+double ModelSCCS::loss_i_with_inner_prods(const ulong i, const ArrayDouble &inner_prods) {
+  ArrayDouble inner_prods_i = view(inner_prods, i * n_intervals, (i + 1) * n_intervals);
+  return loss_i_from_inner_prods(i, inner_prods_i);
+}
+
+void ModelSCCS::inc_grad_i_with_inner_prods(const ulong i,
+                                            ArrayDouble &out,
+                                            const ArrayDouble &inner_prods) {
+  ArrayDouble inner_prods_i = view(inner_prods, i * n_intervals, (i + 1) * n_intervals);
+  inc_grad_i_from_inner_prods(i, inner_prods_i, out);
+}
+
+std::shared_ptr<const ModelSCCS::InnerProds>
+ModelSCCS::get_last_inner_prods(const ArrayDouble &coeffs) const {
+  // Loaded atomically since the model might be used by several threads
+  std::shared_ptr<const InnerProds> inner_prods = std::atomic_load(&last_inner_prods);
+  if (inner_prods != nullptr && inner_prods->coeffs.size() == coeffs.size()
+      && std::equal(coeffs.data(), coeffs.data() + coeffs.size(), inner_prods->coeffs.data())) {
+    return inner_prods;
   }
+  return nullptr;
+}
+
+void ModelSCCS::set_last_inner_prods(const ArrayDouble &coeffs, ArrayDouble &inner_prods) {
+  std::shared_ptr<InnerProds> new_inner_prods = std::make_shared<InnerProds>();
+  new_inner_prods->coeffs = coeffs;
+  new_inner_prods->values = std::move(inner_prods);
+  std::atomic_store(&last_inner_prods, std::shared_ptr<const InnerProds>(new_inner_prods));
 }
 
 void ModelSCCS::compute_lip_consts() {
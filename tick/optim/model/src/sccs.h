@@ -28,11 +28,62 @@ class ModelSCCS : public ModelLipschitz  {
   // Censoring vectors
   SBaseArrayULongPtr censoring;
 
+  unsigned int n_threads;
+
+  //! Inner products of the features of all patients with the coefficients they were computed
+  //! at, the inner products of patient i being stored from index i * n_intervals
+  struct InnerProds {
+    ArrayDouble coeffs;
+    ArrayDouble values;
+  };
+
+  //! Inner products computed by the last call to loss or loss_and_grad. They are reused when
+  //! the loss or gradient is computed again at the same coefficients, as in the line searches
+  //! of first order solvers
+  std::shared_ptr<const InnerProds> last_inner_prods;
+
+  //! Gets the last inner products if they were computed at coeffs, nullptr otherwise
+  std::shared_ptr<const InnerProds> get_last_inner_prods(const ArrayDouble &coeffs) const;
+
+  void set_last_inner_prods(const ArrayDouble &coeffs, ArrayDouble &inner_prods);
+
+  /**
+   * @brief Computes the inner products of the features of patient i with the coefficients
+   * \param inner_prods : array of size n_intervals in which they are stored, set to 0 after
+   * the censoring
+   */
+  void compute_inner_prods(const ulong i, const ArrayDouble &coeffs,
+                           ArrayDouble &inner_prods) const;
+
+  //! @brief Loss of patient i, given the inner products of its features
+  double loss_i_from_inner_prods(const ulong i, ArrayDouble &inner_prods) const;
+
+  //! @brief Increments out with the gradient of patient i, given the inner products of its
+  //! features
+  void inc_grad_i_from_inner_prods(const ulong i, ArrayDouble &inner_prods,
+                                   ArrayDouble &out) const;
+
+ private:
+  void compute_inner_prods_i(const ulong i, const ArrayDouble &coeffs,
+                             ArrayDouble &inner_prods);
+
+  double loss_i_with_inner_prods(const ulong i, const ArrayDouble &inner_prods);
+
+  void inc_grad_i_with_inner_prods(const ulong i, ArrayDouble &out,
+                                   const ArrayDouble &inner_prods);
+
+  //! Accumulates the losses and gradients of the patients of a block (one per thread) in a
+  //! single pass over their features, storing their inner products
+  void loss_and_grad_block(const ulong block, const ArrayDouble &coeffs,
+                           std::vector<ArrayDouble> &block_grads, ArrayDouble &block_losses,
+                           ArrayDouble &inner_prods);
+
  public:
   ModelSCCS(const SBaseArrayDouble2dPtrList1D &features,
                           const SArrayIntPtrList1D &labels,
                           const SBaseArrayULongPtr censoring,
-                          ulong n_lags);
+                          ulong n_lags,
+                          const int n_threads = 1);
 
   const char *get_class_name() const override {
     return "LongitudinalMultinomial";
@@ -48,6 +99,12 @@ class ModelSCCS : public ModelLipschitz  {
               const ArrayDouble &coeffs,
               ArrayDouble &out) override;
 
+  /**
+   * @brief Computes the loss and the gradient in a single pass over the features, stored in out
+   * @return The loss
+   */
+  double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
+
   void compute_lip_consts() override;
 
   ulong get_n_samples() const override { return n_samples; }
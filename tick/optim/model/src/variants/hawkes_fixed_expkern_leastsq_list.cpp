@@ -2,6 +2,8 @@
 
 #include "hawkes_fixed_expkern_leastsq_list.h"
 
+#include <limits>
+
 ModelHawkesFixedExpKernLeastSqList::ModelHawkesFixedExpKernLeastSqList(
     const SArrayDouble2dPtr decays,
     const int max_n_threads,
@@ -13,6 +15,7 @@ ModelHawkesFixedExpKernLeastSqList::ModelHawkesFixedExpKernLeastSqList(
 }
 
 void ModelHawkesFixedExpKernLeastSqList::hessian(ArrayDouble &out) {
+  if (has_support()) TICK_ERROR("hessian is not available when a support is set");
   if (!weights_computed) compute_weights();
   auto *casted_model = static_cast<ModelHawkesFixedExpKernLeastSq *>(aggregated_model.get());
   casted_model->hessian(out);
@@ -32,6 +35,7 @@ void ModelHawkesFixedExpKernLeastSqList::compute_weights_timestamps_list() {
 
   for (ulong r = 0; r < n_realizations; ++r) {
     model_list[r] = ModelHawkesFixedExpKernLeastSq(decays, 1, optimization_level);
+    if (has_support()) model_list[r].set_support(support_indptr, support_indices);
     model_list[r].set_data(timestamps_list[r], (*end_times)[r]);
     model_list[r].allocate_weights();
   }
@@ -40,34 +44,99 @@ void ModelHawkesFixedExpKernLeastSqList::compute_weights_timestamps_list() {
   parallel_run(get_n_threads(), n_realizations * n_nodes,
                &ModelHawkesFixedExpKernLeastSqList::compute_weights_i_r, this, model_list);
 
-  for (ulong r = 0; r < n_realizations; ++r) {
-    Dg.mult_incr(model_list[r].Dg, 1);
-    Dg2.mult_incr(model_list[r].Dg2, 1);
-    C.mult_incr(model_list[r].C, 1);
-    E.mult_incr(model_list[r].E, 1);
-  }
+  for (ulong r = 0; r < n_realizations; ++r) add_weights(model_list[r], 1);
+
+  last_realization_model = std::move(model_list.back());
+  last_realization_model.weights_computed = true;
+  window_start = ModelHawkesFixedExpKernLeastSq();
+  window_bounds.clear();
 }
 
 void ModelHawkesFixedExpKernLeastSqList::compute_weights_timestamps(
     const SArrayDoublePtrList1D &timestamps, double end_time) {
   auto model = ModelHawkesFixedExpKernLeastSq(decays, get_n_threads(), optimization_level);
+  if (has_support()) model.set_support(support_indptr, support_indices);
   model.set_data(timestamps, end_time);
   model.compute_weights();
+  add_weights(model, 1);
+
+  last_realization_model = std::move(model);
+  window_start = ModelHawkesFixedExpKernLeastSq();
+  window_bounds.clear();
+}
+
+void ModelHawkesFixedExpKernLeastSqList::add_weights(const ModelHawkesFixedExpKernLeastSq &model,
+                                                     const double factor) {
+  Dg.mult_incr(model.Dg, factor);
+  Dg2.mult_incr(model.Dg2, factor);
+  C.mult_incr(model.C, factor);
+  E.mult_incr(model.E, factor);
+}
 
-  Dg.mult_incr(model.Dg, 1);
-  Dg2.mult_incr(model.Dg2, 1);
-  C.mult_incr(model.C, 1);
-  E.mult_incr(model.E, 1);
+ModelHawkesFixedExpKernLeastSq ModelHawkesFixedExpKernLeastSqList::weights_snapshot(
+    const ModelHawkesFixedExpKernLeastSq &model) {
+  ModelHawkesFixedExpKernLeastSq snapshot;
+  snapshot.Dg = model.Dg;
+  snapshot.Dg2 = model.Dg2;
+  snapshot.C = model.C;
+  snapshot.E = model.E;
+  snapshot.end_time = model.end_time;
+  snapshot.n_jumps_per_node = SArrayULong::new_ptr(*model.n_jumps_per_node);
+  snapshot.weights_computed = true;
+  return snapshot;
+}
+
+SArrayDoublePtrList1D ModelHawkesFixedExpKernLeastSqList::append_weights(
+    const SArrayDoublePtrList1D &timestamps, double end_time) {
+  if (!weights_computed) compute_weights();
+
+  // Only the weights of the last realization change
+  last_realization_model.check_appended_events(timestamps, end_time);
+  if (window < std::numeric_limits<double>::infinity()) {
+    window_bounds.push_back(weights_snapshot(last_realization_model));
+  }
+  add_weights(last_realization_model, -1);
+  last_realization_model.set_n_threads(max_n_threads);
+  last_realization_model.append_events(timestamps, end_time);
+  add_weights(last_realization_model, 1);
+
+  forget_window_batches(end_time);
+  return last_realization_model.timestamps;
+}
+
+void ModelHawkesFixedExpKernLeastSqList::forget_window_batches(const double end_time) {
+  while (!window_bounds.empty() && window_bounds.front().end_time <= end_time - window) {
+    ModelHawkesFixedExpKernLeastSq &bound = window_bounds.front();
+    add_weights(bound, -1);
+
+    double forgotten_duration = bound.end_time;
+    ArrayULong n_forgotten_jumps = *bound.n_jumps_per_node;
+    if (window_start.weights_computed) {
+      add_weights(window_start, 1);
+      forgotten_duration -= window_start.end_time;
+      for (ulong i = 0; i < n_nodes; ++i) {
+        n_forgotten_jumps[i] -= (*window_start.n_jumps_per_node)[i];
+      }
+    }
+    forget_events(forgotten_duration, n_forgotten_jumps);
+
+    window_start = std::move(bound);
+    window_bounds.pop_front();
+  }
 }
 
 void ModelHawkesFixedExpKernLeastSqList::allocate_weights() {
-  Dg = ArrayDouble2d(n_nodes, n_nodes);
+  check_support();
+  ulong n_E_weights = 0;
+  for (ulong i = 0; i < n_nodes; ++i) n_E_weights += get_n_sources(i) * get_n_sources(i);
+
+  Dg = ArrayDouble(get_n_support_pairs());
   Dg.init_to_zero();
-  Dg2 = ArrayDouble2d(n_nodes, n_nodes);
+  Dg2 = ArrayDouble(get_n_support_pairs());
   Dg2.init_to_zero();
-  C = ArrayDouble2d(n_nodes, n_nodes);
+  C = ArrayDouble(get_n_support_pairs());
   C.init_to_zero();
-  E = ArrayDouble2d(n_nodes, n_nodes * n_nodes);
+  E = ArrayDouble(n_E_weights);
   E.init_to_zero();
 
   weights_allocated = true;
@@ -78,20 +147,22 @@ void ModelHawkesFixedExpKernLeastSqList::synchronize_aggregated_model() {
 
   casted_model->set_n_nodes(n_nodes);
   casted_model->max_n_threads = max_n_threads;
+  casted_model->set_support(support_indptr, support_indices);
+  casted_model->compute_E_starts();
 
   // We make views to avoid copies
   casted_model->Dg = view(Dg);
   casted_model->Dg2 = view(Dg2);
   casted_model->C = view(C);
   casted_model->E = view(E);
-  casted_model->end_time = end_times->sum();
+  casted_model->end_time = end_times->sum() - forgotten_time;
 
-  casted_model->n_total_jumps = n_jumps_per_realization->sum();
-  casted_model->n_jumps_per_node = n_jumps_per_node;
+  casted_model->n_total_jumps = get_remembered_n_total_jumps();
+  casted_model->n_jumps_per_node = get_remembered_n_jumps_per_node();
 
   casted_model->weights_computed = weights_computed;
 }
 
 ulong ModelHawkesFixedExpKernLeastSqList::get_n_coeffs() const {
-  return n_nodes + n_nodes * n_nodes;
+  return n_nodes + get_n_support_pairs();
 }
@@ -7,6 +7,8 @@
 #include "hawkes_leastsq_list.h"
 #include "../hawkes_fixed_expkern_leastsq.h"
 
+#include <deque>
+
 /** \class ModelHawkesFixedExpKernLeastSqList
  * \brief Class for computing L2 Contrast function and gradient for Hawkes processes with
  * exponential kernels with fixed exponent (i.e., alpha*beta*e^{-beta t}, with fixed beta)
@@ -14,11 +16,20 @@
  */
 class ModelHawkesFixedExpKernLeastSqList : public ModelHawkesLeastSqList {
   //! @brief Some arrays used for intermediate computings. They are initialized in init()
-  ArrayDouble2d E, Dg, Dg2, C;
+  //! They are summed over all realizations and stored like in ModelHawkesFixedExpKernLeastSq
+  ArrayDouble E, Dg, Dg2, C;
 
   //! @brief The 2d array of decays (remember that the decays are fixed!)
   SArrayDouble2dPtr decays;
 
+  //! @brief Model of the last realization, kept to append events to it
+  ModelHawkesFixedExpKernLeastSq last_realization_model;
+
+  //! @brief Weights of the last realization at the start of the window and at the bounds of the
+  //! batches of events appended since then. The start is empty if nothing was forgotten yet.
+  ModelHawkesFixedExpKernLeastSq window_start;
+  std::deque<ModelHawkesFixedExpKernLeastSq> window_bounds;
+
  public:
   //! @brief Constructor
   //! \param decays : the 2d array of the decays
@@ -33,7 +44,8 @@ class ModelHawkesFixedExpKernLeastSqList : public ModelHawkesLeastSqList {
    * @brief Compute hessian
    * \param coeffs : Point in which hessian is computed
    * \param out : Array in which the value of the hessian is stored
-   * \note : We only fill data, python code takes care of creating index and indexptr
+   * \note : We only fill data, python code takes care of creating index and indexptr. The
+   * hessian is not available when a support is set
    */
   void hessian(ArrayDouble &out);
 
@@ -72,6 +84,20 @@ class ModelHawkesFixedExpKernLeastSqList : public ModelHawkesLeastSqList {
   void compute_weights_timestamps_list() override;
   void compute_weights_timestamps(const SArrayDoublePtrList1D &timestamps,
                                   double end_time) override;
+
+  //! @brief Adds factor times the weights of the given realization model to the aggregated ones
+  void add_weights(const ModelHawkesFixedExpKernLeastSq &model, const double factor);
+
+  //! @brief Copies the weights, end time and number of jumps of a realization model
+  static ModelHawkesFixedExpKernLeastSq weights_snapshot(const ModelHawkesFixedExpKernLeastSq &model);
+
+  //! @brief Forgets the batches of events of the last realization that ended before
+  //! end_time - window
+  void forget_window_batches(const double end_time);
+
+ protected:
+  SArrayDoublePtrList1D append_weights(const SArrayDoublePtrList1D &timestamps,
+                                       double end_time) override;
 };
 
 #endif  // TICK_OPTIM_MODEL_SRC_VARIANTS_HAWKES_FIXED_EXPKERN_LEASTSQ_LIST_H_
@@ -5,7 +5,7 @@
 
 ModelHawkesFixedExpKernLogLikList::ModelHawkesFixedExpKernLogLikList(
     const double decay, const int max_n_threads) :
-    ModelHawkesList(max_n_threads, 0), decay(decay) {}
+    ModelHawkesList(max_n_threads, 0), decay(decay), weights_tol(0.) {}
 
 void ModelHawkesFixedExpKernLogLikList::incremental_set_data(
     const SArrayDoublePtrList1D &timestamps, double end_time) {
@@ -36,6 +36,8 @@ void ModelHawkesFixedExpKernLogLikList::incremental_set_data(
   n_jumps_per_realization->append1(n_total_jumps);
 
   auto model = ModelHawkesFixedExpKernLogLik(decay, get_n_threads());
+  model.set_weights_tol(weights_tol);
+  if (has_support()) model.set_support(support_indptr, support_indices);
   model.set_data(timestamps, end_time);
   model.compute_weights();
   model_list.push_back(model);
@@ -48,6 +50,8 @@ void ModelHawkesFixedExpKernLogLikList::compute_weights() {
 
   for (ulong r = 0; r < n_realizations; ++r) {
     model_list[r] = ModelHawkesFixedExpKernLogLik(decay, 1);
+    model_list[r].set_weights_tol(weights_tol);
+    if (has_support()) model_list[r].set_support(support_indptr, support_indices);
     model_list[r].set_data(timestamps_list[r], (*end_times)[r]);
     model_list[r].allocate_weights();
   }
@@ -61,6 +65,32 @@ void ModelHawkesFixedExpKernLogLikList::compute_weights() {
   weights_computed = true;
 }
 
+void ModelHawkesFixedExpKernLogLikList::set_weights_tol(const double weights_tol) {
+  if (weights_tol < 0) {
+    TICK_ERROR("weights_tol must be non negative, received " << weights_tol);
+  }
+  this->weights_tol = weights_tol;
+  weights_computed = false;
+}
+
+ulong ModelHawkesFixedExpKernLogLikList::get_n_stored_weights() const {
+  ulong n_stored_weights = 0;
+  for (auto &model : model_list) {
+    n_stored_weights += model.get_n_stored_weights();
+  }
+  return n_stored_weights;
+}
+
+SArrayDoublePtrList1D ModelHawkesFixedExpKernLogLikList::append_weights(
+    const SArrayDoublePtrList1D &timestamps, double end_time) {
+  if (!weights_computed) compute_weights();
+
+  ModelHawkesFixedExpKernLogLik &last_model = model_list.back();
+  last_model.set_n_threads(max_n_threads);
+  last_model.append_events(timestamps, end_time);
+  return last_model.timestamps;
+}
+
 std::tuple<ulong, ulong> ModelHawkesFixedExpKernLogLikList::get_realization_node(ulong i_r) {
   const ulong r = static_cast<const ulong>(i_r / n_nodes);
   const ulong i = i_r % n_nodes;
@@ -99,10 +129,8 @@ void ModelHawkesFixedExpKernLogLikList::grad_i_r(const ulong i_r,
   ulong r, i;
   std::tie(r, i) = get_realization_node(i_r);
 
-  ArrayDouble tmp_grad_i(get_n_coeffs());
-  tmp_grad_i.init_to_zero();
-  model_list[r].grad_dim_i(i, coeffs, tmp_grad_i);
-  out.mult_incr(tmp_grad_i, 1.);
+  // grad_dim_i only increments the coefficients of node i
+  model_list[r].grad_dim_i(i, coeffs, out);
 }
 
 void ModelHawkesFixedExpKernLogLikList::grad(const ArrayDouble &coeffs, ArrayDouble &out) {
@@ -123,6 +151,24 @@ void ModelHawkesFixedExpKernLogLikList::grad_i(const ulong i, const ArrayDouble
   model_list[r_i.first].grad_i(r_i.second, coeffs, out);
 }
 
+void ModelHawkesFixedExpKernLogLikList::grad_batch(const ArrayULong &indices,
+                                                   const ArrayDouble &coeffs,
+                                                   ArrayDouble &out) {
+  if (!weights_computed) compute_weights();
+
+  out.fill(0);
+
+  ulong i;
+  ulong k;
+  for (ulong l = 0; l < indices.size(); ++l) {
+    const auto r_i = sampled_i_to_realization(indices[l]);
+    ModelHawkesFixedExpKernLogLik &model = model_list[r_i.first];
+    model.sampled_i_to_index(r_i.second, &i, &k);
+    model.grad_i_k(i, k, coeffs, out);
+  }
+  out /= indices.size();
+}
+
 double ModelHawkesFixedExpKernLogLikList::loss_and_grad(const ArrayDouble &coeffs,
                                                         ArrayDouble &out) {
   // TODO(svp) create parallel_map_array_reduce_result
@@ -162,6 +208,7 @@ void ModelHawkesFixedExpKernLogLikList::hessian_i_r(const ulong i_r,
 
 void ModelHawkesFixedExpKernLogLikList::hessian(const ArrayDouble &coeffs,
                                                 ArrayDouble &out) {
+  if (has_support()) TICK_ERROR("hessian is not available when a support is set");
   if (!weights_computed) compute_weights();
   parallel_run(
     get_n_threads(), n_realizations * n_nodes,
@@ -183,5 +230,5 @@ std::pair<ulong, ulong> ModelHawkesFixedExpKernLogLikList::sampled_i_to_realizat
 }
 
 ulong ModelHawkesFixedExpKernLogLikList::get_n_coeffs() const {
-  return n_nodes + n_nodes * n_nodes;
+  return n_nodes + get_n_support_pairs();
 }
@@ -16,6 +16,9 @@ class ModelHawkesFixedExpKernLogLikList : public ModelHawkesList {
   //! @brief Value of decay for this model. Shared by all kernels
   double decay;
 
+  //! @brief Weights below this value are not stored, see ModelHawkesFixedExpKernLogLik
+  double weights_tol;
+
   std::vector<ModelHawkesFixedExpKernLogLik> model_list;
 
  public:
@@ -66,6 +69,15 @@ class ModelHawkesFixedExpKernLogLikList : public ModelHawkesList {
    */
   void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) override;
 
+  /**
+   * @brief Compute the average of the gradients of a batch of samples
+   * \param indices : selected samples (between 0 and rand_max)
+   * \param coeffs : Point in which gradient is computed
+   * \param out : Array in which the value of the gradient is stored
+   */
+  void grad_batch(const ArrayULong &indices, const ArrayDouble &coeffs,
+                  ArrayDouble &out) override;
+
   /**
    * @brief Compute loss and gradient
    * \param coeffs : Point in which loss and gradient are computed
@@ -98,6 +110,19 @@ class ModelHawkesFixedExpKernLogLikList : public ModelHawkesList {
     this->decay = decay;
   }
 
+  double get_weights_tol() const {
+    return weights_tol;
+  }
+
+  /**
+   * @brief Set the tolerance below which weights are not stored and reset weights computing
+   * \param weights_tol : new tolerance, if positive the weights are stored in sparse arrays
+   */
+  void set_weights_tol(const double weights_tol);
+
+  //! @brief Returns the number of weights stored in memory for all realizations
+  ulong get_n_stored_weights() const;
+
   ulong get_rand_max() const {
     return get_n_total_jumps();
   }
@@ -153,6 +178,10 @@ class ModelHawkesFixedExpKernLogLikList : public ModelHawkesList {
   void hessian_i_r(const ulong i_r, const ArrayDouble &coeffs, ArrayDouble &out);
 
   std::pair<ulong, ulong> sampled_i_to_realization(const ulong sampled_i);
+
+ protected:
+  SArrayDoublePtrList1D append_weights(const SArrayDoublePtrList1D &timestamps,
+                                       double end_time) override;
 };
 
 #endif  // TICK_OPTIM_MODEL_SRC_VARIANTS_HAWKES_FIXED_EXPKERN_LOGLIK_LIST_H_
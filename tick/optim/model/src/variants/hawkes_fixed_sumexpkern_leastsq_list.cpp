@@ -4,6 +4,8 @@
 #include "hawkes_fixed_sumexpkern_leastsq_list.h"
 #include "../hawkes_utils.h"
 
+#include <limits>
+
 ModelHawkesFixedSumExpKernLeastSqList::ModelHawkesFixedSumExpKernLeastSqList(
     const ArrayDouble &decays,
     const ulong n_baselines,
@@ -41,16 +43,12 @@ void ModelHawkesFixedSumExpKernLeastSqList::compute_weights_timestamps_list() {
   parallel_run(get_n_threads(), n_realizations * n_nodes,
                &ModelHawkesFixedSumExpKernLeastSqList::compute_weights_i_r, this, model_list);
 
-  for (ulong r = 0; r < n_realizations; ++r) {
-    L.mult_incr(model_list[r].L, 1);
-    for (ulong i = 0; i < n_nodes; ++i) {
-      Dg[i].mult_incr(model_list[r].Dg[i], 1);
-      Dgg[i].mult_incr(model_list[r].Dgg[i], 1);
-      C[i].mult_incr(model_list[r].C[i], 1);
-      E[i].mult_incr(model_list[r].E[i], 1);
-      K[i].mult_incr(model_list[r].K[i], 1);
-    }
-  }
+  for (ulong r = 0; r < n_realizations; ++r) add_weights(model_list[r], 1);
+
+  last_realization_model = std::move(model_list.back());
+  last_realization_model.weights_computed = true;
+  window_start = ModelHawkesFixedSumExpKernLeastSq();
+  window_bounds.clear();
 }
 
 void ModelHawkesFixedSumExpKernLeastSqList::compute_weights_timestamps(
@@ -59,18 +57,83 @@ void ModelHawkesFixedSumExpKernLeastSqList::compute_weights_timestamps(
                                                  get_n_threads(), optimization_level);
   model.set_data(timestamps, end_time);
   model.compute_weights();
+  add_weights(model, 1);
 
-  L.mult_incr(model.L, 1);
+  last_realization_model = std::move(model);
+  window_start = ModelHawkesFixedSumExpKernLeastSq();
+  window_bounds.clear();
+}
+
+void ModelHawkesFixedSumExpKernLeastSqList::add_weights(
+    const ModelHawkesFixedSumExpKernLeastSq &model, const double factor) {
+  L.mult_incr(model.L, factor);
   for (ulong i = 0; i < n_nodes; ++i) {
-    Dg[i].mult_incr(model.Dg[i], 1);
-    Dgg[i].mult_incr(model.Dgg[i], 1);
-    C[i].mult_incr(model.C[i], 1);
-    E[i].mult_incr(model.E[i], 1);
-    K[i].mult_incr(model.K[i], 1);
+    Dg[i].mult_incr(model.Dg[i], factor);
+    Dgg[i].mult_incr(model.Dgg[i], factor);
+    C[i].mult_incr(model.C[i], factor);
+    E[i].mult_incr(model.E[i], factor);
+    K[i].mult_incr(model.K[i], factor);
+  }
+}
+
+ModelHawkesFixedSumExpKernLeastSq ModelHawkesFixedSumExpKernLeastSqList::weights_snapshot(
+    const ModelHawkesFixedSumExpKernLeastSq &model) {
+  ModelHawkesFixedSumExpKernLeastSq snapshot;
+  snapshot.L = model.L;
+  snapshot.Dg = model.Dg;
+  snapshot.Dgg = model.Dgg;
+  snapshot.C = model.C;
+  snapshot.E = model.E;
+  snapshot.K = model.K;
+  snapshot.end_time = model.end_time;
+  snapshot.n_jumps_per_node = SArrayULong::new_ptr(*model.n_jumps_per_node);
+  snapshot.weights_computed = true;
+  return snapshot;
+}
+
+SArrayDoublePtrList1D ModelHawkesFixedSumExpKernLeastSqList::append_weights(
+    const SArrayDoublePtrList1D &timestamps, double end_time) {
+  if (!weights_computed) compute_weights();
+
+  // Only the weights of the last realization change
+  last_realization_model.check_appended_events(timestamps, end_time);
+  if (window < std::numeric_limits<double>::infinity()) {
+    window_bounds.push_back(weights_snapshot(last_realization_model));
+  }
+  add_weights(last_realization_model, -1);
+  last_realization_model.set_n_threads(max_n_threads);
+  last_realization_model.append_events(timestamps, end_time);
+  add_weights(last_realization_model, 1);
+
+  forget_window_batches(end_time);
+  return last_realization_model.timestamps;
+}
+
+void ModelHawkesFixedSumExpKernLeastSqList::forget_window_batches(const double end_time) {
+  while (!window_bounds.empty() && window_bounds.front().end_time <= end_time - window) {
+    ModelHawkesFixedSumExpKernLeastSq &bound = window_bounds.front();
+    add_weights(bound, -1);
+
+    double forgotten_duration = bound.end_time;
+    ArrayULong n_forgotten_jumps = *bound.n_jumps_per_node;
+    if (window_start.weights_computed) {
+      add_weights(window_start, 1);
+      forgotten_duration -= window_start.end_time;
+      for (ulong i = 0; i < n_nodes; ++i) {
+        n_forgotten_jumps[i] -= (*window_start.n_jumps_per_node)[i];
+      }
+    }
+    forget_events(forgotten_duration, n_forgotten_jumps);
+
+    window_start = std::move(bound);
+    window_bounds.pop_front();
   }
 }
 
 void ModelHawkesFixedSumExpKernLeastSqList::allocate_weights() {
+  // The weights do not depend on the support, it only restricts the pairs of nodes they are
+  // used for
+  check_support();
   L = ArrayDouble(n_baselines);
   L.init_to_zero();
 
@@ -102,6 +165,7 @@ void ModelHawkesFixedSumExpKernLeastSqList::synchronize_aggregated_model() {
   casted_model->n_baselines = n_baselines;
   casted_model->period_length = period_length;
   casted_model->max_n_threads = max_n_threads;
+  casted_model->set_support(support_indptr, support_indices);
 
   casted_model->L = view(L);
   casted_model->C = ArrayDouble2dList1D(n_nodes);
@@ -117,16 +181,16 @@ void ModelHawkesFixedSumExpKernLeastSqList::synchronize_aggregated_model() {
     casted_model->E[i] = view(E[i]);
     casted_model->K[i] = view(K[i]);
   }
-  casted_model->end_time = end_times->sum();
+  casted_model->end_time = end_times->sum() - forgotten_time;
 
-  casted_model->n_total_jumps = n_jumps_per_realization->sum();
-  casted_model->n_jumps_per_node = n_jumps_per_node;
+  casted_model->n_total_jumps = get_remembered_n_total_jumps();
+  casted_model->n_jumps_per_node = get_remembered_n_jumps_per_node();
 
   casted_model->weights_computed = weights_computed;
 }
 
 ulong ModelHawkesFixedSumExpKernLeastSqList::get_n_coeffs() const {
-  return n_nodes * n_baselines + n_nodes * n_nodes * n_decays;
+  return n_nodes * n_baselines + get_n_support_pairs() * n_decays;
 }
 
 ulong ModelHawkesFixedSumExpKernLeastSqList::get_n_baselines() const {
@@ -8,6 +8,8 @@
 #include "../hawkes_fixed_sumexpkern_leastsq.h"
 #include "hawkes_leastsq_list.h"
 
+#include <deque>
+
 /** \class ModelHawkesFixedSumExpKernLeastSqList
  * \brief Class for computing L2 Contrast function and gradient for Hawkes processes with
  * exponential kernels with fixed exponent (i.e., alpha*beta*e^{-beta t}, with fixed beta)
@@ -30,6 +32,14 @@ class ModelHawkesFixedSumExpKernLeastSqList : public ModelHawkesLeastSqList {
   //! @brief n_decays (number of decays in the sum exponential kernel)
   ulong n_decays;
 
+  //! @brief Model of the last realization, kept to append events to it
+  ModelHawkesFixedSumExpKernLeastSq last_realization_model;
+
+  //! @brief Weights of the last realization at the start of the window and at the bounds of the
+  //! batches of events appended since then. The start is empty if nothing was forgotten yet.
+  ModelHawkesFixedSumExpKernLeastSq window_start;
+  std::deque<ModelHawkesFixedSumExpKernLeastSq> window_bounds;
+
  public:
   //! @brief Constructor
   //! \param timestamps : a list of arrays representing the realization
@@ -79,6 +89,20 @@ class ModelHawkesFixedSumExpKernLeastSqList : public ModelHawkesLeastSqList {
   void compute_weights_timestamps_list() override;
   void compute_weights_timestamps(const SArrayDoublePtrList1D &timestamps,
                                   double end_time) override;
+
+  //! @brief Adds factor times the weights of the given realization model to the aggregated ones
+  void add_weights(const ModelHawkesFixedSumExpKernLeastSq &model, const double factor);
+
+  //! @brief Copies the weights, end time and number of jumps of a realization model
+  static ModelHawkesFixedSumExpKernLeastSq weights_snapshot(const ModelHawkesFixedSumExpKernLeastSq &model);
+
+  //! @brief Forgets the batches of events of the last realization that ended before
+  //! end_time - window
+  void forget_window_batches(const double end_time);
+
+ protected:
+  SArrayDoublePtrList1D append_weights(const SArrayDoublePtrList1D &timestamps,
+                                       double end_time) override;
 };
 
 #endif  // TICK_OPTIM_MODEL_SRC_VARIANTS_HAWKES_FIXED_SUMEXPKERN_LEASTSQ_LIST_H_
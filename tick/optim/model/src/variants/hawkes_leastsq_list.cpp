@@ -3,11 +3,14 @@
 #include "hawkes_leastsq_list.h"
 #include "hawkes_utils.h"
 
+#include <limits>
+
 ModelHawkesLeastSqList::ModelHawkesLeastSqList(
     const int max_n_threads,
     const unsigned int optimization_level)
     : ModelHawkesList(max_n_threads, optimization_level),
-      weights_allocated(false) {}
+      weights_allocated(false), window(std::numeric_limits<double>::infinity()),
+      forgotten_time(0), forgotten_n_jumps_per_node(0) {}
 
 void ModelHawkesLeastSqList::grad_i(const ulong i, const ArrayDouble &coeffs,
                                     ArrayDouble &out) {
@@ -35,6 +38,10 @@ double ModelHawkesLeastSqList::loss(const ArrayDouble &coeffs) {
 void ModelHawkesLeastSqList::compute_weights() {
   allocate_weights();
 
+  // All events are accounted for again
+  forgotten_time = 0;
+  forgotten_n_jumps_per_node = ArrayULong(0);
+
   compute_weights_timestamps_list();
 
   weights_computed = true;
@@ -75,3 +82,46 @@ void ModelHawkesLeastSqList::incremental_set_data(const SArrayDoublePtrList1D &t
   weights_computed = true;
   synchronize_aggregated_model();
 }
+
+void ModelHawkesLeastSqList::append_events(const SArrayDoublePtrList1D &timestamps,
+                                           double end_time) {
+  ModelHawkesList::append_events(timestamps, end_time);
+  synchronize_aggregated_model();
+}
+
+double ModelHawkesLeastSqList::get_window() const {
+  return window;
+}
+
+void ModelHawkesLeastSqList::set_window(const double window) {
+  if (!(window > 0)) {
+    TICK_ERROR("window must be positive, received " << window);
+  }
+  this->window = window;
+}
+
+void ModelHawkesLeastSqList::forget_events(const double duration,
+                                           const ArrayULong &n_jumps_per_node) {
+  if (forgotten_n_jumps_per_node.size() == 0) {
+    forgotten_n_jumps_per_node = ArrayULong(n_nodes);
+    forgotten_n_jumps_per_node.init_to_zero();
+  }
+  forgotten_time += duration;
+  forgotten_n_jumps_per_node.mult_incr(n_jumps_per_node, 1);
+}
+
+SArrayULongPtr ModelHawkesLeastSqList::get_remembered_n_jumps_per_node() const {
+  if (forgotten_n_jumps_per_node.size() == 0) return n_jumps_per_node;
+
+  auto remembered_n_jumps_per_node = SArrayULong::new_ptr(n_nodes);
+  for (ulong i = 0; i < n_nodes; ++i) {
+    (*remembered_n_jumps_per_node)[i] = (*n_jumps_per_node)[i] - forgotten_n_jumps_per_node[i];
+  }
+  return remembered_n_jumps_per_node;
+}
+
+ulong ModelHawkesLeastSqList::get_remembered_n_total_jumps() const {
+  const ulong n_forgotten_jumps =
+      forgotten_n_jumps_per_node.size() > 0 ? forgotten_n_jumps_per_node.sum() : 0;
+  return n_jumps_per_realization->sum() - n_forgotten_jumps;
+}
@@ -19,6 +19,14 @@ class ModelHawkesLeastSqList : public ModelHawkesList {
   //! @bbrief aggregated model used to compute loss, gradient and hessian
   std::unique_ptr<ModelHawkesSingle> aggregated_model;
 
+  //! @brief Duration over which the events appended to the last realization are remembered
+  double window;
+
+  //! @brief Duration and number of jumps per node of the realizations that have been forgotten
+  //! as they got out of the window
+  double forgotten_time;
+  ArrayULong forgotten_n_jumps_per_node;
+
  public:
   //! @brief Constructor
   //! \param max_n_threads : number of cores to be used for multithreading. If negative,
@@ -65,7 +73,32 @@ class ModelHawkesLeastSqList : public ModelHawkesList {
    */
   void grad_i(const ulong i, const ArrayDouble &coeffs, ArrayDouble &out) override;
 
+  void append_events(const SArrayDoublePtrList1D &timestamps, double end_time) override;
+
+  double get_window() const;
+
+  /**
+   * @brief Set the duration over which appended events are remembered
+   * Once events are appended to the last realization, the batches of events that ended more than
+   * window before its new end time are removed from the weights.
+   * \param window : duration of the window, infinite if events are never forgotten
+   */
+  void set_window(const double window);
+
  protected:
+  /**
+   * @brief Removes a beginning of realization from the jumps and duration of the aggregated model
+   * \param duration : forgotten duration
+   * \param n_jumps_per_node : number of forgotten jumps of each node
+   */
+  void forget_events(const double duration, const ArrayULong &n_jumps_per_node);
+
+  //! @brief Number of jumps of each node that have not been forgotten
+  SArrayULongPtr get_remembered_n_jumps_per_node() const;
+
+  //! @brief Number of jumps that have not been forgotten
+  ulong get_remembered_n_total_jumps() const;
+
   //! @brief allocate arrays to store precomputations
   virtual void allocate_weights() {}
 
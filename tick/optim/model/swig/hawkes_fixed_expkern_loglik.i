@@ -14,6 +14,7 @@ class ModelHawkesFixedExpKernLogLik : public Model {
   void set_data(const SArrayDoublePtrList1D &timestamps, const double end_time);
 
   void compute_weights();
+  void append_events(const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time);
 
   inline unsigned long get_rand_max() const;
 
@@ -24,6 +25,13 @@ class ModelHawkesFixedExpKernLogLik : public Model {
   double get_decay() const;
   void set_decay(double decay);
 
+  double get_weights_tol() const;
+  void set_weights_tol(double weights_tol);
+  ulong get_n_stored_weights() const;
+
+  void set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices);
+  bool has_support() const;
+
   unsigned int get_n_threads() const;
   void set_n_threads(unsigned int n_threads);
 
@@ -20,9 +20,13 @@ class ModelHawkesFixedSumExpKernLeastSq : public Model {
   void set_data(const SArrayDoublePtrList1D &timestamps, const double end_time);
 
   void compute_weights();
+  void append_events(const SArrayDoublePtrList1D &timestamps_chunk, const double new_end_time);
 
   double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
 
+  void set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices);
+  bool has_support() const;
+
   ulong get_n_total_jumps() const;
   ulong get_n_coeffs() const;
   ulong get_n_nodes() const;
@@ -14,4 +14,25 @@ class ModelLinReg : public ModelGeneralizedLinear,
               const bool fit_intercept,
               const int n_threads);
 
+  ModelLinReg(const SBaseArrayDouble2dPtrList1D &feature_shards,
+              const SArrayDoublePtr labels,
+              const bool fit_intercept,
+              const int n_threads);
+
+};
+
+class ModelLinRegFloat : public ModelGeneralizedLinearFloat,
+                         public ModelLipschitzFloat {
+ public:
+
+  ModelLinRegFloat(const SBaseArrayFloat2dPtr features,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+
+  ModelLinRegFloat(const SBaseArrayFloat2dPtrList1D &feature_shards,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+
 };
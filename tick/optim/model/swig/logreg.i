@@ -13,7 +13,30 @@ class ModelLogReg : public ModelGeneralizedLinear, public ModelLipschitz {
               const bool fit_intercept,
               const int n_threads);
 
+  ModelLogReg(const SBaseArrayDouble2dPtrList1D &feature_shards,
+              const SArrayDoublePtr labels,
+              const bool fit_intercept,
+              const int n_threads);
+
   static void sigmoid(const ArrayDouble &x, ArrayDouble &out);
 
   static void logistic(const ArrayDouble &x, ArrayDouble &out);
 };
+
+class ModelLogRegFloat : public ModelGeneralizedLinearFloat, public ModelLipschitzFloat {
+ public:
+
+  ModelLogRegFloat(const SBaseArrayFloat2dPtr features,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+
+  ModelLogRegFloat(const SBaseArrayFloat2dPtrList1D &feature_shards,
+                   const SArrayFloatPtr labels,
+                   const bool fit_intercept,
+                   const int n_threads);
+
+  static void sigmoid(const ArrayFloat &x, ArrayFloat &out);
+
+  static void logistic(const ArrayFloat &x, ArrayFloat &out);
+};
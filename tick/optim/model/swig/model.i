@@ -16,7 +16,29 @@ class Model {
   virtual void grad(const ArrayDouble& coeffs, ArrayDouble& out);
   virtual double loss(const ArrayDouble& coeffs);
 
+  virtual void grad_batch(const ArrayULong& indices, const ArrayDouble& coeffs,
+                          ArrayDouble& out);
+  virtual double loss_batch(const ArrayULong& indices, const ArrayDouble& coeffs);
+
   virtual unsigned long get_epoch_size() const;
 };
 
 typedef std::shared_ptr<Model> ModelPtr;
+
+class ModelFloat {
+
+ public:
+
+  ModelFloat() { }
+
+  virtual void grad(const ArrayFloat& coeffs, ArrayFloat& out);
+  virtual double loss(const ArrayFloat& coeffs);
+
+  virtual void grad_batch(const ArrayULong& indices, const ArrayFloat& coeffs,
+                          ArrayFloat& out);
+  virtual double loss_batch(const ArrayULong& indices, const ArrayFloat& coeffs);
+
+  virtual unsigned long get_epoch_size() const;
+};
+
+typedef std::shared_ptr<ModelFloat> ModelFloatPtr;
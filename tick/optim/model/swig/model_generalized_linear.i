@@ -12,7 +12,37 @@ class ModelGeneralizedLinear : public ModelLabelsFeatures {
                          const bool fit_intercept,
                          const int n_threads = 1);
 
+  ModelGeneralizedLinear(const SBaseArrayDouble2dPtrList1D &feature_shards,
+                         const SArrayDoublePtr labels,
+                         const bool fit_intercept,
+                         const int n_threads = 1);
+
+  unsigned long get_n_coeffs() const override;
+
+  virtual void set_fit_intercept(bool fit_intercept);
+
+  virtual double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
+
+  SArrayDoublePtr get_features_norm_sq();
+};
+
+class ModelGeneralizedLinearFloat : public ModelLabelsFeaturesFloat {
+ public:
+  ModelGeneralizedLinearFloat(const SBaseArrayFloat2dPtr features,
+                              const SArrayFloatPtr labels,
+                              const bool fit_intercept,
+                              const int n_threads = 1);
+
+  ModelGeneralizedLinearFloat(const SBaseArrayFloat2dPtrList1D &feature_shards,
+                              const SArrayFloatPtr labels,
+                              const bool fit_intercept,
+                              const int n_threads = 1);
+
   unsigned long get_n_coeffs() const override;
 
   virtual void set_fit_intercept(bool fit_intercept);
+
+  virtual double loss_and_grad(const ArrayFloat &coeffs, ArrayFloat &out);
+
+  SArrayDoublePtr get_features_norm_sq();
 };
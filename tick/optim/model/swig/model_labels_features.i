@@ -12,6 +12,24 @@ class ModelLabelsFeatures : public virtual Model {
   ModelLabelsFeatures(const SBaseArrayDouble2dPtr features,
                       const SArrayDoublePtr labels);
 
+  ModelLabelsFeatures(const SBaseArrayDouble2dPtrList1D &feature_shards,
+                      const SArrayDoublePtr labels);
+
+  virtual unsigned long get_n_samples() const;
+  virtual unsigned long get_n_features() const;
+  unsigned long get_n_shards() const;
+};
+
+class ModelLabelsFeaturesFloat : public virtual ModelFloat {
+
+ public:
+  ModelLabelsFeaturesFloat(const SBaseArrayFloat2dPtr features,
+                           const SArrayFloatPtr labels);
+
+  ModelLabelsFeaturesFloat(const SBaseArrayFloat2dPtrList1D &feature_shards,
+                           const SArrayFloatPtr labels);
+
   virtual unsigned long get_n_samples() const;
   virtual unsigned long get_n_features() const;
+  unsigned long get_n_shards() const;
 };
@@ -15,3 +15,12 @@ class ModelLipschitz : public virtual Model {
   double get_lip_max() override;
   double get_lip_mean() override;
 };
+
+class ModelLipschitzFloat : public virtual ModelFloat {
+ public:
+
+  ModelLipschitzFloat();
+
+  double get_lip_max() override;
+  double get_lip_mean() override;
+};
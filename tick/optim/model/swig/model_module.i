@@ -1,8 +1,16 @@
 // License: BSD 3 clause
 
-%module model
+%module(threads="1") model
 
 %include defs.i
+
+// The GIL is only released while computing losses and gradients, so that
+// several models can be used at the same time from Python threads. Other
+// methods keep it since they might release arrays owned by Python
+%feature("nothreadallow");
+%feature("nothreadallow", "0") loss;
+%feature("nothreadallow", "0") grad;
+%feature("nothreadallow", "0") loss_and_grad;
 %include std_shared_ptr.i
 
 %shared_ptr(Model);
@@ -15,6 +23,14 @@
 %shared_ptr(ModelLogReg);
 %shared_ptr(ModelPoisReg);
 
+%shared_ptr(ModelFloat);
+%shared_ptr(ModelLabelsFeaturesFloat);
+%shared_ptr(ModelGeneralizedLinearFloat);
+%shared_ptr(ModelLipschitzFloat);
+%shared_ptr(ModelLinRegFloat);
+%shared_ptr(ModelLogRegFloat);
+%shared_ptr(ModelPoisRegFloat);
+
 %shared_ptr(ModelHawkes);
 
 %shared_ptr(ModelHawkesSingle);
@@ -9,7 +9,7 @@ enum class LinkType {
     exponential
 };
 
-class ModelPoisReg : public Model {
+class ModelPoisReg : public ModelGeneralizedLinear {
  public:
 
   ModelPoisReg(const SBaseArrayDouble2dPtr features,
@@ -18,6 +18,31 @@ class ModelPoisReg : public Model {
                const bool fit_intercept,
                const int n_threads);
 
+  ModelPoisReg(const SBaseArrayDouble2dPtrList1D &feature_shards,
+               const SArrayDoublePtr labels,
+               const LinkType link_type,
+               const bool fit_intercept,
+               const int n_threads);
+
+  inline void set_link_type(LinkType link_type);
+
+};
+
+class ModelPoisRegFloat : public ModelGeneralizedLinearFloat {
+ public:
+
+  ModelPoisRegFloat(const SBaseArrayFloat2dPtr features,
+                    const SArrayFloatPtr labels,
+                    const LinkType link_type,
+                    const bool fit_intercept,
+                    const int n_threads);
+
+  ModelPoisRegFloat(const SBaseArrayFloat2dPtrList1D &feature_shards,
+                    const SArrayFloatPtr labels,
+                    const LinkType link_type,
+                    const bool fit_intercept,
+                    const int n_threads);
+
   inline void set_link_type(LinkType link_type);
 
 };
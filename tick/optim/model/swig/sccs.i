@@ -14,12 +14,15 @@ class ModelSCCS : public Model {
   ModelSCCS(const SBaseArrayDouble2dPtrList1D &features,
             const SArrayIntPtrList1D &labels,
             const SBaseArrayULongPtr censoring,
-            ulong n_lags);
+            ulong n_lags,
+            const int n_threads = 1);
 
   double loss(ArrayDouble &coeffs);
 
   void grad(ArrayDouble &coeffs, ArrayDouble &out);
 
+  double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
+
   void compute_lip_consts();
 
   unsigned long get_rand_max();
@@ -13,12 +13,17 @@ public:
   ModelHawkesFixedExpKernLogLikList(const double decay,
                                     const int max_n_threads = 1);
 
+  double loss_i(const ulong i, const ArrayDouble &coeffs);
   double loss_and_grad(const ArrayDouble &coeffs, ArrayDouble &out);
   double hessian_norm(const ArrayDouble &coeffs, const ArrayDouble &vector);
   void hessian(const ArrayDouble &coeffs, ArrayDouble &out);
 
   void set_decay(const double decay);
 
+  double get_weights_tol() const;
+  void set_weights_tol(const double weights_tol);
+  ulong get_n_stored_weights() const;
+
   void incremental_set_data(const SArrayDoublePtrList1D &timestamps, double end_time);
 
   void compute_weights();
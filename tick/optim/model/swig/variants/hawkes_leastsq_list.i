@@ -14,4 +14,7 @@ class ModelHawkesLeastSqList : public ModelHawkesList {
   void incremental_set_data(const SArrayDoublePtrList1D &timestamps, double end_time);
 
   void compute_weights();
+
+  double get_window() const;
+  void set_window(const double window);
 };
@@ -12,6 +12,7 @@ class ModelHawkesList : public Model {
                   const unsigned int optimization_level = 0);
 
   void set_data(const SArrayDoublePtrList2D &timestamps_list, const VArrayDoublePtr end_time);
+  void append_events(const SArrayDoublePtrList1D &timestamps, double end_time);
 
   VArrayDoublePtr get_end_times() const;
   ulong get_n_coeffs() const;
@@ -22,4 +23,7 @@ class ModelHawkesList : public Model {
   SArrayULongPtr get_n_jumps_per_realization() const;
 
   void set_n_threads(const int max_n_threads);
+
+  void set_support(const SArrayULongPtr indptr, const SArrayULongPtr indices);
+  bool has_support() const;
 };
@@ -26,6 +26,35 @@ class Test(TestGLM):
         model_spars.fit(csr_matrix(features), times, censoring)
         self.run_test_for_glm(model, model_spars, 1e-5, 1e-4)
 
+    def test_ModelCoxRegPartialLik_n_threads(self):
+        """...Test Cox Regression loss and gradient are the same whatever the
+        number of threads and when computed together
+        """
+        np.random.seed(123)
+        n_samples, n_features = 200, 10
+        w0 = np.random.randn(n_features)
+        features, times, censoring = SimuCoxReg(w0, n_samples=n_samples,
+                                                verbose=False,
+                                                seed=1234).simulate()
+        features[np.random.rand(n_samples, n_features) < .7] = 0
+        coeffs = np.random.randn(n_features)
+
+        model = ModelCoxRegPartialLik().fit(features, times, censoring)
+        loss = model.loss(coeffs)
+        grad = model.grad(coeffs)
+
+        for n_threads in [1, 4]:
+            for X in [features, csr_matrix(features)]:
+                model_threads = ModelCoxRegPartialLik(n_threads=n_threads)
+                model_threads.fit(X, times, censoring)
+                loss_threads, grad_threads = \
+                    model_threads.loss_and_grad(coeffs)
+                self.assertAlmostEqual(loss_threads, loss)
+                np.testing.assert_almost_equal(grad_threads, grad)
+                self.assertAlmostEqual(model_threads.loss(coeffs), loss)
+                np.testing.assert_almost_equal(model_threads.grad(coeffs),
+                                               grad)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -6,6 +6,9 @@ from scipy.optimize import check_grad, fmin_bfgs
 
 import unittest
 
+from tick.optim.model.base import ModelGeneralizedLinear, LOSS, GRAD, \
+    LOSS_AND_GRAD
+
 
 class TestGLM(unittest.TestCase):
     def _test_grad(self, model, coeffs,
@@ -51,3 +54,61 @@ class TestGLM(unittest.TestCase):
             np.testing.assert_almost_equal(model.grad(coeffs),
                                            model_spars.grad(coeffs),
                                            decimal=10)
+
+        # Check that batch loss and gradient over all samples are the full
+        # loss and gradient
+        for m in [model, model_spars]:
+            if not isinstance(m, ModelGeneralizedLinear):
+                continue
+            indices = np.arange(m.n_samples, dtype=np.uint64)
+            grad_batch = np.empty(m.n_coeffs)
+            m._model.grad_batch(indices, coeffs, grad_batch)
+            np.testing.assert_almost_equal(grad_batch, m.grad(coeffs),
+                                           decimal=10)
+            self.assertAlmostEqual(m._model.loss_batch(indices, coeffs),
+                                   m.loss(coeffs))
+
+            # Check that the fused loss and gradient are the loss and
+            # gradient, at new coefficients and at the cached ones
+            for coeffs_ in [coeffs + 1., coeffs]:
+                n_passes_over_data = m.n_passes_over_data
+                loss, grad = m.loss_and_grad(coeffs_)
+                self.assertAlmostEqual(loss, m.loss(coeffs_))
+                np.testing.assert_almost_equal(grad, m.grad(coeffs_),
+                                               decimal=10)
+                self.assertEqual(m.n_passes_over_data - n_passes_over_data,
+                                 m.pass_per_operation[LOSS_AND_GRAD] +
+                                 m.pass_per_operation[LOSS] +
+                                 m.pass_per_operation[GRAD])
+
+    def run_test_for_glm_float32(self, model, model_float32, decimal=4):
+        """Checks that a model fitted on float32 features works in single
+        precision and gives the same loss and gradient as the float64 one
+        """
+        self.assertEqual(model_float32.dtype, np.float32)
+        self.assertEqual(model_float32.features.dtype, np.float32)
+        self.assertEqual(model_float32.labels.dtype, np.float32)
+
+        coeffs = np.random.randn(model.n_coeffs)
+        self.assertAlmostEqual(model_float32.loss(coeffs),
+                               model.loss(coeffs), places=decimal)
+        grad = model_float32.grad(coeffs)
+        self.assertEqual(grad.dtype, np.float32)
+        np.testing.assert_almost_equal(grad, model.grad(coeffs),
+                                       decimal=decimal)
+
+    def run_test_for_glm_shards(self, model, model_shards):
+        """Checks that a model fitted on shards of the features matrix gives
+        the same loss and gradient as the one fitted on the whole matrix
+        """
+        self.assertEqual(model_shards.n_samples, model.n_samples)
+        self.assertEqual(model_shards.n_features, model.n_features)
+        self.assertEqual(model_shards._model.get_n_shards(),
+                         len(model_shards.features))
+
+        coeffs = np.random.randn(model.n_coeffs)
+        self.assertAlmostEqual(model_shards.loss(coeffs), model.loss(coeffs))
+        np.testing.assert_almost_equal(model_shards.grad(coeffs),
+                                       model.grad(coeffs), decimal=10)
+        self.assertAlmostEqual(model_shards.get_lip_max(),
+                               model.get_lip_max())
@@ -3,11 +3,12 @@
 import unittest
 import numpy as np
 from scipy.optimize import check_grad
+from scipy.sparse import block_diag
 
 from tick.optim.model import ModelHawkesFixedExpKernLeastSq
 
 from tick.optim.model.tests.hawkes_utils import hawkes_exp_kernel_intensities, \
-    hawkes_least_square_error
+    hawkes_least_square_error, split_last_realization
 
 
 class Test(unittest.TestCase):
@@ -94,6 +95,84 @@ class Test(unittest.TestCase):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_least_sq_append_events(self):
+        """...Test that events appended to ModelHawkesFixedExpKernLeastSq
+        give the same model as fitting all of them at once
+        """
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 3, 2 * end_time / 3])
+
+        for incremental in [False, True]:
+            model = ModelHawkesFixedExpKernLeastSq(decays=self.decays,
+                                                   n_threads=2)
+            if incremental:
+                for events, events_end_time in zip(first_events,
+                                                   first_end_times):
+                    model.incremental_fit(events, end_time=events_end_time)
+            else:
+                model.fit(first_events, end_times=first_end_times)
+
+            for events, events_end_time in chunks:
+                model.append_events(events, end_time=events_end_time)
+
+            self.assertEqual(model.n_jumps, self.model_list.n_jumps)
+            np.testing.assert_almost_equal(model.end_times,
+                                           self.model_list.end_times)
+            self.assertAlmostEqual(model.loss(self.coeffs),
+                                   self.model_list.loss(self.coeffs))
+            np.testing.assert_almost_equal(model.grad(self.coeffs),
+                                           self.model_list.grad(self.coeffs))
+            np.testing.assert_almost_equal(
+                model.hessian(self.coeffs).todense(),
+                self.model_list.hessian(self.coeffs).todense())
+
+        msg = "^Appended events of component 0 start at"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            model.append_events([np.array([end_time / 2]), np.array([]),
+                                 np.array([])], end_time=2 * end_time)
+        # The model is left unchanged
+        self.assertAlmostEqual(model.loss(self.coeffs),
+                               self.model_list.loss(self.coeffs))
+
+    def test_model_hawkes_least_sq_window(self):
+        """...Test that ModelHawkesFixedExpKernLeastSq with a window forgets
+        the batches of appended events ending before the window
+        """
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 3, 2 * end_time / 3])
+
+        # Events of the last realization before end_time / 3 are forgotten,
+        # the other realizations are kept
+        model = ModelHawkesFixedExpKernLeastSq(decays=self.decays,
+                                               window=end_time / 2)
+        model.fit(first_events, end_times=first_end_times)
+        for events, events_end_time in chunks:
+            model.append_events(events, end_time=events_end_time)
+
+        model_cut = ModelHawkesFixedExpKernLeastSq(decays=self.decays)
+        model_cut.fit(first_events, end_times=first_end_times)
+        model_kept = ModelHawkesFixedExpKernLeastSq(decays=self.decays)
+        model_kept.fit(self.timestamps_list[:-1])
+
+        n_jumps = self.model_list.n_jumps - model_cut.n_jumps + \
+            model_kept.n_jumps
+        self.assertAlmostEqual(
+            model.loss(self.coeffs) * n_jumps,
+            self.model_list.loss(self.coeffs) * self.model_list.n_jumps -
+            model_cut.loss(self.coeffs) * model_cut.n_jumps +
+            model_kept.loss(self.coeffs) * model_kept.n_jumps)
+
+        # Fitting again accounts for all events
+        model.fit(self.timestamps_list)
+        self.assertAlmostEqual(model.loss(self.coeffs),
+                               self.model_list.loss(self.coeffs))
+
+        msg = "^window must be positive, received -1"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            model.window = -1.
+
     def test_model_hawkes_least_sq_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
@@ -145,6 +224,82 @@ class Test(unittest.TestCase):
         self.assertEqual(self.model_list.loss(self.coeffs),
                          model_change_decay.loss(self.coeffs))
 
+    def test_model_hawkes_least_sq_support(self):
+        """...Test that ModelHawkesFixedExpKernLeastSq with a support gives
+        the same results as the dense model with zero adjacency outside of the
+        support
+        """
+        support = np.array([[1, 0, 1],
+                            [0, 0, 0],
+                            [1, 1, 0]])
+        mask = support.ravel() != 0
+        adjacency = self.adjacency * support
+        coeffs = np.hstack((self.baseline, adjacency.ravel()))
+        coeffs_support = np.hstack((self.baseline, adjacency.ravel()[mask]))
+        grad_mask = np.hstack((np.ones(self.n_nodes, dtype=bool), mask))
+
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 2])
+
+        model_support = ModelHawkesFixedExpKernLeastSq(
+            decays=self.decays, n_threads=2, support=support)
+        model_support.fit(first_events, end_times=first_end_times)
+        for events, events_end_time in chunks:
+            model_support.append_events(events, end_time=events_end_time)
+
+        self.assertEqual(model_support.n_coeffs, self.n_nodes + 4)
+        self.assertAlmostEqual(model_support.loss(coeffs_support),
+                               self.model_list.loss(coeffs))
+        np.testing.assert_almost_equal(
+            model_support.grad(coeffs_support),
+            self.model_list.grad(coeffs)[grad_mask])
+
+        with self.assertRaisesRegex(RuntimeError, "hessian is not available"):
+            model_support.hessian(coeffs_support)
+
+        model_wrong = ModelHawkesFixedExpKernLeastSq(decays=self.decays,
+                                                     support=np.eye(2))
+        with self.assertRaisesRegex(RuntimeError, "support indptr must have"):
+            model_wrong.fit(self.timestamps_list)
+            model_wrong.loss(np.ones(5))
+
+    def test_model_hawkes_least_sq_large_sparse_support(self):
+        """...Test that ModelHawkesFixedExpKernLeastSq computes its weights
+        on a large sparse support in a time depending on its number of
+        non-zeros, not on the number of nodes
+        """
+        n_blocks = 1500
+        block_support = np.array([[1, 1], [0, 1]])
+        support = block_diag([block_support] * n_blocks, format='csr')
+        decays = np.kron(np.eye(n_blocks), self.decays[:2, :2])
+        block_events = [t for t in self.timestamps_list[0][:2]]
+        end_time = max(map(max, block_events))
+        first_events, first_end_times, chunks = split_last_realization(
+            [block_events], [end_time / 2])
+
+        block_model = ModelHawkesFixedExpKernLeastSq(
+            decays=self.decays[:2, :2], support=block_support)
+        block_model.fit(block_events)
+        block_coeffs = np.random.rand(block_model.n_coeffs)
+
+        model = ModelHawkesFixedExpKernLeastSq(decays=decays, n_threads=2,
+                                               support=support)
+        model.fit(first_events[0] * n_blocks, end_times=first_end_times[0])
+        for events, events_end_time in chunks:
+            model.append_events(events * n_blocks, end_time=events_end_time)
+
+        def tile_coeffs(coeffs):
+            return np.hstack((np.tile(coeffs[:2], n_blocks),
+                              np.tile(coeffs[2:], n_blocks)))
+
+        coeffs = tile_coeffs(block_coeffs)
+        self.assertAlmostEqual(model.loss(coeffs),
+                               block_model.loss(block_coeffs))
+        np.testing.assert_almost_equal(
+            model.grad(coeffs) * n_blocks,
+            tile_coeffs(block_model.grad(block_coeffs)))
+
     def test_hawkes_list_n_threads(self):
         """...Test that the number of used threads is as expected
         """
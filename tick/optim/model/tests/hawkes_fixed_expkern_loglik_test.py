@@ -6,7 +6,7 @@ from scipy.optimize import check_grad
 
 from tick.optim.model import ModelHawkesFixedExpKernLogLik
 from tick.optim.model.tests.hawkes_utils import hawkes_log_likelihood, \
-    hawkes_exp_kernel_intensities
+    hawkes_exp_kernel_intensities, split_last_realization
 
 
 class Test(unittest.TestCase):
@@ -94,6 +94,48 @@ class Test(unittest.TestCase):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_loglik_append_events(self):
+        """...Test that events appended to ModelHawkesFixedExpKernLogLik
+        give the same model as fitting all of them at once, with dense and
+        sparse weights
+        """
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 3, 2 * end_time / 3])
+
+        for weights_tol in [0., 1e-10]:
+            for incremental in [False, True]:
+                model = ModelHawkesFixedExpKernLogLik(
+                    self.decay, n_threads=2, weights_tol=weights_tol)
+                if incremental:
+                    for events, events_end_time in zip(first_events,
+                                                       first_end_times):
+                        model.incremental_fit(events,
+                                              end_time=events_end_time)
+                else:
+                    model.fit(first_events, end_times=first_end_times)
+
+                for events, events_end_time in chunks:
+                    model.append_events(events, end_time=events_end_time)
+
+                self.assertEqual(model.n_jumps, self.model_list.n_jumps)
+                self.assertAlmostEqual(model.loss(self.coeffs),
+                                       self.model_list.loss(self.coeffs))
+                np.testing.assert_almost_equal(
+                    model.grad(self.coeffs), self.model_list.grad(self.coeffs))
+                np.testing.assert_almost_equal(
+                    model.hessian(self.coeffs).todense(),
+                    self.model_list.hessian(self.coeffs).todense())
+
+        msg = "^Provided end_time \\(1\\) is smaller than current end_time"
+        with self.assertRaisesRegex(RuntimeError, msg):
+            model.append_events([np.array([]) for _ in range(self.n_nodes)],
+                                end_time=1.)
+
+        msg = "^``end_time`` must be given when no events are appended$"
+        with self.assertRaisesRegex(ValueError, msg):
+            model.append_events([np.array([]) for _ in range(self.n_nodes)])
+
     def test_model_hawkes_loglik_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
@@ -102,6 +144,30 @@ class Test(unittest.TestCase):
                                    self.coeffs),
                         1e-5)
 
+    def test_model_hawkes_loglik_batch(self):
+        """...Test that ModelHawkesFixedExpKernLogLik batch loss and gradient
+        are the averages over the selected samples
+        """
+        for model in [self.model, self.model_list]:
+            n_samples = model.n_jumps
+            indices = np.arange(n_samples, dtype=np.uint64)
+            grad_batch = np.empty(model.n_coeffs)
+            model._model.grad_batch(indices, self.coeffs, grad_batch)
+            np.testing.assert_almost_equal(grad_batch,
+                                           model.grad(self.coeffs))
+            self.assertAlmostEqual(
+                model._model.loss_batch(indices, self.coeffs),
+                model.loss(self.coeffs))
+
+            indices = np.array([1, 4, 4, n_samples - 1], dtype=np.uint64)
+            grads = []
+            for i in indices:
+                model._model.grad_batch(np.array([i]), self.coeffs,
+                                        grad_batch)
+                grads += [grad_batch.copy()]
+            model._model.grad_batch(indices, self.coeffs, grad_batch)
+            np.testing.assert_almost_equal(grad_batch, np.mean(grads, axis=0))
+
     def test_model_hawkes_loglik_hessian_norm(self):
         """...Test that ModelHawkesFixedExpKernLeastSq hessian norm is
         consistent with gradient
@@ -196,5 +262,104 @@ class Test(unittest.TestCase):
 
                 self.assertLess(check_grad(g_i, h_i, self.coeffs), 1e-5)
 
+    def test_model_hawkes_loglik_weights_tol(self):
+        """...Test that ModelHawkesFixedExpKernLogLik with sparse weights
+        gives the same results as with dense weights and stores fewer weights
+        when nodes are active at different times
+        """
+        # Each node is only active on its own time interval
+        decay = 3.
+        timestamps = [20 * i + np.sort(np.random.rand(20) * 5)
+                      for i in range(self.n_nodes)]
+        coeffs = np.hstack((self.baseline, self.adjacency.ravel()))
+        vector = np.random.rand(len(coeffs))
+
+        model = ModelHawkesFixedExpKernLogLik(decay).fit(timestamps)
+        for weights_tol, decimal in [(1e-300, 10), (1e-8, 6)]:
+            model_sparse = ModelHawkesFixedExpKernLogLik(
+                decay, n_threads=2, weights_tol=weights_tol).fit(timestamps)
+            self.assertEqual(model_sparse.weights_tol, weights_tol)
+
+            np.testing.assert_almost_equal(model_sparse.loss(coeffs),
+                                           model.loss(coeffs), decimal)
+            np.testing.assert_almost_equal(model_sparse.grad(coeffs),
+                                           model.grad(coeffs), decimal)
+            np.testing.assert_almost_equal(
+                model_sparse.hessian_norm(coeffs, vector),
+                model.hessian_norm(coeffs, vector), decimal)
+            np.testing.assert_almost_equal(
+                model_sparse.hessian(coeffs).todense(),
+                model.hessian(coeffs).todense(), decimal)
+
+            indices = np.array([0, 3, 19, 20, 59], dtype=np.uint64)
+            for i in indices:
+                self.assertAlmostEqual(
+                    model_sparse._model.loss_i(int(i), coeffs),
+                    model._model.loss_i(int(i), coeffs), decimal)
+            grad_batch, grad_batch_sparse = np.empty((2, len(coeffs)))
+            model._model.grad_batch(indices, coeffs, grad_batch)
+            model_sparse._model.grad_batch(indices, coeffs,
+                                           grad_batch_sparse)
+            np.testing.assert_almost_equal(grad_batch_sparse, grad_batch,
+                                           decimal)
+
+        self.assertLess(model_sparse.n_stored_weights,
+                        model.n_stored_weights / 2)
+
+        # Changing the tolerance recomputes the weights
+        model.weights_tol = 1e-8
+        self.assertAlmostEqual(model.loss(coeffs), model_sparse.loss(coeffs))
+        self.assertEqual(model.n_stored_weights,
+                         model_sparse.n_stored_weights)
+
+        with self.assertRaisesRegex(RuntimeError, "weights_tol must be non "
+                                                  "negative"):
+            model.weights_tol = -1.
+
+    def test_model_hawkes_loglik_support(self):
+        """...Test that ModelHawkesFixedExpKernLogLik with a support gives the
+        same results as the dense model with zero adjacency outside of the
+        support
+        """
+        support = np.array([[1, 0, 1],
+                            [0, 0, 0],
+                            [1, 1, 0]])
+        mask = support.ravel() != 0
+        adjacency = self.adjacency * support
+        coeffs = np.hstack((self.baseline, adjacency.ravel()))
+        coeffs_support = np.hstack((self.baseline, adjacency.ravel()[mask]))
+        grad_mask = np.hstack((np.ones(self.n_nodes, dtype=bool), mask))
+
+        for weights_tol in [0., 1e-8]:
+            model = ModelHawkesFixedExpKernLogLik(
+                self.decay, weights_tol=weights_tol)
+            model.fit(self.timestamps_list)
+            model_support = ModelHawkesFixedExpKernLogLik(
+                self.decay, n_threads=2, weights_tol=weights_tol,
+                support=support)
+            model_support.fit(self.timestamps_list)
+
+            self.assertEqual(model_support.n_coeffs, self.n_nodes + 4)
+            self.assertAlmostEqual(model_support.loss(coeffs_support),
+                                   model.loss(coeffs))
+            np.testing.assert_almost_equal(model_support.grad(coeffs_support),
+                                           model.grad(coeffs)[grad_mask])
+            vector = np.random.rand(len(coeffs)) * grad_mask
+            self.assertAlmostEqual(
+                model_support.hessian_norm(coeffs_support, vector[grad_mask]),
+                model.hessian_norm(coeffs, vector))
+            self.assertLess(model_support.n_stored_weights,
+                            model.n_stored_weights)
+
+        with self.assertRaisesRegex(RuntimeError, "hessian is not available"):
+            model_support.hessian(coeffs_support)
+
+        model_wrong = ModelHawkesFixedExpKernLogLik(self.decay,
+                                                    support=np.eye(2))
+        with self.assertRaisesRegex(RuntimeError, "support indptr must have"):
+            model_wrong.fit(self.timestamps_list)
+            model_wrong.loss(np.ones(5))
+
+
 if __name__ == '__main__':
     unittest.main()
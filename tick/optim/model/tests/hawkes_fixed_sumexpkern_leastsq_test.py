@@ -11,7 +11,7 @@ from tick.optim.model import ModelHawkesFixedSumExpKernLeastSq
 
 from tick.optim.model.tests.hawkes_utils import (
     hawkes_sumexp_kernel_intensities, hawkes_sumexp_kernel_varying_intensities,
-    hawkes_least_square_error)
+    hawkes_least_square_error, split_last_realization)
 
 
 class Test(InferenceTest):
@@ -162,6 +162,84 @@ class Test(InferenceTest):
         self.assertEqual(model_incremental_fit.loss(self.coeffs),
                          self.model_list.loss(self.coeffs))
 
+    def test_model_hawkes_least_sq_append_events(self):
+        """...Test that events appended to ModelHawkesFixedSumExpKernLeastSq
+        give the same model as fitting all of them at once, with constant
+        and varying baselines
+        """
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 3, 2 * end_time / 3])
+
+        for n_baselines, period_length in [(1, 1.), (3, 1.4)]:
+            model_list = ModelHawkesFixedSumExpKernLeastSq(
+                decays=self.decays, n_baselines=n_baselines,
+                period_length=period_length)
+            model_list.fit(self.timestamps_list)
+            coeffs = np.random.rand(model_list.n_coeffs)
+
+            for incremental in [False, True]:
+                model = ModelHawkesFixedSumExpKernLeastSq(
+                    decays=self.decays, n_baselines=n_baselines,
+                    period_length=period_length, n_threads=2)
+                if incremental:
+                    for events, events_end_time in zip(first_events,
+                                                       first_end_times):
+                        model.incremental_fit(events,
+                                              end_time=events_end_time)
+                else:
+                    model.fit(first_events, end_times=first_end_times)
+
+                for events, events_end_time in chunks:
+                    model.append_events(events, end_time=events_end_time)
+
+                self.assertEqual(model.n_jumps, model_list.n_jumps)
+                self.assertAlmostEqual(model.loss(coeffs),
+                                       model_list.loss(coeffs))
+                np.testing.assert_almost_equal(model.grad(coeffs),
+                                               model_list.grad(coeffs))
+
+    def test_model_hawkes_least_sq_window(self):
+        """...Test that ModelHawkesFixedSumExpKernLeastSq with a window
+        forgets the batches of appended events ending before the window
+        """
+        end_time = max(map(max, self.timestamps_list[-1]))
+        first_events, first_end_times, chunks = split_last_realization(
+            self.timestamps_list, [end_time / 3, 2 * end_time / 3])
+
+        model_list = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=3, period_length=1.4)
+        model_list.fit(self.timestamps_list)
+        coeffs = np.random.rand(model_list.n_coeffs)
+
+        # Events of the last realization before end_time / 3 are forgotten,
+        # the other realizations are kept
+        model = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=3, period_length=1.4,
+            window=end_time / 2)
+        model.fit(first_events, end_times=first_end_times)
+        for events, events_end_time in chunks:
+            model.append_events(events, end_time=events_end_time)
+
+        model_cut = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=3, period_length=1.4)
+        model_cut.fit(first_events, end_times=first_end_times)
+        model_kept = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=3, period_length=1.4)
+        model_kept.fit(self.timestamps_list[:-1])
+
+        n_jumps = model_list.n_jumps - model_cut.n_jumps + model_kept.n_jumps
+        self.assertAlmostEqual(
+            model.loss(coeffs) * n_jumps,
+            model_list.loss(coeffs) * model_list.n_jumps -
+            model_cut.loss(coeffs) * model_cut.n_jumps +
+            model_kept.loss(coeffs) * model_kept.n_jumps)
+        np.testing.assert_almost_equal(
+            model.grad(coeffs) * n_jumps,
+            model_list.grad(coeffs) * model_list.n_jumps -
+            model_cut.grad(coeffs) * model_cut.n_jumps +
+            model_kept.grad(coeffs) * model_kept.n_jumps)
+
     def test_model_hawkes_least_sq_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
@@ -177,6 +255,37 @@ class Test(InferenceTest):
             self.assertAlmostEqual(norm(model.grad(coeffs_min)),
                                    .0, delta=1e-4)
 
+    def test_model_hawkes_least_sq_support(self):
+        """...Test that ModelHawkesFixedSumExpKernLeastSq with a support gives
+        the same results as the dense model with zero adjacency outside of the
+        support
+        """
+        support = np.array([[1, 0, 1],
+                            [0, 0, 0],
+                            [1, 1, 0]])
+        mask = np.repeat(support.ravel() != 0, self.n_decays)
+        adjacency = self.adjacency * support[:, :, np.newaxis]
+        grad_mask = np.hstack((np.ones(2 * self.dim, dtype=bool), mask))
+
+        model = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=2, period_length=1.5)
+        model.fit(self.timestamps_list)
+        model_support = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=2, period_length=1.5,
+            n_threads=2, support=support)
+        model_support.fit(self.timestamps_list)
+
+        baseline = np.random.rand(self.dim, 2)
+        coeffs = np.hstack((baseline.ravel(), adjacency.ravel()))
+        coeffs_support = np.hstack((baseline.ravel(), adjacency.ravel()[mask]))
+
+        self.assertEqual(model_support.n_coeffs,
+                         2 * self.dim + 4 * self.n_decays)
+        self.assertAlmostEqual(model_support.loss(coeffs_support),
+                               model.loss(coeffs))
+        np.testing.assert_almost_equal(model_support.grad(coeffs_support),
+                                       model.grad(coeffs)[grad_mask])
+
     def test_model_hawkes_least_sq_change_decays(self):
         """...Test that loss is still consistent after decays modification in
         ModelHawkesFixedSumExpKernLeastSq
@@ -236,6 +345,32 @@ class Test(InferenceTest):
                                model.loss(coeffs),
                                places=2)
 
+    def test_model_hawkes_varying_baseline_many_periods(self):
+        """...Test that ModelHawkesFixedSumExpKernLeastSq with a varying
+        baseline taking the same value on all intervals of many short periods
+        is consistent with a constant baseline
+        """
+        n_baselines = 4
+        period_length = .3
+        model = ModelHawkesFixedSumExpKernLeastSq(
+            decays=self.decays, n_baselines=n_baselines,
+            period_length=period_length)
+        model.fit(self.timestamps_list)
+
+        coeffs = np.hstack((np.repeat(self.baseline, n_baselines),
+                            self.adjacency.ravel()))
+        self.assertAlmostEqual(model.loss(coeffs),
+                               self.model_list.loss(self.coeffs))
+
+        grad = model.grad(coeffs)
+        constant_grad = self.model_list.grad(self.coeffs)
+        n_baseline_coeffs = self.dim * n_baselines
+        np.testing.assert_almost_equal(
+            grad[:n_baseline_coeffs].reshape(self.dim, n_baselines).sum(
+                axis=1), constant_grad[:self.dim])
+        np.testing.assert_almost_equal(grad[n_baseline_coeffs:],
+                                       constant_grad[self.dim:])
+
     def test_model_hawkes_varying_baseline_least_sq_grad(self):
         """...Test that ModelHawkesFixedExpKernLeastSq gradient is consistent
         with loss
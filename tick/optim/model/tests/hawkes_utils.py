@@ -109,3 +109,22 @@ def hawkes_sumexp_kernel_varying_intensities(baseline, decays, adjacency,
                 sum_exponential_kernel(t, adjacency[i, j], decays)
 
     return hawkes_intensities_varying_baseline(timestamps, baseline, kernels)
+
+
+def split_last_realization(timestamps_list, cuts):
+    """Splits the last realization at the given times, returns the
+    realizations cut at the first time, their end times, and the chunks of
+    events following each cut with their end times
+    """
+    timestamps = timestamps_list[-1]
+    end_time = max(map(max, timestamps))
+    bounds = [0] + list(cuts) + [end_time]
+
+    chunks = [[t[(t >= start) & ((t < end) | (end == end_time))]
+               for t in timestamps]
+              for start, end in zip(bounds[:-1], bounds[1:])]
+    first_events = timestamps_list[:-1] + [chunks[0]]
+    first_end_times = np.array([max(map(max, events))
+                                for events in timestamps_list[:-1]] +
+                               [cuts[0]])
+    return first_events, first_end_times, list(zip(chunks[1:], bounds[2:]))
@@ -38,6 +38,31 @@ class Test(TestGLM):
         model_spars = ModelLinReg(fit_intercept=False).fit(X_spars, y)
         self.run_test_for_glm(model, model_spars, 1e-5, 1e-4)
 
+        # Check that float32 features are used natively, dense and sparse
+        X_float32 = X.astype(np.float32)
+        model_float32 = ModelLinReg(fit_intercept=False).fit(X_float32, y)
+        model_spars_float32 = ModelLinReg(fit_intercept=False) \
+            .fit(X_spars.astype(np.float32), y)
+        self.assertIs(model_float32.features, X_float32)
+        self.run_test_for_glm_float32(model, model_float32)
+        self.run_test_for_glm_float32(model_spars, model_spars_float32)
+
+        # Check that features split in shards give the same model
+        rows = [slice(0, 1000), slice(1000, 1001), slice(1001, n_samples)]
+        model_shards = ModelLinReg(fit_intercept=False) \
+            .fit([X[r] for r in rows], y)
+        model_spars_shards = ModelLinReg(fit_intercept=False) \
+            .fit([X_spars[r] for r in rows], y)
+        self.run_test_for_glm_shards(model, model_shards)
+        self.run_test_for_glm_shards(model_spars, model_spars_shards)
+        # The Lipschitz constant is computed across shards
+        self.assertAlmostEqual(model_shards.get_lip_best(),
+                               model.get_lip_best())
+        self.assertAlmostEqual(model_spars_shards.get_lip_best(),
+                               model.get_lip_best())
+        with self.assertRaisesRegex(ValueError, "columns"):
+            ModelLinReg().fit([X[:10], X[10:, 1:]], y)
+
         # Test for the Lipschitz constants without intercept
         self.assertAlmostEqual(model.get_lip_best(), 2.6873683857125981)
         self.assertAlmostEqual(model.get_lip_mean(), 9.95845726788432)
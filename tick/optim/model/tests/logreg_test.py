@@ -38,6 +38,31 @@ class Test(TestGLM):
         model_spars = ModelLogReg(fit_intercept=False).fit(X_spars, y)
         self.run_test_for_glm(model, model_spars, 1e-5, 1e-4)
 
+        # Check that float32 features are used natively, dense and sparse
+        X_float32 = X.astype(np.float32)
+        model_float32 = ModelLogReg(fit_intercept=False).fit(X_float32, y)
+        model_spars_float32 = ModelLogReg(fit_intercept=False) \
+            .fit(X_spars.astype(np.float32), y)
+        self.assertIs(model_float32.features, X_float32)
+        self.run_test_for_glm_float32(model, model_float32)
+        self.run_test_for_glm_float32(model_spars, model_spars_float32)
+
+        # Check that features split in shards give the same model
+        rows = [slice(0, 1000), slice(1000, 1001), slice(1001, n_samples)]
+        model_shards = ModelLogReg(fit_intercept=False) \
+            .fit([X[r] for r in rows], y)
+        model_spars_shards = ModelLogReg(fit_intercept=False) \
+            .fit([X_spars[r] for r in rows], y)
+        self.run_test_for_glm_shards(model, model_shards)
+        self.run_test_for_glm_shards(model_spars, model_spars_shards)
+        # The Lipschitz constant is computed across shards
+        self.assertAlmostEqual(model_shards.get_lip_best(),
+                               model.get_lip_best())
+        self.assertAlmostEqual(model_spars_shards.get_lip_best(),
+                               model.get_lip_best())
+        with self.assertRaisesRegex(ValueError, "columns"):
+            ModelLogReg().fit([X[:10], X[10:, 1:]], y)
+
         # Test for the Lipschitz constants without intercept
         self.assertAlmostEqual(model.get_lip_best(), 0.67184209642814952)
         self.assertAlmostEqual(model.get_lip_mean(), 2.48961431697108)
@@ -54,6 +79,73 @@ class Test(TestGLM):
         self.assertAlmostEqual(model_spars.get_lip_mean(), model.get_lip_mean())
         self.assertAlmostEqual(model_spars.get_lip_max(), model.get_lip_max())
 
+    def test_ModelLogReg_batch(self):
+        """...Test that the loss and gradient of a batch of samples are the
+        ones of the model fitted on these samples, with more features than
+        a block of the batch kernels
+        """
+        np.random.seed(12)
+        n_samples, n_features = 200, 1300
+        X, y = SimuLogReg(np.random.randn(n_features), -1.,
+                          n_samples=n_samples, verbose=False).simulate()
+        X[np.random.rand(n_samples, n_features) < 0.5] = 0
+        indices = np.random.choice(n_samples, 17, replace=False)
+        coeffs = np.random.randn(n_features + 1) / n_features
+
+        for fit_intercept in [True, False]:
+            n_coeffs = n_features + int(fit_intercept)
+            model_batch = ModelLogReg(fit_intercept=fit_intercept)
+            model_batch.fit(X[indices], y[indices])
+            grad = model_batch.grad(coeffs[:n_coeffs])
+            loss = model_batch.loss(coeffs[:n_coeffs])
+
+            for features in [X, csr_matrix(X), [X[:50], X[50:]]]:
+                model = ModelLogReg(fit_intercept=fit_intercept)
+                model.fit(features, y)
+                grad_batch = np.empty(n_coeffs)
+                model._model.grad_batch(indices.astype(np.uint64),
+                                        coeffs[:n_coeffs], grad_batch)
+                np.testing.assert_almost_equal(grad_batch, grad, decimal=10)
+                self.assertAlmostEqual(
+                    model._model.loss_batch(indices.astype(np.uint64),
+                                            coeffs[:n_coeffs]), loss)
+
+    def test_ModelLogReg_features_norm_sq(self):
+        """...Test the squared norms of the features rows are the same
+        whatever the number of threads, the sparsity and the shards of the
+        features, and that they follow in place modifications of the features
+        """
+        np.random.seed(12)
+        n_samples, n_features = 1000, 10
+        X, y = SimuLogReg(np.random.randn(n_features), None,
+                          n_samples=n_samples, verbose=False).simulate()
+        X[np.random.rand(n_samples, n_features) < 0.5] = 0
+        X_spars = csr_matrix(X)
+        norms_sq = (X ** 2).sum(axis=1)
+
+        with self.assertRaisesRegex(ValueError, "call ``fit`` before"):
+            ModelLogReg().get_features_norm_sq()
+
+        for features in [X, X_spars, [X[:300], X[300:]],
+                         [X_spars[:300], X_spars[300:]]]:
+            for n_threads in [1, 4]:
+                model = ModelLogReg(n_threads=n_threads).fit(features, y)
+                np.testing.assert_almost_equal(model.get_features_norm_sq(),
+                                               norms_sq)
+
+        # Norms are computed again by models fitted after the matrix is
+        # modified in place, including the ones fitted before
+        model_1 = ModelLogReg(n_threads=4).fit(X, y)
+        lip_max = model_1.get_lip_max()
+        X *= 2
+        model_2 = ModelLogReg(fit_intercept=False).fit(X, y)
+        self.assertAlmostEqual(model_2.get_lip_max(), 4 * lip_max - 1)
+        np.testing.assert_almost_equal(model_2.get_features_norm_sq(),
+                                       4 * norms_sq)
+        model_1.fit(X, y)
+        np.testing.assert_almost_equal(model_1.get_features_norm_sq(),
+                                       4 * norms_sq)
+
 
 if __name__ == '__main__':
     unittest.main()
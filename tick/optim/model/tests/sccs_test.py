@@ -67,6 +67,31 @@ class ModelSCCSTest(unittest.TestCase):
             .fit(X_sparse, y, censoring)
         self._test_grad(model, coeffs)
 
+    def test_loss_and_grad_n_threads(self):
+        """Test longitudinal multinomial model loss and gradient are the same
+        whatever the number of threads and when computed together."""
+        sim = SimuSCCS(200, 20, 3, 4, None, True, "infinite", seed=42,
+                       verbose=False)
+        X, y, censoring, coeffs = sim.simulate()
+        X = LongitudinalFeaturesLagger(n_lags=4) \
+            .fit_transform(X, censoring)
+        model = ModelSCCS(n_intervals=20, n_lags=4).fit(X, y, censoring)
+        loss = model.loss(coeffs)
+        grad = model.grad(coeffs)
+
+        for n_threads in [1, 3]:
+            model_threads = ModelSCCS(n_intervals=20, n_lags=4,
+                                      n_threads=n_threads)
+            model_threads.fit(X, y, censoring)
+            loss_threads, grad_threads = model_threads.loss_and_grad(coeffs)
+            self.assertAlmostEqual(loss_threads, loss)
+            np.testing.assert_almost_equal(grad_threads, grad)
+
+            # Loss and gradient are computed again at the same coefficients
+            # from the stored inner products
+            self.assertAlmostEqual(model_threads.loss(coeffs), loss)
+            np.testing.assert_almost_equal(model_threads.grad(coeffs), grad)
+
     def test_lipschitz_constant(self):
         """Test longitudinal multinomial model Lipschitz constant."""
         X = [np.array([[0, 0, 1],
@@ -1,6 +1,7 @@
 # License: BSD 3 clause
 
 from abc import ABC, abstractmethod
+from copy import copy
 import numpy as np
 from tick.base import Base
 
@@ -12,6 +13,12 @@ class Prox(ABC, Base):
     ----------
     range : `tuple` of two `int`, default=`None`
         Range on which the prox is applied
+
+    Attributes
+    ----------
+    dtype : `numpy.dtype` (read-only)
+        Floating point type of the coefficients the prox is applied on,
+        see ``astype``
     """
 
     _attrinfos = {
@@ -20,16 +27,23 @@ class Prox(ABC, Base):
         },
         "_range": {
             "writable": False
+        },
+        "dtype": {
+            "writable": False
         }
     }
 
     # The name of the attribute that will contain the C++ prox object
     _cpp_obj_name = "_prox"
 
+    # Maps the floating point types supported by the prox to its C++ class
+    _cpp_class_dtype_map = {}
+
     def __init__(self, range: tuple=None):
         Base.__init__(self)
         self._range = None
         self._prox = None
+        self.dtype = np.dtype(np.float64)
         self.range = range
 
     @property
@@ -104,3 +118,44 @@ class Prox(ABC, Base):
     @abstractmethod
     def value(self, coeffs: np.ndarray) -> float:
         pass
+
+    def astype(self, dtype):
+        """Gives the prox applied on coefficients of the given floating
+        point type
+
+        Parameters
+        ----------
+        dtype : `numpy.dtype` or `str`
+            Either ``float64`` or ``float32``
+
+        Returns
+        -------
+        output : `Prox`
+            The current instance if it already has the given ``dtype``,
+            otherwise a copy of it with a C++ prox working with ``dtype``
+        """
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        if dtype not in self._cpp_class_dtype_map:
+            raise ValueError("%s does not support dtype %s"
+                             % (self.__class__.__name__, dtype))
+        prox = copy(self)
+        prox._set("dtype", dtype)
+        prox._set("_prox", prox._build_cpp_prox(dtype))
+        return prox
+
+    def _build_cpp_prox(self, dtype):
+        """Builds the C++ prox working with the given dtype, with the
+        current parameters of the prox
+
+        Notes
+        -----
+        Must be overloaded in child classes supporting several dtypes
+        """
+        raise NotImplementedError()
+
+    def _as_dict(self):
+        dd = Base._as_dict(self)
+        dd["dtype"] = self.dtype.name
+        return dd
@@ -5,6 +5,7 @@
 import numpy as np
 from .base import Prox
 from .build.prox import ProxElasticNet as _ProxElasticNet
+from .build.prox import ProxElasticNetFloat as _ProxElasticNetFloat
 
 __author__ = 'Maryan Morel'
 
@@ -49,17 +50,26 @@ class ProxElasticNet(Prox):
         }
     }
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _ProxElasticNet,
+        np.dtype(np.float32): _ProxElasticNetFloat
+    }
+
     def __init__(self, strength: float, ratio: float, range: tuple=None,
                  positive=False):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxElasticNet(strength, ratio, positive)
-        else:
-            self._prox = _ProxElasticNet(strength, ratio, range[0],
-                                         range[1], positive)
         self.positive = positive
         self.strength = strength
         self.ratio = ratio
+        self._prox = self._build_cpp_prox(self.dtype)
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = self._cpp_class_dtype_map[dtype]
+        if self.range is None:
+            return prox_class(self.strength, self.ratio, self.positive)
+        else:
+            return prox_class(self.strength, self.ratio, self.range[0],
+                              self.range[1], self.positive)
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
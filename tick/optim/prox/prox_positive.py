@@ -5,6 +5,7 @@
 import numpy as np
 from .base import Prox
 from .build.prox import ProxPositive as _ProxPositive
+from .build.prox import ProxPositiveFloat as _ProxPositiveFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -21,12 +22,21 @@ class ProxPositive(Prox):
         applied on the whole vector
     """
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _ProxPositive,
+        np.dtype(np.float32): _ProxPositiveFloat
+    }
+
     def __init__(self, range: tuple=None, positive: bool=False):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxPositive(0.)
+        self._prox = self._build_cpp_prox(self.dtype)
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = self._cpp_class_dtype_map[dtype]
+        if self.range is None:
+            return prox_class(0.)
         else:
-            self._prox = _ProxPositive(0., range[0], range[1])
+            return prox_class(0., self.range[0], self.range[1])
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
@@ -5,6 +5,7 @@
 import numpy as np
 from .base import Prox
 from .build.prox import ProxZero as _ProxZero
+from .build.prox import ProxZeroFloat as _ProxZeroFloat
 
 
 __author__ = 'Stephane Gaiffas'
@@ -24,12 +25,21 @@ class ProxZero(Prox):
     Using ``ProxZero`` means no penalization is applied on the model.
     """
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _ProxZero,
+        np.dtype(np.float32): _ProxZeroFloat
+    }
+
     def __init__(self, range: tuple=None):
         Prox.__init__(self, range)
-        if range is None:
-            self._prox = _ProxZero(0.)
+        self._prox = self._build_cpp_prox(self.dtype)
+
+    def _build_cpp_prox(self, dtype):
+        prox_class = self._cpp_class_dtype_map[dtype]
+        if self.range is None:
+            return prox_class(0.)
         else:
-            self._prox = _ProxZero(0., range[0], range[1])
+            return prox_class(0., self.range[0], self.range[1])
 
     def _call(self, coeffs: np.ndarray, step: object, out: np.ndarray):
         self._prox.call(coeffs, step, out)
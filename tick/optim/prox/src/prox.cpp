@@ -2,32 +2,37 @@
 
 #include "prox.h"
 
-Prox::Prox(double strength,
-           bool positive) {
+template <class T>
+TProx<T>::TProx(double strength,
+                bool positive) {
   has_range = false;
   this->strength = strength;
   this->positive = positive;
 }
 
-Prox::Prox(double strength,
-           ulong start,
-           ulong end,
-           bool positive) :
-  Prox(strength, positive) {
+template <class T>
+TProx<T>::TProx(double strength,
+                ulong start,
+                ulong end,
+                bool positive) :
+  TProx<T>(strength, positive) {
   set_start_end(start, end);
 }
 
-const std::string Prox::get_class_name() const {
+template <class T>
+const std::string TProx<T>::get_class_name() const {
   return "Prox";
 }
 
-const bool Prox::is_separable() const {
+template <class T>
+const bool TProx<T>::is_separable() const {
   return false;
 }
 
-void Prox::call(const ArrayDouble &coeffs,
-                double step,
-                ArrayDouble &out) {
+template <class T>
+void TProx<T>::call(const Array<T> &coeffs,
+                    double step,
+                    Array<T> &out) {
   if (has_range) {
     if (end > coeffs.size()) TICK_ERROR(
       get_class_name() << " of range [" << start << ", " << end
@@ -43,15 +48,17 @@ void Prox::call(const ArrayDouble &coeffs,
   call(coeffs, step, out, start, end);
 }
 
-void Prox::call(const ArrayDouble &coeffs,
-                double step,
-                ArrayDouble &out,
-                ulong start,
-                ulong end) {
+template <class T>
+void TProx<T>::call(const Array<T> &coeffs,
+                    double step,
+                    Array<T> &out,
+                    ulong start,
+                    ulong end) {
   TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-double Prox::value(const ArrayDouble &coeffs) {
+template <class T>
+double TProx<T>::value(const Array<T> &coeffs) {
   if (has_range) {
     if (end > coeffs.size()) TICK_ERROR(
       get_class_name() << " of range [" << start << ", " << end
@@ -65,22 +72,26 @@ double Prox::value(const ArrayDouble &coeffs) {
   return value(coeffs, start, end);
 }
 
-double Prox::value(const ArrayDouble &coeffs,
-                   ulong start,
-                   ulong end) {
+template <class T>
+double TProx<T>::value(const Array<T> &coeffs,
+                       ulong start,
+                       ulong end) {
   TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-double Prox::get_strength() const {
+template <class T>
+double TProx<T>::get_strength() const {
   return strength;
 }
 
-void Prox::set_strength(double strength) {
+template <class T>
+void TProx<T>::set_strength(double strength) {
   this->strength = strength;
 }
 
-void Prox::set_start_end(ulong start,
-                         ulong end) {
+template <class T>
+void TProx<T>::set_start_end(ulong start,
+                             ulong end) {
   if (start >= end) TICK_ERROR(
     get_class_name() << " can't have start(" << start
                      << ") greater or equal than end(" << end << ")");
@@ -89,18 +100,30 @@ void Prox::set_start_end(ulong start,
   this->end = end;
 }
 
-ulong Prox::get_start() const {
+template <class T>
+bool TProx<T>::get_has_range() const {
+  return has_range;
+}
+
+template <class T>
+ulong TProx<T>::get_start() const {
   return start;
 }
 
-ulong Prox::get_end() const {
+template <class T>
+ulong TProx<T>::get_end() const {
   return end;
 }
 
-bool Prox::get_positive() const {
+template <class T>
+bool TProx<T>::get_positive() const {
   return positive;
 }
 
-void Prox::set_positive(bool positive) {
+template <class T>
+void TProx<T>::set_positive(bool positive) {
   this->positive = positive;
 }
+
+template class TProx<double>;
+template class TProx<float>;
@@ -12,7 +12,10 @@
 #include <memory>
 #include <string>
 
-class Prox {
+//! @brief Base class of proximal operators, templated on the scalar type of the coefficients
+//! (double or float)
+template <class T>
+class TProx {
  protected:
   //! @brief Weight of the proximal operator
   double strength;
@@ -27,32 +30,34 @@ class Prox {
   bool positive;
 
  public:
-  Prox(double strength, bool positive);
+  TProx(double strength, bool positive);
 
-  Prox(double strength, ulong start, ulong end, bool positive);
+  TProx(double strength, ulong start, ulong end, bool positive);
+
+  virtual ~TProx() {}
 
   virtual const std::string get_class_name() const;
 
   virtual const bool is_separable() const;
 
   //! @brief call prox on coeffs, with a given step and store result in out
-  virtual void call(const ArrayDouble &coeffs, double step, ArrayDouble &out);
+  virtual void call(const Array<T> &coeffs, double step, Array<T> &out);
 
   //! @brief call prox on a part of coeffs (defined by start-end), with a given step and
   //! store result in out
-  virtual void call(const ArrayDouble &coeffs,
+  virtual void call(const Array<T> &coeffs,
                     double step,
-                    ArrayDouble &out,
+                    Array<T> &out,
                     ulong start,
                     ulong end);
 
   //! @brief get penalization value of the prox on the coeffs vector.
   //! This takes strength into account
-  virtual double value(const ArrayDouble &coeffs);
+  virtual double value(const Array<T> &coeffs);
 
   //! @brief get penalization value of the prox on a part of coeffs (defined by start-end).
   //! This takes strength into account
-  virtual double value(const ArrayDouble &coeffs,
+  virtual double value(const Array<T> &coeffs,
                        ulong start,
                        ulong end);
 
@@ -60,6 +65,9 @@ class Prox {
 
   virtual void set_strength(double strength);
 
+  //! @brief true if the prox is applied only on the range [start, end)
+  virtual bool get_has_range() const;
+
   virtual ulong get_start() const;
 
   virtual ulong get_end() const;
@@ -72,6 +80,10 @@ class Prox {
   virtual void set_positive(bool positive);
 };
 
+typedef TProx<double> Prox;
+typedef TProx<float> ProxFloat;
+
 typedef std::shared_ptr<Prox> ProxPtr;
+typedef std::shared_ptr<ProxFloat> ProxFloatPtr;
 
 #endif  // TICK_OPTIM_PROX_SRC_PROX_H_
@@ -5,24 +5,31 @@
 
 #include "prox_separable.h"
 
-class ProxElasticNet : public ProxSeparable {
+template <class T>
+class TProxElasticNet : public TProxSeparable<T> {
  protected:
+  using TProxSeparable<T>::strength;
+  using TProxSeparable<T>::positive;
+
   double ratio;
 
  public:
-  ProxElasticNet(double strength, double ratio, bool positive);
+  TProxElasticNet(double strength, double ratio, bool positive);
 
-  ProxElasticNet(double strength, double ratio, ulong start, ulong end, bool positive);
+  TProxElasticNet(double strength, double ratio, ulong start, ulong end, bool positive);
 
   const std::string get_class_name() const override;
 
-  double call_single(double x, double step) const override;
+  T call_single(T x, double step) const override;
 
-  double value_single(double x) const override;
+  double value_single(T x) const override;
 
   virtual double get_ratio() const;
 
   virtual void set_ratio(double ratio);
 };
 
+typedef TProxElasticNet<double> ProxElasticNet;
+typedef TProxElasticNet<float> ProxElasticNetFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_ELASTICNET_H_
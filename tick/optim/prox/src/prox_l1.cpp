@@ -2,22 +2,26 @@
 
 #include "prox_l1.h"
 
-ProxL1::ProxL1(double strength,
-               bool positive)
-  : ProxSeparable(strength, positive) {}
+template <class T>
+TProxL1<T>::TProxL1(double strength,
+                    bool positive)
+  : TProxSeparable<T>(strength, positive) {}
 
-ProxL1::ProxL1(double strength,
-               ulong start,
-               ulong end,
-               bool positive)
-  : ProxSeparable(strength, start, end, positive) {}
+template <class T>
+TProxL1<T>::TProxL1(double strength,
+                    ulong start,
+                    ulong end,
+                    bool positive)
+  : TProxSeparable<T>(strength, start, end, positive) {}
 
-const std::string ProxL1::get_class_name() const {
+template <class T>
+const std::string TProxL1<T>::get_class_name() const {
   return "ProxL1";
 }
 
-double ProxL1::call_single(double x,
-                           double step) const {
+template <class T>
+T TProxL1<T>::call_single(T x,
+                          double step) const {
   double thresh = step * strength;
   if (x > 0) {
     if (x > thresh) {
@@ -40,9 +44,10 @@ double ProxL1::call_single(double x,
   }
 }
 
-double ProxL1::call_single(double x,
-                           double step,
-                           ulong n_times) const {
+template <class T>
+T TProxL1<T>::call_single(T x,
+                          double step,
+                          ulong n_times) const {
   if (n_times >= 1) {
     return call_single(x, n_times * step);
   } else {
@@ -50,6 +55,55 @@ double ProxL1::call_single(double x,
   }
 }
 
-double ProxL1::value_single(double x) const {
+// Repeat n_times x <- prox(x - drift). The iterate moves linearly by -(drift + thresh) while
+// x - drift > thresh, by -(drift - thresh) while x - drift < -thresh and is set to 0 otherwise,
+// so we only need to find how long it stays in each of these (at most three) phases
+template <class T>
+void TProxL1<T>::call_single_with_drift(ulong i,
+                                        const Array<T> &coeffs,
+                                        double step,
+                                        T drift,
+                                        Array<T> &out,
+                                        ulong n_times) const {
+  const double thresh = step * strength;
+  double x = coeffs[i];
+  ulong remaining = n_times;
+  while (remaining > 0) {
+    const bool upper = x - drift > thresh;
+    if (!upper && (positive || x - drift >= -thresh)) {
+      x = 0;
+      --remaining;
+      const bool stays_zero = positive ? -drift <= thresh : std::abs(drift) <= thresh;
+      if (stays_zero) break;
+      continue;
+    }
+    // In this phase x <- x - slope
+    const double slope = upper ? drift + thresh : drift - thresh;
+    auto in_phase = [&](double z) {
+      return upper ? z - drift > thresh : z - drift < -thresh;
+    };
+    // The phase lasts forever if x moves away from 0, otherwise it lasts as long as
+    // x / slope > 1
+    if (upper ? slope <= 0 : slope >= 0) {
+      x -= remaining * slope;
+      break;
+    }
+    const double phase_length = std::ceil(x / slope - 1);
+    ulong n_steps = phase_length >= remaining ? remaining
+                                              : static_cast<ulong>(std::max(phase_length, 1.));
+    // Fix rounding errors of the phase length estimate
+    while (n_steps > 1 && !in_phase(x - (n_steps - 1) * slope)) --n_steps;
+    while (n_steps < remaining && in_phase(x - n_steps * slope)) ++n_steps;
+    x -= n_steps * slope;
+    remaining -= n_steps;
+  }
+  out[i] = x;
+}
+
+template <class T>
+double TProxL1<T>::value_single(T x) const {
   return std::abs(x);
 }
+
+template class TProxL1<double>;
+template class TProxL1<float>;
@@ -5,20 +5,32 @@
 
 #include "prox_separable.h"
 
-class ProxL1 : public ProxSeparable {
+template <class T>
+class TProxL1 : public TProxSeparable<T> {
+ protected:
+  using TProxSeparable<T>::strength;
+  using TProxSeparable<T>::positive;
+
  public:
-  ProxL1(double strength, bool positive);
+  TProxL1(double strength, bool positive);
 
-  ProxL1(double strength, ulong start, ulong end, bool positive);
+  TProxL1(double strength, ulong start, ulong end, bool positive);
 
   const std::string get_class_name() const override;
 
-  double call_single(double x, double step) const override;
+  T call_single(T x, double step) const override;
 
   // Repeat n_times the prox on coordinate i
-  double call_single(double x, double step, ulong n_times) const override;
+  T call_single(T x, double step, ulong n_times) const override;
+
+  // Repeat n_times the drift and the prox on coordinate i, in closed form
+  void call_single_with_drift(ulong i, const Array<T> &coeffs, double step, T drift,
+                              Array<T> &out, ulong n_times) const override;
 
-  double value_single(double x) const override;
+  double value_single(T x) const override;
 };
 
+typedef TProxL1<double> ProxL1;
+typedef TProxL1<float> ProxL1Float;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_L1_H_
@@ -26,27 +26,7 @@ void ProxL1w::call_single(ulong i,
                           const ArrayDouble &coeffs,
                           double step,
                           ArrayDouble &out) const {
-  double thresh = step * strength;
-  double coeffs_i = coeffs[i];
-  double thresh_i = thresh * (*weights)[i];
-  if (coeffs_i > 0) {
-    if (coeffs_i > thresh_i) {
-      out[i] = coeffs_i - thresh_i;
-    } else {
-      out[i] = 0;
-    }
-  } else {
-    // If coeffs_i is negative we set it to 0
-    if (positive) {
-      out[i] = 0;
-    } else {
-      if (coeffs_i < -thresh_i) {
-        out[i] = coeffs_i + thresh_i;
-      } else {
-        out[i] = 0;
-      }
-    }
-  }
+  out[i] = call_single_value(i, coeffs[i], step, 1);
 }
 
 void ProxL1w::call_single(ulong i,
@@ -54,10 +34,34 @@ void ProxL1w::call_single(ulong i,
                           double step,
                           ArrayDouble &out,
                           ulong n_times) const {
-  if (n_times >= 1) {
-    call_single(i, coeffs, n_times * step, out);
+  out[i] = call_single_value(i, coeffs[i], step, n_times);
+}
+
+double ProxL1w::call_single_value(ulong i,
+                                  double x,
+                                  double step,
+                                  ulong n_times) const {
+  if (n_times == 0) {
+    return x;
+  }
+  double thresh_i = n_times * step * strength * (*weights)[i];
+  if (x > 0) {
+    if (x > thresh_i) {
+      return x - thresh_i;
+    } else {
+      return 0;
+    }
   } else {
-    out[i] = coeffs[i];
+    // If x is negative we set it to 0
+    if (positive) {
+      return 0;
+    } else {
+      if (x < -thresh_i) {
+        return x + thresh_i;
+      } else {
+        return 0;
+      }
+    }
   }
 }
 
@@ -26,6 +26,8 @@ class ProxL1w : public ProxSeparable {
   void call_single(ulong i, const ArrayDouble &coeffs, double step,
                    ArrayDouble &out, ulong n_times) const override;
 
+  double call_single_value(ulong i, double x, double step, ulong n_times) const override;
+
   double value_single(ulong i,
                       const ArrayDouble &coeffs) const override;
 
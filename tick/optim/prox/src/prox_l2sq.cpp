@@ -2,23 +2,40 @@
 
 #include "prox_l2sq.h"
 
-ProxL2Sq::ProxL2Sq(double strength,
-                   bool positive)
-  : ProxSeparable(strength, positive) {}
+namespace {
 
-ProxL2Sq::ProxL2Sq(double strength,
-                   ulong start,
-                   ulong end,
-                   bool positive)
-  : ProxSeparable(strength, start, end, positive) {}
+// Value of x after n_times steps x <- (x - drift) / (1 + h), that is
+// a^n x - drift * (a + ... + a^n) with a = 1 / (1 + h)
+double l2sq_drift_steps(double x, double h, double drift, double n_times) {
+  if (h == 0) return x - n_times * drift;
+  const double n_log_a = -n_times * std::log1p(h);
+  // a + ... + a^n = (1 - a^n) / h
+  return std::exp(n_log_a) * x + drift * std::expm1(n_log_a) / h;
+}
+
+}  // namespace
+
+template <class T>
+TProxL2Sq<T>::TProxL2Sq(double strength,
+                        bool positive)
+  : TProxSeparable<T>(strength, positive) {}
 
-const std::string ProxL2Sq::get_class_name() const {
+template <class T>
+TProxL2Sq<T>::TProxL2Sq(double strength,
+                        ulong start,
+                        ulong end,
+                        bool positive)
+  : TProxSeparable<T>(strength, start, end, positive) {}
+
+template <class T>
+const std::string TProxL2Sq<T>::get_class_name() const {
   return "ProxL2Sq";
 }
 
 // Compute the prox on the i-th coordinate only
-double ProxL2Sq::call_single(double x,
-                             double step) const {
+template <class T>
+T TProxL2Sq<T>::call_single(T x,
+                            double step) const {
   if (positive && x < 0) {
     return 0;
   } else {
@@ -27,9 +44,10 @@ double ProxL2Sq::call_single(double x,
 }
 
 // Repeat n_times the prox on coordinate i
-double ProxL2Sq::call_single(double x,
-                             double step,
-                             ulong n_times) const {
+template <class T>
+T TProxL2Sq<T>::call_single(T x,
+                            double step,
+                            ulong n_times) const {
   if (n_times >= 1) {
     if (positive && x < 0) {
       return 0;
@@ -41,6 +59,48 @@ double ProxL2Sq::call_single(double x,
   }
 }
 
-double ProxL2Sq::value_single(double x) const {
+// Repeat n_times x <- prox(x - drift). Without positivity this is an affine recursion, with
+// positivity the iterate is set to 0 once x - drift < 0, after which it either stays at 0
+// or follows the recursion forever
+template <class T>
+void TProxL2Sq<T>::call_single_with_drift(ulong i,
+                                          const Array<T> &coeffs,
+                                          double step,
+                                          T drift,
+                                          Array<T> &out,
+                                          ulong n_times) const {
+  const double h = step * strength;
+  double x = coeffs[i];
+  ulong remaining = n_times;
+  while (remaining > 0) {
+    if (positive && x - drift < 0) {
+      x = 0;
+      --remaining;
+      if (drift >= 0) break;
+      continue;
+    }
+    if (!positive || drift <= 0) {
+      x = l2sq_drift_steps(x, h, drift, remaining);
+      break;
+    }
+    // x decreases towards -drift / h < 0 and stays in this phase as long as x >= drift
+    const double phase_length = h == 0 ? std::floor(x / drift)
+        : std::floor(std::log(drift * (1 + h) / (h * x + drift)) / -std::log1p(h)) + 1;
+    ulong n_steps = phase_length >= remaining ? remaining
+                                              : static_cast<ulong>(std::max(phase_length, 1.));
+    // Fix rounding errors of the phase length estimate
+    while (n_steps > 1 && l2sq_drift_steps(x, h, drift, n_steps - 1) < drift) --n_steps;
+    while (n_steps < remaining && l2sq_drift_steps(x, h, drift, n_steps) >= drift) ++n_steps;
+    x = l2sq_drift_steps(x, h, drift, n_steps);
+    remaining -= n_steps;
+  }
+  out[i] = x;
+}
+
+template <class T>
+double TProxL2Sq<T>::value_single(T x) const {
   return x * x / 2;
 }
+
+template class TProxL2Sq<double>;
+template class TProxL2Sq<float>;
@@ -5,20 +5,32 @@
 
 #include "prox_separable.h"
 
-class ProxL2Sq : public ProxSeparable {
+template <class T>
+class TProxL2Sq : public TProxSeparable<T> {
+ protected:
+  using TProxSeparable<T>::strength;
+  using TProxSeparable<T>::positive;
+
  public:
-  ProxL2Sq(double strength, bool positive);
+  TProxL2Sq(double strength, bool positive);
 
-  ProxL2Sq(double strength, ulong start, ulong end, bool positive);
+  TProxL2Sq(double strength, ulong start, ulong end, bool positive);
 
   const std::string get_class_name() const override;
 
-  double value_single(double x) const override;
+  double value_single(T x) const override;
 
-  double call_single(double x, double step) const override;
+  T call_single(T x, double step) const override;
 
   // Repeat n_times the prox on coordinate i
-  double call_single(double x, double step, ulong n_times) const override;
+  T call_single(T x, double step, ulong n_times) const override;
+
+  // Repeat n_times the drift and the prox on coordinate i, in closed form
+  void call_single_with_drift(ulong i, const Array<T> &coeffs, double step, T drift,
+                              Array<T> &out, ulong n_times) const override;
 };
 
+typedef TProxL2Sq<double> ProxL2Sq;
+typedef TProxL2Sq<float> ProxL2SqFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_L2SQ_H_
@@ -2,20 +2,24 @@
 
 #include "prox_positive.h"
 
-ProxPositive::ProxPositive(double strength)
-  : ProxSeparable(strength, true) {}
+template <class T>
+TProxPositive<T>::TProxPositive(double strength)
+  : TProxSeparable<T>(strength, true) {}
 
-ProxPositive::ProxPositive(double strength,
-                           ulong start,
-                           ulong end)
-  : ProxSeparable(strength, start, end, true) {}
+template <class T>
+TProxPositive<T>::TProxPositive(double strength,
+                                ulong start,
+                                ulong end)
+  : TProxSeparable<T>(strength, start, end, true) {}
 
-const std::string ProxPositive::get_class_name() const {
+template <class T>
+const std::string TProxPositive<T>::get_class_name() const {
   return "ProxPositive";
 }
 
-double ProxPositive::call_single(double x,
-                                 double step) const {
+template <class T>
+T TProxPositive<T>::call_single(T x,
+                                double step) const {
   if (x < 0) {
     return 0;
   } else {
@@ -23,14 +27,19 @@ double ProxPositive::call_single(double x,
   }
 }
 
-double ProxPositive::call_single(double x,
-                                 double step,
-                                 ulong n_times) const {
+template <class T>
+T TProxPositive<T>::call_single(T x,
+                                double step,
+                                ulong n_times) const {
   return call_single(x, step);
 }
 
-double ProxPositive::value(const ArrayDouble &coeffs,
-                           ulong start,
-                           ulong end) {
+template <class T>
+double TProxPositive<T>::value(const Array<T> &coeffs,
+                               ulong start,
+                               ulong end) {
   return 0.;
 }
+
+template class TProxPositive<double>;
+template class TProxPositive<float>;
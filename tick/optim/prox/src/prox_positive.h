@@ -5,21 +5,25 @@
 
 #include "prox_separable.h"
 
-class ProxPositive : public ProxSeparable {
+template <class T>
+class TProxPositive : public TProxSeparable<T> {
  public:
-  explicit ProxPositive(double strength);
+  explicit TProxPositive(double strength);
 
-  ProxPositive(double strength, ulong start, ulong end);
+  TProxPositive(double strength, ulong start, ulong end);
 
   const std::string get_class_name() const override;
 
-  double call_single(double x, double step) const override;
+  T call_single(T x, double step) const override;
 
   // Repeat n_times the prox on coordinate i
-  double call_single(double x, double step, ulong n_times) const override;
+  T call_single(T x, double step, ulong n_times) const override;
 
   // Override value, only this value method should be called
-  double value(const ArrayDouble &coeffs, ulong start, ulong end) override;
+  double value(const Array<T> &coeffs, ulong start, ulong end) override;
 };
 
+typedef TProxPositive<double> ProxPositive;
+typedef TProxPositive<float> ProxPositiveFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_POSITIVE_H_
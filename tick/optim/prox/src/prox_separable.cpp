@@ -2,23 +2,28 @@
 
 #include "prox_separable.h"
 
-ProxSeparable::ProxSeparable(double strength, bool positive)
-  : Prox(strength, positive) {}
+template <class T>
+TProxSeparable<T>::TProxSeparable(double strength, bool positive)
+  : TProx<T>(strength, positive) {}
 
-ProxSeparable::ProxSeparable(double strength, ulong start, ulong end, bool positive)
-  : Prox(strength, start, end, positive) {}
+template <class T>
+TProxSeparable<T>::TProxSeparable(double strength, ulong start, ulong end, bool positive)
+  : TProx<T>(strength, start, end, positive) {}
 
-const std::string ProxSeparable::get_class_name() const {
+template <class T>
+const std::string TProxSeparable<T>::get_class_name() const {
   return "ProxSeparable";
 }
 
-const bool ProxSeparable::is_separable() const {
+template <class T>
+const bool TProxSeparable<T>::is_separable() const {
   return true;
 }
 
-void ProxSeparable::call(const ArrayDouble &coeffs,
-                         const ArrayDouble &step,
-                         ArrayDouble &out) {
+template <class T>
+void TProxSeparable<T>::call(const Array<T> &coeffs,
+                             const ArrayDouble &step,
+                             Array<T> &out) {
   if (has_range) {
     if (end > coeffs.size()) TICK_ERROR(
       "Range [" << start << ", " << end
@@ -32,39 +37,53 @@ void ProxSeparable::call(const ArrayDouble &coeffs,
   }
 }
 
-void ProxSeparable::call(const ArrayDouble &coeffs,
-                         double step,
-                         ArrayDouble &out,
-                         ulong start,
-                         ulong end) {
-  ArrayDouble sub_coeffs = view(coeffs, start, end);
-  ArrayDouble sub_out = view(out, start, end);
+template <class T>
+void TProxSeparable<T>::call(const Array<T> &coeffs,
+                             double step,
+                             Array<T> &out,
+                             ulong start,
+                             ulong end) {
+  check_zero_mask(end - start);
+  Array<T> sub_coeffs = view(coeffs, start, end);
+  Array<T> sub_out = view(out, start, end);
   for (ulong i = 0; i < sub_coeffs.size(); ++i) {
     // Call the prox on each coordinate
-    call_single(i, sub_coeffs, step, sub_out);
+    if (is_zeroed(i)) {
+      sub_out[i] = 0;
+    } else {
+      call_single(i, sub_coeffs, step, sub_out);
+    }
   }
 }
 
-void ProxSeparable::call(const ArrayDouble &coeffs,
-                         const ArrayDouble &step,
-                         ArrayDouble &out,
-                         ulong start,
-                         ulong end) {
-  ArrayDouble sub_coeffs = view(coeffs, start, end);
-  ArrayDouble sub_out = view(out, start, end);
+template <class T>
+void TProxSeparable<T>::call(const Array<T> &coeffs,
+                             const ArrayDouble &step,
+                             Array<T> &out,
+                             ulong start,
+                             ulong end) {
+  check_zero_mask(end - start);
+  Array<T> sub_coeffs = view(coeffs, start, end);
+  Array<T> sub_out = view(out, start, end);
   for (ulong i = 0; i < sub_coeffs.size(); ++i) {
-    call_single(i, sub_coeffs, step[i], sub_out);
+    if (is_zeroed(i)) {
+      sub_out[i] = 0;
+    } else {
+      call_single(i, sub_coeffs, step[i], sub_out);
+    }
   }
 }
 
-double ProxSeparable::call_single(double x,
-                                  double step) const {
+template <class T>
+T TProxSeparable<T>::call_single(T x,
+                                 double step) const {
   TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-double ProxSeparable::call_single(double x,
-                                  double step,
-                                  ulong n_times) const {
+template <class T>
+T TProxSeparable<T>::call_single(T x,
+                                 double step,
+                                 ulong n_times) const {
   if (n_times >= 1) {
     for (ulong r = 0; r < n_times; ++r) {
       x = call_single(x, step);
@@ -73,43 +92,92 @@ double ProxSeparable::call_single(double x,
   return x;
 }
 
+template <class T>
+T TProxSeparable<T>::call_single_value(ulong i,
+                                       T x,
+                                       double step,
+                                       ulong n_times) const {
+  return call_single(x, step, n_times);
+}
+
 // Compute the prox on the i-th coordinate only
-void ProxSeparable::call_single(ulong i,
-                                const ArrayDouble &coeffs,
-                                double step,
-                                ArrayDouble &out) const {
+template <class T>
+void TProxSeparable<T>::call_single(ulong i,
+                                    const Array<T> &coeffs,
+                                    double step,
+                                    Array<T> &out) const {
   out[i] = call_single(coeffs[i], step);
 }
 
 // Repeat n_times the prox on coordinate i
-void ProxSeparable::call_single(ulong i,
-                                const ArrayDouble &coeffs,
-                                double step,
-                                ArrayDouble &out,
-                                ulong n_times) const {
+template <class T>
+void TProxSeparable<T>::call_single(ulong i,
+                                    const Array<T> &coeffs,
+                                    double step,
+                                    Array<T> &out,
+                                    ulong n_times) const {
   out[i] = call_single(coeffs[i], step, n_times);
 }
 
-double ProxSeparable::value(const ArrayDouble &coeffs,
-                            ulong start,
-                            ulong end) {
+// Repeat n_times the drift and the prox on coordinate i
+template <class T>
+void TProxSeparable<T>::call_single_with_drift(ulong i,
+                                               const Array<T> &coeffs,
+                                               double step,
+                                               T drift,
+                                               Array<T> &out,
+                                               ulong n_times) const {
+  out[i] = coeffs[i];
+  for (ulong r = 0; r < n_times; ++r) {
+    out[i] -= drift;
+    call_single(i, out, step, out);
+  }
+}
+
+template <class T>
+void TProxSeparable<T>::set_zero_mask(SArrayULongPtr zero_mask) {
+  this->zero_mask = zero_mask;
+}
+
+template <class T>
+void TProxSeparable<T>::clear_zero_mask() {
+  zero_mask = nullptr;
+}
+
+template <class T>
+void TProxSeparable<T>::check_zero_mask(ulong size) const {
+  if (zero_mask != nullptr && zero_mask->size() != size) {
+    TICK_ERROR("zero_mask has size " << zero_mask->size() << " while the prox is applied on "
+                                     << size << " coordinates");
+  }
+}
+
+template <class T>
+double TProxSeparable<T>::value(const Array<T> &coeffs,
+                                ulong start,
+                                ulong end) {
   double val = 0;
   // We work on a view, so that sub_coeffs and weights are "aligned"
   // (namely both ranging between 0 and end - start).
   // This is particularly convenient for Prox classes with weights for each
   // coordinate
-  ArrayDouble sub_coeffs = view(coeffs, start, end);
+  Array<T> sub_coeffs = view(coeffs, start, end);
   for (ulong i = 0; i < sub_coeffs.size(); ++i) {
     val += value_single(i, sub_coeffs);
   }
   return strength * val;
 }
 
-double ProxSeparable::value_single(double x) const {
+template <class T>
+double TProxSeparable<T>::value_single(T x) const {
   TICK_CLASS_DOES_NOT_IMPLEMENT(get_class_name());
 }
 
-double ProxSeparable::value_single(ulong i,
-                                   const ArrayDouble &coeffs) const {
+template <class T>
+double TProxSeparable<T>::value_single(ulong i,
+                                       const Array<T> &coeffs) const {
   return value_single(coeffs[i]);
 }
+
+template class TProxSeparable<double>;
+template class TProxSeparable<float>;
@@ -5,54 +5,93 @@
 
 #include "prox.h"
 
-class ProxSeparable : public Prox {
+template <class T>
+class TProxSeparable : public TProx<T> {
+ protected:
+  using TProx<T>::has_range;
+  using TProx<T>::start;
+  using TProx<T>::end;
+  using TProx<T>::strength;
+
+  // If set, the coordinates i (relative to the range of the prox) such that zero_mask[i] != 0
+  // are set to 0 by the prox
+  SArrayULongPtr zero_mask;
+
  public:
-  ProxSeparable(double strength, bool positive);
+  TProxSeparable(double strength, bool positive);
 
-  ProxSeparable(double strength, ulong start, ulong end, bool positive);
+  TProxSeparable(double strength, ulong start, ulong end, bool positive);
 
   const std::string get_class_name() const override;
 
   const bool is_separable() const override;
 
-  using Prox::call;
+  using TProx<T>::call;
 
   //! @brief call prox on coeffs, with a given step and store result in out
   //! @note this calls call_single on each coordinate
-  void call(const ArrayDouble &coeffs, double step, ArrayDouble &out, ulong start,
+  void call(const Array<T> &coeffs, double step, Array<T> &out, ulong start,
             ulong end) override;
 
   //! @brief call prox on coeffs, with a vector of different steps and store result in out
-  virtual void call(const ArrayDouble &coeffs, const ArrayDouble &step, ArrayDouble &out);
+  virtual void call(const Array<T> &coeffs, const ArrayDouble &step, Array<T> &out);
 
   //! @brief call prox on a part of coeffs (defined by start-end), with a vector of different
   //! steps and store result in out
-  virtual void call(const ArrayDouble &coeffs, const ArrayDouble &step, ArrayDouble &out,
+  virtual void call(const Array<T> &coeffs, const ArrayDouble &step, Array<T> &out,
                     ulong start, ulong end);
 
   //! @brief apply prox on a single value
-  virtual double call_single(double x, double step) const;
+  virtual T call_single(T x, double step) const;
 
   //! @brief apply prox on a single value several times
-  virtual double call_single(double x, double step, ulong n_times) const;
+  virtual T call_single(T x, double step, ulong n_times) const;
+
+  //! @brief apply prox several times on a single value x taken by coordinate i
+  //! @note proxes that depend on the coordinate (such as weighted ones) must override it
+  virtual T call_single_value(ulong i, T x, double step, ulong n_times) const;
 
   //! @brief apply prox on a single value defined by coordinate i
-  virtual void call_single(ulong i, const ArrayDouble &coeffs, double step,
-                           ArrayDouble &out) const;
+  virtual void call_single(ulong i, const Array<T> &coeffs, double step,
+                           Array<T> &out) const;
 
   //! @brief apply prox on a single value defined by coordinate i several times
-  virtual void call_single(ulong i, const ArrayDouble &coeffs, double step,
-                           ArrayDouble &out, ulong n_times) const;
+  virtual void call_single(ulong i, const Array<T> &coeffs, double step,
+                           Array<T> &out, ulong n_times) const;
+
+  //! @brief apply n_times the step x <- prox(x - drift) on the value defined by coordinate i
+  //! @note this is used by lazy solvers to catch up with the steps where coordinate i only
+  //! sees a constant drift, proxes that have a closed form for it should override it
+  virtual void call_single_with_drift(ulong i, const Array<T> &coeffs, double step, T drift,
+                                      Array<T> &out, ulong n_times) const;
+
+  //! @brief restricts the prox to the coordinates i such that zero_mask[i] == 0, the other ones
+  //! are set to 0. This solves the problem restricted to a subset of coordinates with the same
+  //! model. Indices are relative to the range of the prox
+  void set_zero_mask(SArrayULongPtr zero_mask);
 
-  double value(const ArrayDouble &coeffs, ulong start, ulong end) override;
+  //! @brief removes the mask given to set_zero_mask
+  void clear_zero_mask();
+
+  //! @brief checks that the mask, if any, fits a range of the given size
+  void check_zero_mask(ulong size) const;
+
+  inline bool is_zeroed(ulong i) const {
+    return zero_mask != nullptr && (*zero_mask)[i] != 0;
+  }
+
+  double value(const Array<T> &coeffs, ulong start, ulong end) override;
 
   //! @brief get penalization value of the prox on a single value defined by coordinate i
   //! @warning This does not take strength into account
-  virtual double value_single(ulong i, const ArrayDouble &coeffs) const;
+  virtual double value_single(ulong i, const Array<T> &coeffs) const;
 
   //! @brief get penalization value of the prox on a single value
   //! @warning This does not take strength into account
-  virtual double value_single(double x) const;
+  virtual double value_single(T x) const;
 };
 
+typedef TProxSeparable<double> ProxSeparable;
+typedef TProxSeparable<float> ProxSeparableFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_SEPARABLE_H_
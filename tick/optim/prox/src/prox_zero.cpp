@@ -2,31 +2,50 @@
 
 #include "prox_zero.h"
 
-ProxZero::ProxZero(double strength)
-  : ProxSeparable(strength, false) {}
+template <class T>
+TProxZero<T>::TProxZero(double strength)
+  : TProxSeparable<T>(strength, false) {}
 
-ProxZero::ProxZero(double strength,
-                   ulong start,
-                   ulong end)
-  : ProxSeparable(strength, start, end, false) {}
+template <class T>
+TProxZero<T>::TProxZero(double strength,
+                        ulong start,
+                        ulong end)
+  : TProxSeparable<T>(strength, start, end, false) {}
 
-const std::string ProxZero::get_class_name() const {
+template <class T>
+const std::string TProxZero<T>::get_class_name() const {
   return "ProxZero";
 }
 
-double ProxZero::call_single(double x,
-                             double step) const {
+template <class T>
+T TProxZero<T>::call_single(T x,
+                            double step) const {
   return x;
 }
 
-double ProxZero::call_single(double x,
-                             double step,
-                             ulong n_times) const {
+template <class T>
+T TProxZero<T>::call_single(T x,
+                            double step,
+                            ulong n_times) const {
   return x;
 }
 
-double ProxZero::value(const ArrayDouble &coeffs,
-                       ulong start,
-                       ulong end) {
+template <class T>
+void TProxZero<T>::call_single_with_drift(ulong i,
+                                          const Array<T> &coeffs,
+                                          double step,
+                                          T drift,
+                                          Array<T> &out,
+                                          ulong n_times) const {
+  out[i] = coeffs[i] - n_times * drift;
+}
+
+template <class T>
+double TProxZero<T>::value(const Array<T> &coeffs,
+                           ulong start,
+                           ulong end) {
   return 0.;
 }
+
+template class TProxZero<double>;
+template class TProxZero<float>;
@@ -5,21 +5,29 @@
 
 #include "prox_separable.h"
 
-class ProxZero : public ProxSeparable {
+template <class T>
+class TProxZero : public TProxSeparable<T> {
  public:
-  explicit ProxZero(double strength);
+  explicit TProxZero(double strength);
 
-  ProxZero(double strength,
+  TProxZero(double strength,
            ulong start,
            ulong end);
 
   const std::string get_class_name() const override;
 
-  double call_single(double x, double step) const override;
+  T call_single(T x, double step) const override;
 
-  double call_single(double x, double step, ulong n_times) const override;
+  T call_single(T x, double step, ulong n_times) const override;
 
-  double value(const ArrayDouble &coeffs, ulong start, ulong end) override;
+  // Repeat n_times the drift and the prox on coordinate i, in closed form
+  void call_single_with_drift(ulong i, const Array<T> &coeffs, double step, T drift,
+                              Array<T> &out, ulong n_times) const override;
+
+  double value(const Array<T> &coeffs, ulong start, ulong end) override;
 };
 
+typedef TProxZero<double> ProxZero;
+typedef TProxZero<float> ProxZeroFloat;
+
 #endif  // TICK_OPTIM_PROX_SRC_PROX_ZERO_H_
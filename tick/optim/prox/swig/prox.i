@@ -24,6 +24,8 @@ class Prox {
 
   virtual void set_strength(double strength);
 
+  virtual bool get_has_range() const final;
+
   virtual ulong get_start() const final;
 
   virtual ulong get_end() const final;
@@ -36,3 +38,38 @@ class Prox {
 };
 
 typedef std::shared_ptr<Prox> ProxPtr;
+
+class ProxFloat {
+ public:
+  ProxFloat(double strength,
+            bool positive);
+
+  ProxFloat(double strength,
+            unsigned long start,
+            unsigned long end,
+            bool positive);
+
+  virtual void call(const ArrayFloat &coeffs,
+                    double step,
+                    ArrayFloat &out);
+
+  virtual double value(const ArrayFloat &coeffs);
+
+  virtual double get_strength() const;
+
+  virtual void set_strength(double strength);
+
+  virtual bool get_has_range() const final;
+
+  virtual ulong get_start() const final;
+
+  virtual ulong get_end() const final;
+
+  virtual void set_start_end(ulong start, ulong end);
+
+  virtual bool get_positive() const final;
+
+  virtual void set_positive(bool positive) final;
+};
+
+typedef std::shared_ptr<ProxFloat> ProxFloatPtr;
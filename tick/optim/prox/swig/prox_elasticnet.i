@@ -20,3 +20,20 @@ class ProxElasticNet : public ProxSeparable {
 
   virtual void set_ratio(double ratio) final;
 };
+
+class ProxElasticNetFloat : public ProxSeparableFloat {
+ public:
+  ProxElasticNetFloat(double strength,
+                      double ratio,
+                      bool positive);
+
+  ProxElasticNetFloat(double strength,
+                      double ratio,
+                      ulong start,
+                      ulong end,
+                      bool positive);
+
+  virtual double get_ratio() const final;
+
+  virtual void set_ratio(double ratio) final;
+};
@@ -4,7 +4,7 @@
 #include "prox_l1.h"
 %}
 
-class ProxL1 : public Prox {
+class ProxL1 : public ProxSeparable {
  public:
    ProxL1(double strength,
           bool positive);
@@ -14,3 +14,14 @@ class ProxL1 : public Prox {
           ulong end,
           bool positive);
 };
+
+class ProxL1Float : public ProxSeparableFloat {
+ public:
+   ProxL1Float(double strength,
+               bool positive);
+
+   ProxL1Float(double strength,
+               ulong start,
+               ulong end,
+               bool positive);
+};
@@ -14,3 +14,14 @@ class ProxL2Sq : public ProxSeparable {
             ulong end,
             bool positive);
 };
+
+class ProxL2SqFloat : public ProxSeparableFloat {
+ public:
+   ProxL2SqFloat(double strength,
+                 bool positive);
+
+   ProxL2SqFloat(double strength,
+                 ulong start,
+                 ulong end,
+                 bool positive);
+};
@@ -1,8 +1,12 @@
 // License: BSD 3 clause
 
-%module prox
+%module(threads="1") prox
 
 %include defs.i
+
+// The GIL is only released while applying the prox, see model_module.i
+%feature("nothreadallow");
+%feature("nothreadallow", "0") call;
 %include std_shared_ptr.i
 
 %shared_ptr(Prox);
@@ -21,6 +25,14 @@
 %shared_ptr(ProxL2);
 %shared_ptr(ProxGroupL1);
 
+%shared_ptr(ProxFloat);
+%shared_ptr(ProxSeparableFloat);
+%shared_ptr(ProxZeroFloat);
+%shared_ptr(ProxPositiveFloat);
+%shared_ptr(ProxL2SqFloat);
+%shared_ptr(ProxL1Float);
+%shared_ptr(ProxElasticNetFloat);
+
 %{
 #include "tick_python.h"
 %}
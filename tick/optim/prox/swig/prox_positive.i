@@ -4,7 +4,7 @@
 #include "prox_positive.h"
 %}
 
-class ProxPositive : public Prox {
+class ProxPositive : public ProxSeparable {
  public:
    ProxPositive(double strength);
 
@@ -12,3 +12,12 @@ class ProxPositive : public Prox {
                 ulong start,
                 ulong end);
 };
+
+class ProxPositiveFloat : public ProxSeparableFloat {
+ public:
+   ProxPositiveFloat(double strength);
+
+   ProxPositiveFloat(double strength,
+                     ulong start,
+                     ulong end);
+};
@@ -20,4 +20,30 @@ class ProxSeparable : public Prox {
   virtual void call(const ArrayDouble &coeffs,
                     const ArrayDouble &step,
                     ArrayDouble &out);
+
+  void set_zero_mask(SArrayULongPtr zero_mask);
+
+  void clear_zero_mask();
+};
+
+class ProxSeparableFloat : public ProxFloat {
+
+ public:
+  ProxSeparableFloat(double strength,
+                     bool positive);
+
+  ProxSeparableFloat(double strength,
+                     unsigned long start,
+                     unsigned long end,
+                     bool positive);
+
+  using ProxFloat::call;
+
+  virtual void call(const ArrayFloat &coeffs,
+                    const ArrayDouble &step,
+                    ArrayFloat &out);
+
+  void set_zero_mask(SArrayULongPtr zero_mask);
+
+  void clear_zero_mask();
 };
@@ -4,7 +4,7 @@
 #include "prox_zero.h"
 %}
 
-class ProxZero : public Prox {
+class ProxZero : public ProxSeparable {
  public:
    ProxZero(double strength);
 
@@ -12,3 +12,12 @@ class ProxZero : public Prox {
             unsigned long start,
             unsigned long end);
 };
+
+class ProxZeroFloat : public ProxSeparableFloat {
+ public:
+   ProxZeroFloat(double strength);
+
+   ProxZeroFloat(double strength,
+                 unsigned long start,
+                 unsigned long end);
+};
@@ -52,6 +52,29 @@ class Test(TestProx):
                                delta=1e-15)
         assert_almost_equal(prox.call(coeffs, step=t), out, decimal=10)
 
+    def test_ProxL1_zero_mask(self):
+        """...Test that ProxL1 sets the coordinates of its zero mask to 0
+        """
+        coeffs = self.coeffs.copy()
+        prox = ProxL1(3e-2, (3, 8))
+        out = prox.call(coeffs, step=1.7)
+
+        zero_mask = np.array([0, 1, 0, 0, 1], dtype=np.uint64)
+        prox._prox.set_zero_mask(zero_mask)
+        out_masked = out.copy()
+        out_masked[[4, 7]] = 0
+        assert_almost_equal(prox.call(coeffs, step=1.7), out_masked,
+                            decimal=10)
+
+        prox._prox.clear_zero_mask()
+        assert_almost_equal(prox.call(coeffs, step=1.7), out, decimal=10)
+
+        prox._prox.set_zero_mask(np.zeros(4, dtype=np.uint64))
+        msg = '^zero_mask has size 4 while the prox is applied on 5 ' \
+              'coordinates$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            prox.call(coeffs, step=1.7)
+
 
 if __name__ == '__main__':
     unittest.main()
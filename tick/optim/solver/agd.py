@@ -114,9 +114,10 @@ class AGD(SolverFirstOrder):
         else:
             grad_y = self.model.grad(y)
             x[:] = self.prox.call(y - step * grad_y, step)
+            obj_x = self.objective(x)
         t = np.sqrt((1. + (1. + 4. * t * t))) / 2.
         y[:] = x + (prev_t - 1) / t * (x - prev_x)
-        return x, y, t, step
+        return x, y, t, step, obj_x
 
     def _solve(self, x0: np.ndarray = None, step: float = None):
         x, prev_x, y, grad_y, t, step, obj = \
@@ -125,13 +126,12 @@ class AGD(SolverFirstOrder):
             prev_t = t
             prev_x[:] = x
             prev_obj = obj
-            x, y, t, step = self._gradient_step(x, prev_x, y, grad_y, t,
-                                                prev_t, step)
+            x, y, t, step, obj = self._gradient_step(x, prev_x, y, grad_y, t,
+                                                     prev_t, step)
             if step == 0:
                 print('Step equals 0... at %i' % n_iter)
                 break
             rel_delta = relative_distance(x, prev_x)
-            obj = self.objective(x)
             rel_obj = abs(obj - prev_obj) / abs(prev_obj)
             converged = rel_obj < self.tol
             # If converged, we stop the loop and record the last step
@@ -113,6 +113,9 @@ class SolverFirstOrder(Solver):
                              'call ``fit`` on it before passing it to '
                              '``set_model``' % model.name)
         self._set("model", model)
+        if self.prox is not None:
+            # The prox must work with the floating point type of the model
+            self._set("prox", self.prox.astype(model.dtype))
         return self
 
     def _initialize_values(self, x0: np.ndarray = None, step: float = None,
@@ -155,13 +158,13 @@ class SolverFirstOrder(Solver):
         else:
             self.step = step
         if x0 is None:
-            x0 = np.zeros(self.model.n_coeffs)
-        iterate = x0.copy()
+            x0 = np.zeros(self.model.n_coeffs, dtype=self.model.dtype)
+        iterate = x0.astype(self.model.dtype)
         obj = self.objective(iterate)
 
         result = [step, obj, iterate]
         for _ in range(n_empty_vectors):
-            result.append(np.zeros_like(x0))
+            result.append(np.zeros_like(iterate))
 
         return tuple(result)
 
@@ -182,10 +185,14 @@ class SolverFirstOrder(Solver):
         -----
         In some solvers, ``set_model`` must be called before
         ``set_prox``, otherwise and error might be raised.
+        If the model works with ``float32`` data, the solver keeps a
+        ``float32`` copy of the prox, see `Prox.astype`
         """
         if not isinstance(prox, Prox):
             raise ValueError('Passed object of class %s is not a '
                              'Prox class' % prox.name)
+        if self.model is not None:
+            prox = prox.astype(self.model.dtype)
         self._set("prox", prox)
         return self
 
@@ -113,6 +113,37 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         """
         SolverFirstOrder.set_model(self, model)
         SolverSto.set_model(self, model)
+        # The C++ solver might have been rebuilt for the dtype of the model
+        if self.prox is not None:
+            SolverSto.set_prox(self, self.prox)
+        return self
+
+    def update_model(self, model: Model):
+        """Replace the model of the solver by a model fitted on new
+        samples, while keeping the state of the solver (current iterate and
+        solver specific variables such as AdaGrad's accumulated squared
+        gradients or SDCA's dual variables). This allows to learn on a
+        stream of chunks of samples with `partial_solve`
+
+        Parameters
+        ----------
+        model : `Model`
+            The new model. It must have the same number of coefficients and
+            the same dtype as the current one
+
+        Returns
+        -------
+        output : `Solver`
+            The `Solver` with given model
+        """
+        if self.model is None:
+            return self.set_model(model)
+        if model.n_coeffs != self.model.n_coeffs:
+            raise ValueError("Cannot update a model with %i coefficients "
+                             "with a model with %i coefficients"
+                             % (self.model.n_coeffs, model.n_coeffs))
+        SolverSto.update_model(self, model)
+        SolverFirstOrder.set_model(self, model)
         return self
 
     def set_prox(self, prox: Prox):
@@ -130,7 +161,7 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         """
 
         SolverFirstOrder.set_prox(self, prox)
-        SolverSto.set_prox(self, prox)
+        SolverSto.set_prox(self, self.prox)
         return self
 
     @property
@@ -168,9 +199,48 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
         step, obj, minimizer, prev_minimizer = self._initialize_values(x0, step,
                                                                    n_empty_vectors=1)
         self._solver.set_starting_iterate(minimizer)
+        self._run_epochs(self.max_iter + 1, obj, minimizer, prev_minimizer)
+        return minimizer
+
+    def partial_solve(self, x0: np.array = None, n_epochs: int = 1):
+        """Launch the solver for a few epochs, starting from its current
+        state instead of resetting it as `solve` does
+
+        Parameters
+        ----------
+        x0 : np.array, shape=(n_coeffs,), default=`None`
+            If given, the solver is reset and starts from this iterate
+
+        n_epochs : `int`, default=1
+            Number of epochs to run
+
+        Returns
+        -------
+        output : np.array, shape=(n_coeffs,)
+            Obtained minimizer
+        """
+        self._start_solve()
+        if x0 is not None:
+            _, obj, minimizer, prev_minimizer = \
+                self._initialize_values(x0, n_empty_vectors=1)
+            self._solver.set_starting_iterate(minimizer)
+        else:
+            minimizer = np.empty(self.model.n_coeffs, dtype=self.model.dtype)
+            self._solver.get_iterate(minimizer)
+            prev_minimizer = np.empty_like(minimizer)
+            obj = self.objective(minimizer)
+        self._run_epochs(n_epochs, obj, minimizer, prev_minimizer)
+        self._end_solve()
+        return self.solution
+
+    def _run_epochs(self, n_epochs, obj, minimizer, prev_minimizer):
+        """Runs epochs of the wrapped C++ solver until ``n_epochs`` are
+        done or until convergence, and stores the obtained minimizer in
+        ``minimizer`` and in ``solution``
+        """
         # At each iteration we call self._solver.solve that does a full
         # epoch
-        for n_iter in range(self.max_iter + 1):
+        for n_iter in range(n_epochs):
             prev_minimizer[:] = minimizer
             prev_obj = obj
             # Launch one epoch using the wrapped C++ solver
@@ -190,4 +260,3 @@ class SolverFirstOrderSto(SolverFirstOrder, SolverSto):
             if converged:
                 break
         self._set("solution", minimizer)
-        return minimizer
@@ -2,6 +2,8 @@
 
 from abc import ABC
 
+import numpy as np
+
 from tick.base import Base
 from tick.optim.model.base import Model
 from tick.optim.prox.base import Prox
@@ -53,39 +55,82 @@ class SolverSto(Base):
             "writable": False,
             "cpp_setter": "set_rand_max"
         },
+        "_model_epoch_size": {
+            "writable": False
+        },
         "_rand_type": {
             "writable": False,
             "cpp_setter": "set_rand_type"
         },
         "seed": {
             "cpp_setter": "set_seed"
+        },
+        "n_threads": {
+            "cpp_setter": "set_n_threads"
+        },
+        "atomic_writes": {
+            "cpp_setter": "set_atomic_writes"
+        },
+        "batch_size": {
+            "cpp_setter": "set_batch_size"
         }
     }
 
     # The name of the attribute that might contain the C++ solver object
     _cpp_obj_name = "_solver"
 
+    # Maps the floating point types supported by the solver to its C++ class
+    _cpp_class_dtype_map = {}
+
     def __init__(self, epoch_size: int=None, rand_type: str="unif", seed=-1):
         Base.__init__(self)
         # The C++ wrapped solver is to be given in child classes
         self._solver = None
         self._rand_type = None
         self._rand_max = None
+        # The epoch_size taken from the model, if not given by the user
+        self._model_epoch_size = None
         self.epoch_size = epoch_size
         self.rand_type = rand_type
         self.seed = seed
 
     def set_model(self, model: Model):
+        # The C++ solver must work with the floating point type of the model
+        if model.dtype not in self._cpp_class_dtype_map:
+            raise ValueError("%s does not support dtype %s"
+                             % (self.__class__.__name__, model.dtype))
+        solver_class = self._cpp_class_dtype_map[model.dtype]
+        if not isinstance(self._solver, solver_class):
+            self._set_cpp_solver(model.dtype)
         # Give the C++ wrapped model to the solver
         self._solver.set_model(model._model)
         # If not already specified, we use the model's epoch_size
         if self.epoch_size is None:
             self.epoch_size = model._epoch_size
+            self._set("_model_epoch_size", self.epoch_size)
         # We always use the _rand_max given by the model
         model_rand_max = model._rand_max
         self._set("_rand_max", model_rand_max)
         return self
 
+    def update_model(self, model: Model):
+        # The C++ solver keeps its state, hence it cannot be rebuilt for
+        # another floating point type
+        solver_class = self._cpp_class_dtype_map.get(model.dtype)
+        if solver_class is None or not isinstance(self._solver, solver_class):
+            raise ValueError("Cannot update %s with a model of dtype %s, "
+                             "the solver works with another dtype"
+                             % (self.__class__.__name__, model.dtype))
+        self._solver.update_model(model._model)
+        # An epoch goes once through the new samples, unless the epoch_size
+        # was given by the user
+        if self.epoch_size is None or \
+                self.epoch_size == self._model_epoch_size:
+            self.epoch_size = model._epoch_size
+            self._set("_model_epoch_size", self.epoch_size)
+        self._set("_rand_max", model._rand_max)
+        return self
+
     def set_prox(self, prox: Prox):
         if prox._prox is None:
             raise ValueError("Prox %s is not compatible with stochastic "
@@ -95,6 +140,26 @@ class SolverSto(Base):
         self._solver.set_prox(prox._prox)
         return self
 
+    def _build_cpp_solver(self, dtype):
+        """Builds the C++ solver working with the given dtype
+
+        Notes
+        -----
+        Must be overloaded in child classes
+        """
+        raise NotImplementedError()
+
+    def _set_cpp_solver(self, dtype):
+        """Replaces the C++ solver by one working with the given dtype, and
+        gives it the parameters of the current one
+        """
+        self._set("_solver", self._build_cpp_solver(dtype))
+        for name, attrinfo in self._attrinfos.items():
+            cpp_setter = attrinfo.get("cpp_setter")
+            value = getattr(self, name, None)
+            if cpp_setter is not None and value is not None:
+                getattr(self._solver, cpp_setter)(value)
+
     @property
     def rand_type(self):
         if self._rand_type == unif:
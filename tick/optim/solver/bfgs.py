@@ -99,7 +99,18 @@ class BFGS(SolverFirstOrder):
             self._set("_prox_grad", lambda x: x)
         elif type(prox) is ProxL2Sq:
             SolverFirstOrder.set_prox(self, prox)
-            self._set("_prox_grad", lambda x: prox.strength * x)
+
+            def prox_grad(x):
+                # Coordinates outside of the range of the prox (such as an
+                # intercept) are not penalized
+                if prox.range is None:
+                    return prox.strength * x
+                start, end = prox.range
+                grad = np.zeros_like(x)
+                grad[start:end] = prox.strength * x[start:end]
+                return grad
+
+            self._set("_prox_grad", prox_grad)
         else:
             raise ValueError("BFGS only accepts ProxZero and ProxL2sq "
                              "for now")
@@ -129,7 +129,6 @@ class GD(SolverFirstOrder):
                 print('Step equals 0... at %i' % n_iter)
                 break
             rel_delta = relative_distance(x, prev_x)
-            obj = self.objective(x)
             rel_obj = abs(obj - prev_obj) / abs(prev_obj)
             converged = rel_obj < self.tol
             # If converged, we stop the loop and record the last step
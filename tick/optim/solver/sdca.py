@@ -3,6 +3,7 @@
 
 from tick.optim.solver.base import SolverFirstOrderSto
 from .build.solver import SDCA as _SDCA
+from .build.solver import SDCAFloat as _SDCAFloat
 import numpy as np
 
 
@@ -45,6 +46,18 @@ class SDCA(SolverFirstOrderSto):
         Information along iteration is recorded in history each time the
         iteration number of a multiple of ``record_every``
 
+    n_threads : `int`, default=1
+        Number of threads used to run an epoch. If larger than 1, each
+        thread samples its own indices and updates the shared iterate
+        without locks (Hogwild!). Threads only write the coordinates on
+        which the sampled gradient is non-zero, hence a separable prox is
+        required
+
+    atomic_writes : `bool`, default=False
+        If `True` and ``n_threads > 1``, increments of the shared primal
+        vector are done with atomic operations, hence no increment made by
+        a thread is overwritten by another one
+
     Attributes
     ----------
     model : `Solver`
@@ -59,11 +72,17 @@ class SDCA(SolverFirstOrderSto):
         'l_l2sq': {'cpp_setter': 'set_l_l2sq'}
     }
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _SDCA,
+        np.dtype(np.float32): _SDCAFloat
+    }
+
     def __init__(self, l_l2sq: float, epoch_size: int = None,
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1):
+                 seed: int = -1, n_threads: int = 1,
+                 atomic_writes: bool = False):
 
         SolverFirstOrderSto.__init__(self, step=0, epoch_size=epoch_size,
                                      rand_type=rand_type, tol=tol,
@@ -71,12 +90,18 @@ class SDCA(SolverFirstOrderSto):
                                      print_every=print_every,
                                      record_every=record_every, seed=seed)
         self.l_l2sq = l_l2sq
+        # Construct the wrapped C++ SDCA solver
+        self._solver = self._build_cpp_solver(np.dtype(np.float64))
+        self.n_threads = n_threads
+        self.atomic_writes = atomic_writes
+
+    def _build_cpp_solver(self, dtype):
         epoch_size = self.epoch_size
         if epoch_size is None:
             epoch_size = 0
-        # Construct the wrapped C++ SDCA solver
-        self._solver = _SDCA(self.l_l2sq, epoch_size,
-                             self.tol, self._rand_type, self.seed)
+        return self._cpp_class_dtype_map[dtype](self.l_l2sq, epoch_size,
+                                                self.tol, self._rand_type,
+                                                self.seed)
 
     def objective(self, coeffs, loss: float = None):
         """Compute the objective minimized by the solver at ``coeffs``
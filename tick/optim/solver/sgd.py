@@ -1,7 +1,10 @@
 # License: BSD 3 clause
 
+import numpy as np
+
 from tick.optim.solver.base import SolverFirstOrderSto
 from tick.optim.solver.build.solver import SGD as _SGD
+from tick.optim.solver.build.solver import SGDFloat as _SGDFloat
 
 __author__ = "Stephane Gaiffas"
 
@@ -50,6 +53,27 @@ class SGD(SolverFirstOrderSto):
         The seed of the random sampling. If it is negative then a random seed
         (different at each run) will be chosen.
 
+    n_threads : `int`, default=1
+        Number of threads used to run an epoch. If larger than 1, each
+        thread samples its own indices and updates the shared iterate
+        without locks (Hogwild!). Threads only write the coordinates on
+        which the sampled gradient is non-zero, hence a separable prox is
+        required
+
+    atomic_writes : `bool`, default=False
+        If `True` and ``n_threads > 1``, increments of the shared iterate
+        and the prox writes following them are done with atomic
+        operations, hence no increment made by a thread is overwritten by
+        another one
+
+    batch_size : `int`, default=1
+        Number of samples used at each iteration. If larger than 1, each
+        iteration uses the average of the gradients of ``batch_size``
+        samples (computed with the model's ``grad_batch``) and an epoch
+        performs ``epoch_size / batch_size`` iterations, hence it still goes
+        through ``epoch_size`` samples. It cannot be used together with
+        ``n_threads > 1``
+
     Attributes
     ----------
     model : `Solver`
@@ -59,15 +83,28 @@ class SGD(SolverFirstOrderSto):
         Proximal operator to solve
     """
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _SGD,
+        np.dtype(np.float32): _SGDFloat
+    }
+
     def __init__(self, step: float = None, epoch_size: int = None,
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1):
+                 seed: int = -1, n_threads: int = 1,
+                 atomic_writes: bool = False, batch_size: int = 1):
 
         SolverFirstOrderSto.__init__(self, step, epoch_size, rand_type,
                                      tol, max_iter, verbose,
                                      print_every, record_every, seed)
+        # Construct the wrapped C++ SGD solver
+        self._solver = self._build_cpp_solver(np.dtype(np.float64))
+        self.n_threads = n_threads
+        self.atomic_writes = atomic_writes
+        self.batch_size = batch_size
+
+    def _build_cpp_solver(self, dtype):
         # Type mapping None to unsigned long and double does not work...
         step = self.step
         if step is None:
@@ -75,6 +112,6 @@ class SGD(SolverFirstOrderSto):
         epoch_size = self.epoch_size
         if epoch_size is None:
             epoch_size = 0
-        # Construct the wrapped C++ SGD solver
-        self._solver = _SGD(epoch_size, self.tol,
-                            self._rand_type, step, self.seed)
+        return self._cpp_class_dtype_map[dtype](epoch_size, self.tol,
+                                                self._rand_type, step,
+                                                self.seed)
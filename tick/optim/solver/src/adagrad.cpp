@@ -3,19 +3,28 @@
 #include "adagrad.h"
 #include "prox_separable.h"
 
-AdaGrad::AdaGrad(ulong epoch_size, double tol, RandType rand_type, double step, int seed)
-  : StoSolver(epoch_size, tol, rand_type, seed), hist_grad(iterate.size()), step(step) {
+template <class T>
+TAdaGrad<T>::TAdaGrad(ulong epoch_size, double tol, RandType rand_type, double step, int seed)
+  : TStoSolver<T>(epoch_size, tol, rand_type, seed), hist_grad(iterate.size()), step(step) {
 }
 
-void AdaGrad::solve() {
-  std::shared_ptr<ProxSeparable> casted_prox;
+template <class T>
+void TAdaGrad<T>::solve() {
+  if (n_threads > 1) {
+    init_threads();
+    parallel_run(n_threads, n_threads, &TAdaGrad<T>::solve_thread, this);
+    t += epoch_size;
+    return;
+  }
+
+  std::shared_ptr<TProxSeparable<T> > casted_prox;
   if (prox->is_separable()) {
-    casted_prox = std::static_pointer_cast<ProxSeparable>(prox);
+    casted_prox = std::static_pointer_cast<TProxSeparable<T> >(prox);
   } else {
     TICK_ERROR("Prox in Adagrad must be separable but got " << prox->get_class_name());
   }
 
-  ArrayDouble grad_i(iterate.size());
+  Array<T> grad_i(iterate.size());
   grad_i.init_to_zero();
 
   ArrayDouble steps(iterate.size());
@@ -49,11 +58,37 @@ void AdaGrad::solve() {
   }
 }
 
-void AdaGrad::set_starting_iterate(ArrayDouble &new_iterate) {
-  StoSolver::set_starting_iterate(new_iterate);
+template <class T>
+void TAdaGrad<T>::solve_thread(ulong thread) {
+  Array<T> grad_i(iterate.size());
+  grad_i.init_to_zero();
 
-  hist_grad = ArrayDouble(new_iterate.size());
-  hist_grad.init_to_zero();
+  // We add this constant in case the sqrt below approaches 0.0
+  const double jitter = 1e-6;
+
+  const ulong thread_epoch_size = get_thread_epoch_size(thread);
+  for (ulong k = 0; k < thread_epoch_size; ++k) {
+    const ulong i = get_next_i(thread, k);
+    model->grad_i(i, iterate, grad_i);
+
+    // Only coordinates with a non-zero gradient are written
+    for (ulong j = 0; j < iterate.size(); ++j) {
+      const double grad_i_j = grad_i[j];
+      if (grad_i_j == 0) continue;
+      shared_incr(hist_grad[j], grad_i_j * grad_i_j);
+      const double step_j = step / (std::sqrt(hist_grad[j] + jitter));
+      shared_incr_prox(j, -step_j * grad_i_j, step_j);
+    }
+  }
 }
 
+template <class T>
+void TAdaGrad<T>::set_starting_iterate(Array<T> &new_iterate) {
+  TStoSolver<T>::set_starting_iterate(new_iterate);
+
+  hist_grad = Array<T>(new_iterate.size());
+  hist_grad.init_to_zero();
+}
 
+template class TAdaGrad<double>;
+template class TAdaGrad<float>;
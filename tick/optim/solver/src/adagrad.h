@@ -5,17 +5,38 @@
 
 #include "sto_solver.h"
 
-class AdaGrad : public StoSolver {
+template <class T>
+class TAdaGrad : public TStoSolver<T> {
+ protected:
+  using TStoSolver<T>::model;
+  using TStoSolver<T>::prox;
+  using TStoSolver<T>::iterate;
+  using TStoSolver<T>::t;
+  using TStoSolver<T>::epoch_size;
+  using TStoSolver<T>::n_threads;
+  using TStoSolver<T>::init_threads;
+  using TStoSolver<T>::get_thread_epoch_size;
+  using TStoSolver<T>::shared_incr;
+  using TStoSolver<T>::shared_incr_prox;
+
  private:
-  ArrayDouble hist_grad;
+  Array<T> hist_grad;
   double step;
 
  public:
-  AdaGrad(ulong epoch_size, double tol, RandType rand_type, double step, int seed);
+  using TStoSolver<T>::get_next_i;
+
+  TAdaGrad(ulong epoch_size, double tol, RandType rand_type, double step, int seed);
 
   void solve() override;
 
-  void set_starting_iterate(ArrayDouble &new_iterate) override;
+  //! @brief Runs the share of the current epoch of a thread, when n_threads > 1
+  void solve_thread(ulong thread);
+
+  void set_starting_iterate(Array<T> &new_iterate) override;
 };
 
+typedef TAdaGrad<double> AdaGrad;
+typedef TAdaGrad<float> AdaGradFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_ADAGRAD_H_
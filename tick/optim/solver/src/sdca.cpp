@@ -7,53 +7,92 @@
 #include <prox_l2sq.h>
 #include "sdca.h"
 
-SDCA::SDCA(double l_l2sq,
-           ulong epoch_size,
-           double tol,
-           RandType rand_type,
-           int seed
-) : StoSolver(epoch_size, tol, rand_type, seed), l_l2sq(l_l2sq) {
+template <class T>
+TSDCA<T>::TSDCA(double l_l2sq,
+                ulong epoch_size,
+                double tol,
+                RandType rand_type,
+                int seed
+) : TStoSolver<T>(epoch_size, tol, rand_type, seed), l_l2sq(l_l2sq) {
   stored_variables_ready = false;
+  n_past_samples = 0;
 }
 
-void SDCA::set_model(ModelPtr model) {
-  StoSolver::set_model(model);
+template <class T>
+void TSDCA<T>::set_model(std::shared_ptr<TModel<T> > model) {
+  TStoSolver<T>::set_model(model);
   this->model = model;
   stored_variables_ready = false;
 }
 
-void SDCA::reset() {
-  StoSolver::reset();
+template <class T>
+void TSDCA<T>::update_model(std::shared_ptr<TModel<T> > model) {
+  TStoSolver<T>::update_model(model);
+  if (!stored_variables_ready) {
+    init_stored_variables();
+    return;
+  }
+
+  // tmp_primal_vector is the sum of dual_vector[i] * x_i / (l_l2sq * n), where n is the number
+  // of samples seen so far. The dual variables of the previous samples are frozen, hence we only
+  // rescale their contribution with the new number of samples and start with zero dual
+  // variables for the new ones
+  const ulong n_previous_samples = n_past_samples + n_samples;
+  n_past_samples = n_previous_samples;
+  n_samples = model->get_n_samples();
+  tmp_primal_vector *= static_cast<double>(n_previous_samples) / (n_previous_samples + n_samples);
+  prox->call(tmp_primal_vector, 1. / l_l2sq, iterate);
+
+  dual_vector = Array<T>(n_samples);
+  delta = Array<T>(n_samples);
+  dual_vector.init_to_zero();
+  delta.init_to_zero();
+}
+
+template <class T>
+void TSDCA<T>::reset() {
+  TStoSolver<T>::reset();
   init_stored_variables();
 }
 
-void SDCA::init_stored_variables() {
+template <class T>
+void TSDCA<T>::init_stored_variables() {
   n_samples = model->get_n_samples();
   n_coeffs = model->get_n_coeffs();
 
   if (dual_vector.size() != n_samples)
-    dual_vector = ArrayDouble(n_samples);
+    dual_vector = Array<T>(n_samples);
 
   if (delta.size() != n_samples)
-    delta = ArrayDouble(n_samples);
+    delta = Array<T>(n_samples);
 
   if (tmp_primal_vector.size() != n_coeffs)
-    tmp_primal_vector = ArrayDouble(n_coeffs);
+    tmp_primal_vector = Array<T>(n_coeffs);
 
   dual_vector.init_to_zero();
   delta.init_to_zero();
   tmp_primal_vector.init_to_zero();
+  n_past_samples = 0;
   stored_variables_ready = true;
 }
 
-void SDCA::solve() {
+template <class T>
+void TSDCA<T>::solve() {
   if (!stored_variables_ready) {
     init_stored_variables();
   }
 
+  if (n_threads > 1) {
+    init_threads();
+    parallel_run(n_threads, n_threads, &TSDCA<T>::solve_thread, this);
+    t += epoch_size;
+    return;
+  }
+
   ulong i;
   double delta_i;
-  double _1_over_lbda_n = 1 / (l_l2sq * n_samples);
+  double _1_over_lbda_n = 1 / (l_l2sq * (n_past_samples + n_samples));
+  const double model_l_l2sq = get_model_l_l2sq();
   ulong start_t = t;
 
   for (t = start_t; t < start_t + epoch_size; ++t) {
@@ -61,7 +100,7 @@ void SDCA::solve() {
     i = get_next_i();
 
     // Maximize the dual coordinate i
-    delta_i = model->sdca_dual_min_i(i, dual_vector, iterate, delta, l_l2sq);
+    delta_i = model->sdca_dual_min_i(i, dual_vector, iterate, delta, model_l_l2sq);
 
     // Update the dual variable
     dual_vector[i] += delta_i;
@@ -70,10 +109,10 @@ void SDCA::solve() {
     delta[i] = delta_i;
 
     // Update the primal variable
-    BaseArrayDouble features_i = model->get_features(i);
+    BaseArray<T> features_i = model->get_features(i);
 
     if (model->use_intercept()) {
-      ArrayDouble primal_features = view(tmp_primal_vector, 0, features_i.size());
+      Array<T> primal_features = view(tmp_primal_vector, 0, features_i.size());
       primal_features.mult_incr(features_i, delta_i * _1_over_lbda_n);
       tmp_primal_vector[model->get_n_features()] += delta_i * _1_over_lbda_n;
     } else {
@@ -84,3 +123,47 @@ void SDCA::solve() {
     prox->call(tmp_primal_vector, 1. / l_l2sq, iterate);
   }
 }
+
+template <class T>
+void TSDCA<T>::solve_thread(ulong thread) {
+  const double _1_over_lbda_n = 1 / (l_l2sq * (n_past_samples + n_samples));
+  const double model_l_l2sq = get_model_l_l2sq();
+  const ulong n_features = model->get_n_features();
+  const bool use_intercept = model->use_intercept();
+
+  const ulong thread_epoch_size = get_thread_epoch_size(thread);
+  for (ulong k = 0; k < thread_epoch_size; ++k) {
+    const ulong i = get_next_i(thread, k);
+
+    // Maximize the dual coordinate i
+    const double delta_i = model->sdca_dual_min_i(i, dual_vector, iterate, delta,
+                                                  model_l_l2sq);
+    dual_vector[i] += delta_i;
+    delta[i] = delta_i;
+
+    // Since the prox is separable, only the coordinates of the primal variable matching the
+    // non-zero features of sample i change
+    BaseArray<T> features_i = model->get_features(i);
+    const double coeff = delta_i * _1_over_lbda_n;
+    if (features_i.is_sparse()) {
+      for (ulong idx = 0; idx < features_i.size_sparse(); ++idx) {
+        const ulong j = features_i.indices()[idx];
+        shared_incr(tmp_primal_vector[j], coeff * features_i.data()[idx]);
+        prox_single(j, tmp_primal_vector, 1. / l_l2sq);
+      }
+    } else {
+      for (ulong j = 0; j < features_i.size(); ++j) {
+        shared_incr(tmp_primal_vector[j], coeff * features_i.data()[j]);
+        prox_single(j, tmp_primal_vector, 1. / l_l2sq);
+      }
+    }
+
+    if (use_intercept) {
+      shared_incr(tmp_primal_vector[n_features], coeff);
+      prox_single(n_features, tmp_primal_vector, 1. / l_l2sq);
+    }
+  }
+}
+
+template class TSDCA<double>;
+template class TSDCA<float>;
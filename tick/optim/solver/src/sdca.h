@@ -17,40 +17,63 @@
 // TODO: code accelerated SDCA
 
 
-class SDCA : public StoSolver {
+template <class T>
+class TSDCA : public TStoSolver<T> {
   // SDCA Solver's class
 
  protected:
+  using TStoSolver<T>::model;
+  using TStoSolver<T>::prox;
+  using TStoSolver<T>::iterate;
+  using TStoSolver<T>::t;
+  using TStoSolver<T>::epoch_size;
+  using TStoSolver<T>::n_threads;
+  using TStoSolver<T>::init_threads;
+  using TStoSolver<T>::get_thread_epoch_size;
+  using TStoSolver<T>::shared_incr;
+  using TStoSolver<T>::prox_single;
+
   ulong n_samples, n_coeffs;
 
+  // Number of samples of the previous models given with update_model. Their dual variables are
+  // not stored anymore, but their contribution is kept in tmp_primal_vector
+  ulong n_past_samples;
+
   // A boolean that attests that our arrays of ascent variables and dual variables are initialized
   // with the right size
   bool stored_variables_ready;
 
   // Store for coefficient update before prox call.
-  ArrayDouble tmp_primal_vector;
+  Array<T> tmp_primal_vector;
 
   // Level of ridge regularization. This is mandatory for SDCA.
   double l_l2sq;
 
   // Ascent variables
-  ArrayDouble delta;
+  Array<T> delta;
 
   // The dual variable
-  ArrayDouble dual_vector;
+  Array<T> dual_vector;
 
  public:
-  SDCA(double l_l2sq,
-       ulong epoch_size = 0,
-       double tol = 0.,
-       RandType rand_type = RandType::unif,
-       int seed = -1);
+  using TStoSolver<T>::get_next_i;
+
+  TSDCA(double l_l2sq,
+        ulong epoch_size = 0,
+        double tol = 0.,
+        RandType rand_type = RandType::unif,
+        int seed = -1);
 
   void reset();
 
   void solve();
 
-  void set_model(ModelPtr model);
+  //! @brief Runs the share of the current epoch of a thread, when n_threads > 1
+  void solve_thread(ulong thread);
+
+  void set_model(std::shared_ptr<TModel<T> > model);
+
+  void update_model(std::shared_ptr<TModel<T> > model) override;
 
   void init_stored_variables();
 
@@ -61,6 +84,21 @@ class SDCA : public StoSolver {
   void set_l_l2sq(double l_l2sq) {
     this->l_l2sq = l_l2sq;
   }
+
+  ulong get_n_past_samples() const {
+    return n_past_samples;
+  }
+
+ private:
+  // Level of ridge regularization to give to the model, that normalizes it with its own number
+  // of samples instead of the number of samples seen by the solver
+  double get_model_l_l2sq() const {
+    if (n_past_samples == 0) return l_l2sq;
+    return l_l2sq * (n_past_samples + n_samples) / n_samples;
+  }
 };
 
+typedef TSDCA<double> SDCA;
+typedef TSDCA<float> SDCAFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_SDCA_H_
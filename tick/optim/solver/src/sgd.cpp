@@ -6,20 +6,29 @@
 
 #include "sgd.h"
 
-SGD::SGD(ulong epoch_size,
-         double tol,
-         RandType rand_type,
-         double step,
-         int seed)
-    : StoSolver(epoch_size, tol, rand_type, seed),
+template <class T>
+TSGD<T>::TSGD(ulong epoch_size,
+              double tol,
+              RandType rand_type,
+              double step,
+              int seed)
+    : TStoSolver<T>(epoch_size, tol, rand_type, seed),
       step(step) {}
 
-void SGD::solve() {
-    if (model->is_sparse()) {
+template <class T>
+void TSGD<T>::solve() {
+    if (batch_size > 1) {
+        if (n_threads > 1) TICK_ERROR("SGD cannot use both batch_size > 1 and n_threads > 1");
+        solve_batch();
+    } else if (n_threads > 1) {
+        init_threads();
+        parallel_run(n_threads, n_threads, &TSGD<T>::solve_thread, this);
+        t += epoch_size;
+    } else if (model->is_sparse()) {
         solve_sparse();
     } else {
         // Dense case
-        ArrayDouble grad(iterate.size());
+        Array<T> grad(iterate.size());
         grad.init_to_zero();
 
         const ulong start_t = t;
@@ -33,7 +42,8 @@ void SGD::solve() {
     }
 }
 
-void SGD::solve_sparse() {
+template <class T>
+void TSGD<T>::solve_sparse() {
     // The model is sparse, so it is a ModelGeneralizedLinear and the iteration looks a
     // little bit different
     ulong n_features = model->get_n_features();
@@ -43,7 +53,7 @@ void SGD::solve_sparse() {
     for (t = start_t; t < start_t + epoch_size; ++t) {
         ulong i = get_next_i();
         // Sparse features vector
-        BaseArrayDouble x_i = model->get_features(i);
+        BaseArray<T> x_i = model->get_features(i);
         // Gradient factor
         double alpha_i = model->grad_i_factor(i, iterate);
         // Update the step
@@ -51,7 +61,7 @@ void SGD::solve_sparse() {
         double delta = -step_t * alpha_i;
         if (use_intercept) {
             // Get the features vector, which is sparse here
-            ArrayDouble iterate_no_interc = view(iterate, 0, n_features);
+            Array<T> iterate_no_interc = view(iterate, 0, n_features);
             iterate_no_interc.mult_incr(x_i, delta);
             iterate[n_features] += delta;
         } else {
@@ -63,6 +73,65 @@ void SGD::solve_sparse() {
     }
 }
 
-inline double SGD::get_step_t() {
+template <class T>
+void TSGD<T>::solve_batch() {
+    Array<T> grad(iterate.size());
+    ArrayULong indices;
+
+    // Each mini-batch is one iteration, an epoch still goes through epoch_size samples
+    const ulong start_t = t;
+    const ulong n_batches = get_n_batches();
+    for (t = start_t; t < start_t + n_batches; ++t) {
+        get_next_batch(t - start_t, indices);
+        model->grad_batch(indices, iterate, grad);
+        step_t = get_step_t();
+        iterate.mult_incr(grad, -step_t);
+        prox->call(iterate, step_t, iterate);
+    }
+}
+
+template <class T>
+void TSGD<T>::solve_thread(ulong thread) {
+    ulong n_features = model->get_n_features();
+    bool use_intercept = model->use_intercept();
+    bool sparse = model->is_sparse();
+
+    Array<T> grad;
+    if (!sparse) {
+        grad = Array<T>(iterate.size());
+        grad.init_to_zero();
+    }
+
+    const ulong start_t = t;
+    const ulong thread_epoch_size = get_thread_epoch_size(thread);
+    for (ulong k = 0; k < thread_epoch_size; ++k) {
+        const ulong i = get_next_i(thread, k);
+        // Threads iterations are interleaved to compute the step
+        const double thread_step_t = step / (start_t + k * n_threads + thread + 1);
+        if (sparse) {
+            // Only the coordinates of the non-zero features of x_i are written
+            BaseArray<T> x_i = model->get_features(i);
+            const double delta = -thread_step_t * model->grad_i_factor(i, iterate);
+            for (ulong idx = 0; idx < x_i.size_sparse(); ++idx) {
+                const ulong j = x_i.indices()[idx];
+                shared_incr_prox(j, delta * x_i.data()[idx], thread_step_t);
+            }
+            if (use_intercept) {
+                shared_incr_prox(n_features, delta, thread_step_t);
+            }
+        } else {
+            model->grad_i(i, iterate, grad);
+            for (ulong j = 0; j < iterate.size(); ++j) {
+                shared_incr_prox(j, -thread_step_t * grad[j], thread_step_t);
+            }
+        }
+    }
+}
+
+template <class T>
+inline double TSGD<T>::get_step_t() {
     return step / (t + 1);
 }
+
+template class TSGD<double>;
+template class TSGD<float>;
@@ -15,17 +15,34 @@
 #include "../../prox/src/prox.h"
 #include "sto_solver.h"
 
-class SGD : public StoSolver {
+template <class T>
+class TSGD : public TStoSolver<T> {
+ protected:
+    using TStoSolver<T>::model;
+    using TStoSolver<T>::prox;
+    using TStoSolver<T>::iterate;
+    using TStoSolver<T>::t;
+    using TStoSolver<T>::epoch_size;
+    using TStoSolver<T>::n_threads;
+    using TStoSolver<T>::batch_size;
+    using TStoSolver<T>::init_threads;
+    using TStoSolver<T>::get_n_batches;
+    using TStoSolver<T>::get_next_batch;
+    using TStoSolver<T>::get_thread_epoch_size;
+    using TStoSolver<T>::shared_incr_prox;
+
  private:
     double step_t;
     double step;
 
  public:
-    SGD(ulong epoch_size = 0,
-        double tol = 0.,
-        RandType rand_type = RandType::unif,
-        double step = 0.,
-        int seed = -1);
+    using TStoSolver<T>::get_next_i;
+
+    TSGD(ulong epoch_size = 0,
+         double tol = 0.,
+         RandType rand_type = RandType::unif,
+         double step = 0.,
+         int seed = -1);
 
     inline double get_step_t() const {
         return step_t;
@@ -43,7 +60,16 @@ class SGD : public StoSolver {
 
     void solve_sparse();
 
+    //! @brief Runs an epoch with mini-batches of batch_size samples
+    void solve_batch();
+
+    //! @brief Runs the share of the current epoch of a thread, when n_threads > 1
+    void solve_thread(ulong thread);
+
     inline double get_step_t();
 };
 
+typedef TSGD<double> SGD;
+typedef TSGD<float> SGDFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_SGD_H_
@@ -8,25 +8,33 @@
 
 #include <prox_zero.h>
 
-StoSolver::StoSolver(int seed)
-    : seed(seed) {
+#include <algorithm>
+
+template <class T>
+TStoSolver<T>::TStoSolver(int seed)
+    : seed(seed), n_threads(1), atomic_writes(false), batch_size(1) {
     set_seed(seed);
     permutation_ready = false;
 }
 
-StoSolver::StoSolver(ulong epoch_size,
-                     double tol,
-                     RandType rand_type,
-                     int seed)
-    : prox(std::make_shared<ProxZero>(0.0)),
+template <class T>
+TStoSolver<T>::TStoSolver(ulong epoch_size,
+                          double tol,
+                          RandType rand_type,
+                          int seed)
+    : prox(std::make_shared<TProxZero<T> >(0.0)),
       epoch_size(epoch_size),
       tol(tol),
-      rand_type(rand_type) {
+      rand_type(rand_type),
+      n_threads(1),
+      atomic_writes(false),
+      batch_size(1) {
     set_seed(seed);
     permutation_ready = false;
 }
 
-void StoSolver::init_permutation() {
+template <class T>
+void TStoSolver<T>::init_permutation() {
     if ((rand_type == RandType::perm) && (rand_max > 0)) {
         permutation = ArrayULong(rand_max);
         for (ulong i = 0; i < rand_max; ++i)
@@ -34,7 +42,8 @@ void StoSolver::init_permutation() {
     }
 }
 
-void StoSolver::reset() {
+template <class T>
+void TStoSolver<T>::reset() {
     t = 1;
     if (rand_type == RandType::perm) {
         i_perm = 0;
@@ -42,7 +51,8 @@ void StoSolver::reset() {
     }
 }
 
-ulong StoSolver::get_next_i() {
+template <class T>
+ulong TStoSolver<T>::get_next_i() {
     ulong i = 0;
     if (rand_type == RandType::unif) {
         i = rand_unif(rand_max - 1);
@@ -61,7 +71,8 @@ ulong StoSolver::get_next_i() {
 }
 
 // Simulation of a random permutation using Knuth's algorithm
-void StoSolver::shuffle() {
+template <class T>
+void TStoSolver<T>::shuffle() {
     if (rand_type == RandType::perm) {
         // A secure check
         if (permutation.size() != rand_max) {
@@ -70,29 +81,167 @@ void StoSolver::shuffle() {
         // Restart the i_perm
         i_perm = 0;
 
-        for (ulong i = 1; i < rand_max; ++i) {
-            // uniform number in { 0, ..., i }
-            ulong j = rand_unif(i);
-            // Exchange permutation[i] and permutation[j]
-            ulong tmp = permutation[i];
-            permutation[i] = permutation[j];
-            permutation[j] = tmp;
+        const ArrayULong shard_starts = model ? model->get_shard_starts() : ArrayULong();
+        if (shard_starts.size() > 2 && shard_starts[shard_starts.size() - 1] == rand_max) {
+            shuffle_shards(shard_starts);
+        } else {
+            shuffle_range(permutation, 0, rand_max);
         }
     }
     permutation_ready = true;
 }
 
-void StoSolver::get_minimizer(ArrayDouble &out) {
+template <class T>
+void TStoSolver<T>::shuffle_range(ArrayULong &array, ulong start, ulong end) {
+    for (ulong i = start + 1; i < end; ++i) {
+        // uniform number in { start, ..., i }
+        ulong j = start + rand_unif(i - start);
+        // Exchange array[i] and array[j]
+        ulong tmp = array[i];
+        array[i] = array[j];
+        array[j] = tmp;
+    }
+}
+
+template <class T>
+void TStoSolver<T>::shuffle_shards(const ArrayULong &shard_starts) {
+    const ulong n_shards = shard_starts.size() - 1;
+    ArrayULong shards(n_shards);
+    for (ulong shard = 0; shard < n_shards; ++shard)
+        shards[shard] = shard;
+    shuffle_range(shards, 0, n_shards);
+
+    ulong start = 0;
+    for (ulong k = 0; k < n_shards; ++k) {
+        const ulong shard = shards[k];
+        const ulong shard_size = shard_starts[shard + 1] - shard_starts[shard];
+        for (ulong i = 0; i < shard_size; ++i)
+            permutation[start + i] = shard_starts[shard] + i;
+        shuffle_range(permutation, start, start + shard_size);
+        start += shard_size;
+    }
+}
+
+template <class T>
+void TStoSolver<T>::set_n_threads(int n_threads) {
+    if (n_threads < 1) TICK_ERROR("n_threads must be positive, got " << n_threads);
+    this->n_threads = n_threads;
+    thread_rands.clear();
+}
+
+template <class T>
+void TStoSolver<T>::set_batch_size(ulong batch_size) {
+    if (batch_size < 1) TICK_ERROR("batch_size must be positive, got " << batch_size);
+    this->batch_size = batch_size;
+}
+
+template <class T>
+void TStoSolver<T>::get_next_batch(ulong batch, ArrayULong &indices) {
+    const ulong size = std::min(batch_size, epoch_size - batch * batch_size);
+    if (indices.size() != size) indices = ArrayULong(size);
+    for (ulong k = 0; k < size; ++k) {
+        indices[k] = get_next_i();
+    }
+}
+
+template <class T>
+void TStoSolver<T>::init_separable_prox() {
+    if (!prox->is_separable()) {
+        TICK_ERROR("Prox must be separable but got " << prox->get_class_name());
+    }
+    separable_prox = std::static_pointer_cast<TProxSeparable<T> >(prox);
+    separable_prox_start = 0;
+    separable_prox_end = iterate.size();
+    if (prox->get_has_range()) {
+        separable_prox_start = prox->get_start();
+        separable_prox_end = prox->get_end();
+        if (separable_prox_end > iterate.size()) TICK_ERROR(
+            prox->get_class_name() << " of range [" << separable_prox_start << ", "
+                                   << separable_prox_end
+                                   << "] cannot be called on a vector of size " << iterate.size());
+    }
+    separable_prox->check_zero_mask(separable_prox_end - separable_prox_start);
+}
+
+template <class T>
+void TStoSolver<T>::init_threads() {
+    if (!prox->is_separable()) {
+        TICK_ERROR("Stochastic solvers with n_threads > 1 require a separable prox, got "
+                       << prox->get_class_name());
+    }
+    init_separable_prox();
+
+    if (thread_rands.size() != static_cast<ulong>(n_threads)) {
+        thread_rands.clear();
+        for (int thread = 0; thread < n_threads; ++thread) {
+            // Each thread gets its own stream, derived from the seed of the solver
+            thread_rands.emplace_back(seed < 0 ? -1 : seed + thread + 1);
+        }
+    }
+
+    // With permutation sampling, threads share the permutations of the epoch, one per pass
+    // over the samples
+    if (rand_type == RandType::perm && rand_max > 0) {
+        const ulong n_passes = std::max(ulong{1}, (epoch_size + rand_max - 1) / rand_max);
+        if (epoch_permutation.size() != n_passes * rand_max) {
+            epoch_permutation = ArrayULong(n_passes * rand_max);
+        }
+        for (ulong pass = 0; pass < n_passes; ++pass) {
+            shuffle();
+            std::copy(permutation.data(), permutation.data() + rand_max,
+                      epoch_permutation.data() + pass * rand_max);
+        }
+    }
+}
+
+// Iterations of an epoch are dealt to threads in a round robin fashion: thread
+// number thread runs iterations thread, thread + n_threads, thread + 2 * n_threads...
+template <class T>
+ulong TStoSolver<T>::get_thread_epoch_size(ulong thread) const {
+    return thread < epoch_size ? (epoch_size - thread - 1) / n_threads + 1 : 0;
+}
+
+template <class T>
+ulong TStoSolver<T>::get_next_i(ulong thread, ulong k) {
+    if (rand_type == RandType::perm) {
+        return epoch_permutation[k * n_threads + thread];
+    } else {
+        return thread_rands[thread].uniform_int(ulong{0}, rand_max - 1);
+    }
+}
+
+template <class T>
+void TStoSolver<T>::update_model(std::shared_ptr<TModel<T> > model) {
+    if (!this->model) {
+        set_model(model);
+        return;
+    }
+    if (model->get_n_coeffs() != iterate.size()) {
+        TICK_ERROR("Cannot update a model with " << iterate.size()
+                       << " coefficients with a model with " << model->get_n_coeffs()
+                       << " coefficients");
+    }
+    this->model = model;
+    permutation_ready = false;
+}
+
+template <class T>
+void TStoSolver<T>::get_minimizer(Array<T> &out) {
     for (ulong i = 0; i < iterate.size(); ++i)
         out[i] = iterate[i];
 }
 
-void StoSolver::get_iterate(ArrayDouble &out) {
+template <class T>
+void TStoSolver<T>::get_iterate(Array<T> &out) {
     for (ulong i = 0; i < iterate.size(); ++i)
         out[i] = iterate[i];
 }
 
-void StoSolver::set_starting_iterate(ArrayDouble &new_iterate) {
+template <class T>
+void TStoSolver<T>::set_starting_iterate(Array<T> &new_iterate) {
     for (ulong i = 0; i < new_iterate.size(); ++i)
         iterate[i] = new_iterate[i];
 }
+
+template class TStoSolver<double>;
+template class TStoSolver<float>;
@@ -11,6 +11,10 @@
 #include <rand.h>
 #include "model.h"
 #include "prox.h"
+#include "prox_separable.h"
+
+#include <atomic>
+#include <vector>
 
 
 // TODO: code an abstract class and use it for StoSolvers
@@ -23,13 +27,15 @@ enum class RandType {
     perm
 };
 
-// Base abstract for a stochastic solver
-class StoSolver {
+// Base abstract for a stochastic solver, templated on the floating point type of the
+// model and of the iterate (double or float)
+template <class T>
+class TStoSolver {
  protected:
     // Model object
-    ModelPtr model;
+    std::shared_ptr<TModel<T> > model;
 
-    ProxPtr prox;
+    std::shared_ptr<TProx<T> > prox;
 
     Rand rand;
 
@@ -37,7 +43,7 @@ class StoSolver {
     ulong t = 1;
 
     // Iterate
-    ArrayDouble iterate;
+    Array<T> iterate;
 
     // sampling is done in {0, ..., rand_max-1}
     // This is useful to know in what range random sampling must be done
@@ -65,27 +71,180 @@ class StoSolver {
     // Init permutation array in case of Random is srt to permutation
     void init_permutation();
 
+    // Randomly permutes the elements of array between start (included) and end (excluded)
+    void shuffle_range(ArrayULong &array, ulong start, ulong end);
+
+    // Draws a permutation that goes through the shards of the model in a random order, and
+    // through the samples of each shard in a random order. This way, an epoch reads each
+    // shard of features only once when they are not in memory
+    void shuffle_shards(const ArrayULong &shard_starts);
+
     // Seed of the random sampling
     int seed;
 
+    // Number of threads used to run an epoch. If larger than 1, the epoch is
+    // split between threads that sample their own indices and update the shared
+    // iterate without locks (Hogwild!)
+    int n_threads;
+
+    // If true, the increments made by threads on the shared iterate are atomic, and so are the
+    // prox writes of shared_incr_prox (see below), hence no increment is lost
+    bool atomic_writes;
+
+    // Number of samples drawn at each iteration by solvers using mini-batches
+    ulong batch_size;
+
+    // Number of mini-batches within an epoch, the last one might be smaller than batch_size
+    inline ulong get_n_batches() const {
+        return (epoch_size + batch_size - 1) / batch_size;
+    }
+
+    // Samples the indices of the mini-batch number batch of the current epoch
+    void get_next_batch(ulong batch, ArrayULong &indices);
+
+    // Random generators used by each thread to sample indices
+    std::vector<Rand> thread_rands;
+
+    // With permutation sampling and several threads, the indices of the whole epoch: a new
+    // permutation is drawn for each pass over the rand_max samples, as in get_next_i()
+    ArrayULong epoch_permutation;
+
+    // Prox casted as a separable prox and the range of coordinates it is applied to. They
+    // are set by init_separable_prox() for solvers that apply the prox coordinate-wise
+    std::shared_ptr<TProxSeparable<T> > separable_prox;
+    ulong separable_prox_start, separable_prox_end;
+
+    // Checks that the prox is separable and prepares coordinate-wise prox calls
+    void init_separable_prox();
+
+    // Prepares sampling and prox before an epoch is run on several threads
+    void init_threads();
+
+    // Number of iterations performed by a thread in an epoch
+    ulong get_thread_epoch_size(ulong thread) const;
+
+    // The index sampled by a thread for its k-th iteration of the current epoch, which is
+    // the iteration k * n_threads + thread of the epoch
+    ulong get_next_i(ulong thread, ulong k);
+
+    // Adds value to a coordinate of the shared iterate
+    inline void shared_incr(T &x, T value) const {
+        if (atomic_writes) {
+            std::atomic<T> *atomic_x = reinterpret_cast<std::atomic<T> *>(&x);
+            T old_x = atomic_x->load(std::memory_order_relaxed);
+            while (!atomic_x->compare_exchange_weak(old_x, old_x + value,
+                                                    std::memory_order_relaxed)) {}
+        } else {
+            x += value;
+        }
+    }
+
+    // Adds value to iterate[j] and applies the prox to it. With atomic_writes, the prox is written
+    // by a compare-and-swap against the value left by the increment: if another thread modified
+    // iterate[j] in between, the prox is not written, since that thread applies it in turn to a
+    // value that includes this increment
+    inline void shared_incr_prox(ulong j, T value, double step) {
+        if (!atomic_writes) {
+            iterate[j] += value;
+            prox_single(j, iterate, step);
+        } else if (j < separable_prox_start || j >= separable_prox_end) {
+            shared_incr(iterate[j], value);
+        } else if (separable_prox->is_zeroed(j - separable_prox_start)) {
+            iterate[j] = 0;
+        } else {
+            std::atomic<T> *atomic_x = reinterpret_cast<std::atomic<T> *>(&iterate[j]);
+            T old_x = atomic_x->load(std::memory_order_relaxed);
+            while (!atomic_x->compare_exchange_weak(old_x, old_x + value,
+                                                    std::memory_order_relaxed)) {}
+            T incr_x = old_x + value;
+            T prox_x = separable_prox->call_single_value(j - separable_prox_start, incr_x, step, 1);
+            atomic_x->compare_exchange_strong(incr_x, prox_x, std::memory_order_relaxed);
+        }
+    }
+
+    // Sets iterate[j] to the prox of x[j] applied n_times, or to x[j] if j is not in the range
+    // of the prox
+    inline void prox_single(ulong j, const Array<T> &x, double step, ulong n_times = 1) {
+        if (j < separable_prox_start || j >= separable_prox_end) {
+            iterate[j] = x[j];
+        } else if (separable_prox->is_zeroed(j - separable_prox_start)) {
+            iterate[j] = 0;
+        } else {
+            Array<T> x_prox = view(x, separable_prox_start, separable_prox_end);
+            Array<T> iterate_prox = view(iterate, separable_prox_start, separable_prox_end);
+            separable_prox->call_single(j - separable_prox_start, x_prox, step, iterate_prox,
+                                        n_times);
+        }
+    }
+
+    // Applies n_times to iterate[j] the step x <- prox(x - drift), or only the drift if j is
+    // not in the range of the prox
+    inline void prox_single_with_drift(ulong j, double step, T drift, ulong n_times) {
+        if (j < separable_prox_start || j >= separable_prox_end) {
+            iterate[j] -= n_times * drift;
+        } else if (separable_prox->is_zeroed(j - separable_prox_start)) {
+            iterate[j] = 0;
+        } else {
+            Array<T> iterate_prox = view(iterate, separable_prox_start, separable_prox_end);
+            separable_prox->call_single_with_drift(j - separable_prox_start, iterate_prox, step,
+                                                   drift, iterate_prox, n_times);
+        }
+    }
+
+    // Same as prox_single_with_drift for a coordinate written by several threads. With
+    // atomic_writes, the result is written by a compare-and-swap against the value it is
+    // computed from, and computed again if another thread modified iterate[j] in between.
+    // buffer is a scratch array of the size of the iterate, owned by the calling thread
+    inline void shared_prox_single_with_drift(ulong j, double step, T drift, ulong n_times,
+                                              Array<T> &buffer) {
+        if (!atomic_writes) {
+            prox_single_with_drift(j, step, drift, n_times);
+            return;
+        }
+        std::atomic<T> *atomic_x = reinterpret_cast<std::atomic<T> *>(&iterate[j]);
+        T old_x = atomic_x->load(std::memory_order_relaxed);
+        T new_x;
+        do {
+            if (j < separable_prox_start || j >= separable_prox_end) {
+                new_x = old_x - n_times * drift;
+            } else if (separable_prox->is_zeroed(j - separable_prox_start)) {
+                new_x = 0;
+            } else {
+                buffer[j] = old_x;
+                Array<T> buffer_prox = view(buffer, separable_prox_start, separable_prox_end);
+                separable_prox->call_single_with_drift(j - separable_prox_start, buffer_prox, step,
+                                                       drift, buffer_prox, n_times);
+                new_x = buffer[j];
+            }
+        } while (!atomic_x->compare_exchange_weak(old_x, new_x, std::memory_order_relaxed));
+    }
+
  public:
-    explicit StoSolver(int seed = -1);
+    explicit TStoSolver(int seed = -1);
 
-    StoSolver(ulong epoch_size = 0,
-              double tol = 0.,
-              RandType rand_type = RandType::unif,
-              int seed = -1);
+    TStoSolver(ulong epoch_size = 0,
+               double tol = 0.,
+               RandType rand_type = RandType::unif,
+               int seed = -1);
 
-    virtual ~StoSolver() = default;
+    virtual ~TStoSolver() = default;
 
-    virtual void set_model(ModelPtr model) {
+    virtual void set_model(std::shared_ptr<TModel<T> > model) {
         this->model = model;
         permutation_ready = false;
-        iterate = ArrayDouble(model->get_n_coeffs());
+        iterate = Array<T>(model->get_n_coeffs());
         iterate.init_to_zero();
     }
 
-    virtual void set_prox(ProxPtr prox) {
+    /**
+     * @brief Replaces the model by a model with the same number of coefficients, fitted on new
+     * samples, while keeping the state of the solver
+     * @note Unlike set_model, the iterate is not reset, hence the optimization goes on with the
+     * new samples. This is used to learn on a stream of chunks of samples
+     */
+    virtual void update_model(std::shared_ptr<TModel<T> > model);
+
+    virtual void set_prox(std::shared_ptr<TProx<T> > prox) {
         this->prox = prox;
     }
 
@@ -102,11 +261,11 @@ class StoSolver {
 
     virtual void solve() {}
 
-    virtual void get_minimizer(ArrayDouble &out);
+    virtual void get_minimizer(Array<T> &out);
 
-    virtual void get_iterate(ArrayDouble &out);
+    virtual void get_iterate(Array<T> &out);
 
-    virtual void set_starting_iterate(ArrayDouble &new_iterate);
+    virtual void set_starting_iterate(Array<T> &new_iterate);
 
     // Returns a uniform integer in the set {0, ..., m - 1}
     inline ulong rand_unif(ulong m) {
@@ -149,6 +308,29 @@ class StoSolver {
         this->rand_max = rand_max;
         permutation_ready = false;
     }
+
+    inline int get_n_threads() const {
+        return n_threads;
+    }
+
+    void set_n_threads(int n_threads);
+
+    inline ulong get_batch_size() const {
+        return batch_size;
+    }
+
+    void set_batch_size(ulong batch_size);
+
+    inline bool get_atomic_writes() const {
+        return atomic_writes;
+    }
+
+    inline void set_atomic_writes(bool atomic_writes) {
+        this->atomic_writes = atomic_writes;
+    }
 };
 
+typedef TStoSolver<double> StoSolver;
+typedef TStoSolver<float> StoSolverFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_STO_SOLVER_H_
@@ -6,28 +6,39 @@
 
 #include "svrg.h"
 
-SVRG::SVRG(ulong epoch_size,
-           double tol,
-           RandType rand_type,
-           double step,
-           int seed,
-           VarianceReductionMethod variance_reduction
+template <class T>
+TSVRG<T>::TSVRG(ulong epoch_size,
+                double tol,
+                RandType rand_type,
+                double step,
+                int seed,
+                VarianceReductionMethod variance_reduction,
+                bool lazy
 )
-    : StoSolver(epoch_size, tol, rand_type, seed),
-      step(step), variance_reduction(variance_reduction) {
+    : TStoSolver<T>(epoch_size, tol, rand_type, seed),
+      step(step), variance_reduction(variance_reduction), lazy(lazy) {
 }
 
-void SVRG::solve() {
-    ArrayDouble mu(iterate.size());
-    ArrayDouble fixed_w = next_iterate;
+template <class T>
+void TSVRG<T>::solve() {
+    Array<T> mu(iterate.size());
+    Array<T> fixed_w = next_iterate;
     model->grad(fixed_w, mu);
 
-    if (model->is_sparse()) {
-        solve_sparse();
+    if (batch_size > 1) {
+        solve_batch(fixed_w, mu);
+    } else if (n_threads > 1) {
+        solve_threaded(fixed_w, mu);
+    } else if (model->is_sparse()) {
+        if (lazy) {
+            solve_sparse_lazy(fixed_w, mu);
+        } else {
+            solve_sparse();
+        }
     } else {
         // Dense case
-        ArrayDouble grad_i(iterate.size());
-        ArrayDouble grad_i_fixed_w(iterate.size());
+        Array<T> grad_i(iterate.size());
+        Array<T> grad_i_fixed_w(iterate.size());
 
         ulong rand_index{0};
 
@@ -63,17 +74,18 @@ void SVRG::solve() {
     t += epoch_size;
 }
 
-void SVRG::solve_sparse() {
-    // TODO: once lazy updates will be implemented in prox we will be able to
-    // do lazy updating with mu vector
+template <class T>
+void TSVRG<T>::solve_sparse() {
+    // Each step applies the mu drift and the prox to all coordinates, see solve_sparse_lazy for
+    // the epoch that only updates the coordinates of the non-zero features of the samples
 
     // The model is sparse, so it is a ModelGeneralizedLinear and the iteration looks a
     // little bit different
     ulong n_features = model->get_n_features();
     bool use_intercept = model->use_intercept();
 
-    ArrayDouble mu(iterate.size());
-    ArrayDouble fixed_w = iterate;
+    Array<T> mu(iterate.size());
+    Array<T> fixed_w = iterate;
     model->grad(fixed_w, mu);
 
     ulong rand_index{0};
@@ -90,14 +102,14 @@ void SVRG::solve_sparse() {
     for (ulong t = 0; t < epoch_size; ++t) {
         ulong i = get_next_i();
         // Sparse features vector
-        BaseArrayDouble x_i = model->get_features(i);
+        BaseArray<T> x_i = model->get_features(i);
         // Gradients factor
         double alpha_i_iterate = model->grad_i_factor(i, iterate);
         double alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
         double delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
         if (use_intercept) {
             // Get the features vector, which is sparse here
-            ArrayDouble iterate_no_interc = view(iterate, 0, n_features);
+            Array<T> iterate_no_interc = view(iterate, 0, n_features);
             //
             iterate_no_interc.mult_incr(x_i, delta);
             iterate[n_features] += delta;
@@ -120,8 +132,240 @@ void SVRG::solve_sparse() {
         next_iterate = iterate;
 }
 
-void SVRG::set_starting_iterate(ArrayDouble &new_iterate) {
-    StoSolver::set_starting_iterate(new_iterate);
+template <class T>
+void TSVRG<T>::catch_up(ulong j, ulong n_steps, const Array<T> &mu) {
+    if (n_steps > 0) {
+        // Between two updates, coordinate j only sees the mu drift and the prox, the prox
+        // applies these steps all at once (in closed form for the usual separable proxes)
+        prox_single_with_drift(j, step, step * mu[j], n_steps);
+    }
+}
+
+template <class T>
+ulong TSVRG<T>::claim_steps(ulong &last_time_j, ulong t) const {
+    std::atomic<ulong> *atomic_last_time_j = reinterpret_cast<std::atomic<ulong> *>(&last_time_j);
+    ulong old_last_time_j = atomic_last_time_j->load(std::memory_order_relaxed);
+    while (old_last_time_j < t &&
+           !atomic_last_time_j->compare_exchange_weak(old_last_time_j, t,
+                                                      std::memory_order_relaxed)) {}
+    return old_last_time_j;
+}
+
+template <class T>
+void TSVRG<T>::solve_sparse_lazy(const Array<T> &fixed_w, const Array<T> &mu) {
+    // Iterates can only be computed lazily if the phase iterate is the last one
+    if (variance_reduction != VarianceReductionMethod::Last) {
+        TICK_ERROR("SVRG lazy updates can only be used with variance reduction method Last");
+    }
+    if (!prox->is_separable()) {
+        TICK_ERROR("SVRG lazy updates require a separable prox, got " << prox->get_class_name());
+    }
+    init_separable_prox();
+
+    ulong n_features = model->get_n_features();
+    ulong n_coeffs = iterate.size();
+    bool use_intercept = model->use_intercept();
+
+    // last_time[j] is the number of inner steps of this epoch already applied to coordinate j
+    ArrayULong last_time(n_coeffs);
+    last_time.init_to_zero();
+
+    for (ulong t = 0; t < epoch_size; ++t) {
+        ulong i = get_next_i();
+        // Sparse features vector
+        BaseArray<T> x_i = model->get_features(i);
+        const ulong x_i_nnz = x_i.size_sparse();
+        const INDICE_TYPE *x_i_indices = x_i.indices();
+        const T *x_i_data = x_i.data();
+
+        // Bring the coordinates involved in x_i up to date
+        for (ulong idx = 0; idx < x_i_nnz; ++idx) {
+            ulong j = x_i_indices[idx];
+            catch_up(j, t - last_time[j], mu);
+            last_time[j] = t;
+        }
+
+        // Gradients factor
+        double alpha_i_iterate = model->grad_i_factor(i, iterate);
+        double alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
+        double delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
+
+        for (ulong idx = 0; idx < x_i_nnz; ++idx) {
+            ulong j = x_i_indices[idx];
+            iterate[j] += delta * x_i_data[idx] - step * mu[j];
+            prox_single(j, iterate, step);
+            last_time[j] = t + 1;
+        }
+
+        if (use_intercept) {
+            // The intercept is involved in every sample, it is never delayed
+            iterate[n_features] += delta - step * mu[n_features];
+            prox_single(n_features, iterate, step);
+            last_time[n_features] = t + 1;
+        }
+    }
+
+    // Final catch-up so that the whole iterate is up to date at the end of the epoch
+    for (ulong j = 0; j < n_coeffs; ++j) {
+        catch_up(j, epoch_size - last_time[j], mu);
+    }
 
     next_iterate = iterate;
 }
+
+template <class T>
+void TSVRG<T>::solve_batch(const Array<T> &fixed_w, const Array<T> &mu) {
+    if (n_threads > 1) TICK_ERROR("SVRG cannot use both batch_size > 1 and n_threads > 1");
+    if (lazy) TICK_ERROR("SVRG lazy updates cannot be used with batch_size > 1");
+
+    Array<T> grad_batch(iterate.size());
+    Array<T> grad_batch_fixed_w(iterate.size());
+    ArrayULong indices;
+
+    const ulong n_batches = get_n_batches();
+    ulong rand_index{0};
+
+    if (variance_reduction == VarianceReductionMethod::Random ||
+        variance_reduction == VarianceReductionMethod::Average) {
+        next_iterate.init_to_zero();
+    }
+
+    if (variance_reduction == VarianceReductionMethod::Random) {
+        rand_index = rand_unif(n_batches - 1);
+    }
+
+    for (ulong batch = 0; batch < n_batches; ++batch) {
+        get_next_batch(batch, indices);
+        model->grad_batch(indices, iterate, grad_batch);
+        model->grad_batch(indices, fixed_w, grad_batch_fixed_w);
+        for (ulong j = 0; j < iterate.size(); ++j) {
+            iterate[j] = iterate[j] - step * (grad_batch[j] - grad_batch_fixed_w[j] + mu[j]);
+        }
+        prox->call(iterate, step, iterate);
+
+        if (variance_reduction == VarianceReductionMethod::Random && batch == rand_index)
+            next_iterate = iterate;
+
+        if (variance_reduction == VarianceReductionMethod::Average)
+            next_iterate.mult_incr(iterate, 1.0 / n_batches);
+    }
+
+    if (variance_reduction == VarianceReductionMethod::Last)
+        next_iterate = iterate;
+}
+
+template <class T>
+void TSVRG<T>::solve_threaded(const Array<T> &fixed_w, const Array<T> &mu) {
+    if (variance_reduction != VarianceReductionMethod::Last) {
+        TICK_ERROR("SVRG with n_threads > 1 can only be used with variance reduction method Last");
+    }
+    init_threads();
+
+    ArrayULong last_time(iterate.size());
+    last_time.init_to_zero();
+    // Lazy updates need the order in which threads actually run their iterations, which is
+    // given by a shared counter
+    std::atomic<ulong> t_epoch_counter{0};
+
+    parallel_run(n_threads, n_threads, &TSVRG<T>::solve_thread, this, fixed_w, mu, last_time,
+                 t_epoch_counter);
+
+    if (model->is_sparse() && lazy) {
+        // The intercept is updated at every iteration, it is never delayed
+        if (model->use_intercept()) last_time[model->get_n_features()] = epoch_size;
+        for (ulong j = 0; j < iterate.size(); ++j) {
+            if (epoch_size > last_time[j]) catch_up(j, epoch_size - last_time[j], mu);
+        }
+    }
+
+    next_iterate = iterate;
+}
+
+template <class T>
+void TSVRG<T>::solve_thread(ulong thread, const Array<T> &fixed_w, const Array<T> &mu,
+                            ArrayULong &last_time, std::atomic<ulong> &t_epoch_counter) {
+    ulong n_features = model->get_n_features();
+    bool use_intercept = model->use_intercept();
+    bool sparse = model->is_sparse();
+
+    Array<T> grad_i, grad_i_fixed_w;
+    if (!sparse) {
+        grad_i = Array<T>(iterate.size());
+        grad_i_fixed_w = Array<T>(iterate.size());
+    }
+    // Scratch array for atomic catch ups
+    Array<T> catch_up_buffer;
+    if (sparse && lazy && atomic_writes) catch_up_buffer = Array<T>(iterate.size());
+
+    const ulong thread_epoch_size = get_thread_epoch_size(thread);
+    for (ulong k = 0; k < thread_epoch_size; ++k) {
+        const ulong i = get_next_i(thread, k);
+
+        if (sparse) {
+            // Index of this iteration within the epoch
+            const ulong t_epoch = t_epoch_counter.fetch_add(1, std::memory_order_relaxed);
+            BaseArray<T> x_i = model->get_features(i);
+            const ulong x_i_nnz = x_i.size_sparse();
+            const INDICE_TYPE *x_i_indices = x_i.indices();
+            const T *x_i_data = x_i.data();
+
+            if (lazy) {
+                // Other threads might be ahead on this coordinate, so we only catch up with
+                // the missed steps this thread claimed, if any
+                for (ulong idx = 0; idx < x_i_nnz; ++idx) {
+                    ulong j = x_i_indices[idx];
+                    const ulong last_time_j = claim_steps(last_time[j], t_epoch);
+                    if (t_epoch > last_time_j) {
+                        shared_prox_single_with_drift(j, step, step * mu[j], t_epoch - last_time_j,
+                                                      catch_up_buffer);
+                    }
+                }
+            }
+
+            double alpha_i_iterate = model->grad_i_factor(i, iterate);
+            double alpha_i_fixed_w = model->grad_i_factor(i, fixed_w);
+            double delta = -step * (alpha_i_iterate - alpha_i_fixed_w);
+
+            if (lazy) {
+                // The step t_epoch of coordinate j comes with the increment, unless another
+                // thread already caught it up
+                for (ulong idx = 0; idx < x_i_nnz; ++idx) {
+                    ulong j = x_i_indices[idx];
+                    if (claim_steps(last_time[j], t_epoch + 1) <= t_epoch) {
+                        shared_incr_prox(j, delta * x_i_data[idx] - step * mu[j], step);
+                    } else {
+                        shared_incr(iterate[j], delta * x_i_data[idx]);
+                    }
+                }
+            } else {
+                // Without lazy updates, the mu drift is applied to all coordinates
+                for (ulong idx = 0; idx < x_i_nnz; ++idx) {
+                    shared_incr(iterate[x_i_indices[idx]], delta * x_i_data[idx]);
+                }
+                for (ulong j = 0; j < n_features; ++j) {
+                    shared_incr_prox(j, -step * mu[j], step);
+                }
+            }
+
+            if (use_intercept) {
+                shared_incr_prox(n_features, delta - step * mu[n_features], step);
+            }
+        } else {
+            model->grad_i(i, iterate, grad_i);
+            model->grad_i(i, fixed_w, grad_i_fixed_w);
+            for (ulong j = 0; j < iterate.size(); ++j) {
+                shared_incr_prox(j, -step * (grad_i[j] - grad_i_fixed_w[j] + mu[j]), step);
+            }
+        }
+    }
+}
+
+template <class T>
+void TSVRG<T>::set_starting_iterate(Array<T> &new_iterate) {
+    TStoSolver<T>::set_starting_iterate(new_iterate);
+
+    next_iterate = iterate;
+}
+
+template class TSVRG<double>;
+template class TSVRG<float>;
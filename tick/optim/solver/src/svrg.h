@@ -11,8 +11,32 @@
 #include "sgd.h"
 #include "../../prox/src/prox.h"
 
-class SVRG : public StoSolver {
+template <class T>
+class TSVRG : public TStoSolver<T> {
+ protected:
+    using TStoSolver<T>::model;
+    using TStoSolver<T>::prox;
+    using TStoSolver<T>::iterate;
+    using TStoSolver<T>::t;
+    using TStoSolver<T>::epoch_size;
+    using TStoSolver<T>::n_threads;
+    using TStoSolver<T>::atomic_writes;
+    using TStoSolver<T>::batch_size;
+    using TStoSolver<T>::rand_unif;
+    using TStoSolver<T>::init_threads;
+    using TStoSolver<T>::init_separable_prox;
+    using TStoSolver<T>::get_n_batches;
+    using TStoSolver<T>::get_next_batch;
+    using TStoSolver<T>::get_thread_epoch_size;
+    using TStoSolver<T>::shared_incr;
+    using TStoSolver<T>::shared_incr_prox;
+    using TStoSolver<T>::prox_single;
+    using TStoSolver<T>::prox_single_with_drift;
+    using TStoSolver<T>::shared_prox_single_with_drift;
+
  public:
+    using TStoSolver<T>::get_next_i;
+
     enum class VarianceReductionMethod {
         Last    = 1,
         Average = 2,
@@ -22,15 +46,37 @@ class SVRG : public StoSolver {
  private:
     double step;
     VarianceReductionMethod variance_reduction;
-    ArrayDouble next_iterate;
+    Array<T> next_iterate;
+
+    // If true, sparse epochs only update the coordinates of the sampled rows
+    // and apply delayed steps to the other ones when they are needed
+    bool lazy;
+
+    // Sparse epoch with lazy ("just-in-time") updates of the iterate
+    void solve_sparse_lazy(const Array<T> &fixed_w, const Array<T> &mu);
+
+    // Applies to coordinate j the n_steps inner steps it has missed with lazy updates
+    void catch_up(ulong j, ulong n_steps, const Array<T> &mu);
+
+    // Moves last_time_j forward to t with an atomic operation if it is behind, and returns its
+    // previous value. The steps in between are claimed by the calling thread, which is the only
+    // one to apply them, even if several threads update coordinate j at the same time
+    ulong claim_steps(ulong &last_time_j, ulong t) const;
+
+    // Epoch with mini-batches of batch_size samples
+    void solve_batch(const Array<T> &fixed_w, const Array<T> &mu);
+
+    // Epoch run on n_threads threads sharing the iterate
+    void solve_threaded(const Array<T> &fixed_w, const Array<T> &mu);
 
  public:
-    SVRG(ulong epoch_size,
-         double tol,
-         RandType rand_type,
-         double step,
-         int seed = -1,
-         VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last);
+    TSVRG(ulong epoch_size,
+          double tol,
+          RandType rand_type,
+          double step,
+          int seed = -1,
+          VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last,
+          bool lazy = false);
 
     void solve() override;
 
@@ -39,7 +85,7 @@ class SVRG : public StoSolver {
     }
 
     void set_step(double step) {
-        SVRG::step = step;
+        TSVRG<T>::step = step;
     }
 
     VarianceReductionMethod get_variance_reduction() const {
@@ -47,12 +93,27 @@ class SVRG : public StoSolver {
     }
 
     void set_variance_reduction(VarianceReductionMethod variance_reduction) {
-        SVRG::variance_reduction = variance_reduction;
+        TSVRG<T>::variance_reduction = variance_reduction;
+    }
+
+    bool get_lazy() const {
+        return lazy;
     }
 
-    void set_starting_iterate(ArrayDouble &new_iterate) override;
+    void set_lazy(bool lazy) {
+        TSVRG<T>::lazy = lazy;
+    }
+
+    void set_starting_iterate(Array<T> &new_iterate) override;
 
     void solve_sparse();
+
+    //! @brief Runs the share of the current epoch of a thread, when n_threads > 1
+    void solve_thread(ulong thread, const Array<T> &fixed_w, const Array<T> &mu,
+                      ArrayULong &last_time, std::atomic<ulong> &t_epoch_counter);
 };
 
+typedef TSVRG<double> SVRG;
+typedef TSVRG<float> SVRGFloat;
+
 #endif  // TICK_OPTIM_SOLVER_SRC_SVRG_H_
@@ -1,7 +1,10 @@
 # License: BSD 3 clause
 
+import numpy as np
+
 from tick.optim.solver.base import SolverFirstOrderSto
 from tick.optim.solver.build.solver import SVRG as _SVRG
+from tick.optim.solver.build.solver import SVRGFloat as _SVRGFloat
 
 __author__ = "Stephane Gaiffas"
 
@@ -59,6 +62,41 @@ class SVRG(SolverFirstOrderSto):
           epoch
         * 'rand': the phase iterate is a random iterate of the previous epoch
 
+    lazy : `bool`, default = False
+        If `True` and the features are sparse, each inner step only updates
+        the coordinates of the iterate corresponding to the non-zero features
+        of the sampled sample. The variance reduction term and the prox are
+        applied to the other coordinates only when they are needed, with a
+        catch-up pass at the end of each epoch. This makes an inner step cost
+        proportional to the number of non-zero features instead of
+        ``n_coeffs``. It requires a separable prox (such as `ProxZero`,
+        `ProxL1`, `ProxL2Sq` or `ProxElasticNet`) and
+        ``variance_reduction='last'``. Delayed steps are caught up in closed
+        form, hence iterates are the same as the ones obtained with
+        ``lazy=False``, up to floating point errors
+
+    n_threads : `int`, default=1
+        Number of threads used to run an epoch. If larger than 1, each
+        thread samples its own indices and updates the shared iterate
+        without locks (Hogwild!). With sparse features and ``lazy=True``,
+        threads only write the coordinates of the non-zero features of the
+        sampled samples. It requires a separable prox and
+        ``variance_reduction='last'``
+
+    atomic_writes : `bool`, default=False
+        If `True` and ``n_threads > 1``, increments of the shared iterate
+        and the prox writes following them are done with atomic
+        operations, hence no increment made by a thread is overwritten by
+        another one
+
+    batch_size : `int`, default=1
+        Number of samples used at each iteration. If larger than 1, each
+        iteration uses the average of the gradients of ``batch_size``
+        samples (computed with the model's ``grad_batch``) and an epoch
+        performs ``epoch_size / batch_size`` iterations, hence it still goes
+        through ``epoch_size`` samples. It cannot be used together with
+        ``n_threads > 1`` nor ``lazy=True``
+
     Attributes
     ----------
     model : `Solver`
@@ -68,15 +106,32 @@ class SVRG(SolverFirstOrderSto):
         Proximal operator to solve
     """
 
+    _cpp_class_dtype_map = {
+        np.dtype(np.float64): _SVRG,
+        np.dtype(np.float32): _SVRGFloat
+    }
+
     def __init__(self, step: float = None, epoch_size: int = None,
                  rand_type: str = "unif", tol: float = 0.,
                  max_iter: int = 100, verbose: bool = True,
                  print_every: int = 10, record_every: int = 1,
-                 seed: int = -1, variance_reduction: str = "last"):
+                 seed: int = -1, variance_reduction: str = "last",
+                 lazy: bool = False, n_threads: int = 1,
+                 atomic_writes: bool = False, batch_size: int = 1):
 
         SolverFirstOrderSto.__init__(self, step, epoch_size, rand_type,
                                      tol, max_iter, verbose,
                                      print_every, record_every, seed=seed)
+        # Construct the wrapped C++ SVRG solver
+        self._solver = self._build_cpp_solver(np.dtype(np.float64))
+
+        self.variance_reduction = variance_reduction
+        self.lazy = lazy
+        self.n_threads = n_threads
+        self.atomic_writes = atomic_writes
+        self.batch_size = batch_size
+
+    def _build_cpp_solver(self, dtype):
         step = self.step
         if step is None:
             step = 0.
@@ -85,11 +140,16 @@ class SVRG(SolverFirstOrderSto):
         if epoch_size is None:
             epoch_size = 0
 
-        # Construct the wrapped C++ SGD solver
-        self._solver = _SVRG(epoch_size, self.tol,
-                             self._rand_type, step, self.seed)
+        return self._cpp_class_dtype_map[dtype](epoch_size, self.tol,
+                                                self._rand_type, step,
+                                                self.seed)
 
+    def _set_cpp_solver(self, dtype):
+        # variance_reduction and lazy are only stored in the C++ solver
+        variance_reduction, lazy = self.variance_reduction, self.lazy
+        SolverFirstOrderSto._set_cpp_solver(self, dtype)
         self.variance_reduction = variance_reduction
+        self.lazy = lazy
 
     @property
     def variance_reduction(self):
@@ -107,3 +167,11 @@ class SVRG(SolverFirstOrderSto):
 
         self._solver.set_variance_reduction(
             variance_reduction_methods_mapper[val])
+
+    @property
+    def lazy(self):
+        return self._solver.get_lazy()
+
+    @lazy.setter
+    def lazy(self, val: bool):
+        self._solver.set_lazy(bool(val))
@@ -19,3 +19,16 @@ public:
 
     void solve();
 };
+
+class AdaGradFloat : public StoSolverFloat {
+
+public:
+
+    AdaGradFloat(unsigned long epoch_size,
+        double tol,
+        RandType rand_type,
+        double step,
+        int seed);
+
+    void solve();
+};
@@ -19,6 +19,8 @@ public:
 
     void set_model(std::shared_ptr<Model> model);
 
+    void update_model(std::shared_ptr<Model> model);
+
     void set_prox(std::shared_ptr<Prox> prox);
 
     void reset();
@@ -31,4 +33,36 @@ public:
 
     void set_l_l2sq(double l_l2sq);
 
+    unsigned long get_n_past_samples() const;
+
+};
+
+class SDCAFloat : public StoSolverFloat {
+
+public:
+
+    SDCAFloat(double l_l2sq,
+              unsigned long epoch_size = 0,
+              double tol = 0.,
+              RandType rand_type = RandType::unif,
+              int seed = -1);
+
+    void set_model(std::shared_ptr<ModelFloat> model);
+
+    void update_model(std::shared_ptr<ModelFloat> model);
+
+    void set_prox(std::shared_ptr<ProxFloat> prox);
+
+    void reset();
+
+    void init_stored_variables();
+
+    void solve();
+
+    double get_l_l2sq() const;
+
+    void set_l_l2sq(double l_l2sq);
+
+    unsigned long get_n_past_samples() const;
+
 };
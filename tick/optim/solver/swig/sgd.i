@@ -23,3 +23,20 @@ public:
 
     void solve();
 };
+
+class SGDFloat : public StoSolverFloat {
+
+public:
+
+    SGDFloat(unsigned long epoch_size,
+             double tol,
+             RandType rand_type,
+             double step,
+             int seed);
+
+    inline void set_step(double step);
+
+    inline double get_step() const;
+
+    void solve();
+};
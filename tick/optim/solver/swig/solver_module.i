@@ -1,8 +1,14 @@
 // License: BSD 3 clause
 
-%module solver
+%module(threads="1") solver
 
 %include defs.i
+
+// The GIL is only released while solving, so that several solvers can run
+// at the same time from Python threads. Other methods keep it since they
+// might release arrays owned by Python
+%feature("nothreadallow");
+%feature("nothreadallow", "0") solve;
 %include std_shared_ptr.i
 
 %{
@@ -47,8 +47,67 @@ public:
 
     virtual void set_model(std::shared_ptr<Model> model);
 
+    virtual void update_model(std::shared_ptr<Model> model);
+
     virtual void set_prox(std::shared_ptr<Prox> prox);
 
     void set_seed(int seed);
 
+    inline int get_n_threads() const;
+    void set_n_threads(int n_threads);
+
+    inline bool get_atomic_writes() const;
+    inline void set_atomic_writes(bool atomic_writes);
+
+    inline unsigned long get_batch_size() const;
+    void set_batch_size(unsigned long batch_size);
+
+};
+
+class StoSolverFloat {
+    // Base abstract for a stochastic solver
+
+public:
+
+    StoSolverFloat(unsigned long epoch_size,
+                   double tol,
+                   RandType rand_type);
+
+    virtual void solve();
+
+    virtual void get_minimizer(ArrayFloat &out);
+
+    virtual void get_iterate(ArrayFloat &out);
+
+    virtual void set_starting_iterate(ArrayFloat &new_iterate);
+
+    inline void set_tol(double tol);
+    inline double get_tol() const;
+
+    inline void set_epoch_size(unsigned long epoch_size);
+    inline unsigned long get_epoch_size() const;
+
+    inline void set_rand_type(RandType rand_type);
+    inline RandType get_rand_type() const;
+
+    inline void set_rand_max(unsigned long rand_max);
+    inline unsigned long get_rand_max() const;
+
+    virtual void set_model(std::shared_ptr<ModelFloat> model);
+
+    virtual void update_model(std::shared_ptr<ModelFloat> model);
+
+    virtual void set_prox(std::shared_ptr<ProxFloat> prox);
+
+    void set_seed(int seed);
+
+    inline int get_n_threads() const;
+    void set_n_threads(int n_threads);
+
+    inline bool get_atomic_writes() const;
+    inline void set_atomic_writes(bool atomic_writes);
+
+    inline unsigned long get_batch_size() const;
+    void set_batch_size(unsigned long batch_size);
+
 };
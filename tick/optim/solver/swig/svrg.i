@@ -21,7 +21,8 @@ public:
          RandType rand_type,
          double step,
          int seed,
-         VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last);
+         VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last,
+         bool lazy = false);
 
     void solve();
 
@@ -30,4 +31,38 @@ public:
     VarianceReductionMethod get_variance_reduction();
 
     void set_variance_reduction(VarianceReductionMethod variance_reduction);
+
+    bool get_lazy();
+
+    void set_lazy(bool lazy);
+};
+
+class SVRGFloat : public StoSolverFloat {
+
+public:
+    enum class VarianceReductionMethod {
+        Last    = 1,
+        Average = 2,
+        Random  = 3
+    };
+
+    SVRGFloat(unsigned long epoch_size,
+              double tol,
+              RandType rand_type,
+              double step,
+              int seed,
+              VarianceReductionMethod variance_reduction = VarianceReductionMethod::Last,
+              bool lazy = false);
+
+    void solve();
+
+    void set_step(double step);
+
+    VarianceReductionMethod get_variance_reduction();
+
+    void set_variance_reduction(VarianceReductionMethod variance_reduction);
+
+    bool get_lazy();
+
+    void set_lazy(bool lazy);
 };
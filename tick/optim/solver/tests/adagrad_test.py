@@ -2,6 +2,10 @@
 
 import unittest
 
+import numpy as np
+
+from tick.optim.model import ModelLogReg
+from tick.optim.prox import ProxL2Sq
 from tick.optim.solver import AdaGrad
 from tick.optim.solver.tests.solver import TestSolver
 
@@ -18,5 +22,78 @@ class Test(TestSolver):
         self.check_solver(solver, fit_intercept=True, model="logreg",
                           decimal=1)
 
+    def test_solver_adagrad_threaded(self):
+        """...Check AdaGrad solver with several threads for Logistic
+        Regression with Ridge penalization
+        """
+        solver = AdaGrad(max_iter=100, verbose=False, seed=Test.sto_seed,
+                         step=0.01, n_threads=4)
+        self.check_solver(solver, fit_intercept=True, model="logreg",
+                          decimal=1)
+
+    def test_adagrad_update_model(self):
+        """...Test AdaGrad keeps its iterate and its accumulated squared
+        gradients when its model is updated with new samples
+        """
+        np.random.seed(12)
+        n_samples, n_features = 500, 10
+        y, X, _, _ = TestSolver.generate_logistic_data(n_features, n_samples)
+        model_1 = ModelLogReg(fit_intercept=False).fit(X[:250], y[:250])
+        model_2 = ModelLogReg(fit_intercept=False).fit(X[250:], y[250:])
+
+        iterates = []
+        for keep_state in [True, False]:
+            adagrad = AdaGrad(step=0.1, verbose=False, seed=Test.sto_seed)
+            adagrad.set_model(model_1).set_prox(ProxL2Sq(1e-3))
+            coeffs_1 = adagrad.partial_solve(np.zeros(n_features),
+                                             n_epochs=5).copy()
+
+            if keep_state:
+                adagrad.update_model(model_2)
+                iterate = np.empty(n_features)
+                adagrad._solver.get_iterate(iterate)
+                np.testing.assert_array_equal(iterate, coeffs_1)
+                iterates.append(adagrad.partial_solve(n_epochs=1))
+            else:
+                # Restarting resets the accumulated squared gradients
+                adagrad.set_model(model_2)
+                iterates.append(adagrad.partial_solve(coeffs_1, n_epochs=1))
+
+        # The steps are smaller with the gradients accumulated on model_1
+        self.assertLess(np.linalg.norm(iterates[0] - coeffs_1),
+                        np.linalg.norm(iterates[1] - coeffs_1))
+
+    def test_adagrad_update_model_epoch_size(self):
+        """...Test the epoch size of AdaGrad follows the number of samples of
+        the updated model, unless it was given by the user
+        """
+        np.random.seed(12)
+        n_samples, n_features = 500, 10
+        y, X, _, _ = TestSolver.generate_logistic_data(n_features, n_samples)
+        model_1 = ModelLogReg(fit_intercept=False).fit(X[:300], y[:300])
+        model_2 = ModelLogReg(fit_intercept=False).fit(X[300:], y[300:])
+
+        adagrad = AdaGrad(step=0.1, verbose=False)
+        adagrad.set_model(model_1).set_prox(ProxL2Sq(1e-3))
+        self.assertEqual(adagrad.epoch_size, 300)
+        adagrad.update_model(model_2)
+        self.assertEqual(adagrad.epoch_size, 200)
+        self.assertEqual(adagrad._solver.get_epoch_size(), 200)
+
+        # Epoch size given at construction
+        adagrad = AdaGrad(step=0.1, verbose=False, epoch_size=50)
+        adagrad.set_model(model_1).update_model(model_2)
+        self.assertEqual(adagrad.epoch_size, 50)
+        self.assertEqual(adagrad._solver.get_epoch_size(), 50)
+
+        # Epoch size given after the model
+        adagrad = AdaGrad(step=0.1, verbose=False)
+        adagrad.set_model(model_1)
+        adagrad.epoch_size = 50
+        adagrad.update_model(model_2)
+        self.assertEqual(adagrad.epoch_size, 50)
+        self.assertEqual(adagrad._solver.get_epoch_size(), 50)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -35,6 +35,27 @@ class Test(TestSolver):
         err = Test.evaluate_model(coeffs, coeffs0, interc0)
         self.assertAlmostEqual(err, 0., delta=5e-1)
 
+    def test_solver_bfgs_prox_range(self):
+        """...Check BFGS solver does not penalize the coordinates outside of
+        the range of the prox
+        """
+        np.random.seed(12)
+        n_samples, n_features = 3000, 10
+        coeffs0 = weights_sparse_gauss(n_features, nnz=5)
+        X, y = SimuLogReg(coeffs0, 2., n_samples=n_samples,
+                          verbose=False, seed=123).simulate()
+        model = ModelLogReg(fit_intercept=True).fit(X, y)
+        strength = 1e-2
+        prox = ProxL2Sq(strength, (0, n_features))
+        solver = BFGS(max_iter=100, verbose=False, tol=1e-10)
+        coeffs = solver.set_model(model).set_prox(prox).solve()
+
+        # The intercept is not penalized, hence the gradient of the objective
+        # at the minimum is the gradient of the loss for it
+        grad = model.grad(coeffs)
+        grad[:n_features] += strength * coeffs[:n_features]
+        assert_almost_equal(grad, np.zeros(model.n_coeffs), decimal=6)
+
 
 if __name__ == '__main__':
     unittest.main()
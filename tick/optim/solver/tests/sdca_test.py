@@ -50,6 +50,17 @@ class Test(TestSolver):
 
             np.testing.assert_allclose(coeffs_sdca, coeffs_svrg)
 
+    def test_solver_sdca_threaded(self):
+        """...Check SDCA solver with several threads for a Logistic
+        regression with Ridge penalization, with dense and sparse features
+        """
+        for rand_type in ['unif', 'perm']:
+            solver = SDCA(l_l2sq=1e-5, max_iter=100, verbose=False, tol=0,
+                          seed=Test.sto_seed, n_threads=4,
+                          rand_type=rand_type)
+            self.check_solver(solver, fit_intercept=False, model="logreg",
+                              decimal=1)
+
     def test_sdca_sparse_and_dense_consistency(self):
         """...Test SDCA can run all glm models and is consistent with sparsity
         """
@@ -60,6 +71,39 @@ class Test(TestSolver):
 
         self._test_solver_sparse_and_dense_consistency(create_solver)
 
+    def test_sdca_update_model(self):
+        """...Test SDCA keeps the contribution of the dual variables of the
+        previous samples when its model is updated with new samples
+        """
+        np.random.seed(12)
+        n_samples, n_features = 500, 10
+        y, X, _, _ = TestSolver.generate_logistic_data(n_features, n_samples)
+
+        sdca = SDCA(l_l2sq=1e-2, max_iter=30, verbose=False, tol=0,
+                    seed=Test.sto_seed)
+        sdca.set_model(ModelLogReg(fit_intercept=False).fit(X, y)) \
+            .set_prox(ProxL1(1e-3))
+        coeffs = sdca.solve()
+
+        # Samples seen twice give the same minimizer, since the optimal dual
+        # variables of the second copy are the ones of the first copy
+        sdca_stream = SDCA(l_l2sq=1e-2, verbose=False, tol=0,
+                           seed=Test.sto_seed)
+        sdca_stream.set_model(ModelLogReg(fit_intercept=False).fit(X, y)) \
+            .set_prox(ProxL1(1e-3))
+        sdca_stream.partial_solve(np.zeros(n_features), n_epochs=30)
+        self.assertEqual(sdca_stream._solver.get_n_past_samples(), 0)
+
+        sdca_stream.update_model(ModelLogReg(fit_intercept=False).fit(X, y))
+        self.assertEqual(sdca_stream._solver.get_n_past_samples(), n_samples)
+        coeffs_stream = sdca_stream.partial_solve(n_epochs=30)
+        np.testing.assert_almost_equal(coeffs_stream, coeffs, decimal=4)
+
+        msg = '^Cannot update a model with 10 coefficients with a model ' \
+              'with 11 coefficients$'
+        with self.assertRaisesRegex(ValueError, msg):
+            sdca_stream.update_model(ModelLogReg(fit_intercept=True).fit(X, y))
+
 
 if __name__ == '__main__':
     unittest.main()
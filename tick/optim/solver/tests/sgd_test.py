@@ -16,6 +16,44 @@ class Test(TestSolver):
         self.check_solver(solver, fit_intercept=True, model="logreg",
                           decimal=1)
 
+    def test_solver_sgd_threaded(self):
+        """...Check SGD solver with several threads for Logistic Regression
+        with Ridge penalization
+        """
+        for atomic_writes in [False, True]:
+            solver = SGD(max_iter=100, verbose=False, seed=Test.sto_seed,
+                         step=200, n_threads=4, atomic_writes=atomic_writes)
+            self.check_solver(solver, fit_intercept=True, model="logreg",
+                              decimal=1)
+
+    def test_solver_sgd_batch(self):
+        """...Check SGD solver with mini-batches for Logistic Regression with
+        Ridge penalization
+        """
+        solver = SGD(max_iter=100, verbose=False, seed=Test.sto_seed,
+                     step=200, batch_size=10)
+        self.assertEqual(solver._solver.get_batch_size(), 10)
+        self.check_solver(solver, fit_intercept=True, model="logreg",
+                          decimal=1)
+
+        msg = '^SGD cannot use both batch_size > 1 and n_threads > 1$'
+        solver = SGD(max_iter=1, verbose=False, step=1e-5, batch_size=10,
+                     n_threads=2)
+        with self.assertRaisesRegex(RuntimeError, msg):
+            self.check_solver(solver, fit_intercept=True, model="logreg",
+                              decimal=1)
+
+    def test_sgd_batch_sparse_and_dense_consistency(self):
+        """...Test SGD with mini-batches can run all glm models and is
+        consistent with sparsity
+        """
+
+        def create_solver():
+            return SGD(max_iter=1, verbose=False, step=1e-5,
+                       seed=TestSolver.sto_seed, batch_size=7)
+
+        self._test_solver_sparse_and_dense_consistency(create_solver)
+
     def test_sgd_sparse_and_dense_consistency(self):
         """...Test SGD can run all glm models and is consistent with sparsity
         """
@@ -2,6 +2,12 @@
 
 import unittest
 
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from tick.optim.model import ModelLogReg
+from tick.optim.prox import ProxElasticNet, ProxL1, ProxL2Sq, ProxTV, \
+    ProxZero
 from tick.optim.solver import SVRG
 from tick.optim.solver.tests.solver import TestSolver
 from tick.optim.solver.build.solver import SVRG as _SVRG
@@ -26,6 +32,201 @@ class Test(TestSolver):
 
         self._test_solver_sparse_and_dense_consistency(create_solver)
 
+    def test_svrg_lazy_updates(self):
+        """...Test SVRG lazy updates on sparse features give the same
+        iterates as full updates
+        """
+        n_samples, n_features = 200, 30
+        np.random.seed(12)
+        X = np.random.randn(n_samples, n_features)
+        X[np.random.rand(n_samples, n_features) < 0.8] = 0
+        X_sparse = csr_matrix(X)
+        y = np.sign(np.random.randn(n_samples))
+
+        r = (0, n_features)
+        for fit_intercept in [False, True]:
+            model = ModelLogReg(fit_intercept=fit_intercept).fit(X_sparse, y)
+            # ProxElasticNet has no closed form catch-up and goes through
+            # the generic one
+            for prox in [ProxZero(), ProxL2Sq(1e-2, r),
+                         ProxL2Sq(1e-1, r, positive=True), ProxL1(1e-3, r),
+                         ProxL1(1e-2, r, positive=True),
+                         ProxElasticNet(1e-2, 0.5, r)]:
+                iterates = []
+                for lazy in [False, True]:
+                    svrg = SVRG(step=1e-2, max_iter=5, verbose=False,
+                                seed=TestSolver.sto_seed, lazy=lazy)
+                    svrg.set_model(model).set_prox(prox)
+                    iterates += [svrg.solve()]
+
+                np.testing.assert_almost_equal(iterates[0], iterates[1],
+                                               decimal=10)
+
+    def test_svrg_lazy_updates_errors(self):
+        """...Test SVRG lazy updates raise an error when it cannot be used
+        """
+        X = csr_matrix(np.eye(10))
+        y = np.ones(10)
+        model = ModelLogReg().fit(X, y)
+
+        svrg = SVRG(step=1e-2, max_iter=1, verbose=False, lazy=True,
+                    variance_reduction='avg')
+        svrg.set_model(model).set_prox(ProxZero())
+        self.assertEqual(svrg.lazy, True)
+        msg = '^SVRG lazy updates can only be used with variance reduction ' \
+              'method Last$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            svrg.solve()
+
+        svrg = SVRG(step=1e-2, max_iter=1, verbose=False, lazy=True)
+        svrg.set_model(model).set_prox(ProxTV(1e-2))
+        msg = '^SVRG lazy updates require a separable prox, got ProxTV$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            svrg.solve()
+
+    def test_solver_svrg_threaded(self):
+        """...Check SVRG solver with several threads for a Logistic
+        Regression with Ridge penalization
+        """
+        solver = SVRG(step=1e-3, max_iter=100, verbose=False, tol=0,
+                      n_threads=4)
+        self.check_solver(solver, fit_intercept=True, model="logreg",
+                          decimal=1)
+
+    def test_svrg_threaded_sparse(self):
+        """...Test SVRG with several threads on sparse features gets close
+        to the single threaded solution
+        """
+        n_samples, n_features = 2000, 30
+        np.random.seed(12)
+        X = np.random.randn(n_samples, n_features)
+        X[np.random.rand(n_samples, n_features) < 0.8] = 0
+        X_sparse = csr_matrix(X)
+        y = np.sign(np.random.randn(n_samples))
+
+        model = ModelLogReg(fit_intercept=True).fit(X_sparse, y)
+        prox = ProxL2Sq(1e-2, (0, n_features))
+        svrg = SVRG(step=1e-1, max_iter=30, verbose=False,
+                    seed=TestSolver.sto_seed)
+        svrg.set_model(model).set_prox(prox)
+        coeffs = svrg.solve()
+
+        for lazy, atomic_writes in [(False, False), (True, False),
+                                    (True, True)]:
+            svrg = SVRG(step=1e-1, max_iter=30, verbose=False,
+                        seed=TestSolver.sto_seed, n_threads=4, lazy=lazy,
+                        atomic_writes=atomic_writes)
+            svrg.set_model(model).set_prox(prox)
+            self.assertEqual(svrg.n_threads, 4)
+            self.assertEqual(svrg._solver.get_n_threads(), 4)
+            self.assertEqual(svrg._solver.get_atomic_writes(), atomic_writes)
+            coeffs_threaded = svrg.solve()
+            np.testing.assert_almost_equal(coeffs_threaded, coeffs,
+                                           decimal=2)
+
+        svrg = SVRG(step=1e-1, max_iter=1, verbose=False, n_threads=4)
+        svrg.set_model(model).set_prox(ProxTV(1e-2))
+        msg = '^Stochastic solvers with n_threads > 1 require a separable ' \
+              'prox, got ProxTV$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            svrg.solve()
+
+    def test_solver_svrg_batch(self):
+        """...Check SVRG solver with mini-batches for a Logistic Regression
+        with Ridge penalization
+        """
+        for variance_reduction in ['last', 'avg', 'rand']:
+            solver = SVRG(step=1e-2, max_iter=100, verbose=False, tol=0,
+                          seed=TestSolver.sto_seed, batch_size=10,
+                          variance_reduction=variance_reduction)
+            self.assertEqual(solver._solver.get_batch_size(), 10)
+            self.check_solver(solver, fit_intercept=True, model="logreg",
+                              decimal=1)
+
+    def test_svrg_batch_sparse_and_dense_consistency(self):
+        """...Test SVRG with mini-batches can run all glm models and is
+        consistent with sparsity
+        """
+
+        def create_solver():
+            return SVRG(max_iter=1, verbose=False, step=1e-5,
+                        seed=TestSolver.sto_seed, batch_size=7)
+
+        self._test_solver_sparse_and_dense_consistency(create_solver)
+
+    def test_svrg_batch_errors(self):
+        """...Test SVRG with mini-batches raises an error when combined with
+        lazy updates or several threads
+        """
+        X = csr_matrix(np.eye(10))
+        y = np.ones(10)
+        model = ModelLogReg().fit(X, y)
+
+        svrg = SVRG(step=1e-2, max_iter=1, verbose=False, lazy=True,
+                    batch_size=2)
+        svrg.set_model(model).set_prox(ProxZero())
+        msg = '^SVRG lazy updates cannot be used with batch_size > 1$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            svrg.solve()
+
+        svrg = SVRG(step=1e-2, max_iter=1, verbose=False, n_threads=2,
+                    batch_size=2)
+        svrg.set_model(model).set_prox(ProxZero())
+        msg = '^SVRG cannot use both batch_size > 1 and n_threads > 1$'
+        with self.assertRaisesRegex(RuntimeError, msg):
+            svrg.solve()
+
+    def test_svrg_float32(self):
+        """...Test SVRG runs in single precision on float32 features and
+        finds the same minimizer as in double precision
+        """
+        n_samples, n_features = 200, 30
+        np.random.seed(12)
+        X = np.random.randn(n_samples, n_features)
+        y = np.sign(np.random.randn(n_samples))
+
+        minimizers = []
+        for features in [X, X.astype(np.float32),
+                         csr_matrix(X).astype(np.float32)]:
+            model = ModelLogReg().fit(features, y)
+            svrg = SVRG(step=1e-2, max_iter=10, verbose=False,
+                        seed=TestSolver.sto_seed)
+            svrg.set_model(model).set_prox(ProxL2Sq(1e-2))
+            self.assertEqual(svrg.prox.dtype, model.dtype)
+            minimizers.append(svrg.solve())
+
+        self.assertEqual(minimizers[1].dtype, np.float32)
+        self.assertEqual(minimizers[2].dtype, np.float32)
+        np.testing.assert_almost_equal(minimizers[1], minimizers[0],
+                                       decimal=4)
+        np.testing.assert_almost_equal(minimizers[2], minimizers[0],
+                                       decimal=4)
+
+    def test_svrg_feature_shards(self):
+        """...Test SVRG with features split in shards, sampled shard by shard
+        with random permutations, finds the same minimizer as with the whole
+        features matrix
+        """
+        n_samples, n_features = 200, 30
+        np.random.seed(12)
+        X = np.random.randn(n_samples, n_features)
+        y = np.sign(np.random.randn(n_samples))
+        shards = [X[:50], X[50:120], X[120:]]
+
+        minimizers = []
+        for features in [X, shards, [csr_matrix(shard) for shard in shards]]:
+            model = ModelLogReg().fit(features, y)
+            svrg = SVRG(step=1. / model.get_lip_max(), max_iter=30,
+                        rand_type='perm', verbose=False,
+                        seed=TestSolver.sto_seed)
+            svrg.set_model(model).set_prox(ProxL2Sq(1e-2))
+            minimizers.append(svrg.solve())
+
+        np.testing.assert_almost_equal(minimizers[1], minimizers[0],
+                                       decimal=5)
+        np.testing.assert_almost_equal(minimizers[2], minimizers[0],
+                                       decimal=5)
+
     def test_variance_reduction_setting(self):
         """...Test SVRG variance_reduction parameter is correctly set
         """
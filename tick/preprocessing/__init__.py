@@ -4,9 +4,10 @@ from .features_binarizer import FeaturesBinarizer
 from .longitudinal_features_product import LongitudinalFeaturesProduct
 from .longitudinal_features_lagger import LongitudinalFeaturesLagger
 from .utils import safe_array, check_censoring_consistency,\
-    check_longitudinal_features_consistency
+    check_longitudinal_features_consistency, save_features, load_features
 
 __all__ = ["FeaturesBinarizer", "LongitudinalFeaturesProduct",
            "LongitudinalFeaturesLaggers", "safe_array",
            "check_censoring_consistency",
-           "check_longitudinal_features_consistency"]
+           "check_longitudinal_features_consistency", "save_features",
+           "load_features"]
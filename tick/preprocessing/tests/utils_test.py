@@ -0,0 +1,67 @@
+# License: BSD 3 clause
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from tick.preprocessing import save_features, load_features
+
+
+class Test(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(238924)
+        features = np.random.randn(30, 7)
+        features[features < .5] = 0
+        self.features = features
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_save_load_dense_features(self):
+        """...Test dense features are memory mapped by load_features
+        """
+        path = save_features(os.path.join(self.tmp_dir.name, "features"),
+                             self.features)
+        self.assertTrue(path.endswith(".npy"))
+        features = load_features(path)
+        self.assertIsInstance(features, np.memmap)
+        np.testing.assert_array_equal(features, self.features)
+
+    def test_save_load_sparse_features(self):
+        """...Test sparse features are loaded as a CSR matrix backed by
+        memory mapped arrays
+        """
+        path = save_features(os.path.join(self.tmp_dir.name, "features"),
+                             csr_matrix(self.features))
+        features = load_features(path)
+        self.assertIsInstance(features, csr_matrix)
+        self.assertEqual(features.indices.dtype, np.int32)
+        self.assertEqual(features.indptr.dtype, np.int32)
+        self.assertIsInstance(np.load(os.path.join(path, "data.npy"),
+                                      mmap_mode="r"), np.memmap)
+        np.testing.assert_array_equal(features.toarray(), self.features)
+
+    def test_save_load_feature_shards(self):
+        """...Test shards of features are loaded in the right order
+        """
+        row_blocks = [slice(0, 4), slice(4, 12), slice(12, 30)]
+        for to_shard in [np.ascontiguousarray, csr_matrix]:
+            shards = [to_shard(self.features[rows]) for rows in row_blocks] \
+                     * 4
+            path = save_features(
+                os.path.join(self.tmp_dir.name, to_shard.__name__), shards)
+            loaded_shards = load_features(path)
+            self.assertEqual(len(loaded_shards), len(shards))
+            for shard, loaded_shard in zip(shards, loaded_shards):
+                if to_shard is csr_matrix:
+                    shard, loaded_shard = shard.toarray(), \
+                                          loaded_shard.toarray()
+                np.testing.assert_array_equal(loaded_shard, shard)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,9 +1,16 @@
 # License: BSD 3 clause
 
+import os
+
 import numpy as np
 import pandas as pd
+from scipy import sparse
 from warnings import warn
 
+# Names of the files in which the components of a CSR features matrix are
+# stored by `save_features`
+_CSR_COMPONENTS = ["data", "indices", "indptr", "shape"]
+
 
 def safe_array(X, dtype=np.float64):
     """Checks if the X has the correct type, dtype, and is contiguous.
@@ -91,3 +98,96 @@ def check_censoring_consistency(censoring, n_samples):
         raise ValueError("`censoring` should be a 1-D numpy ndarray of \
             shape (%i,)" % n_samples)
     return safe_array(censoring, "uint64")
+
+
+def save_features(path, features):
+    """Saves a features matrix on disk in a format that can be memory mapped
+    by `load_features`
+
+    Parameters
+    ----------
+    path : `str`
+        Where to save features. A dense matrix is saved in a ``.npy`` file
+        (this extension is appended to ``path`` if missing), a
+        `scipy.sparse.csr_matrix` in a directory containing one ``.npy``
+        file for each of its components, and a list of shards in a
+        directory containing one such file or directory for each shard
+
+    features : `np.ndarray` or `csr_matrix` or `list`
+        The features matrix, or a list of shards containing consecutive
+        blocks of rows of the features matrix
+
+    Returns
+    -------
+    output : `str`
+        The path of the saved features, that can be given to
+        `load_features`
+    """
+    if isinstance(features, (list, tuple)):
+        os.makedirs(path, exist_ok=True)
+        # Shards names are such that they are sorted in the right order
+        n_digits = len(str(max(len(features) - 1, 0)))
+        for k, shard in enumerate(features):
+            save_features(os.path.join(path, "shard_%0*d" % (n_digits, k)),
+                          shard)
+        return path
+
+    if sparse.issparse(features):
+        features = sparse.csr_matrix(features)
+        # C++ sparse arrays store indices as 32 bits integers
+        if features.nnz > np.iinfo(np.int32).max:
+            raise ValueError("A sparse features matrix can have at most %i "
+                             "non zero values, split it in shards"
+                             % np.iinfo(np.int32).max)
+        os.makedirs(path, exist_ok=True)
+        components = [features.data, features.indices.astype(np.int32),
+                      features.indptr.astype(np.int32),
+                      np.array(features.shape)]
+        for name, component in zip(_CSR_COMPONENTS, components):
+            np.save(os.path.join(path, name + ".npy"), component)
+        return path
+
+    if not path.endswith(".npy"):
+        path += ".npy"
+    np.save(path, np.ascontiguousarray(features))
+    return path
+
+
+def load_features(path, mmap_mode="r"):
+    """Loads features saved by `save_features` without reading them in
+    memory, they are memory mapped instead
+
+    Parameters
+    ----------
+    path : `str`
+        Path of a ``.npy`` file containing a dense matrix, of a directory
+        containing the components of a CSR matrix, or of a directory of such
+        shards, sorted by name
+
+    mmap_mode : `str`, default="r"
+        Mode used to memory map the arrays, see `numpy.load`. If `None`,
+        features are read in memory
+
+    Returns
+    -------
+    output : `np.ndarray` or `csr_matrix` or `list`
+        The features matrix, backed by memory mapped arrays, or the list of
+        its shards. It can be given as is to the ``fit`` method of models
+        and learners with features and labels
+    """
+    if not os.path.isdir(path):
+        return np.load(path, mmap_mode=mmap_mode)
+
+    if os.path.exists(os.path.join(path, "indptr.npy")):
+        data, indices, indptr, shape = [
+            np.load(os.path.join(path, name + ".npy"), mmap_mode=mmap_mode)
+            for name in _CSR_COMPONENTS]
+        return sparse.csr_matrix((data, indices, indptr),
+                                 shape=tuple(shape), copy=False)
+
+    shard_names = sorted(name for name in os.listdir(path)
+                         if not name.startswith("."))
+    if len(shard_names) == 0:
+        raise ValueError("No features found in %s" % path)
+    return [load_features(os.path.join(path, name), mmap_mode=mmap_mode)
+            for name in shard_names]
@@ -176,12 +176,16 @@ class SimuHawkes(SimuPointProcess):
             self.set_baseline(i, self.baseline[i])
 
     def _init_kernels(self):
+        # Kernels of the C++ process are zero kernels at initialization,
+        # hence only non zero kernels need to be given to it
         for i, j in product(range(self.n_nodes), range(self.n_nodes)):
-            if self.kernels[i, j] == 0:
-                kernel_ij = self._kernel_0
+            kernel_ij = self.kernels[i, j]
+            if isinstance(kernel_ij, HawkesKernel0):
+                continue
+            if kernel_ij == 0:
+                self.kernels[i, j] = self._kernel_0
             else:
-                kernel_ij = self.kernels[i, j]
-            self.set_kernel(i, j, kernel_ij)
+                self.set_kernel(i, j, kernel_ij)
 
     def check_parameters_coherence(self, kernels, baseline, n_nodes):
         set_kernels = kernels is not None
@@ -251,6 +255,12 @@ class SimuHawkes(SimuPointProcess):
     def _simulate(self):
         """Launch simulation of the Hawkes process by thinning
         """
+        self._check_simulation()
+        SimuPointProcess._simulate(self)
+
+    def _check_simulation(self):
+        """Warns if the process will not jump and raises if it is unstable
+        """
         if self.baseline.dtype == float and np.linalg.norm(self.baseline) == 0:
             warnings.warn("Baselines have not been set, hence this hawkes "
                           "process won't jump")
@@ -263,8 +273,6 @@ class SimuHawkes(SimuPointProcess):
                              "really want to simulate it"
                              % self.spectral_radius())
 
-        SimuPointProcess._simulate(self)
-
     def spectral_radius(self):
         """Compute the spectral radius of the matrix of l1 norm of Hawkes
         kernels.
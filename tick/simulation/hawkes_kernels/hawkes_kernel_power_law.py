@@ -1,6 +1,11 @@
 # License: BSD 3 clause
 
+from math import lgamma
+
+import numpy as np
+
 from .hawkes_kernel import HawkesKernel
+from .hawkes_kernel_sum_exp import HawkesKernelSumExp
 from ..build.simulation import HawkesKernelPowerLaw as _HawkesKernelPowerLaw
 
 
@@ -41,6 +46,85 @@ class HawkesKernelPowerLaw(HawkesKernel):
     def exponent(self):
         return self._kernel.get_exponent()
 
+    def approximate_with_sum_exp(self, max_error=1e-3):
+        """Approximates this kernel with a sum of exponential kernels
+
+        The convolutions of a `HawkesKernelSumExp` are computed recursively,
+        hence a Hawkes process is simulated in a time linear in its number of
+        jumps with this approximation while every jump of the support is
+        visited at each step with a power law kernel.
+
+        The approximation discretizes
+        :math:`(\\delta + t)^{-\\beta} = \\frac{1}{\\Gamma(\\beta)}
+        \\int_0^\\infty s^{\\beta - 1} e^{-s (\\delta + t)} ds` on a geometric
+        grid of decays :math:`s`.
+
+        Parameters
+        ----------
+        max_error : `float`, default=1e-3
+            Maximum relative error of the approximation on the support of the
+            kernel. After the support, the approximation keeps decreasing
+            from the value of the kernel at the end of its support instead of
+            being zero
+
+        Returns
+        -------
+        output : `HawkesKernelSumExp`
+            The sum of exponential kernels approximating this kernel
+        """
+        multiplier, cutoff, exponent = \
+            self.multiplier, self.cutoff, self.exponent
+        support = self.get_support()
+        if multiplier <= 0 or cutoff <= 0 or exponent <= 0:
+            raise ValueError("Only power law kernels with positive "
+                             "multiplier, cutoff and exponent can be "
+                             "approximated, got multiplier=%g, cutoff=%g and "
+                             "exponent=%g" % (multiplier, cutoff, exponent))
+        if not 0 < max_error < 1:
+            raise ValueError("max_error must be in (0, 1), got %g" % max_error)
+
+        # The kernel is zero from the end of its support
+        t_values = np.hstack((0, np.geomspace(cutoff * 1e-3, support, 2000,
+                                              endpoint=False)))
+        kernel_values = self.get_values(t_values)
+
+        # Decays are truncated where the integrand is negligible at the end
+        # of the support for the smallest ones and at 0 for the largest ones
+        eps = max_error / 4
+        log_min_decay = \
+            (np.log(eps * exponent) + lgamma(exponent)) / exponent \
+            - np.log(cutoff + support)
+        log_max_decay = \
+            np.log(2 * (exponent + np.log(1 / eps))) - np.log(cutoff)
+
+        step = 1.
+        for _ in range(10):
+            log_decays = np.arange(log_min_decay, log_max_decay + step, step)
+            decays = np.exp(log_decays)
+            intensities = np.exp(
+                np.log(multiplier * step) + (exponent - 1) * log_decays
+                - decays * cutoff - lgamma(exponent))
+
+            # Terms that never weigh more than a fraction of the error are
+            # dropped
+            weights = intensities * decays
+            kept = weights > eps * kernel_values[-1] / len(weights)
+            decays, intensities = decays[kept], intensities[kept]
+
+            approximated_values = np.exp(-np.outer(t_values, decays)).dot(
+                intensities * decays)
+            relative_errors = \
+                np.abs(approximated_values - kernel_values) / kernel_values
+            if relative_errors.max() <= max_error:
+                return HawkesKernelSumExp(intensities, decays)
+
+            step /= 2
+            log_min_decay -= 1
+            log_max_decay += 1
+
+        raise RuntimeError("Could not approximate %s with a relative error "
+                           "of %g" % (self, max_error))
+
     def __str__(self):
         if self.multiplier == 0:
             return '0'
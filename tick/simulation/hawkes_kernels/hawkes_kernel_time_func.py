@@ -19,8 +19,25 @@ class HawkesKernelTimeFunc(HawkesKernel):
     y_values : `np.ndarray` shape=(n_points,)
         values array used to build the time function. Might be given together 
         with `t_values` instead of `time_function`.
+
+    bound_window : `float`, default=None
+        Length of the time windows on which the kernel is bounded by the
+        thinning algorithm during simulation. Shorter windows reject fewer
+        jumps but need the intensity bound to be computed more often. If
+        `None`, a tenth of the support of the kernel is used, if infinite
+        the kernel is bounded by its maximum on all future times.
+
+    Notes
+    -----
+    The distribution of the simulated processes does not depend on
+    ``bound_window``, but the random draws of the thinning algorithm do.
+    Since the default ``bound_window`` is a tenth of the support, a seeded
+    simulation does not give the same realization as with versions
+    bounding the kernel on all future times, use ``bound_window=np.inf``
+    to get it back.
     """
-    def __init__(self, time_function=None, t_values=None, y_values=None):
+    def __init__(self, time_function=None, t_values=None, y_values=None,
+                 bound_window=None):
         HawkesKernel.__init__(self)
         if (t_values is None and time_function is None) \
                 or (t_values is not None and time_function is not None):
@@ -35,10 +52,21 @@ class HawkesKernelTimeFunc(HawkesKernel):
         else:
             self._kernel = _HawkesKernelTimeFunc(t_values, y_values)
 
+        if bound_window is not None:
+            self.bound_window = bound_window
+
     @property
     def time_function(self):
         return self._kernel.get_time_function()
 
+    @property
+    def bound_window(self):
+        return self._kernel.get_bound_window()
+
+    @bound_window.setter
+    def bound_window(self, val):
+        self._kernel.set_bound_window(val)
+
     def __str__(self):
         return "KernelTimeFunc"
 
@@ -5,14 +5,8 @@ import multiprocessing
 
 import numpy as np
 
-from multiprocessing import Pool
-
 from tick.simulation.base import Simu
-
-
-def simulate_single(simulation):
-    simulation.simulate()
-    return simulation
+from .build.simulation import HawkesMulti as _HawkesMulti
 
 
 class SimuHawkesMulti(Simu):
@@ -20,7 +14,15 @@ class SimuHawkesMulti(Simu):
 
     The incoming Hawkes simulation is replicated by the number n_simulations. At
     simulation time, the replicated Hawkes processes are run in parallel on a
-    number of threads specified by n_threads.
+    number of threads specified by n_threads. Threads are native threads
+    running without the GIL and each realization is kept by its own
+    process, hence no realization is copied between threads.
+
+    Each replicated simulation is started and ended as if it was simulated
+    alone (intensity tracking set with ``track_intensity`` before the
+    replication, verbose messages, ``time_start`` and ``time_elapsed``),
+    except that its ``time_elapsed`` is the duration of the whole parallel
+    run.
 
     Attributes
     ----------
@@ -165,8 +167,28 @@ class SimuHawkesMulti(Simu):
         return self._simulations[i]
 
     def _simulate(self):
-        """ Launches a series of n_simulations Hawkes simulation in a thread
-        pool
+        """ Launches a series of n_simulations Hawkes simulation on native
+        threads
         """
-        p = Pool(self.n_threads)
-        self._simulations = p.map(simulate_single, self._simulations)
+        # All simulations are replicas of the same Hawkes process
+        self._simulations[0]._check_simulation()
+
+        end_times = np.empty(self.n_simulations)
+        n_points = np.empty(self.n_simulations, dtype=np.uint64)
+        hawkes_multi = _HawkesMulti(self.n_threads)
+        for i, simu in enumerate(self._simulations):
+            if simu.end_time is None and simu.max_jumps is None:
+                raise ValueError('Either end_time or max_jumps must be set')
+            end_times[i] = np.finfo(float).max if simu.end_time is None \
+                else simu.end_time
+            n_points[i] = np.iinfo(np.uint64).max if simu.max_jumps is None \
+                else simu.max_jumps
+            hawkes_multi.add_process(simu._pp)
+
+        # Each realization goes through the hooks of its own simulation, its
+        # time_start and time_elapsed are the ones of the parallel run
+        for simu in self._simulations:
+            simu._start_simulation()
+        hawkes_multi.simulate(end_times, n_points)
+        for simu in self._simulations:
+            simu._end_simulation()
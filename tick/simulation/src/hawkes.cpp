@@ -5,7 +5,8 @@
 
 
 Hawkes::Hawkes(unsigned int n_nodes, int seed)
-    : PP(n_nodes, seed), kernels(n_nodes * n_nodes), baselines(n_nodes) {
+    : PP(n_nodes, seed), kernels(n_nodes * n_nodes), baselines(n_nodes),
+      intensity_bound_window(std::numeric_limits<double>::infinity()) {
   for (unsigned int i = 0; i < n_nodes; i++) {
     baselines[i] = std::make_shared<HawkesConstantBaseline>(0.);
 
@@ -16,6 +17,8 @@ Hawkes::Hawkes(unsigned int n_nodes, int seed)
 }
 
 void Hawkes::init_intensity_(ArrayDouble &intensity, double *total_intensity_bound) {
+  init_sparse_kernels();
+
   *total_intensity_bound = 0;
   for (unsigned int i = 0; i < n_nodes; i++) {
     intensity[i] = get_baseline(i, 0.);
@@ -23,32 +26,104 @@ void Hawkes::init_intensity_(ArrayDouble &intensity, double *total_intensity_bou
   }
 }
 
+void Hawkes::init_sparse_kernels() {
+  node_sources.assign(n_nodes, std::vector<unsigned int>());
+  node_targets.assign(n_nodes, std::vector<std::pair<unsigned int, ulong> >());
+  source_convolutions.resize(n_nodes);
+  source_bounds.resize(n_nodes);
+  intensity_bound_window = std::numeric_limits<double>::infinity();
+
+  for (unsigned int i = 0; i < n_nodes; i++) {
+    for (unsigned int j = 0; j < n_nodes; j++) {
+      const HawkesKernelPtr &kernel = kernels[i * n_nodes + j];
+      if (kernel->get_support() == 0) continue;
+      node_targets[j].emplace_back(i, node_sources[i].size());
+      node_sources[i].push_back(j);
+      intensity_bound_window = std::min(intensity_bound_window, kernel->get_bound_window());
+    }
+    source_convolutions[i].assign(node_sources[i].size(), 0.);
+    source_bounds[i].assign(node_sources[i].size(), 0.);
+  }
+
+  excitations = ArrayDouble(n_nodes);
+  excitations.init_to_zero();
+  excitation_bounds = ArrayDouble(n_nodes);
+  excitation_bounds.init_to_zero();
+  pending_jumps.clear();
+}
+
+double Hawkes::get_intensity_bound_window() {
+  return intensity_bound_window;
+}
+
+void Hawkes::update_jump_(int index) {
+  pending_jumps.push_back(static_cast<unsigned int>(index));
+}
+
 bool Hawkes::update_time_shift_(double delay,
                                 ArrayDouble &intensity,
                                 double *total_intensity_bound1) {
+  // The state is not serialized, hence it is built again if the simulation is resumed
+  const bool sparse_kernels_ready = node_sources.size() == n_nodes;
+  if (!sparse_kernels_ready) init_sparse_kernels();
+
+  // When time does not move, only the kernels of the nodes that just jumped have changed
+  if (delay > 0 || !sparse_kernels_ready) {
+    update_all_convolutions(get_time() + delay);
+  } else if (!pending_jumps.empty()) {
+    update_jumped_convolutions(get_time() + delay);
+  }
+  pending_jumps.clear();
+
   if (total_intensity_bound1) *total_intensity_bound1 = 0;
   bool flag_negative_intensity1 = false;
 
-  // We loop on the contributions
   for (unsigned int i = 0; i < n_nodes; i++) {
-    intensity[i] = get_baseline(i, get_time());
+    intensity[i] = get_baseline(i, get_time()) + excitations[i];
     if (total_intensity_bound1)
-      *total_intensity_bound1 += get_baseline_bound(i, get_time());
+      *total_intensity_bound1 += get_baseline_bound(i, get_time()) + excitation_bounds[i];
 
-    for (unsigned int j = 0; j < n_nodes; j++) {
-      HawkesKernelPtr &k = kernels[i * n_nodes + j];
+    if (intensity[i] < 0) flag_negative_intensity1 = true;
+  }
+  return flag_negative_intensity1;
+}
 
-      if (k->get_support() == 0) continue;
+void Hawkes::update_all_convolutions(double time) {
+  for (unsigned int i = 0; i < n_nodes; i++) {
+    const std::vector<unsigned int> &sources = node_sources[i];
+    for (ulong k = 0; k < sources.size(); k++) {
+      const unsigned int j = sources[k];
       double bound = 0;
-      intensity[i] += k->get_convolution(get_time() + delay, *timestamps[j], &bound);
+      source_convolutions[i][k] =
+          kernels[i * n_nodes + j]->get_convolution(time, *timestamps[j], &bound);
+      source_bounds[i][k] = bound;
+    }
+    update_excitation(i);
+  }
+}
 
-      if (total_intensity_bound1) {
-        *total_intensity_bound1 += bound;
-      }
-      if (intensity[i] < 0) flag_negative_intensity1 = true;
+void Hawkes::update_jumped_convolutions(double time) {
+  for (const unsigned int j : pending_jumps) {
+    for (const std::pair<unsigned int, ulong> &target : node_targets[j]) {
+      const unsigned int i = target.first;
+      const ulong k = target.second;
+      double bound = 0;
+      source_convolutions[i][k] =
+          kernels[i * n_nodes + j]->get_convolution(time, *timestamps[j], &bound);
+      source_bounds[i][k] = bound;
+      // Sums are computed again rather than incremented to avoid accumulating rounding errors
+      update_excitation(i);
     }
   }
-  return flag_negative_intensity1;
+}
+
+void Hawkes::update_excitation(unsigned int i) {
+  excitations[i] = 0;
+  excitation_bounds[i] = 0;
+  for (ulong k = 0; k < node_sources[i].size(); k++) {
+    excitations[i] += source_convolutions[i][k];
+    excitation_bounds[i] += source_bounds[i][k];
+  }
 }
 
 void Hawkes::reset() {
@@ -72,6 +147,9 @@ void Hawkes::set_kernel(unsigned int i, unsigned int j, HawkesKernelPtr &kernel)
   else
     kernel = kernel->duplicate_if_necessary(kernel);
   kernels[i * n_nodes + j] = kernel;
+
+  // Lists of non zero kernels must be built again
+  node_sources.clear();
 }
 
 HawkesKernelPtr Hawkes::get_kernel(unsigned int i, unsigned int j) {
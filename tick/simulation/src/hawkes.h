@@ -13,6 +13,8 @@
 
 #include <cfloat>
 #include <memory>
+#include <utility>
+#include <vector>
 
 #include "time_func.h"
 #include "varray.h"
@@ -54,6 +56,34 @@ class Hawkes : public PP {
   /// @brief The mus
   std::vector<HawkesBaselinePtr> baselines;
 
+ private:
+  // The state below lets the simulation only go through the non zero kernels, and only update
+  // the intensities of the nodes excited by a jump. It is built at the start of each simulation
+
+  /// @brief For each node i, the nodes j such that kernel (i, j) is not zero
+  std::vector<std::vector<unsigned int> > node_sources;
+
+  /// @brief For each node j, the pairs (i, k) such that node_sources[i][k] == j
+  std::vector<std::vector<std::pair<unsigned int, ulong> > > node_targets;
+
+  /// @brief Convolutions of the non zero kernels at current time, aligned with node_sources
+  std::vector<std::vector<double> > source_convolutions;
+
+  /// @brief Bounds of the future values of these convolutions, aligned with node_sources
+  std::vector<std::vector<double> > source_bounds;
+
+  /// @brief Sum of the convolutions of each node, ie. its intensity without baseline
+  ArrayDouble excitations;
+
+  /// @brief Sum of the bounds of the convolutions of each node
+  ArrayDouble excitation_bounds;
+
+  /// @brief Nodes that jumped since the intensities were last updated
+  std::vector<unsigned int> pending_jumps;
+
+  /// @brief Smallest window on which the non zero kernels are bounded
+  double intensity_bound_window;
+
  public :
   /**
    * @brief A constructor for an empty multidimensional Hawkes process
@@ -146,6 +176,38 @@ class Hawkes : public PP {
                                   ArrayDouble &intensity,
                                   double *total_intensity_bound);
 
+  /**
+   * @brief Records that a node jumped so that only the intensities it excites are updated
+   * \param index : The node that jumped
+   */
+  void update_jump_(int index) override;
+
+  /**
+   * @brief The bound of the total intensity is valid as long as the bounds of all kernels are
+   */
+  double get_intensity_bound_window() override;
+
+  /**
+   * @brief Builds the lists of non zero kernels and the cached convolutions
+   */
+  void init_sparse_kernels();
+
+  /**
+   * @brief Computes the convolutions of all non zero kernels at given time
+   */
+  void update_all_convolutions(double time);
+
+  /**
+   * @brief Computes again the convolutions of the kernels of the nodes that jumped, at given
+   * time
+   */
+  void update_jumped_convolutions(double time);
+
+  /**
+   * @brief Sums the cached convolutions of node i into its excitation and excitation bound
+   */
+  void update_excitation(unsigned int i);
+
   /**
    * @brief Get future baseline maximum reachable value for a specific dimension at a given time
    * \param i : the dimension
@@ -6,6 +6,7 @@
 #include "defs.h"
 #include "sarray.h"
 
+#include <limits>
 #include <memory>
 
 #include <cereal/types/polymorphic.hpp>
@@ -89,7 +90,7 @@ class HawkesKernel {
                                  double *const bound);
 
   /**
-   * Returns the maximum of the kernel after time t
+   * Returns the maximum of the kernel on [t, t + get_bound_window()]
    * knowing that the value of the kernel at time t is value_at_t
    * @note default is value_at_t (decreasing kernel)
    */
@@ -97,6 +98,16 @@ class HawkesKernel {
     return value_at_t;
   }
 
+  /**
+   * Returns the length of the window on which get_future_max bounds the kernel. Bounds of the
+   * intensity obtained from the convolutions are only valid during this window, after which
+   * they must be computed again
+   * @note default is infinity, the kernel is bounded on all future times
+   */
+  virtual double get_bound_window() const {
+    return std::numeric_limits<double>::infinity();
+  }
+
   //! Returns support used to plot the kernel
   virtual double get_plot_support() { return get_support(); }
 
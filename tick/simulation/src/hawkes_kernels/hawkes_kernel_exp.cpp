@@ -3,8 +3,6 @@
 
 #include "hawkes_kernel_exp.h"
 
-// By default, approximated fast formula for computing exponentials are not used
-bool HawkesKernelExp::use_fast_exp = false;
 
 void HawkesKernelExp::rewind() {
   last_convolution_time = 0;
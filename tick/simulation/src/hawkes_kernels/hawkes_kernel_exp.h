@@ -20,10 +20,6 @@
  * where \f$ \alpha \f$ is the intensity of the kernel and \f$ \beta \f$ its decay.
  */
 class HawkesKernelExp : public HawkesKernel {
-  //! A static field to decide whether (approximated) fast formula for exponential
-  //! should be used or not
-  static bool use_fast_exp;
-
   //! Intensity of the kernel, also noted \f$ \alpha \f$
   double intensity;
 
@@ -96,10 +92,13 @@ class HawkesKernelExp : public HawkesKernel {
                          const ArrayDouble &timestamps,
                          double *const bound) override;
 
-  //! simple setter
-  static void set_fast_exp(bool flag) { use_fast_exp = flag; }
-  //! simple getter
-  static bool get_fast_exp() { return use_fast_exp; }
+  //! @brief Sets the global precision of the exponential function, see ::set_fast_exp
+  //! @deprecated The precision is not specific to this kernel anymore, it is shared by all
+  //! kernels, models and learners. Use tick.base.set_exp_precision instead
+  static void set_fast_exp(bool flag) { ::set_fast_exp(flag); }
+  //! @brief Returns the global precision of the exponential function, see ::get_fast_exp
+  //! @deprecated Use tick.base.get_exp_precision instead
+  static bool get_fast_exp() { return ::get_fast_exp(); }
 
   //! simple getter
   double get_intensity() { return intensity; }
@@ -126,7 +125,6 @@ class HawkesKernelExp : public HawkesKernel {
   void serialize(Archive &ar) {
     ar(cereal::make_nvp("HawkesKernel", cereal::base_class<HawkesKernel>(this)));
 
-    ar(CEREAL_NVP(use_fast_exp));
     ar(CEREAL_NVP(intensity));
     ar(CEREAL_NVP(decay));
     ar(CEREAL_NVP(last_convolution_time));
@@ -135,16 +133,10 @@ class HawkesKernelExp : public HawkesKernel {
   }
 
  private:
-  //! @brief Custom exponential function taking into account optimization level
+  //! @brief Custom exponential function taking into account the global precision
   //! \param x : The value exponential is computed at
   inline double cexp(double x) {
-    int optimization_level;
-    if (use_fast_exp) {
-      optimization_level = 1;
-    } else {
-      optimization_level = 0;
-    }
-    return optimized_exp(x, optimization_level);
+    return optimized_exp(x, 0);
   }
 };
 
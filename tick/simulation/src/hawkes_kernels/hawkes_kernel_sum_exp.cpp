@@ -7,8 +7,6 @@
 #include "base.h"
 #include "hawkes_kernel_sum_exp.h"
 
-// By default, approximated fast formula for computing exponentials are not used
-bool HawkesKernelSumExp::use_fast_exp = false;
 
 void HawkesKernelSumExp::rewind() {
   last_convolution_values = ArrayDouble(n_decays);
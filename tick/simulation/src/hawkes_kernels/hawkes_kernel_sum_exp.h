@@ -17,10 +17,6 @@
  * where \f$ \alpha_u \f$ are the intensities of the kernel and \f$ \beta_u \f$ its decays.
  */
 class HawkesKernelSumExp : public HawkesKernel {
-  //! A static field to decide whether (approximated) fast formula for exponential
-  //! should be used or not
-  static bool use_fast_exp;
-
   //! Number of decays of the kernel, also noted \f$ U \f$
   ulong n_decays;
 
@@ -99,10 +95,13 @@ class HawkesKernelSumExp : public HawkesKernel {
                          const ArrayDouble &timestamps,
                          double *const bound) override;
 
-  //! simple setter
-  static void set_fast_exp(bool flag) { use_fast_exp = flag; }
-  //! simple getter
-  static bool get_fast_exp() { return use_fast_exp; }
+  //! @brief Sets the global precision of the exponential function, see ::set_fast_exp
+  //! @deprecated The precision is not specific to this kernel anymore, it is shared by all
+  //! kernels, models and learners. Use tick.base.set_exp_precision instead
+  static void set_fast_exp(bool flag) { ::set_fast_exp(flag); }
+  //! @brief Returns the global precision of the exponential function, see ::get_fast_exp
+  //! @deprecated Use tick.base.get_exp_precision instead
+  static bool get_fast_exp() { return ::get_fast_exp(); }
 
   /**
    * @brief Simple getter
@@ -140,7 +139,6 @@ class HawkesKernelSumExp : public HawkesKernel {
   void serialize(Archive &ar) {
     ar(cereal::make_nvp("HawkesKernel", cereal::base_class<HawkesKernel>(this)));
 
-    ar(CEREAL_NVP(use_fast_exp));
     ar(CEREAL_NVP(n_decays));
     ar(CEREAL_NVP(intensities));
     ar(CEREAL_NVP(decays));
@@ -151,16 +149,10 @@ class HawkesKernelSumExp : public HawkesKernel {
   }
 
  private:
-  //! @brief Custom exponential function taking into account optimization level
+  //! @brief Custom exponential function taking into account the global precision
   //! \param x : The value exponential is computed at
   inline double cexp(double x) {
-    int optimization_level;
-    if (use_fast_exp) {
-      optimization_level = 1;
-    } else {
-      optimization_level = 0;
-    }
-    return optimized_exp(x, optimization_level);
+    return optimized_exp(x, 0);
   }
 };
 
@@ -2,12 +2,21 @@
 
 #include "hawkes_kernel_time_func.h"
 
+#include <cmath>
+#include <deque>
+
 HawkesKernelTimeFunc::HawkesKernelTimeFunc(const TimeFunction &time_function)
     : HawkesKernel(), time_function(time_function) {
   if (time_function.get_border_type() != TimeFunction::BorderType::Border0) TICK_ERROR(
       "Only TimeFunction with a border 0 can be used in HawkesKernelTimeFunc");
 
   support = time_function.get_support_right();
+
+  // By default, the kernel is bounded on windows of a tenth of its support
+  const bool is_sampled = time_function.get_sampled_y() != nullptr
+      && time_function.get_sampled_y()->size() > 0;
+  bound_window = is_sampled && support > 0 ? support / 10
+                                           : std::numeric_limits<double>::infinity();
 }
 
 HawkesKernelTimeFunc::HawkesKernelTimeFunc(const ArrayDouble &t_axis, const ArrayDouble &y_axis)
@@ -23,7 +32,46 @@ double HawkesKernelTimeFunc::get_value_(double x) {
 }
 
 double HawkesKernelTimeFunc::get_future_max(double t, double value_at_t) {
-  return time_function.future_bound(t);
+  if (std::isinf(bound_window) || time_function.get_sampled_y() == nullptr
+      || time_function.get_sampled_y()->size() == 0) {
+    return time_function.future_bound(t);
+  }
+  if (t >= support) return 0;
+
+  if (window_max.empty()) compute_window_max();
+  const double t0 = time_function.get_t0();
+  const ulong i = t < t0 ? 0 : static_cast<ulong>((t - t0) / time_function.get_dt());
+  return window_max[std::min<ulong>(i, window_max.size() - 1)];
+}
+
+void HawkesKernelTimeFunc::set_bound_window(double bound_window) {
+  if (bound_window <= 0) TICK_ERROR("bound_window must be positive, got " << bound_window);
+
+  this->bound_window = bound_window;
+  window_max.clear();
+}
+
+void HawkesKernelTimeFunc::compute_window_max() {
+  const ArrayDouble &sampled_y = *time_function.get_sampled_y();
+  const ulong n_samples = sampled_y.size();
+  // Samples i to i + window_size include [t, t + bound_window] for any t between samples i
+  // and i + 1. The kernel being interpolated between samples, it is bounded by their maximum
+  const ulong window_size = static_cast<ulong>(std::ceil(bound_window / time_function.get_dt())) + 1;
+
+  window_max.assign(n_samples, 0.);
+  // Sliding window maximum, indices of decreasing samples are kept in a deque
+  std::deque<ulong> max_indices;
+  for (ulong k = n_samples; k-- > 0;) {
+    while (!max_indices.empty() && sampled_y[max_indices.back()] <= sampled_y[k]) {
+      max_indices.pop_back();
+    }
+    max_indices.push_back(k);
+    if (max_indices.front() > k + window_size) max_indices.pop_front();
+
+    window_max[k] = sampled_y[max_indices.front()];
+    // The kernel equals 0 after its last sample, which might be in the window
+    if (k + window_size >= n_samples - 1) window_max[k] = std::max(window_max[k], 0.);
+  }
 }
 
 
@@ -7,6 +7,8 @@
 #include "time_func.h"
 #include "hawkes_kernel.h"
 
+#include <vector>
+
 /**
  * @class HawkesKernelTimeFunc
  * @brief Piecewise linear Hawkes kernels. This kernel is handled with a TimeFunction
@@ -16,9 +18,19 @@ class HawkesKernelTimeFunc : public HawkesKernel {
   //! @brief The TimeFunction used by the kernel
   TimeFunction time_function;
 
+  //! @brief Length of the window on which the kernel is bounded by get_future_max
+  double bound_window;
+
+  //! @brief Maximum of the kernel on the window starting at each sample of the time function,
+  //! computed the first time it is needed
+  std::vector<double> window_max;
+
   //! Getting the value of the kernel at the point x (where x is positive)
   double get_value_(double x) override;
 
+  //! Computes the maximum of the kernel on the window starting at each sample
+  void compute_window_max();
+
  public :
   //! @brief Constructor
   explicit HawkesKernelTimeFunc(const TimeFunction &time_function);
@@ -33,11 +45,22 @@ class HawkesKernelTimeFunc : public HawkesKernel {
   HawkesKernelTimeFunc();
 
   /**
-   * Returns the maximum of the kernel after time t
+   * Returns the maximum of the kernel on [t, t + bound_window]
    * knowing that the value of the kernel at time t is value_at_t
   */
   double get_future_max(double t, double value_at_t) override;
 
+  double get_bound_window() const override { return bound_window; }
+
+  /**
+   * @brief Sets the length of the window on which the kernel is bounded during simulation
+   * @param bound_window: Length of the window, if infinite the kernel is bounded by its
+   * maximum on all future times
+   * @note Shorter windows give tighter bounds, hence fewer rejected jumps, but the bounds
+   * must be computed again at the end of each window
+   */
+  void set_bound_window(double bound_window);
+
   //! @brief simple getter
   const TimeFunction &get_time_function() const { return time_function; }
 
@@ -46,6 +69,7 @@ class HawkesKernelTimeFunc : public HawkesKernel {
     ar(cereal::make_nvp("HawkesKernel", cereal::base_class<HawkesKernel>(this)));
 
     ar(CEREAL_NVP(time_function));
+    ar(CEREAL_NVP(bound_window));
   }
 };
 
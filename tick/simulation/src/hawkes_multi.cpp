@@ -0,0 +1,25 @@
+// License: BSD 3 clause
+
+
+#include "hawkes_multi.h"
+
+HawkesMulti::HawkesMulti(unsigned int n_threads)
+    : n_threads(n_threads >= 1 ? n_threads : std::thread::hardware_concurrency()) {}
+
+void HawkesMulti::add_process(Hawkes &hawkes) {
+  processes.push_back(&hawkes);
+}
+
+void HawkesMulti::simulate(ArrayDouble &end_times, ArrayULong &n_points) {
+  if (end_times.size() != processes.size() || n_points.size() != processes.size()) {
+    TICK_ERROR("HawkesMulti has " << processes.size() << " processes but got "
+                                  << end_times.size() << " end times and "
+                                  << n_points.size() << " numbers of points");
+  }
+  parallel_run(n_threads, processes.size(), &HawkesMulti::simulate_i, this, end_times,
+               n_points);
+}
+
+void HawkesMulti::simulate_i(ulong i, ArrayDouble &end_times, ArrayULong &n_points) {
+  processes[i]->simulate(end_times[i], n_points[i]);
+}
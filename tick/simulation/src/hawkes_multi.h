@@ -0,0 +1,57 @@
+#ifndef TICK_SIMULATION_SRC_HAWKES_MULTI_H_
+#define TICK_SIMULATION_SRC_HAWKES_MULTI_H_
+
+// License: BSD 3 clause
+
+#include "base.h"
+
+#include <vector>
+
+#include "hawkes.h"
+
+/*! \class HawkesMulti
+ * \brief Simulates several independent Hawkes processes in parallel on native threads
+ *
+ * The processes are not owned by this class, they must outlive the calls to simulate. Each
+ * process keeps its timestamps in its own arrays, hence no realization is copied once
+ * simulated.
+ */
+class HawkesMulti {
+ private:
+  //! @brief Number of threads used to simulate the processes
+  unsigned int n_threads;
+
+  //! @brief The processes to simulate
+  std::vector<Hawkes *> processes;
+
+  //! @brief Simulates process i up to end_times[i] or n_points[i] jumps
+  void simulate_i(ulong i, ArrayDouble &end_times, ArrayULong &n_points);
+
+ public:
+  /**
+   * @brief Constructor
+   * \param n_threads : The number of threads used to simulate the processes
+   */
+  explicit HawkesMulti(unsigned int n_threads = 1);
+
+  /**
+   * @brief Adds a process to the processes to simulate
+   * \param hawkes : The Hawkes process, which is not copied
+   */
+  void add_process(Hawkes &hawkes);
+
+  /**
+   * @brief Simulates all processes in parallel
+   * \param end_times : Time until which each process is simulated
+   * \param n_points : Number of jumps after which each process stops being simulated
+   */
+  void simulate(ArrayDouble &end_times, ArrayULong &n_points);
+
+  //! @brief Returns the number of processes to simulate
+  ulong get_n_processes() const { return processes.size(); }
+
+  //! @brief Returns the number of threads used to simulate the processes
+  unsigned int get_n_threads() const { return n_threads; }
+};
+
+#endif  // TICK_SIMULATION_SRC_HAWKES_MULTI_H_
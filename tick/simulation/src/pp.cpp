@@ -16,6 +16,7 @@ PP::PP(unsigned int n_nodes, int seed)
   flag_negative_intensity = false;
 
   max_total_intensity_bound = 0;
+  total_intensity_bound_end = std::numeric_limits<double>::infinity();
 
   // Init total number of jumps
   n_total_jumps = 0;
@@ -36,6 +37,7 @@ PP::~PP() {
 
 void PP::init_intensity() {
   init_intensity_(intensity, &total_intensity_bound);
+  total_intensity_bound_end = time + get_intensity_bound_window();
   max_total_intensity_bound = total_intensity_bound;
 }
 
@@ -89,8 +91,11 @@ void PP::update_time_shift(double delay, bool flag_compute_intensity_bound, bool
 
   time += delay;
 
-  if (flag_compute_intensity_bound && max_total_intensity_bound < total_intensity_bound)
-    max_total_intensity_bound = total_intensity_bound;
+  if (flag_compute_intensity_bound) {
+    total_intensity_bound_end = time + get_intensity_bound_window();
+    if (max_total_intensity_bound < total_intensity_bound)
+      max_total_intensity_bound = total_intensity_bound;
+  }
 
   if (flag_itr) itr_process();
 }
@@ -120,9 +125,15 @@ void PP::simulate(double end_time, ulong n_points) {
     // We compute the time of the potential next random jump
     const double timeOfNextJump = time + rand.exponential(total_intensity_bound);
 
+    // If the bound of the intensity expires before, no jump is drawn and we go to the end of
+    // its validity to compute it again
+    const bool bound_expired = timeOfNextJump > total_intensity_bound_end
+        && total_intensity_bound_end < end_time;
+    const double timeOfNextUpdate = bound_expired ? total_intensity_bound_end : timeOfNextJump;
+
     // If we must track record the intensities we perform a loop
     if (itr_on()) {
-      while (itr_time + itr_time_step < std::min(timeOfNextJump, end_time)) {
+      while (itr_time + itr_time_step < std::min(timeOfNextUpdate, end_time)) {
         update_time_shift(itr_time_step + itr_time - time, false, true);
         if (flag_negative_intensity) break;
         itr_time = itr_time + itr_time_step;
@@ -131,11 +142,17 @@ void PP::simulate(double end_time, ulong n_points) {
     }
 
     // Are we done ?
-    if (timeOfNextJump >= end_time) {
+    if (timeOfNextUpdate >= end_time) {
       time = end_time;
       break;
     }
 
+    if (bound_expired) {
+      update_time_shift(total_intensity_bound_end - time, true, false);
+      if (flag_negative_intensity) break;
+      continue;
+    }
+
     // We go to timeOfNextJump
     // Do not compute intensity bound here as we want new intensities but old bound that we
     // have used for the exponential law
@@ -181,6 +198,7 @@ void PP::update_jump(int index) {
   // We make the jump on the corresponding signal
   timestamps[index]->append1(time);
   n_total_jumps += 1;
+  update_jump_(index);
 }
 
 
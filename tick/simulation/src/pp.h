@@ -9,6 +9,8 @@
 
 #include <cereal/types/vector.hpp>
 
+#include <limits>
+
 /*! \class PP
  * \brief (Purely virtual) The name of this class stands for Point Processes.
  *  This is the main class that holds a Point Process realization.
@@ -44,6 +46,9 @@ class PP {
   /// @brief Bound of the future total intensity
   double total_intensity_bound;
 
+  /// @brief Time until which total_intensity_bound bounds the total intensity
+  double total_intensity_bound_end;
+
  private :
   // Current total intensity
   double total_intensity;
@@ -159,6 +164,13 @@ class PP {
    */
   void update_jump(int index);
 
+  /**
+   * @brief Virtual method called after a jump has been recorded in ith component, before the
+   * intensities are updated
+   * \param index : The component that jumped
+   */
+  virtual void update_jump_(int index) {}
+
  private :
   /**
    * @brief Update a time shift of delay seconds and eventually recompute the
@@ -185,6 +197,15 @@ class PP {
   virtual void init_intensity_(ArrayDouble &intensity,
                                double *total_intensity_bound);
 
+  /**
+   * @brief Length of the time window during which the bound of the total intensity computed by
+   * update_time_shift_ is valid. Once it is over, the bound is computed again
+   * @note default is infinity, the bound is valid until the next jump
+   */
+  virtual double get_intensity_bound_window() {
+    return std::numeric_limits<double>::infinity();
+  }
+
 
 ////////////////////////////////////////////////////////////////////////////////
 //                            Getters and setters
@@ -244,6 +265,7 @@ class PP {
     ar(CEREAL_NVP(n_total_jumps));
     ar(CEREAL_NVP(n_nodes));
     ar(CEREAL_NVP(total_intensity_bound));
+    ar(CEREAL_NVP(total_intensity_bound_end));
     ar(CEREAL_NVP(total_intensity));
     ar(CEREAL_NVP(intensity));
     ar(CEREAL_NVP(flag_negative_intensity));
@@ -267,6 +289,7 @@ class PP {
     ar(CEREAL_NVP(n_total_jumps));
     ar(CEREAL_NVP(n_nodes));
     ar(CEREAL_NVP(total_intensity_bound));
+    ar(CEREAL_NVP(total_intensity_bound_end));
     ar(CEREAL_NVP(total_intensity));
     ar(CEREAL_NVP(intensity));
     ar(CEREAL_NVP(flag_negative_intensity));
@@ -81,6 +81,9 @@ class HawkesKernelTimeFunc : public HawkesKernel {
   HawkesKernelTimeFunc(const ArrayDouble &t_axis, const ArrayDouble &y_axis);
   HawkesKernelTimeFunc();
   TimeFunction get_time_function();
+
+  double get_bound_window();
+  void set_bound_window(double bound_window);
 };
 
 TICK_MAKE_PICKLABLE(HawkesKernelTimeFunc);
@@ -0,0 +1,20 @@
+// License: BSD 3 clause
+
+
+%{
+#include "hawkes_multi.h"
+%}
+
+
+class HawkesMulti {
+ public :
+
+  HawkesMulti(unsigned int n_threads = 1);
+
+  void add_process(Hawkes &hawkes);
+
+  void simulate(ArrayDouble &end_times, ArrayULong &n_points);
+
+  ulong get_n_processes() const;
+  unsigned int get_n_threads() const;
+};
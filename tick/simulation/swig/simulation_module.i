@@ -1,8 +1,14 @@
 // License: BSD 3 clause
 
-%module simulation
+%module(threads="1") simulation
 
 %include defs.i
+
+// The GIL is only released while simulating several processes on native
+// threads. Other methods keep it since they might release arrays owned by
+// Python
+%feature("nothreadallow");
+%feature("nothreadallow", "0") HawkesMulti::simulate;
 %include serialization.i
 
 %{
@@ -47,5 +53,6 @@ class PP {
 %include poisson.i
 %include inhomogeneous_poisson.i
 %include hawkes.i
+%include hawkes_multi.i
 
 %include hawkes_kernels.i
@@ -4,7 +4,8 @@ import unittest
 from itertools import product
 import numpy as np
 
-from tick.simulation import SimuHawkesExpKernels, HawkesKernelExp, HawkesKernel0
+from tick.simulation import SimuHawkesExpKernels, HawkesKernelExp, \
+    HawkesKernel0, SimuHawkes
 
 
 class Test(unittest.TestCase):
@@ -73,6 +74,41 @@ class Test(unittest.TestCase):
             self.assertAlmostEqual(np.mean(self.hawkes.tracked_intensity[i]),
                                    mean_intensity[i], delta=0.1)
 
+    def test_hawkes_sparse_adjacency(self):
+        """...Test that zero kernels of a sparse adjacency matrix are skipped
+        without changing the simulation
+        """
+        n_nodes = 30
+        adjacency = np.random.rand(n_nodes, n_nodes)
+        adjacency[np.random.rand(n_nodes, n_nodes) < 0.9] = 0
+        baseline = np.random.rand(n_nodes)
+        sparse_hawkes = SimuHawkesExpKernels(adjacency, 2., baseline=baseline,
+                                             end_time=100, seed=2039,
+                                             verbose=False)
+        sparse_hawkes.adjust_spectral_radius(0.8)
+        sparse_hawkes.track_intensity(0.1)
+        sparse_hawkes.simulate()
+
+        # Zero kernels given as exponential kernels of zero intensity are
+        # not skipped
+        kernels = np.empty((n_nodes, n_nodes), dtype=object)
+        for i, j in product(range(n_nodes), range(n_nodes)):
+            kernels[i, j] = HawkesKernelExp(sparse_hawkes.adjacency[i, j], 2.)
+        dense_hawkes = SimuHawkes(kernels=kernels, baseline=baseline,
+                                  end_time=100, seed=2039, verbose=False)
+        dense_hawkes.track_intensity(0.1)
+        dense_hawkes.simulate()
+
+        self.assertGreater(sparse_hawkes.n_total_jumps, 100)
+        self.assertEqual(sparse_hawkes.n_total_jumps,
+                         dense_hawkes.n_total_jumps)
+        for i in range(n_nodes):
+            np.testing.assert_array_almost_equal(
+                sparse_hawkes.timestamps[i], dense_hawkes.timestamps[i])
+            np.testing.assert_array_almost_equal(
+                sparse_hawkes.tracked_intensity[i],
+                dense_hawkes.tracked_intensity[i])
+
 
 if __name__ == "__main__":
     unittest.main()
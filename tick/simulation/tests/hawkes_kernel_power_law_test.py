@@ -2,7 +2,10 @@
 
 import unittest
 
-from tick.simulation.hawkes_kernels import HawkesKernelPowerLaw
+import numpy as np
+
+from tick.simulation.hawkes_kernels import HawkesKernelPowerLaw, \
+    HawkesKernelSumExp
 
 
 class Test(unittest.TestCase):
@@ -119,6 +122,26 @@ class Test(unittest.TestCase):
         self.assertEqual(hawkes_kernel_power_law.__strtex__(),
                          "$(0.01+t)^{-1.2}$")
 
+    def test_HawkesKernelPowerLaw_approximate_with_sum_exp(self):
+        """...Test HawkesKernelPowerLaw approximation with a sum of
+        exponential kernels
+        """
+        for max_error in [1e-2, 1e-4]:
+            kernel_sum_exp = self.hawkes_kernel_power_law \
+                .approximate_with_sum_exp(max_error=max_error)
+            self.assertIsInstance(kernel_sum_exp, HawkesKernelSumExp)
+
+            support = self.hawkes_kernel_power_law.get_support()
+            t_values = np.hstack((0, np.geomspace(1e-4, support, 100,
+                                                  endpoint=False)))
+            values = self.hawkes_kernel_power_law.get_values(t_values)
+            np.testing.assert_array_less(
+                np.abs(kernel_sum_exp.get_values(t_values) - values),
+                max_error * values)
+
+        with self.assertRaisesRegex(ValueError, "positive multiplier"):
+            HawkesKernelPowerLaw(0.1, 0.01, 0).approximate_with_sum_exp()
+
 
 if __name__ == "__main__":
     unittest.main()
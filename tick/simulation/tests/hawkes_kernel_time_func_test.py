@@ -5,7 +5,9 @@ import unittest
 import numpy as np
 
 from tick.base import TimeFunction
+from tick.simulation import SimuHawkes
 from tick.simulation.hawkes_kernels import HawkesKernelTimeFunc
+from tick.simulation.hawkes_multi import SimuHawkesMulti
 
 
 class Test(unittest.TestCase):
@@ -47,6 +49,46 @@ class Test(unittest.TestCase):
         self.assertEqual(self.hawkes_kernel_time_func.__strtex__(),
                          "TimeFunc Kernel")
 
+    def test_HawkesKernelTimeFunc_bound_window(self):
+        """...Test HawkesKernelTimeFunc bound_window parameter and that
+        the distribution of simulations does not depend on it
+        """
+        self.assertAlmostEqual(self.hawkes_kernel_time_func.bound_window,
+                               self.hawkes_kernel_time_func.get_support() / 10)
+
+        kernel = HawkesKernelTimeFunc(self.time_function, bound_window=2.)
+        self.assertEqual(kernel.bound_window, 2.)
+        kernel.bound_window = np.inf
+        self.assertEqual(kernel.bound_window, np.inf)
+        with self.assertRaisesRegex(RuntimeError, "bound_window must be "
+                                                  "positive"):
+            kernel.bound_window = 0
+
+        # The window only changes the random draws of the thinning, hence
+        # the number of jumps has the same distribution whatever the window
+        t_values = np.arange(10, dtype=float)
+        y_values = np.linspace(0.1, 0, 10)
+        end_time, n_simulations = 1000, 100
+        mean_n_jumps = []
+        for bound_window in [np.inf, 2., 0.1]:
+            kernel = HawkesKernelTimeFunc(t_values=t_values,
+                                          y_values=y_values,
+                                          bound_window=bound_window)
+            hawkes = SimuHawkes(kernels=[[kernel]], baseline=[1.],
+                                end_time=end_time, seed=2093, verbose=False)
+            multi = SimuHawkesMulti(hawkes, n_simulations=n_simulations,
+                                    n_threads=4)
+            multi.simulate()
+            for timestamps in multi.timestamps:
+                self.assertTrue(np.all(np.diff(timestamps[0]) >= 0))
+                self.assertLessEqual(timestamps[0][-1], end_time)
+            mean_n_jumps.append(np.mean(multi.n_total_jumps))
+
+        # The standard deviation of these means is about 0.5% of the
+        # expected number of jumps
+        expected_n_jumps = hawkes.mean_intensity()[0] * end_time
+        np.testing.assert_allclose(mean_n_jumps, expected_n_jumps, rtol=0.03)
+
 
 if __name__ == "__main__":
     unittest.main()
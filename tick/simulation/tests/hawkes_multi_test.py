@@ -95,6 +95,69 @@ class Test(unittest.TestCase):
             np.testing.assert_array_equal(t1[0], t3[0])
             np.testing.assert_array_equal(t1[1], t3[1])
 
+    def test_simu_hawkes_multi_threads(self):
+        """...Test simulations on several threads give the same realizations
+        as the replicated processes simulated one after the other
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=10, verbose=False, seed=504)
+
+        multi_1 = SimuHawkesMulti(hawkes, n_threads=1, n_simulations=10)
+        multi_1.simulate()
+        multi_4 = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=10)
+        multi_4.simulate()
+
+        for i in range(10):
+            single = multi_4.get_single_simulation(i)
+            self.assertEqual(single.simulation_time, 10)
+
+            single_copy = SimuHawkes(kernels=self.kernels,
+                                     baseline=self.baseline, end_time=10,
+                                     verbose=False, seed=single.seed)
+            single_copy.simulate()
+            for t1, t4, t in zip(multi_1.timestamps[i], multi_4.timestamps[i],
+                                 single_copy.timestamps):
+                np.testing.assert_array_equal(t1, t4)
+                np.testing.assert_array_equal(t4, t)
+
+        hawkes.end_time = None
+        hawkes.max_jumps = 20
+        multi = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=3)
+        multi.simulate()
+        self.assertEqual(multi.n_total_jumps, [20, 20, 20])
+
+        hawkes.max_jumps = None
+        multi = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=3)
+        with self.assertRaisesRegex(ValueError, "Either end_time or max_jumps"):
+            multi.simulate()
+
+    def test_simu_hawkes_multi_single_simulation(self):
+        """...Test each realization of SimuHawkesMulti is started and ended
+        as a single simulation, with its intensity tracked
+        """
+        hawkes = SimuHawkes(kernels=self.kernels, baseline=self.baseline,
+                            end_time=10, verbose=False, seed=504)
+        hawkes.track_intensity(0.1)
+
+        multi = SimuHawkesMulti(hawkes, n_threads=4, n_simulations=3)
+        multi.simulate()
+
+        for i in range(3):
+            single = multi.get_single_simulation(i)
+            self.assertGreaterEqual(single.time_elapsed, 0)
+            self.assertLessEqual(single.time_elapsed, multi.time_elapsed)
+
+            single_copy = SimuHawkes(kernels=self.kernels,
+                                     baseline=self.baseline, end_time=10,
+                                     verbose=False, seed=single.seed)
+            single_copy.track_intensity(0.1)
+            single_copy.simulate()
+            np.testing.assert_array_equal(single.intensity_tracked_times,
+                                          single_copy.intensity_tracked_times)
+            for intensity, intensity_copy in zip(
+                    single.tracked_intensity, single_copy.tracked_intensity):
+                np.testing.assert_array_equal(intensity, intensity_copy)
+
     def test_simu_hawkes_no_seed(self):
         """...Test hawkes multi can be simulated even if no seed is given
         """